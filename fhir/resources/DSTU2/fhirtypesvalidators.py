@@ -1,6 +1,5 @@
 # _*_ coding: utf-8 _*_
 """Validators for ``pydantic`` Custom DataType"""
-import importlib
 import typing
 from pathlib import Path
 from typing import Union
@@ -8,8 +7,11 @@ from typing import Union
 from pydantic.class_validators import make_generic_validator
 from pydantic.error_wrappers import ErrorWrapper, ValidationError
 from pydantic.types import StrBytes
+from pydantic.typing import AnyCallable
 from pydantic.utils import ROOT_KEY
 
+from fhir.resources.core.registry import ModelClassRegistry
+
 from .fhirabstractmodel import FHIRAbstractModel
 
 if typing.TYPE_CHECKING:
@@ -337,23 +339,43 @@ MODEL_CLASSES = {
 }
 
 
+MODEL_CLASS_REGISTRY = ModelClassRegistry(MODEL_CLASSES, __package__)
+
+
 def get_fhir_model_class(model_name: str) -> typing.Type[FHIRAbstractModel]:
-    """"""
-    global MODEL_CLASSES
-    klass, module_name = MODEL_CLASSES[model_name]
-    if klass is not None:
-        return klass
-    module = importlib.import_module(module_name, package=__package__)
-    klass = getattr(module, model_name)
-    MODEL_CLASSES[model_name] = (klass, module_name)
-    return klass
+    """Thread safe, model class is imported on first lookup."""
+    return MODEL_CLASS_REGISTRY.get(model_name)
+
+
+# dispatch table: fhir type class -> (model class, ready to call validators)
+VALIDATOR_CHAINS: typing.Dict[
+    typing.Type,
+    typing.Tuple[typing.Type[FHIRAbstractModel], typing.Tuple[AnyCallable, ...]],
+] = {}
+
+
+def get_validator_chain(
+    model_type_cls,
+) -> typing.Tuple[typing.Type[FHIRAbstractModel], typing.Tuple[AnyCallable, ...]]:
+    """Validators (wrapped by ``make_generic_validator``) are built once
+    per fhir type class, instead of for each value."""
+    try:
+        return VALIDATOR_CHAINS[model_type_cls]
+    except KeyError:
+        pass
+    cls = get_fhir_model_class(model_type_cls.__resource_type__)
+    validators = tuple(
+        make_generic_validator(validator)
+        for validator in model_type_cls.__get_validators__()
+    )
+    # concurrent threads may build it twice, first one wins
+    return VALIDATOR_CHAINS.setdefault(model_type_cls, (cls, validators))
 
 
 def run_validator_for_fhir_type(model_type_cls, v, values, config, field):
     """ """
-    cls = get_fhir_model_class(model_type_cls.__resource_type__)
-    for validator in model_type_cls.__get_validators__():
-        func = make_generic_validator(validator)
+    cls, validators = get_validator_chain(model_type_cls)
+    for func in validators:
         v = func(cls, v, values, config, field)
     return v
 
@@ -8,9 +8,7 @@ Last updated: 2022-05-28T12:47:40.239+10:00
 """
 import typing
 
-from pydantic import Field, root_validator
-from pydantic.error_wrappers import ErrorWrapper, ValidationError
-from pydantic.errors import MissingError, NoneIsNotAllowedError
+from pydantic import Field
 
 from . import backboneelement, domainresource, fhirtypes
 
@@ -38,6 +36,7 @@ class Account(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     description: fhirtypes.String = Field(
@@ -50,6 +49,7 @@ class Account(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     description__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_description", title="Extension field for ``description``."
@@ -77,6 +77,7 @@ class Account(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     name: fhirtypes.String = Field(
@@ -88,6 +89,7 @@ class Account(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     name__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_name", title="Extension field for ``name``."
@@ -103,6 +105,7 @@ class Account(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Organization"],
     )
@@ -125,6 +128,7 @@ class Account(domainresource.DomainResource):
         description="The date range of services associated with this account.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     status: fhirtypes.Code = Field(
@@ -134,6 +138,7 @@ class Account(domainresource.DomainResource):
         description="Indicates whether the account is presently used/usable or not.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -155,6 +160,7 @@ class Account(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=[
             "Patient",
@@ -174,6 +180,7 @@ class Account(domainresource.DomainResource):
         description="Categorizes the account for reporting and searching purposes.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -204,65 +211,6 @@ class Account(domainresource.DomainResource):
             "partOf",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_898(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("status", "status__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class AccountCoverage(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -290,6 +238,7 @@ class AccountCoverage(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Coverage"],
     )
@@ -301,6 +250,7 @@ class AccountCoverage(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     priority__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_priority", title="Extension field for ``priority``."
@@ -39,6 +39,7 @@ class Address(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     city__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_city", title="Extension field for ``city``."
@@ -51,6 +52,7 @@ class Address(element.Element):
         description="Country - a nation as commonly understood or generally accepted.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     country__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_country", title="Extension field for ``country``."
@@ -63,6 +65,7 @@ class Address(element.Element):
         description="The name of the administrative area (county).",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     district__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_district", title="Extension field for ``district``."
@@ -79,6 +82,7 @@ class Address(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     line__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -91,6 +95,7 @@ class Address(element.Element):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     postalCode: fhirtypes.String = Field(
@@ -100,6 +105,7 @@ class Address(element.Element):
         description="A postal code designating a region defined by the postal service.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     postalCode__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_postalCode", title="Extension field for ``postalCode``."
@@ -116,6 +122,7 @@ class Address(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     state__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_state", title="Extension field for ``state``."
@@ -132,6 +139,7 @@ class Address(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     text__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_text", title="Extension field for ``text``."
@@ -148,6 +156,7 @@ class Address(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["postal", "physical", "both"],
@@ -163,6 +172,7 @@ class Address(element.Element):
         description="The purpose of this address.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["home", "work", "temp", "old", "billing"],
@@ -8,9 +8,7 @@ Last updated: 2022-05-28T12:47:40.239+10:00
 """
 import typing
 
-from pydantic import Field, root_validator
-from pydantic.error_wrappers import ErrorWrapper, ValidationError
-from pydantic.errors import MissingError, NoneIsNotAllowedError
+from pydantic import Field
 
 from . import backboneelement, domainresource, fhirtypes
 
@@ -46,6 +44,7 @@ class AdministrableProductDefinition(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     device: fhirtypes.ReferenceType = Field(
@@ -62,6 +61,7 @@ class AdministrableProductDefinition(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["DeviceDefinition"],
     )
@@ -86,6 +86,7 @@ class AdministrableProductDefinition(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["MedicinalProductDefinition"],
     )
@@ -97,6 +98,7 @@ class AdministrableProductDefinition(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     ingredient: typing.List[fhirtypes.CodeableConceptType] = Field(
@@ -119,6 +121,7 @@ class AdministrableProductDefinition(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     producedFrom: typing.List[fhirtypes.ReferenceType] = Field(
@@ -142,6 +145,7 @@ class AdministrableProductDefinition(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["ManufacturedItemDefinition"],
     )
@@ -153,6 +157,7 @@ class AdministrableProductDefinition(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     routeOfAdministration: typing.List[
@@ -172,6 +177,7 @@ class AdministrableProductDefinition(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     status: fhirtypes.Code = Field(
@@ -184,6 +190,7 @@ class AdministrableProductDefinition(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -207,6 +214,7 @@ class AdministrableProductDefinition(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -236,65 +244,6 @@ class AdministrableProductDefinition(domainresource.DomainResource):
             "routeOfAdministration",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_3288(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("status", "status__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class AdministrableProductDefinitionProperty(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -313,6 +262,7 @@ class AdministrableProductDefinitionProperty(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     type: fhirtypes.CodeableConceptType = Field(
@@ -322,6 +272,7 @@ class AdministrableProductDefinitionProperty(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     valueAttachment: fhirtypes.AttachmentType = Field(
@@ -331,6 +282,7 @@ class AdministrableProductDefinitionProperty(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -343,6 +295,7 @@ class AdministrableProductDefinitionProperty(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -358,6 +311,7 @@ class AdministrableProductDefinitionProperty(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -370,6 +324,7 @@ class AdministrableProductDefinitionProperty(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -385,6 +340,7 @@ class AdministrableProductDefinitionProperty(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -409,52 +365,6 @@ class AdministrableProductDefinitionProperty(backboneelement.BackboneElement):
             "status",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_one_of_many_4168(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/formats.html#choice
-        A few elements have a choice of more than one data type for their content.
-        All such elements have a name that takes the form nnn[x].
-        The "nnn" part of the name is constant, and the "[x]" is replaced with
-        the title-cased name of the type that is actually used.
-        The table view shows each of these names explicitly.
-
-        Elements that have a choice of data type cannot repeat - they must have a
-        maximum cardinality of 1. When constructing an instance of an element with a
-        choice of types, the authoring system must create a single element with a
-        data type chosen from among the list of permitted data types.
-        """
-        one_of_many_fields = {
-            "value": [
-                "valueAttachment",
-                "valueBoolean",
-                "valueCodeableConcept",
-                "valueDate",
-                "valueQuantity",
-            ]
-        }
-        for prefix, fields in one_of_many_fields.items():
-            assert cls.__fields__[fields[0]].field_info.extra["one_of_many"] == prefix
-            required = (
-                cls.__fields__[fields[0]].field_info.extra["one_of_many_required"]
-                is True
-            )
-            found = False
-            for field in fields:
-                if field in values and values[field] is not None:
-                    if found is True:
-                        raise ValueError(
-                            "Any of one field value is expected from "
-                            f"this list {fields}, but got multiple!"
-                        )
-                    else:
-                        found = True
-            if required is True and found is False:
-                raise ValueError(f"Expect any of field value from this list {fields}.")
-
-        return values
-
 
 class AdministrableProductDefinitionRouteOfAdministration(
     backboneelement.BackboneElement
@@ -481,6 +391,7 @@ class AdministrableProductDefinitionRouteOfAdministration(
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     firstDose: fhirtypes.QuantityType = Field(
@@ -496,6 +407,7 @@ class AdministrableProductDefinitionRouteOfAdministration(
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     maxDosePerDay: fhirtypes.QuantityType = Field(
@@ -508,6 +420,7 @@ class AdministrableProductDefinitionRouteOfAdministration(
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     maxDosePerTreatmentPeriod: fhirtypes.RatioType = Field(
@@ -517,6 +430,7 @@ class AdministrableProductDefinitionRouteOfAdministration(
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     maxSingleDose: fhirtypes.QuantityType = Field(
@@ -529,6 +443,7 @@ class AdministrableProductDefinitionRouteOfAdministration(
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     maxTreatmentPeriod: fhirtypes.DurationType = Field(
@@ -541,6 +456,7 @@ class AdministrableProductDefinitionRouteOfAdministration(
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     targetSpecies: typing.List[
@@ -552,6 +468,7 @@ class AdministrableProductDefinitionRouteOfAdministration(
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -595,6 +512,7 @@ class AdministrableProductDefinitionRouteOfAdministrationTargetSpecies(
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     withdrawalPeriod: typing.List[
@@ -609,6 +527,7 @@ class AdministrableProductDefinitionRouteOfAdministrationTargetSpecies(
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -644,6 +563,7 @@ class AdministrableProductDefinitionRouteOfAdministrationTargetSpeciesWithdrawal
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     supportingInformation__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -664,6 +584,7 @@ class AdministrableProductDefinitionRouteOfAdministrationTargetSpeciesWithdrawal
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     value: fhirtypes.QuantityType = Field(
@@ -673,6 +594,7 @@ class AdministrableProductDefinitionRouteOfAdministrationTargetSpeciesWithdrawal
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -8,9 +8,7 @@ Last updated: 2022-05-28T12:47:40.239+10:00
 """
 import typing
 
-from pydantic import Field, root_validator
-from pydantic.error_wrappers import ErrorWrapper, ValidationError
-from pydantic.errors import MissingError, NoneIsNotAllowedError
+from pydantic import Field
 
 from . import backboneelement, domainresource, fhirtypes
 
@@ -41,6 +39,7 @@ class AdverseEvent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -63,6 +62,7 @@ class AdverseEvent(domainresource.DomainResource):
         description="The overall type of event, intended for search and filtering purposes.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     contributor: typing.List[fhirtypes.ReferenceType] = Field(
@@ -80,6 +80,7 @@ class AdverseEvent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Practitioner", "PractitionerRole", "Device"],
     )
@@ -91,6 +92,7 @@ class AdverseEvent(domainresource.DomainResource):
         description="The date (and perhaps time) when the adverse event occurred.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     date__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_date", title="Extension field for ``date``."
@@ -106,6 +108,7 @@ class AdverseEvent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     detected__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_detected", title="Extension field for ``detected``."
@@ -121,6 +124,7 @@ class AdverseEvent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Encounter"],
     )
@@ -135,6 +139,7 @@ class AdverseEvent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     identifier: fhirtypes.IdentifierType = Field(
@@ -148,6 +153,7 @@ class AdverseEvent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     location: fhirtypes.ReferenceType = Field(
@@ -157,6 +163,7 @@ class AdverseEvent(domainresource.DomainResource):
         description="The information about where the adverse event occurred.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Location"],
     )
@@ -171,6 +178,7 @@ class AdverseEvent(domainresource.DomainResource):
         description="Describes the type of outcome from the adverse event.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     recordedDate: fhirtypes.DateTime = Field(
@@ -182,6 +190,7 @@ class AdverseEvent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     recordedDate__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_recordedDate", title="Extension field for ``recordedDate``."
@@ -197,6 +206,7 @@ class AdverseEvent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=[
             "Patient",
@@ -213,6 +223,7 @@ class AdverseEvent(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["DocumentReference"],
     )
@@ -227,6 +238,7 @@ class AdverseEvent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Condition"],
     )
@@ -238,6 +250,7 @@ class AdverseEvent(domainresource.DomainResource):
         description="Assessment whether this event was of real importance.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     severity: fhirtypes.CodeableConceptType = Field(
@@ -251,6 +264,7 @@ class AdverseEvent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     study: typing.List[fhirtypes.ReferenceType] = Field(
@@ -260,6 +274,7 @@ class AdverseEvent(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["ResearchStudy"],
     )
@@ -271,6 +286,7 @@ class AdverseEvent(domainresource.DomainResource):
         description="This subject or group impacted by the event.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Patient", "Group", "Practitioner", "RelatedPerson"],
     )
@@ -282,6 +298,7 @@ class AdverseEvent(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=[
             "Condition",
@@ -305,6 +322,7 @@ class AdverseEvent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -344,65 +362,6 @@ class AdverseEvent(domainresource.DomainResource):
             "study",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_1409(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("actuality", "actuality__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class AdverseEventSuspectEntity(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -422,6 +381,7 @@ class AdverseEventSuspectEntity(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     instance: fhirtypes.ReferenceType = Field(
@@ -435,6 +395,7 @@ class AdverseEventSuspectEntity(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=[
             "Immunization",
@@ -473,6 +434,7 @@ class AdverseEventSuspectEntityCausality(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     author: fhirtypes.ReferenceType = Field(
@@ -482,6 +444,7 @@ class AdverseEventSuspectEntityCausality(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Practitioner", "PractitionerRole"],
     )
@@ -493,6 +456,7 @@ class AdverseEventSuspectEntityCausality(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     productRelatedness: fhirtypes.String = Field(
@@ -502,6 +466,7 @@ class AdverseEventSuspectEntityCausality(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     productRelatedness__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -8,7 +8,7 @@ Last updated: 2022-05-28T12:47:40.239+10:00
 """
 import typing
 
-from pydantic import Field, root_validator
+from pydantic import Field
 
 from . import backboneelement, domainresource, fhirtypes
 
@@ -32,6 +32,7 @@ class AllergyIntolerance(domainresource.DomainResource):
         description="The source of the information about the allergy that is recorded.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=[
             "Patient",
@@ -48,6 +49,7 @@ class AllergyIntolerance(domainresource.DomainResource):
         description="Category of the identified substance.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["food", "medication", "environment", "biologic"],
@@ -63,6 +65,7 @@ class AllergyIntolerance(domainresource.DomainResource):
         description="The clinical status of the allergy or intolerance.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     code: fhirtypes.CodeableConceptType = Field(
@@ -90,6 +93,7 @@ class AllergyIntolerance(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     criticality: fhirtypes.Code = Field(
@@ -102,6 +106,7 @@ class AllergyIntolerance(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["low", "high", "unable-to-assess"],
@@ -132,6 +137,7 @@ class AllergyIntolerance(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     lastOccurrence: fhirtypes.DateTime = Field(
@@ -249,6 +255,7 @@ class AllergyIntolerance(domainresource.DomainResource):
         description="The patient who has the allergy or intolerance.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Patient"],
     )
@@ -310,6 +317,7 @@ class AllergyIntolerance(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["allergy", "intolerance"],
@@ -329,6 +337,7 @@ class AllergyIntolerance(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -368,52 +377,6 @@ class AllergyIntolerance(domainresource.DomainResource):
             "reaction",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_one_of_many_2026(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/formats.html#choice
-        A few elements have a choice of more than one data type for their content.
-        All such elements have a name that takes the form nnn[x].
-        The "nnn" part of the name is constant, and the "[x]" is replaced with
-        the title-cased name of the type that is actually used.
-        The table view shows each of these names explicitly.
-
-        Elements that have a choice of data type cannot repeat - they must have a
-        maximum cardinality of 1. When constructing an instance of an element with a
-        choice of types, the authoring system must create a single element with a
-        data type chosen from among the list of permitted data types.
-        """
-        one_of_many_fields = {
-            "onset": [
-                "onsetAge",
-                "onsetDateTime",
-                "onsetPeriod",
-                "onsetRange",
-                "onsetString",
-            ]
-        }
-        for prefix, fields in one_of_many_fields.items():
-            assert cls.__fields__[fields[0]].field_info.extra["one_of_many"] == prefix
-            required = (
-                cls.__fields__[fields[0]].field_info.extra["one_of_many_required"]
-                is True
-            )
-            found = False
-            for field in fields:
-                if field in values and values[field] is not None:
-                    if found is True:
-                        raise ValueError(
-                            "Any of one field value is expected from "
-                            f"this list {fields}, but got multiple!"
-                        )
-                    else:
-                        found = True
-            if required is True and found is False:
-                raise ValueError(f"Expect any of field value from this list {fields}.")
-
-        return values
-
 
 class AllergyIntoleranceReaction(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
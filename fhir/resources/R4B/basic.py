@@ -33,6 +33,7 @@ class Basic(domainresource.DomainResource):
         description="Indicates who was responsible for creating the resource instance.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=[
             "Practitioner",
@@ -53,6 +54,7 @@ class Basic(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     created: fhirtypes.Date = Field(
@@ -62,6 +64,7 @@ class Basic(domainresource.DomainResource):
         description="Identifies when the resource was first created.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     created__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_created", title="Extension field for ``created``."
@@ -77,6 +80,7 @@ class Basic(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     subject: fhirtypes.ReferenceType = Field(
@@ -89,6 +93,7 @@ class Basic(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Resource"],
     )
@@ -33,6 +33,7 @@ class BodyStructure(domainresource.DomainResource):
         description="Whether this body site is in active use.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     active__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_active", title="Extension field for ``active``."
@@ -45,6 +46,7 @@ class BodyStructure(domainresource.DomainResource):
         description="A summary, characterization or explanation of the body structure.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     description__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_description", title="Extension field for ``description``."
@@ -57,6 +59,7 @@ class BodyStructure(domainresource.DomainResource):
         description="Identifier for this instance of the anatomical structure.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     image: typing.List[fhirtypes.AttachmentType] = Field(
@@ -78,6 +81,7 @@ class BodyStructure(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     locationQualifier: typing.List[fhirtypes.CodeableConceptType] = Field(
@@ -103,6 +107,7 @@ class BodyStructure(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     patient: fhirtypes.ReferenceType = Field(
@@ -112,6 +117,7 @@ class BodyStructure(domainresource.DomainResource):
         description="The person to which the body site belongs.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Patient"],
     )
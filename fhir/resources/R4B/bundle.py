@@ -8,12 +8,20 @@ Last updated: 2022-05-28T12:47:40.239+10:00
 """
 import typing
 
-from pydantic import Field, root_validator
-from pydantic.error_wrappers import ErrorWrapper, ValidationError
-from pydantic.errors import MissingError, NoneIsNotAllowedError
+from pydantic import Field
+
+from fhir.resources.core.bundlestream import (
+    BundleEntryReader,
+    SourceType,
+    iter_bundle_entries,
+)
+from fhir.resources.core.lazy import parse_raw_lazy_entries
 
 from . import backboneelement, fhirtypes, resource
 
+if typing.TYPE_CHECKING:
+    from pydantic.types import StrBytes
+
 
 class Bundle(resource.Resource):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -36,6 +44,7 @@ class Bundle(resource.Resource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     identifier: fhirtypes.IdentifierType = Field(
@@ -48,6 +57,7 @@ class Bundle(resource.Resource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     link: typing.List[fhirtypes.BundleLinkType] = Field(
@@ -57,6 +67,7 @@ class Bundle(resource.Resource):
         description="A series of links that provide context to this bundle.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     signature: fhirtypes.SignatureType = Field(
@@ -66,6 +77,7 @@ class Bundle(resource.Resource):
         description="Digital Signature - base64 encoded. XML-DSig or a JWT.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     timestamp: fhirtypes.Instant = Field(
@@ -78,6 +90,7 @@ class Bundle(resource.Resource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     timestamp__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_timestamp", title="Extension field for ``timestamp``."
@@ -95,6 +108,7 @@ class Bundle(resource.Resource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     total__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_total", title="Extension field for ``total``."
@@ -110,6 +124,7 @@ class Bundle(resource.Resource):
         description="Indicates the purpose of this bundle - how it is intended to be used.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -149,64 +164,26 @@ class Bundle(resource.Resource):
             "signature",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_769(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
+    @classmethod
+    def iter_entries(
+        cls, source: SourceType, *, resources: bool = False
+    ) -> BundleEntryReader:
+        """Incrementally parses JSON Bundle from file path or stream and yields
+        validated ``BundleEntry`` (or entry ``resource``) one at a time.
+        Top level elements are available as ``bundle`` of the returned reader.
+        """
+        return iter_bundle_entries(cls, source, resources=resources)
+
+    @classmethod
+    def parse_raw(  # type: ignore
+        cls, b: "StrBytes", *, lazy_entries: bool = False, **kwargs: typing.Any
+    ) -> "Bundle":
+        """:param lazy_entries: entry ``resource`` keeps raw data and
+        is validated on first attribute access, see ``core.lazy.LazyResource``.
         """
-        required_fields = [("type", "type__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
+        if lazy_entries is True:
+            return parse_raw_lazy_entries(cls, b, **kwargs)  # type: ignore
+        return super().parse_raw(b, **kwargs)
 
 
 class BundleEntry(backboneelement.BackboneElement):
@@ -237,6 +214,7 @@ class BundleEntry(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     fullUrl__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_fullUrl", title="Extension field for ``fullUrl``."
@@ -249,6 +227,7 @@ class BundleEntry(backboneelement.BackboneElement):
         description="A series of links that provide context to this entry.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     request: fhirtypes.BundleEntryRequestType = Field(
@@ -262,6 +241,7 @@ class BundleEntry(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     resource: fhirtypes.ResourceType = Field(
@@ -274,6 +254,7 @@ class BundleEntry(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     response: fhirtypes.BundleEntryResponseType = Field(
@@ -287,6 +268,7 @@ class BundleEntry(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     search: fhirtypes.BundleEntrySearchType = Field(
@@ -299,6 +281,7 @@ class BundleEntry(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -344,6 +327,7 @@ class BundleEntryRequest(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     ifMatch__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_ifMatch", title="Extension field for ``ifMatch``."
@@ -359,6 +343,7 @@ class BundleEntryRequest(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     ifModifiedSince__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_ifModifiedSince", title="Extension field for ``ifModifiedSince``."
@@ -376,6 +361,7 @@ class BundleEntryRequest(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     ifNoneExist__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_ifNoneExist", title="Extension field for ``ifNoneExist``."
@@ -391,6 +377,7 @@ class BundleEntryRequest(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     ifNoneMatch__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_ifNoneMatch", title="Extension field for ``ifNoneMatch``."
@@ -407,6 +394,7 @@ class BundleEntryRequest(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -426,6 +414,7 @@ class BundleEntryRequest(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     url__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -450,65 +439,6 @@ class BundleEntryRequest(backboneelement.BackboneElement):
             "ifNoneExist",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2059(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("method", "method__ext"), ("url", "url__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class BundleEntryResponse(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -535,6 +465,7 @@ class BundleEntryResponse(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     etag__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_etag", title="Extension field for ``etag``."
@@ -547,6 +478,7 @@ class BundleEntryResponse(backboneelement.BackboneElement):
         description="The date/time that the resource was modified on the server.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     lastModified__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_lastModified", title="Extension field for ``lastModified``."
@@ -562,6 +494,7 @@ class BundleEntryResponse(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     location__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_location", title="Extension field for ``location``."
@@ -577,6 +510,7 @@ class BundleEntryResponse(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     status: fhirtypes.String = Field(
@@ -590,6 +524,7 @@ class BundleEntryResponse(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     status__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -613,65 +548,6 @@ class BundleEntryResponse(backboneelement.BackboneElement):
             "outcome",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2146(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("status", "status__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class BundleEntrySearch(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -696,6 +572,7 @@ class BundleEntrySearch(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["match", "include", "outcome"],
@@ -711,6 +588,7 @@ class BundleEntrySearch(backboneelement.BackboneElement):
         description="When searching, the server's search ranking score for the entry.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     score__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_score", title="Extension field for ``score``."
@@ -752,6 +630,7 @@ class BundleLink(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     relation__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -765,6 +644,7 @@ class BundleLink(backboneelement.BackboneElement):
         description="The reference details for the link.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     url__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -778,62 +658,3 @@ class BundleLink(backboneelement.BackboneElement):
         with preserving original sequence order.
         """
         return ["id", "extension", "modifierExtension", "relation", "url"]
-
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_1173(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("relation", "relation__ext"), ("url", "url__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
@@ -37,6 +37,7 @@ class CareTeam(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     encounter: fhirtypes.ReferenceType = Field(
@@ -49,6 +50,7 @@ class CareTeam(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Encounter"],
     )
@@ -64,6 +66,7 @@ class CareTeam(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     managingOrganization: typing.List[fhirtypes.ReferenceType] = Field(
@@ -73,6 +76,7 @@ class CareTeam(domainresource.DomainResource):
         description="The organization responsible for the care team.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Organization"],
     )
@@ -87,6 +91,7 @@ class CareTeam(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     name__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_name", title="Extension field for ``name``."
@@ -123,6 +128,7 @@ class CareTeam(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     reasonCode: typing.List[fhirtypes.CodeableConceptType] = Field(
@@ -152,6 +158,7 @@ class CareTeam(domainresource.DomainResource):
         description="Indicates the current state of the care team.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["proposed", "active", "suspended", "inactive", "entered-in-error"],
@@ -170,6 +177,7 @@ class CareTeam(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Patient", "Group"],
     )
@@ -239,6 +247,7 @@ class CareTeamParticipant(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=[
             "Practitioner",
@@ -257,6 +266,7 @@ class CareTeamParticipant(backboneelement.BackboneElement):
         description="The organization of the practitioner.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Organization"],
     )
@@ -284,6 +294,7 @@ class CareTeamParticipant(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
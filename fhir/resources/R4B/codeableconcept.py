@@ -32,6 +32,7 @@ class CodeableConcept(element.Element):
         description="A reference to a code defined by a terminology system.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     text: fhirtypes.String = Field(
@@ -45,6 +46,7 @@ class CodeableConcept(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     text__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_text", title="Extension field for ``text``."
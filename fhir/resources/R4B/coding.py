@@ -32,6 +32,7 @@ class Coding(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     code__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_code", title="Extension field for ``code``."
@@ -47,6 +48,7 @@ class Coding(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     display__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_display", title="Extension field for ``display``."
@@ -62,6 +64,7 @@ class Coding(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     system__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_system", title="Extension field for ``system``."
@@ -77,6 +80,7 @@ class Coding(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     userSelected__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_userSelected", title="Extension field for ``userSelected``."
@@ -95,6 +99,7 @@ class Coding(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     version__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_version", title="Extension field for ``version``."
@@ -31,6 +31,7 @@ class ContactDetail(element.Element):
         description="The name of an individual to contact.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     name__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_name", title="Extension field for ``name``."
@@ -46,6 +47,7 @@ class ContactDetail(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -8,9 +8,7 @@ Last updated: 2022-05-28T12:47:40.239+10:00
 """
 import typing
 
-from pydantic import Field, root_validator
-from pydantic.error_wrappers import ErrorWrapper, ValidationError
-from pydantic.errors import MissingError, NoneIsNotAllowedError
+from pydantic import Field
 
 from . import backboneelement, element, fhirtypes
 
@@ -34,6 +32,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         description="Identifies additional names by which this element might also be known.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     alias__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -55,6 +54,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     binding: fhirtypes.ElementDefinitionBindingType = Field(
@@ -67,6 +67,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     code: typing.List[fhirtypes.CodingType] = Field(
@@ -79,6 +80,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     comment: fhirtypes.Markdown = Field(
@@ -93,6 +95,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     comment__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_comment", title="Extension field for ``comment``."
@@ -108,6 +111,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     condition__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -123,6 +127,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     contentReference: fhirtypes.Uri = Field(
@@ -138,6 +143,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     contentReference__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -155,6 +161,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -170,6 +177,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -185,6 +193,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -200,6 +209,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -215,6 +225,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -235,6 +246,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -255,6 +267,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -275,6 +288,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -295,6 +309,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -310,6 +325,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -325,6 +341,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -340,6 +357,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -355,6 +373,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -370,6 +389,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -385,6 +405,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -400,6 +421,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -415,6 +437,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -435,6 +458,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -455,6 +479,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -475,6 +500,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -490,6 +516,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -505,6 +532,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -520,6 +548,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -535,6 +564,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -550,6 +580,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -568,6 +599,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -583,6 +615,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -603,6 +636,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -623,6 +657,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -643,6 +678,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -658,6 +694,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -676,6 +713,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -691,6 +729,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -706,6 +745,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -726,6 +766,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -741,6 +782,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -756,6 +798,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -771,6 +814,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -786,6 +830,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -801,6 +846,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -816,6 +862,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -831,6 +878,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -846,6 +894,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -866,6 +915,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -886,6 +936,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -901,6 +952,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -916,6 +968,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -936,6 +989,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -954,6 +1008,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -972,6 +1027,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -987,6 +1043,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1011,6 +1068,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     definition__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_definition", title="Extension field for ``definition``."
@@ -1026,6 +1084,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     fixedAddress: fhirtypes.AddressType = Field(
@@ -1040,6 +1099,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1057,6 +1117,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1074,6 +1135,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1091,6 +1153,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1108,6 +1171,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1130,6 +1194,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1150,6 +1215,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1170,6 +1236,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1190,6 +1257,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1207,6 +1275,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1224,6 +1293,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1241,6 +1311,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1258,6 +1329,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1275,6 +1347,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1292,6 +1365,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1309,6 +1383,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1326,6 +1401,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1346,6 +1422,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1366,6 +1443,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1386,6 +1464,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1403,6 +1482,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1420,6 +1500,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1437,6 +1518,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1454,6 +1536,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1471,6 +1554,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1491,6 +1575,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1508,6 +1593,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1528,6 +1614,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1548,6 +1635,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1568,6 +1656,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1585,6 +1674,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1605,6 +1695,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1622,6 +1713,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1639,6 +1731,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1661,6 +1754,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1678,6 +1772,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1695,6 +1790,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1712,6 +1808,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1729,6 +1826,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1746,6 +1844,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1763,6 +1862,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1780,6 +1880,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1797,6 +1898,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1817,6 +1919,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1837,6 +1940,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1854,6 +1958,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1871,6 +1976,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1893,6 +1999,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1913,6 +2020,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1933,6 +2041,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1950,6 +2059,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1973,6 +2083,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     isModifier__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_isModifier", title="Extension field for ``isModifier``."
@@ -1988,6 +2099,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     isModifierReason__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -2005,6 +2117,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     isSummary__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_isSummary", title="Extension field for ``isSummary``."
@@ -2021,6 +2134,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     label__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_label", title="Extension field for ``label``."
@@ -2036,6 +2150,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     max: fhirtypes.String = Field(
@@ -2048,6 +2163,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     max__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_max", title="Extension field for ``max``."
@@ -2064,6 +2180,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     maxLength__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_maxLength", title="Extension field for ``maxLength``."
@@ -2080,6 +2197,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -2099,6 +2217,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -2120,6 +2239,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -2139,6 +2259,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -2158,6 +2279,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -2177,6 +2299,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -2198,6 +2321,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -2214,6 +2338,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -2233,6 +2358,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -2253,6 +2379,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     meaningWhenMissing__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -2267,6 +2394,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         description="The minimum number of times this element SHALL appear in the instance.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     min__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_min", title="Extension field for ``min``."
@@ -2283,6 +2411,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -2302,6 +2431,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -2323,6 +2453,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -2342,6 +2473,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -2361,6 +2493,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -2380,6 +2513,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -2401,6 +2535,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -2417,6 +2552,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -2436,6 +2572,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -2459,6 +2596,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     mustSupport__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_mustSupport", title="Extension field for ``mustSupport``."
@@ -2475,6 +2613,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     orderMeaning__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_orderMeaning", title="Extension field for ``orderMeaning``."
@@ -2491,6 +2630,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     path__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -2519,6 +2659,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2546,6 +2687,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2573,6 +2715,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2600,6 +2743,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2627,6 +2771,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2659,6 +2804,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2689,6 +2835,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2721,6 +2868,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2751,6 +2899,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2778,6 +2927,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2805,6 +2955,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2832,6 +2983,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2859,6 +3011,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2886,6 +3039,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2913,6 +3067,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2940,6 +3095,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2967,6 +3123,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2997,6 +3154,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3027,6 +3185,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3057,6 +3216,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3084,6 +3244,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3111,6 +3272,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3138,6 +3300,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3165,6 +3328,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3192,6 +3356,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3222,6 +3387,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3249,6 +3415,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3279,6 +3446,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3309,6 +3477,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3339,6 +3508,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3366,6 +3536,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3396,6 +3567,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3423,6 +3595,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3450,6 +3623,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3482,6 +3656,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3509,6 +3684,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3536,6 +3712,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3563,6 +3740,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3590,6 +3768,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3617,6 +3796,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3644,6 +3824,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3671,6 +3852,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3698,6 +3880,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3728,6 +3911,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3758,6 +3942,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3785,6 +3970,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3812,6 +3998,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3844,6 +4031,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3874,6 +4062,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3904,6 +4093,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3931,6 +4121,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3949,6 +4140,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["xmlAttr", "xmlText", "typeAttr", "cdaText", "xhtml"],
@@ -3971,6 +4163,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     requirements__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_requirements", title="Extension field for ``requirements``."
@@ -3986,6 +4179,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     short__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_short", title="Extension field for ``short``."
@@ -4007,6 +4201,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     sliceIsConstraining__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -4026,6 +4221,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     sliceName__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_sliceName", title="Extension field for ``sliceName``."
@@ -4047,6 +4243,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     type: typing.List[fhirtypes.ElementDefinitionTypeType] = Field(
@@ -4059,6 +4256,7 @@ class ElementDefinition(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -4273,285 +4471,6 @@ class ElementDefinition(backboneelement.BackboneElement):
             "mapping",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_1926(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("path", "path__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_one_of_many_1926(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/formats.html#choice
-        A few elements have a choice of more than one data type for their content.
-        All such elements have a name that takes the form nnn[x].
-        The "nnn" part of the name is constant, and the "[x]" is replaced with
-        the title-cased name of the type that is actually used.
-        The table view shows each of these names explicitly.
-
-        Elements that have a choice of data type cannot repeat - they must have a
-        maximum cardinality of 1. When constructing an instance of an element with a
-        choice of types, the authoring system must create a single element with a
-        data type chosen from among the list of permitted data types.
-        """
-        one_of_many_fields = {
-            "defaultValue": [
-                "defaultValueAddress",
-                "defaultValueAge",
-                "defaultValueAnnotation",
-                "defaultValueAttachment",
-                "defaultValueBase64Binary",
-                "defaultValueBoolean",
-                "defaultValueCanonical",
-                "defaultValueCode",
-                "defaultValueCodeableConcept",
-                "defaultValueCodeableReference",
-                "defaultValueCoding",
-                "defaultValueContactDetail",
-                "defaultValueContactPoint",
-                "defaultValueContributor",
-                "defaultValueCount",
-                "defaultValueDataRequirement",
-                "defaultValueDate",
-                "defaultValueDateTime",
-                "defaultValueDecimal",
-                "defaultValueDistance",
-                "defaultValueDosage",
-                "defaultValueDuration",
-                "defaultValueExpression",
-                "defaultValueHumanName",
-                "defaultValueId",
-                "defaultValueIdentifier",
-                "defaultValueInstant",
-                "defaultValueInteger",
-                "defaultValueMarkdown",
-                "defaultValueMoney",
-                "defaultValueOid",
-                "defaultValueParameterDefinition",
-                "defaultValuePeriod",
-                "defaultValuePositiveInt",
-                "defaultValueQuantity",
-                "defaultValueRange",
-                "defaultValueRatio",
-                "defaultValueRatioRange",
-                "defaultValueReference",
-                "defaultValueRelatedArtifact",
-                "defaultValueSampledData",
-                "defaultValueSignature",
-                "defaultValueString",
-                "defaultValueTime",
-                "defaultValueTiming",
-                "defaultValueTriggerDefinition",
-                "defaultValueUnsignedInt",
-                "defaultValueUri",
-                "defaultValueUrl",
-                "defaultValueUsageContext",
-                "defaultValueUuid",
-            ],
-            "fixed": [
-                "fixedAddress",
-                "fixedAge",
-                "fixedAnnotation",
-                "fixedAttachment",
-                "fixedBase64Binary",
-                "fixedBoolean",
-                "fixedCanonical",
-                "fixedCode",
-                "fixedCodeableConcept",
-                "fixedCodeableReference",
-                "fixedCoding",
-                "fixedContactDetail",
-                "fixedContactPoint",
-                "fixedContributor",
-                "fixedCount",
-                "fixedDataRequirement",
-                "fixedDate",
-                "fixedDateTime",
-                "fixedDecimal",
-                "fixedDistance",
-                "fixedDosage",
-                "fixedDuration",
-                "fixedExpression",
-                "fixedHumanName",
-                "fixedId",
-                "fixedIdentifier",
-                "fixedInstant",
-                "fixedInteger",
-                "fixedMarkdown",
-                "fixedMoney",
-                "fixedOid",
-                "fixedParameterDefinition",
-                "fixedPeriod",
-                "fixedPositiveInt",
-                "fixedQuantity",
-                "fixedRange",
-                "fixedRatio",
-                "fixedRatioRange",
-                "fixedReference",
-                "fixedRelatedArtifact",
-                "fixedSampledData",
-                "fixedSignature",
-                "fixedString",
-                "fixedTime",
-                "fixedTiming",
-                "fixedTriggerDefinition",
-                "fixedUnsignedInt",
-                "fixedUri",
-                "fixedUrl",
-                "fixedUsageContext",
-                "fixedUuid",
-            ],
-            "maxValue": [
-                "maxValueDate",
-                "maxValueDateTime",
-                "maxValueDecimal",
-                "maxValueInstant",
-                "maxValueInteger",
-                "maxValuePositiveInt",
-                "maxValueQuantity",
-                "maxValueTime",
-                "maxValueUnsignedInt",
-            ],
-            "minValue": [
-                "minValueDate",
-                "minValueDateTime",
-                "minValueDecimal",
-                "minValueInstant",
-                "minValueInteger",
-                "minValuePositiveInt",
-                "minValueQuantity",
-                "minValueTime",
-                "minValueUnsignedInt",
-            ],
-            "pattern": [
-                "patternAddress",
-                "patternAge",
-                "patternAnnotation",
-                "patternAttachment",
-                "patternBase64Binary",
-                "patternBoolean",
-                "patternCanonical",
-                "patternCode",
-                "patternCodeableConcept",
-                "patternCodeableReference",
-                "patternCoding",
-                "patternContactDetail",
-                "patternContactPoint",
-                "patternContributor",
-                "patternCount",
-                "patternDataRequirement",
-                "patternDate",
-                "patternDateTime",
-                "patternDecimal",
-                "patternDistance",
-                "patternDosage",
-                "patternDuration",
-                "patternExpression",
-                "patternHumanName",
-                "patternId",
-                "patternIdentifier",
-                "patternInstant",
-                "patternInteger",
-                "patternMarkdown",
-                "patternMoney",
-                "patternOid",
-                "patternParameterDefinition",
-                "patternPeriod",
-                "patternPositiveInt",
-                "patternQuantity",
-                "patternRange",
-                "patternRatio",
-                "patternRatioRange",
-                "patternReference",
-                "patternRelatedArtifact",
-                "patternSampledData",
-                "patternSignature",
-                "patternString",
-                "patternTime",
-                "patternTiming",
-                "patternTriggerDefinition",
-                "patternUnsignedInt",
-                "patternUri",
-                "patternUrl",
-                "patternUsageContext",
-                "patternUuid",
-            ],
-        }
-        for prefix, fields in one_of_many_fields.items():
-            assert cls.__fields__[fields[0]].field_info.extra["one_of_many"] == prefix
-            required = (
-                cls.__fields__[fields[0]].field_info.extra["one_of_many_required"]
-                is True
-            )
-            found = False
-            for field in fields:
-                if field in values and values[field] is not None:
-                    if found is True:
-                        raise ValueError(
-                            "Any of one field value is expected from "
-                            f"this list {fields}, but got multiple!"
-                        )
-                    else:
-                        found = True
-            if required is True and found is False:
-                raise ValueError(f"Expect any of field value from this list {fields}.")
-
-        return values
-
 
 class ElementDefinitionBase(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -4578,6 +4497,7 @@ class ElementDefinitionBase(element.Element):
         description="Maximum cardinality of the base element identified by the path.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     max__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -4591,6 +4511,7 @@ class ElementDefinitionBase(element.Element):
         description="Minimum cardinality of the base element identified by the path.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     min__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -4610,6 +4531,7 @@ class ElementDefinitionBase(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     path__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -4624,69 +4546,6 @@ class ElementDefinitionBase(element.Element):
         """
         return ["id", "extension", "path", "min", "max"]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2296(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [
-            ("max", "max__ext"),
-            ("min", "min__ext"),
-            ("path", "path__ext"),
-        ]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class ElementDefinitionBinding(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -4707,6 +4566,7 @@ class ElementDefinitionBinding(element.Element):
         description="Describes the intended use of this particular set of codes.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     description__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_description", title="Extension field for ``description``."
@@ -4723,6 +4583,7 @@ class ElementDefinitionBinding(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -4742,6 +4603,7 @@ class ElementDefinitionBinding(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["ValueSet"],
     )
@@ -4757,65 +4619,6 @@ class ElementDefinitionBinding(element.Element):
         """
         return ["id", "extension", "strength", "description", "valueSet"]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2618(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("strength", "strength__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class ElementDefinitionConstraint(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -4839,6 +4642,7 @@ class ElementDefinitionConstraint(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     expression__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_expression", title="Extension field for ``expression``."
@@ -4854,6 +4658,7 @@ class ElementDefinitionConstraint(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     human__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -4871,6 +4676,7 @@ class ElementDefinitionConstraint(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     key__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -4884,6 +4690,7 @@ class ElementDefinitionConstraint(element.Element):
         description="Description of why this constraint is necessary or appropriate.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     requirements__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_requirements", title="Extension field for ``requirements``."
@@ -4899,6 +4706,7 @@ class ElementDefinitionConstraint(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -4918,6 +4726,7 @@ class ElementDefinitionConstraint(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["StructureDefinition"],
     )
@@ -4935,6 +4744,7 @@ class ElementDefinitionConstraint(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     xpath__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_xpath", title="Extension field for ``xpath``."
@@ -4958,69 +4768,6 @@ class ElementDefinitionConstraint(element.Element):
             "source",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2993(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [
-            ("human", "human__ext"),
-            ("key", "key__ext"),
-            ("severity", "severity__ext"),
-        ]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class ElementDefinitionExample(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -5041,6 +4788,7 @@ class ElementDefinitionExample(element.Element):
         description="Describes the purpose of this example amoung the set of examples.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     label__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -5057,6 +4805,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5072,6 +4821,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5087,6 +4837,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5102,6 +4853,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5117,6 +4869,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5137,6 +4890,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5155,6 +4909,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5173,6 +4928,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5191,6 +4947,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5206,6 +4963,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5221,6 +4979,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5236,6 +4995,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5251,6 +5011,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5266,6 +5027,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5281,6 +5043,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5296,6 +5059,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5311,6 +5075,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5329,6 +5094,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5347,6 +5113,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5365,6 +5132,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5380,6 +5148,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5395,6 +5164,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5410,6 +5180,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5425,6 +5196,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5440,6 +5212,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5458,6 +5231,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5473,6 +5247,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5491,6 +5266,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5509,6 +5285,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5527,6 +5304,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5542,6 +5320,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5560,6 +5339,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5575,6 +5355,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5590,6 +5371,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5610,6 +5392,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5625,6 +5408,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5640,6 +5424,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5655,6 +5440,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5670,6 +5456,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5685,6 +5472,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5700,6 +5488,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5715,6 +5504,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5730,6 +5520,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5748,6 +5539,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5766,6 +5558,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5781,6 +5574,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5796,6 +5590,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5816,6 +5611,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5834,6 +5630,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5852,6 +5649,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5867,6 +5665,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5938,157 +5737,6 @@ class ElementDefinitionExample(element.Element):
             "valueDosage",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2633(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("label", "label__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_one_of_many_2633(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/formats.html#choice
-        A few elements have a choice of more than one data type for their content.
-        All such elements have a name that takes the form nnn[x].
-        The "nnn" part of the name is constant, and the "[x]" is replaced with
-        the title-cased name of the type that is actually used.
-        The table view shows each of these names explicitly.
-
-        Elements that have a choice of data type cannot repeat - they must have a
-        maximum cardinality of 1. When constructing an instance of an element with a
-        choice of types, the authoring system must create a single element with a
-        data type chosen from among the list of permitted data types.
-        """
-        one_of_many_fields = {
-            "value": [
-                "valueAddress",
-                "valueAge",
-                "valueAnnotation",
-                "valueAttachment",
-                "valueBase64Binary",
-                "valueBoolean",
-                "valueCanonical",
-                "valueCode",
-                "valueCodeableConcept",
-                "valueCodeableReference",
-                "valueCoding",
-                "valueContactDetail",
-                "valueContactPoint",
-                "valueContributor",
-                "valueCount",
-                "valueDataRequirement",
-                "valueDate",
-                "valueDateTime",
-                "valueDecimal",
-                "valueDistance",
-                "valueDosage",
-                "valueDuration",
-                "valueExpression",
-                "valueHumanName",
-                "valueId",
-                "valueIdentifier",
-                "valueInstant",
-                "valueInteger",
-                "valueMarkdown",
-                "valueMoney",
-                "valueOid",
-                "valueParameterDefinition",
-                "valuePeriod",
-                "valuePositiveInt",
-                "valueQuantity",
-                "valueRange",
-                "valueRatio",
-                "valueRatioRange",
-                "valueReference",
-                "valueRelatedArtifact",
-                "valueSampledData",
-                "valueSignature",
-                "valueString",
-                "valueTime",
-                "valueTiming",
-                "valueTriggerDefinition",
-                "valueUnsignedInt",
-                "valueUri",
-                "valueUrl",
-                "valueUsageContext",
-                "valueUuid",
-            ]
-        }
-        for prefix, fields in one_of_many_fields.items():
-            assert cls.__fields__[fields[0]].field_info.extra["one_of_many"] == prefix
-            required = (
-                cls.__fields__[fields[0]].field_info.extra["one_of_many_required"]
-                is True
-            )
-            found = False
-            for field in fields:
-                if field in values and values[field] is not None:
-                    if found is True:
-                        raise ValueError(
-                            "Any of one field value is expected from "
-                            f"this list {fields}, but got multiple!"
-                        )
-                    else:
-                        found = True
-            if required is True and found is False:
-                raise ValueError(f"Expect any of field value from this list {fields}.")
-
-        return values
-
 
 class ElementDefinitionMapping(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -6109,6 +5757,7 @@ class ElementDefinitionMapping(element.Element):
         description="Comments that provide information about the mapping or its use.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     comment__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_comment", title="Extension field for ``comment``."
@@ -6121,6 +5770,7 @@ class ElementDefinitionMapping(element.Element):
         description="An internal reference to the definition of a mapping.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     identity__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -6134,6 +5784,7 @@ class ElementDefinitionMapping(element.Element):
         description="Identifies the computable language in which mapping.map is expressed.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     language__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_language", title="Extension field for ``language``."
@@ -6149,6 +5800,7 @@ class ElementDefinitionMapping(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     map__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -6163,65 +5815,6 @@ class ElementDefinitionMapping(element.Element):
         """
         return ["id", "extension", "identity", "language", "map", "comment"]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2635(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("identity", "identity__ext"), ("map", "map__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class ElementDefinitionSlicing(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -6252,6 +5845,7 @@ class ElementDefinitionSlicing(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     description__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_description", title="Extension field for ``description``."
@@ -6272,6 +5866,7 @@ class ElementDefinitionSlicing(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     ordered: bool = Field(
@@ -6284,6 +5879,7 @@ class ElementDefinitionSlicing(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     ordered__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_ordered", title="Extension field for ``ordered``."
@@ -6300,6 +5896,7 @@ class ElementDefinitionSlicing(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -6317,65 +5914,6 @@ class ElementDefinitionSlicing(element.Element):
         """
         return ["id", "extension", "discriminator", "description", "ordered", "rules"]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2632(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("rules", "rules__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class ElementDefinitionSlicingDiscriminator(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -6403,6 +5941,7 @@ class ElementDefinitionSlicingDiscriminator(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     path__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -6416,6 +5955,7 @@ class ElementDefinitionSlicingDiscriminator(element.Element):
         description="How the element value is interpreted when discrimination is evaluated.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -6433,65 +5973,6 @@ class ElementDefinitionSlicingDiscriminator(element.Element):
         """
         return ["id", "extension", "type", "path"]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_4011(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("path", "path__ext"), ("type", "type__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class ElementDefinitionType(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -6516,6 +5997,7 @@ class ElementDefinitionType(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["contained", "referenced", "bundled"],
@@ -6537,6 +6019,7 @@ class ElementDefinitionType(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     code__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -6558,6 +6041,7 @@ class ElementDefinitionType(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["StructureDefinition", "ImplementationGuide"],
     )
@@ -6585,6 +6069,7 @@ class ElementDefinitionType(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["StructureDefinition", "ImplementationGuide"],
     )
@@ -6604,6 +6089,7 @@ class ElementDefinitionType(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["either", "independent", "specific"],
@@ -6627,62 +6113,3 @@ class ElementDefinitionType(element.Element):
             "aggregation",
             "versioning",
         ]
-
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2335(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("code", "code__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
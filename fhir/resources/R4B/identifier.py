@@ -30,6 +30,7 @@ class Identifier(element.Element):
         description="Organization that issued/manages the identifier.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Organization"],
     )
@@ -41,6 +42,7 @@ class Identifier(element.Element):
         description="Time period during which identifier is/was valid for use.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     system: fhirtypes.Uri = Field(
@@ -53,6 +55,7 @@ class Identifier(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     system__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_system", title="Extension field for ``system``."
@@ -68,6 +71,7 @@ class Identifier(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     use: fhirtypes.Code = Field(
@@ -77,6 +81,7 @@ class Identifier(element.Element):
         description="The purpose of this identifier.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["usual", "official", "temp", "secondary", "old"],
@@ -95,6 +100,7 @@ class Identifier(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     value__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_value", title="Extension field for ``value``."
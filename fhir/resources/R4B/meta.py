@@ -33,6 +33,7 @@ class Meta(element.Element):
         description="When the resource last changed - e.g. when the version changed.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     lastUpdated__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_lastUpdated", title="Extension field for ``lastUpdated``."
@@ -51,6 +52,7 @@ class Meta(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["StructureDefinition"],
     )
@@ -68,6 +70,7 @@ class Meta(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     source: fhirtypes.Uri = Field(
@@ -83,6 +86,7 @@ class Meta(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     source__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_source", title="Extension field for ``source``."
@@ -100,6 +104,7 @@ class Meta(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     versionId: fhirtypes.Id = Field(
@@ -113,6 +118,7 @@ class Meta(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     versionId__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_versionId", title="Extension field for ``versionId``."
@@ -8,9 +8,7 @@ Last updated: 2022-05-28T12:47:40.239+10:00
 """
 import typing
 
-from pydantic import Field, root_validator
-from pydantic.error_wrappers import ErrorWrapper, ValidationError
-from pydantic.errors import MissingError, NoneIsNotAllowedError
+from pydantic import Field
 
 from . import backboneelement, domainresource, fhirtypes
 
@@ -41,6 +39,7 @@ class MolecularSequence(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     coordinateSystem__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -56,6 +55,7 @@ class MolecularSequence(domainresource.DomainResource):
         description="The method for sequencing, for example, chip information.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Device"],
     )
@@ -70,6 +70,7 @@ class MolecularSequence(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     observedSeq: fhirtypes.String = Field(
@@ -83,6 +84,7 @@ class MolecularSequence(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     observedSeq__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_observedSeq", title="Extension field for ``observedSeq``."
@@ -95,6 +97,7 @@ class MolecularSequence(domainresource.DomainResource):
         description="The patient whose sequencing results are described by this resource.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Patient"],
     )
@@ -106,6 +109,7 @@ class MolecularSequence(domainresource.DomainResource):
         description="The organization or lab that should be responsible for this result.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Organization"],
     )
@@ -117,6 +121,7 @@ class MolecularSequence(domainresource.DomainResource):
         description="Pointer to next atomic sequence which at most contains one variant.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["MolecularSequence"],
     )
@@ -133,6 +138,7 @@ class MolecularSequence(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     quantity: fhirtypes.QuantityType = Field(
@@ -142,6 +148,7 @@ class MolecularSequence(domainresource.DomainResource):
         description="The number of copies of the sequence of interest. (RNASeq).",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     readCoverage: fhirtypes.Integer = Field(
@@ -157,6 +164,7 @@ class MolecularSequence(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     readCoverage__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_readCoverage", title="Extension field for ``readCoverage``."
@@ -172,6 +180,7 @@ class MolecularSequence(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     repository: typing.List[fhirtypes.MolecularSequenceRepositoryType] = Field(
@@ -187,6 +196,7 @@ class MolecularSequence(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     specimen: fhirtypes.ReferenceType = Field(
@@ -196,6 +206,7 @@ class MolecularSequence(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Specimen"],
     )
@@ -209,6 +220,7 @@ class MolecularSequence(domainresource.DomainResource):
         description="Information about chromosome structure variation.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     type: fhirtypes.Code = Field(
@@ -218,6 +230,7 @@ class MolecularSequence(domainresource.DomainResource):
         description="Amino Acid Sequence/ DNA Sequence / RNA Sequence.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["aa", "dna", "rna"],
@@ -239,6 +252,7 @@ class MolecularSequence(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -274,65 +288,6 @@ class MolecularSequence(domainresource.DomainResource):
             "structureVariant",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_1935(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("coordinateSystem", "coordinateSystem__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class MolecularSequenceQuality(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -359,6 +314,7 @@ class MolecularSequenceQuality(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     end__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_end", title="Extension field for ``end``."
@@ -374,6 +330,7 @@ class MolecularSequenceQuality(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     fScore__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_fScore", title="Extension field for ``fScore``."
@@ -393,6 +350,7 @@ class MolecularSequenceQuality(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     gtFP__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_gtFP", title="Extension field for ``gtFP``."
@@ -405,6 +363,7 @@ class MolecularSequenceQuality(backboneelement.BackboneElement):
         description="Which method is used to get sequence quality.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     precision: fhirtypes.Decimal = Field(
@@ -414,6 +373,7 @@ class MolecularSequenceQuality(backboneelement.BackboneElement):
         description="QUERY.TP / (QUERY.TP + QUERY.FP).",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     precision__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_precision", title="Extension field for ``precision``."
@@ -431,6 +391,7 @@ class MolecularSequenceQuality(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     queryFP__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_queryFP", title="Extension field for ``queryFP``."
@@ -449,6 +410,7 @@ class MolecularSequenceQuality(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     queryTP__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_queryTP", title="Extension field for ``queryTP``."
@@ -461,6 +423,7 @@ class MolecularSequenceQuality(backboneelement.BackboneElement):
         description="TRUTH.TP / (TRUTH.TP + TRUTH.FN).",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     recall__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_recall", title="Extension field for ``recall``."
@@ -476,6 +439,7 @@ class MolecularSequenceQuality(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     score: fhirtypes.QuantityType = Field(
@@ -489,6 +453,7 @@ class MolecularSequenceQuality(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     standardSequence: fhirtypes.CodeableConceptType = Field(
@@ -498,6 +463,7 @@ class MolecularSequenceQuality(backboneelement.BackboneElement):
         description="Gold standard sequence used for comparing against.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     start: fhirtypes.Integer = Field(
@@ -510,6 +476,7 @@ class MolecularSequenceQuality(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     start__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_start", title="Extension field for ``start``."
@@ -528,6 +495,7 @@ class MolecularSequenceQuality(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     truthFN__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_truthFN", title="Extension field for ``truthFN``."
@@ -546,6 +514,7 @@ class MolecularSequenceQuality(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     truthTP__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_truthTP", title="Extension field for ``truthTP``."
@@ -558,6 +527,7 @@ class MolecularSequenceQuality(backboneelement.BackboneElement):
         description="INDEL / SNP / Undefined variant.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -594,65 +564,6 @@ class MolecularSequenceQuality(backboneelement.BackboneElement):
             "roc",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2700(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("type", "type__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class MolecularSequenceQualityRoc(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -676,6 +587,7 @@ class MolecularSequenceQualityRoc(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     fMeasure__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -691,6 +603,7 @@ class MolecularSequenceQualityRoc(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     numFN__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -706,6 +619,7 @@ class MolecularSequenceQualityRoc(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     numFP__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -721,6 +635,7 @@ class MolecularSequenceQualityRoc(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     numTP__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -736,6 +651,7 @@ class MolecularSequenceQualityRoc(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     precision__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -751,6 +667,7 @@ class MolecularSequenceQualityRoc(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     score__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -766,6 +683,7 @@ class MolecularSequenceQualityRoc(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     sensitivity__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -815,6 +733,7 @@ class MolecularSequenceReferenceSeq(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     genomeBuild: fhirtypes.String = Field(
@@ -831,6 +750,7 @@ class MolecularSequenceReferenceSeq(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     genomeBuild__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_genomeBuild", title="Extension field for ``genomeBuild``."
@@ -848,6 +768,7 @@ class MolecularSequenceReferenceSeq(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["sense", "antisense"],
@@ -870,6 +791,7 @@ class MolecularSequenceReferenceSeq(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     referenceSeqPointer: fhirtypes.ReferenceType = Field(
@@ -879,6 +801,7 @@ class MolecularSequenceReferenceSeq(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["MolecularSequence"],
     )
@@ -890,6 +813,7 @@ class MolecularSequenceReferenceSeq(backboneelement.BackboneElement):
         description='A string like "ACGT".',
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     referenceSeqString__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -908,6 +832,7 @@ class MolecularSequenceReferenceSeq(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["watson", "crick"],
@@ -928,6 +853,7 @@ class MolecularSequenceReferenceSeq(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     windowEnd__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_windowEnd", title="Extension field for ``windowEnd``."
@@ -944,6 +870,7 @@ class MolecularSequenceReferenceSeq(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     windowStart__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_windowStart", title="Extension field for ``windowStart``."
@@ -995,6 +922,7 @@ class MolecularSequenceRepository(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     datasetId__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_datasetId", title="Extension field for ``datasetId``."
@@ -1010,6 +938,7 @@ class MolecularSequenceRepository(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     name__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_name", title="Extension field for ``name``."
@@ -1022,6 +951,7 @@ class MolecularSequenceRepository(backboneelement.BackboneElement):
         description="Id of the read in this external repository.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     readsetId__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_readsetId", title="Extension field for ``readsetId``."
@@ -1037,6 +967,7 @@ class MolecularSequenceRepository(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -1056,6 +987,7 @@ class MolecularSequenceRepository(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     url__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_url", title="Extension field for ``url``."
@@ -1072,6 +1004,7 @@ class MolecularSequenceRepository(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     variantsetId__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_variantsetId", title="Extension field for ``variantsetId``."
@@ -1095,65 +1028,6 @@ class MolecularSequenceRepository(backboneelement.BackboneElement):
             "readsetId",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_3043(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("type", "type__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class MolecularSequenceStructureVariant(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -1176,6 +1050,7 @@ class MolecularSequenceStructureVariant(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     exact__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_exact", title="Extension field for ``exact``."
@@ -1188,6 +1063,7 @@ class MolecularSequenceStructureVariant(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     length: fhirtypes.Integer = Field(
@@ -1197,6 +1073,7 @@ class MolecularSequenceStructureVariant(backboneelement.BackboneElement):
         description="Length of the variant chromosome.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     length__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_length", title="Extension field for ``length``."
@@ -1209,6 +1086,7 @@ class MolecularSequenceStructureVariant(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     variantType: fhirtypes.CodeableConceptType = Field(
@@ -1218,6 +1096,7 @@ class MolecularSequenceStructureVariant(backboneelement.BackboneElement):
         description="Information about chromosome structure variation DNA change type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -1260,6 +1139,7 @@ class MolecularSequenceStructureVariantInner(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     end__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_end", title="Extension field for ``end``."
@@ -1275,6 +1155,7 @@ class MolecularSequenceStructureVariantInner(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     start__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_start", title="Extension field for ``start``."
@@ -1311,6 +1192,7 @@ class MolecularSequenceStructureVariantOuter(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     end__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_end", title="Extension field for ``end``."
@@ -1326,6 +1208,7 @@ class MolecularSequenceStructureVariantOuter(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     start__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_start", title="Extension field for ``start``."
@@ -1367,6 +1250,7 @@ class MolecularSequenceVariant(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     cigar__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_cigar", title="Extension field for ``cigar``."
@@ -1384,6 +1268,7 @@ class MolecularSequenceVariant(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     end__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_end", title="Extension field for ``end``."
@@ -1404,6 +1289,7 @@ class MolecularSequenceVariant(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     observedAllele__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_observedAllele", title="Extension field for ``observedAllele``."
@@ -1424,6 +1310,7 @@ class MolecularSequenceVariant(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     referenceAllele__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_referenceAllele", title="Extension field for ``referenceAllele``."
@@ -1440,6 +1327,7 @@ class MolecularSequenceVariant(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     start__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_start", title="Extension field for ``start``."
@@ -1452,6 +1340,7 @@ class MolecularSequenceVariant(backboneelement.BackboneElement):
         description="A pointer to an Observation containing variant information.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Observation"],
     )
@@ -28,6 +28,7 @@ class Money(element.Element):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     currency__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_currency", title="Extension field for ``currency``."
@@ -40,6 +41,7 @@ class Money(element.Element):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     value__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_value", title="Extension field for ``value``."
@@ -49,6 +49,7 @@ class ObservationDefinition(domainresource.DomainResource):
         description="A code that classifies the general type of observation.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     code: fhirtypes.CodeableConceptType = Field(
@@ -61,6 +62,7 @@ class ObservationDefinition(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     criticalCodedValueSet: fhirtypes.ReferenceType = Field(
@@ -87,6 +89,7 @@ class ObservationDefinition(domainresource.DomainResource):
         description="A unique identifier assigned to this ObservationDefinition artifact.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     method: fhirtypes.CodeableConceptType = Field(
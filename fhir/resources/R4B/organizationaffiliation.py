@@ -31,6 +31,7 @@ class OrganizationAffiliation(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     active__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_active", title="Extension field for ``active``."
@@ -46,6 +47,7 @@ class OrganizationAffiliation(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     endpoint: typing.List[fhirtypes.ReferenceType] = Field(
@@ -79,6 +81,7 @@ class OrganizationAffiliation(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     location: typing.List[fhirtypes.ReferenceType] = Field(
@@ -88,6 +91,7 @@ class OrganizationAffiliation(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Location"],
     )
@@ -103,6 +107,7 @@ class OrganizationAffiliation(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Organization"],
     )
@@ -117,6 +122,7 @@ class OrganizationAffiliation(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Organization"],
     )
@@ -135,6 +141,7 @@ class OrganizationAffiliation(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Organization"],
     )
@@ -149,6 +156,7 @@ class OrganizationAffiliation(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     specialty: typing.List[fhirtypes.CodeableConceptType] = Field(
@@ -161,6 +169,7 @@ class OrganizationAffiliation(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     telecom: typing.List[fhirtypes.ContactPointType] = Field(
@@ -173,6 +182,7 @@ class OrganizationAffiliation(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -34,6 +34,7 @@ class Period(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     end__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_end", title="Extension field for ``end``."
@@ -46,6 +47,7 @@ class Period(element.Element):
         description="The start of the period. The boundary is inclusive.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     start__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_start", title="Extension field for ``start``."
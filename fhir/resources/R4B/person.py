@@ -32,6 +32,7 @@ class Person(domainresource.DomainResource):
         description="Whether this person's record is in active use.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     active__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_active", title="Extension field for ``active``."
@@ -53,6 +54,7 @@ class Person(domainresource.DomainResource):
         description="The birth date for the person.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     birthDate__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_birthDate", title="Extension field for ``birthDate``."
@@ -65,6 +67,7 @@ class Person(domainresource.DomainResource):
         description="Administrative Gender.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["male", "female", "other", "unknown"],
@@ -98,6 +101,7 @@ class Person(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Organization"],
     )
@@ -109,6 +113,7 @@ class Person(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     photo: fhirtypes.AttachmentType = Field(
@@ -133,6 +138,7 @@ class Person(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
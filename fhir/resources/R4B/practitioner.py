@@ -33,6 +33,7 @@ class Practitioner(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     active__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_active", title="Extension field for ``active``."
@@ -52,6 +53,7 @@ class Practitioner(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     birthDate: fhirtypes.Date = Field(
@@ -61,6 +63,7 @@ class Practitioner(domainresource.DomainResource):
         description="The date of birth for the practitioner.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     birthDate__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_birthDate", title="Extension field for ``birthDate``."
@@ -85,6 +88,7 @@ class Practitioner(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["male", "female", "other", "unknown"],
@@ -100,6 +104,7 @@ class Practitioner(domainresource.DomainResource):
         description="An identifier that applies to this person in this role.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     name: typing.List[fhirtypes.HumanNameType] = Field(
@@ -109,6 +114,7 @@ class Practitioner(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     photo: typing.List[fhirtypes.AttachmentType] = Field(
@@ -147,6 +153,7 @@ class Practitioner(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -36,6 +36,7 @@ class ProdCharacteristic(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     color__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -53,6 +54,7 @@ class ProdCharacteristic(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     externalDiameter: fhirtypes.QuantityType = Field(
@@ -67,6 +69,7 @@ class ProdCharacteristic(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     height: fhirtypes.QuantityType = Field(
@@ -81,6 +84,7 @@ class ProdCharacteristic(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     image: typing.List[fhirtypes.AttachmentType] = Field(
@@ -93,6 +97,7 @@ class ProdCharacteristic(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     imprint: typing.List[typing.Optional[fhirtypes.String]] = Field(
@@ -102,6 +107,7 @@ class ProdCharacteristic(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     imprint__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -119,6 +125,7 @@ class ProdCharacteristic(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     scoring: fhirtypes.CodeableConceptType = Field(
@@ -132,6 +139,7 @@ class ProdCharacteristic(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     shape: fhirtypes.String = Field(
@@ -145,6 +153,7 @@ class ProdCharacteristic(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     shape__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_shape", title="Extension field for ``shape``."
@@ -162,6 +171,7 @@ class ProdCharacteristic(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     width: fhirtypes.QuantityType = Field(
@@ -176,6 +186,7 @@ class ProdCharacteristic(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -31,6 +31,7 @@ class ProductShelfLife(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     period: fhirtypes.QuantityType = Field(
@@ -46,6 +47,7 @@ class ProductShelfLife(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     specialPrecautionsForStorage: typing.List[fhirtypes.CodeableConceptType] = Field(
@@ -59,6 +61,7 @@ class ProductShelfLife(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     type: fhirtypes.CodeableConceptType = Field(
@@ -75,6 +78,7 @@ class ProductShelfLife(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
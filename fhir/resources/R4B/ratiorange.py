@@ -29,6 +29,7 @@ class RatioRange(element.Element):
         description="The value of the denominator.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     highNumerator: fhirtypes.QuantityType = Field(
@@ -38,6 +39,7 @@ class RatioRange(element.Element):
         description="The value of the high limit numerator.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     lowNumerator: fhirtypes.QuantityType = Field(
@@ -47,6 +49,7 @@ class RatioRange(element.Element):
         description="The value of the low limit numerator.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -34,6 +34,7 @@ class RelatedPerson(domainresource.DomainResource):
         description="Whether this related person record is in active use.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     active__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_active", title="Extension field for ``active``."
@@ -46,6 +47,7 @@ class RelatedPerson(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     birthDate: fhirtypes.Date = Field(
@@ -55,6 +57,7 @@ class RelatedPerson(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     birthDate__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_birthDate", title="Extension field for ``birthDate``."
@@ -82,6 +85,7 @@ class RelatedPerson(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["male", "female", "other", "unknown"],
@@ -97,6 +101,7 @@ class RelatedPerson(domainresource.DomainResource):
         description="Identifier for a person within a particular scope.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     name: typing.List[fhirtypes.HumanNameType] = Field(
@@ -106,6 +111,7 @@ class RelatedPerson(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     patient: fhirtypes.ReferenceType = Field(
@@ -115,6 +121,7 @@ class RelatedPerson(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Patient"],
     )
@@ -150,6 +157,7 @@ class RelatedPerson(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     telecom: typing.List[fhirtypes.ContactPointType] = Field(
@@ -162,6 +170,7 @@ class RelatedPerson(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
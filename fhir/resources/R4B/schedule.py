@@ -34,6 +34,7 @@ class Schedule(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     active__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_active", title="Extension field for ``active``."
@@ -49,6 +50,7 @@ class Schedule(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=[
             "Patient",
@@ -83,6 +85,7 @@ class Schedule(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     planningHorizon: fhirtypes.PeriodType = Field(
@@ -98,6 +101,7 @@ class Schedule(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     serviceCategory: typing.List[fhirtypes.CodeableConceptType] = Field(
@@ -110,6 +114,7 @@ class Schedule(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     serviceType: typing.List[fhirtypes.CodeableConceptType] = Field(
@@ -119,6 +124,7 @@ class Schedule(domainresource.DomainResource):
         description="The specific service that is to be performed during this appointment.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     specialty: typing.List[fhirtypes.CodeableConceptType] = Field(
@@ -131,6 +137,7 @@ class Schedule(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
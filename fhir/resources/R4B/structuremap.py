@@ -8,9 +8,7 @@ Last updated: 2022-05-28T12:47:40.239+10:00
 """
 import typing
 
-from pydantic import Field, root_validator
-from pydantic.error_wrappers import ErrorWrapper, ValidationError
-from pydantic.errors import MissingError, NoneIsNotAllowedError
+from pydantic import Field
 
 from . import backboneelement, domainresource, fhirtypes
 
@@ -36,6 +34,7 @@ class StructureMap(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     copyright: fhirtypes.Markdown = Field(
@@ -66,6 +65,7 @@ class StructureMap(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     date__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_date", title="Extension field for ``date``."
@@ -97,6 +97,7 @@ class StructureMap(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     experimental__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_experimental", title="Extension field for ``experimental``."
@@ -112,6 +113,7 @@ class StructureMap(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     identifier: typing.List[fhirtypes.IdentifierType] = Field(
@@ -125,6 +127,7 @@ class StructureMap(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     import_fhir: typing.List[typing.Optional[fhirtypes.Canonical]] = Field(
@@ -134,6 +137,7 @@ class StructureMap(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["StructureMap"],
     )
@@ -151,6 +155,7 @@ class StructureMap(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     name: fhirtypes.String = Field(
@@ -164,6 +169,7 @@ class StructureMap(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     name__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -180,6 +186,7 @@ class StructureMap(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     publisher__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_publisher", title="Extension field for ``publisher``."
@@ -210,6 +217,7 @@ class StructureMap(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -230,6 +238,7 @@ class StructureMap(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     title: fhirtypes.String = Field(
@@ -239,6 +248,7 @@ class StructureMap(domainresource.DomainResource):
         description="A short, descriptive, user-friendly title for the structure map.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     title__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_title", title="Extension field for ``title``."
@@ -262,6 +272,7 @@ class StructureMap(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     url__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -281,6 +292,7 @@ class StructureMap(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     version: fhirtypes.String = Field(
@@ -298,6 +310,7 @@ class StructureMap(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     version__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_version", title="Extension field for ``version``."
@@ -338,69 +351,6 @@ class StructureMap(domainresource.DomainResource):
             "group",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_1458(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [
-            ("name", "name__ext"),
-            ("status", "status__ext"),
-            ("url", "url__ext"),
-        ]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class StructureMapGroup(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -424,6 +374,7 @@ class StructureMapGroup(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     documentation__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_documentation", title="Extension field for ``documentation``."
@@ -436,6 +387,7 @@ class StructureMapGroup(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     extends__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_extends", title="Extension field for ``extends``."
@@ -451,6 +403,7 @@ class StructureMapGroup(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     name: fhirtypes.Id = Field(
@@ -460,6 +413,7 @@ class StructureMapGroup(backboneelement.BackboneElement):
         description="A unique name for the group for the convenience of human readers.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     name__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -473,6 +427,7 @@ class StructureMapGroup(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     typeMode: fhirtypes.Code = Field(
@@ -485,6 +440,7 @@ class StructureMapGroup(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -512,65 +468,6 @@ class StructureMapGroup(backboneelement.BackboneElement):
             "rule",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_1983(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("name", "name__ext"), ("typeMode", "typeMode__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class StructureMapGroupInput(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -603,6 +500,7 @@ class StructureMapGroupInput(backboneelement.BackboneElement):
         description="Mode for this instance of data.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -619,6 +517,7 @@ class StructureMapGroupInput(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     name__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -632,6 +531,7 @@ class StructureMapGroupInput(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     type__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_type", title="Extension field for ``type``."
@@ -653,65 +553,6 @@ class StructureMapGroupInput(backboneelement.BackboneElement):
             "documentation",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2515(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("mode", "mode__ext"), ("name", "name__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class StructureMapGroupRule(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -730,6 +571,7 @@ class StructureMapGroupRule(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     documentation: fhirtypes.String = Field(
@@ -751,6 +593,7 @@ class StructureMapGroupRule(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     name__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -764,6 +607,7 @@ class StructureMapGroupRule(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     source: typing.List[fhirtypes.StructureMapGroupRuleSourceType] = Field(
@@ -773,6 +617,7 @@ class StructureMapGroupRule(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     target: typing.List[fhirtypes.StructureMapGroupRuleTargetType] = Field(
@@ -782,6 +627,7 @@ class StructureMapGroupRule(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -802,65 +648,6 @@ class StructureMapGroupRule(backboneelement.BackboneElement):
             "documentation",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2380(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("name", "name__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class StructureMapGroupRuleDependent(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -879,6 +666,7 @@ class StructureMapGroupRuleDependent(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     name__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -892,6 +680,7 @@ class StructureMapGroupRuleDependent(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     variable__ext: typing.List[
@@ -906,65 +695,6 @@ class StructureMapGroupRuleDependent(backboneelement.BackboneElement):
         """
         return ["id", "extension", "modifierExtension", "name", "variable"]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_3314(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("name", "name__ext"), ("variable", "variable__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class StructureMapGroupRuleSource(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -986,6 +716,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     check__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_check", title="Extension field for ``check``."
@@ -998,6 +729,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     condition__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_condition", title="Extension field for ``condition``."
@@ -1010,6 +742,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     context__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -1023,6 +756,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1035,6 +769,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1047,6 +782,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1059,6 +795,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1071,6 +808,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1088,6 +826,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1105,6 +844,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1122,6 +862,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1139,6 +880,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1151,6 +893,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1163,6 +906,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1175,6 +919,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1187,6 +932,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1199,6 +945,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1211,6 +958,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1223,6 +971,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1240,6 +989,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1257,6 +1007,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1274,6 +1025,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1286,6 +1038,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1298,6 +1051,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1310,6 +1064,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1322,6 +1077,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1334,6 +1090,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1349,6 +1106,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1361,6 +1119,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1378,6 +1137,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1395,6 +1155,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1412,6 +1173,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1424,6 +1186,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1436,6 +1199,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1451,6 +1215,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1463,6 +1228,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1475,6 +1241,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1492,6 +1259,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1504,6 +1272,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1516,6 +1285,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1528,6 +1298,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1540,6 +1311,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1552,6 +1324,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1564,6 +1337,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1576,6 +1350,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1593,6 +1368,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1610,6 +1386,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1622,6 +1399,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1634,6 +1412,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1651,6 +1430,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1666,6 +1446,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1681,6 +1462,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1693,6 +1475,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="A value to use if there is no existing value in the source object.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1710,6 +1493,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     element__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_element", title="Extension field for ``element``."
@@ -1722,6 +1506,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description="How to handle the list mode for this element.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["first", "not_first", "last", "not_last", "only_one"],
@@ -1740,6 +1525,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     logMessage__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_logMessage", title="Extension field for ``logMessage``."
@@ -1756,6 +1542,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     max__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_max", title="Extension field for ``max``."
@@ -1771,6 +1558,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     min__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_min", title="Extension field for ``min``."
@@ -1786,6 +1574,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     type__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_type", title="Extension field for ``type``."
@@ -1798,6 +1587,7 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     variable__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_variable", title="Extension field for ``variable``."
@@ -1875,156 +1665,6 @@ class StructureMapGroupRuleSource(backboneelement.BackboneElement):
             "logMessage",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_3005(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("context", "context__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_one_of_many_3005(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/formats.html#choice
-        A few elements have a choice of more than one data type for their content.
-        All such elements have a name that takes the form nnn[x].
-        The "nnn" part of the name is constant, and the "[x]" is replaced with
-        the title-cased name of the type that is actually used.
-        The table view shows each of these names explicitly.
-
-        Elements that have a choice of data type cannot repeat - they must have a
-        maximum cardinality of 1. When constructing an instance of an element with a
-        choice of types, the authoring system must create a single element with a
-        data type chosen from among the list of permitted data types.
-        """
-        one_of_many_fields = {
-            "defaultValue": [
-                "defaultValueAddress",
-                "defaultValueAge",
-                "defaultValueAnnotation",
-                "defaultValueAttachment",
-                "defaultValueBase64Binary",
-                "defaultValueBoolean",
-                "defaultValueCanonical",
-                "defaultValueCode",
-                "defaultValueCodeableConcept",
-                "defaultValueCoding",
-                "defaultValueContactDetail",
-                "defaultValueContactPoint",
-                "defaultValueContributor",
-                "defaultValueCount",
-                "defaultValueDataRequirement",
-                "defaultValueDate",
-                "defaultValueDateTime",
-                "defaultValueDecimal",
-                "defaultValueDistance",
-                "defaultValueDosage",
-                "defaultValueDuration",
-                "defaultValueExpression",
-                "defaultValueHumanName",
-                "defaultValueId",
-                "defaultValueIdentifier",
-                "defaultValueInstant",
-                "defaultValueInteger",
-                "defaultValueMarkdown",
-                "defaultValueMeta",
-                "defaultValueMoney",
-                "defaultValueOid",
-                "defaultValueParameterDefinition",
-                "defaultValuePeriod",
-                "defaultValuePositiveInt",
-                "defaultValueQuantity",
-                "defaultValueRange",
-                "defaultValueRatio",
-                "defaultValueReference",
-                "defaultValueRelatedArtifact",
-                "defaultValueSampledData",
-                "defaultValueSignature",
-                "defaultValueString",
-                "defaultValueTime",
-                "defaultValueTiming",
-                "defaultValueTriggerDefinition",
-                "defaultValueUnsignedInt",
-                "defaultValueUri",
-                "defaultValueUrl",
-                "defaultValueUsageContext",
-                "defaultValueUuid",
-            ]
-        }
-        for prefix, fields in one_of_many_fields.items():
-            assert cls.__fields__[fields[0]].field_info.extra["one_of_many"] == prefix
-            required = (
-                cls.__fields__[fields[0]].field_info.extra["one_of_many_required"]
-                is True
-            )
-            found = False
-            for field in fields:
-                if field in values and values[field] is not None:
-                    if found is True:
-                        raise ValueError(
-                            "Any of one field value is expected from "
-                            f"this list {fields}, but got multiple!"
-                        )
-                    else:
-                        found = True
-            if required is True and found is False:
-                raise ValueError(f"Expect any of field value from this list {fields}.")
-
-        return values
-
 
 class StructureMapGroupRuleTarget(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -2043,6 +1683,7 @@ class StructureMapGroupRuleTarget(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     context__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_context", title="Extension field for ``context``."
@@ -2055,6 +1696,7 @@ class StructureMapGroupRuleTarget(backboneelement.BackboneElement):
         description="How to interpret the context.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["type", "variable"],
@@ -2070,6 +1712,7 @@ class StructureMapGroupRuleTarget(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     element__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_element", title="Extension field for ``element``."
@@ -2082,6 +1725,7 @@ class StructureMapGroupRuleTarget(backboneelement.BackboneElement):
         description="If field is a list, how to manage the list.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["first", "share", "last", "collate"],
@@ -2097,6 +1741,7 @@ class StructureMapGroupRuleTarget(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     listRuleId__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_listRuleId", title="Extension field for ``listRuleId``."
@@ -2109,6 +1754,7 @@ class StructureMapGroupRuleTarget(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     transform: fhirtypes.Code = Field(
@@ -2118,6 +1764,7 @@ class StructureMapGroupRuleTarget(backboneelement.BackboneElement):
         description="How the data is copied / created.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["create", "copy", "+"],
@@ -2133,6 +1780,7 @@ class StructureMapGroupRuleTarget(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     variable__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_variable", title="Extension field for ``variable``."
@@ -2176,6 +1824,7 @@ class StructureMapGroupRuleTargetParameter(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -2191,6 +1840,7 @@ class StructureMapGroupRuleTargetParameter(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -2206,6 +1856,7 @@ class StructureMapGroupRuleTargetParameter(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -2221,6 +1872,7 @@ class StructureMapGroupRuleTargetParameter(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -2236,6 +1888,7 @@ class StructureMapGroupRuleTargetParameter(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -2261,52 +1914,6 @@ class StructureMapGroupRuleTargetParameter(backboneelement.BackboneElement):
             "valueDecimal",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_one_of_many_3937(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/formats.html#choice
-        A few elements have a choice of more than one data type for their content.
-        All such elements have a name that takes the form nnn[x].
-        The "nnn" part of the name is constant, and the "[x]" is replaced with
-        the title-cased name of the type that is actually used.
-        The table view shows each of these names explicitly.
-
-        Elements that have a choice of data type cannot repeat - they must have a
-        maximum cardinality of 1. When constructing an instance of an element with a
-        choice of types, the authoring system must create a single element with a
-        data type chosen from among the list of permitted data types.
-        """
-        one_of_many_fields = {
-            "value": [
-                "valueBoolean",
-                "valueDecimal",
-                "valueId",
-                "valueInteger",
-                "valueString",
-            ]
-        }
-        for prefix, fields in one_of_many_fields.items():
-            assert cls.__fields__[fields[0]].field_info.extra["one_of_many"] == prefix
-            required = (
-                cls.__fields__[fields[0]].field_info.extra["one_of_many_required"]
-                is True
-            )
-            found = False
-            for field in fields:
-                if field in values and values[field] is not None:
-                    if found is True:
-                        raise ValueError(
-                            "Any of one field value is expected from "
-                            f"this list {fields}, but got multiple!"
-                        )
-                    else:
-                        found = True
-            if required is True and found is False:
-                raise ValueError(f"Expect any of field value from this list {fields}.")
-
-        return values
-
 
 class StructureMapStructure(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -2327,6 +1934,7 @@ class StructureMapStructure(backboneelement.BackboneElement):
         description="The name used for this type in the map.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     alias__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_alias", title="Extension field for ``alias``."
@@ -2351,6 +1959,7 @@ class StructureMapStructure(backboneelement.BackboneElement):
         description="How the referenced structure is used in this mapping.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -2367,6 +1976,7 @@ class StructureMapStructure(backboneelement.BackboneElement):
         description="The canonical reference to the structure.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["StructureDefinition"],
@@ -2390,62 +2000,3 @@ class StructureMapStructure(backboneelement.BackboneElement):
             "alias",
             "documentation",
         ]
-
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2424(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("mode", "mode__ext"), ("url", "url__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
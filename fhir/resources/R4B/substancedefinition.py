@@ -8,9 +8,7 @@ Last updated: 2022-05-28T12:47:40.239+10:00
 """
 import typing
 
-from pydantic import Field, root_validator
-from pydantic.error_wrappers import ErrorWrapper, ValidationError
-from pydantic.errors import MissingError, NoneIsNotAllowedError
+from pydantic import Field
 
 from . import backboneelement, domainresource, fhirtypes
 
@@ -42,6 +40,7 @@ class SubstanceDefinition(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     code: typing.List[fhirtypes.SubstanceDefinitionCodeType] = Field(
@@ -51,6 +50,7 @@ class SubstanceDefinition(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     description: fhirtypes.Markdown = Field(
@@ -60,6 +60,7 @@ class SubstanceDefinition(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     description__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_description", title="Extension field for ``description``."
@@ -72,6 +73,7 @@ class SubstanceDefinition(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     grade: typing.List[fhirtypes.CodeableConceptType] = Field(
@@ -87,6 +89,7 @@ class SubstanceDefinition(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     identifier: typing.List[fhirtypes.IdentifierType] = Field(
@@ -96,6 +99,7 @@ class SubstanceDefinition(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     informationSource: typing.List[fhirtypes.ReferenceType] = Field(
@@ -105,6 +109,7 @@ class SubstanceDefinition(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Citation"],
     )
@@ -120,6 +125,7 @@ class SubstanceDefinition(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Organization"],
     )
@@ -131,6 +137,7 @@ class SubstanceDefinition(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     molecularWeight: typing.List[
@@ -145,6 +152,7 @@ class SubstanceDefinition(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     name: typing.List[fhirtypes.SubstanceDefinitionNameType] = Field(
@@ -154,6 +162,7 @@ class SubstanceDefinition(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     note: typing.List[fhirtypes.AnnotationType] = Field(
@@ -163,6 +172,7 @@ class SubstanceDefinition(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     property: typing.List[fhirtypes.SubstanceDefinitionPropertyType] = Field(
@@ -172,6 +182,7 @@ class SubstanceDefinition(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     relationship: typing.List[fhirtypes.SubstanceDefinitionRelationshipType] = Field(
@@ -184,6 +195,7 @@ class SubstanceDefinition(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     sourceMaterial: fhirtypes.SubstanceDefinitionSourceMaterialType = Field(
@@ -193,6 +205,7 @@ class SubstanceDefinition(domainresource.DomainResource):
         description="Material or taxonomic/anatomical source for the substance.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     status: fhirtypes.CodeableConceptType = Field(
@@ -202,6 +215,7 @@ class SubstanceDefinition(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     structure: fhirtypes.SubstanceDefinitionStructureType = Field(
@@ -211,6 +225,7 @@ class SubstanceDefinition(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     supplier: typing.List[fhirtypes.ReferenceType] = Field(
@@ -226,6 +241,7 @@ class SubstanceDefinition(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Organization"],
     )
@@ -237,6 +253,7 @@ class SubstanceDefinition(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     version__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_version", title="Extension field for ``version``."
@@ -296,6 +313,7 @@ class SubstanceDefinitionCode(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     note: typing.List[fhirtypes.AnnotationType] = Field(
@@ -305,6 +323,7 @@ class SubstanceDefinitionCode(backboneelement.BackboneElement):
         description="Any comment can be provided in this field, if necessary.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     source: typing.List[fhirtypes.ReferenceType] = Field(
@@ -314,6 +333,7 @@ class SubstanceDefinitionCode(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["DocumentReference"],
     )
@@ -325,6 +345,7 @@ class SubstanceDefinitionCode(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     statusDate: fhirtypes.DateTime = Field(
@@ -337,6 +358,7 @@ class SubstanceDefinitionCode(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     statusDate__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_statusDate", title="Extension field for ``statusDate``."
@@ -377,6 +399,7 @@ class SubstanceDefinitionMoiety(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e amount[x]
         one_of_many="amount",
         one_of_many_required=False,
@@ -389,6 +412,7 @@ class SubstanceDefinitionMoiety(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e amount[x]
         one_of_many="amount",
         one_of_many_required=False,
@@ -404,6 +428,7 @@ class SubstanceDefinitionMoiety(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     measurementType: fhirtypes.CodeableConceptType = Field(
@@ -418,6 +443,7 @@ class SubstanceDefinitionMoiety(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     molecularFormula: fhirtypes.String = Field(
@@ -430,6 +456,7 @@ class SubstanceDefinitionMoiety(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     molecularFormula__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -444,6 +471,7 @@ class SubstanceDefinitionMoiety(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     name__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_name", title="Extension field for ``name``."
@@ -456,6 +484,7 @@ class SubstanceDefinitionMoiety(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     role: fhirtypes.CodeableConceptType = Field(
@@ -465,6 +494,7 @@ class SubstanceDefinitionMoiety(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     stereochemistry: fhirtypes.CodeableConceptType = Field(
@@ -474,6 +504,7 @@ class SubstanceDefinitionMoiety(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -497,44 +528,6 @@ class SubstanceDefinitionMoiety(backboneelement.BackboneElement):
             "measurementType",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_one_of_many_2804(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/formats.html#choice
-        A few elements have a choice of more than one data type for their content.
-        All such elements have a name that takes the form nnn[x].
-        The "nnn" part of the name is constant, and the "[x]" is replaced with
-        the title-cased name of the type that is actually used.
-        The table view shows each of these names explicitly.
-
-        Elements that have a choice of data type cannot repeat - they must have a
-        maximum cardinality of 1. When constructing an instance of an element with a
-        choice of types, the authoring system must create a single element with a
-        data type chosen from among the list of permitted data types.
-        """
-        one_of_many_fields = {"amount": ["amountQuantity", "amountString"]}
-        for prefix, fields in one_of_many_fields.items():
-            assert cls.__fields__[fields[0]].field_info.extra["one_of_many"] == prefix
-            required = (
-                cls.__fields__[fields[0]].field_info.extra["one_of_many_required"]
-                is True
-            )
-            found = False
-            for field in fields:
-                if field in values and values[field] is not None:
-                    if found is True:
-                        raise ValueError(
-                            "Any of one field value is expected from "
-                            f"this list {fields}, but got multiple!"
-                        )
-                    else:
-                        found = True
-            if required is True and found is False:
-                raise ValueError(f"Expect any of field value from this list {fields}.")
-
-        return values
-
 
 class SubstanceDefinitionMolecularWeight(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -560,6 +553,7 @@ class SubstanceDefinitionMolecularWeight(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     method: fhirtypes.CodeableConceptType = Field(
@@ -569,6 +563,7 @@ class SubstanceDefinitionMolecularWeight(backboneelement.BackboneElement):
         description="The method by which the molecular weight was determined.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     type: fhirtypes.CodeableConceptType = Field(
@@ -581,6 +576,7 @@ class SubstanceDefinitionMolecularWeight(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -615,6 +611,7 @@ class SubstanceDefinitionName(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     jurisdiction: typing.List[fhirtypes.CodeableConceptType] = Field(
@@ -624,6 +621,7 @@ class SubstanceDefinitionName(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     language: typing.List[fhirtypes.CodeableConceptType] = Field(
@@ -633,6 +631,7 @@ class SubstanceDefinitionName(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     name: fhirtypes.String = Field(
@@ -642,6 +641,7 @@ class SubstanceDefinitionName(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     name__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -655,6 +655,7 @@ class SubstanceDefinitionName(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     preferred: bool = Field(
@@ -664,6 +665,7 @@ class SubstanceDefinitionName(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     preferred__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_preferred", title="Extension field for ``preferred``."
@@ -676,6 +678,7 @@ class SubstanceDefinitionName(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["DocumentReference"],
     )
@@ -687,6 +690,7 @@ class SubstanceDefinitionName(backboneelement.BackboneElement):
         description="The status of the name, for example 'current', 'proposed'.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     synonym: typing.List[fhirtypes.SubstanceDefinitionNameType] = Field(
@@ -698,6 +702,7 @@ class SubstanceDefinitionName(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     translation: typing.List[fhirtypes.SubstanceDefinitionNameType] = Field(
@@ -707,6 +712,7 @@ class SubstanceDefinitionName(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     type: fhirtypes.CodeableConceptType = Field(
@@ -716,6 +722,7 @@ class SubstanceDefinitionName(backboneelement.BackboneElement):
         description="Name type, for example 'systematic',  'scientific, 'brand'.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -741,65 +748,6 @@ class SubstanceDefinitionName(backboneelement.BackboneElement):
             "source",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2538(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("name", "name__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class SubstanceDefinitionNameOfficial(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -818,6 +766,7 @@ class SubstanceDefinitionNameOfficial(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     date: fhirtypes.DateTime = Field(
@@ -827,6 +776,7 @@ class SubstanceDefinitionNameOfficial(backboneelement.BackboneElement):
         description="Date of the official name change.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     date__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_date", title="Extension field for ``date``."
@@ -842,6 +792,7 @@ class SubstanceDefinitionNameOfficial(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -870,6 +821,7 @@ class SubstanceDefinitionProperty(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     valueAttachment: fhirtypes.AttachmentType = Field(
@@ -879,6 +831,7 @@ class SubstanceDefinitionProperty(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -891,6 +844,7 @@ class SubstanceDefinitionProperty(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -906,6 +860,7 @@ class SubstanceDefinitionProperty(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -918,6 +873,7 @@ class SubstanceDefinitionProperty(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -933,6 +889,7 @@ class SubstanceDefinitionProperty(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -956,52 +913,6 @@ class SubstanceDefinitionProperty(backboneelement.BackboneElement):
             "valueAttachment",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_one_of_many_3042(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/formats.html#choice
-        A few elements have a choice of more than one data type for their content.
-        All such elements have a name that takes the form nnn[x].
-        The "nnn" part of the name is constant, and the "[x]" is replaced with
-        the title-cased name of the type that is actually used.
-        The table view shows each of these names explicitly.
-
-        Elements that have a choice of data type cannot repeat - they must have a
-        maximum cardinality of 1. When constructing an instance of an element with a
-        choice of types, the authoring system must create a single element with a
-        data type chosen from among the list of permitted data types.
-        """
-        one_of_many_fields = {
-            "value": [
-                "valueAttachment",
-                "valueBoolean",
-                "valueCodeableConcept",
-                "valueDate",
-                "valueQuantity",
-            ]
-        }
-        for prefix, fields in one_of_many_fields.items():
-            assert cls.__fields__[fields[0]].field_info.extra["one_of_many"] == prefix
-            required = (
-                cls.__fields__[fields[0]].field_info.extra["one_of_many_required"]
-                is True
-            )
-            found = False
-            for field in fields:
-                if field in values and values[field] is not None:
-                    if found is True:
-                        raise ValueError(
-                            "Any of one field value is expected from "
-                            f"this list {fields}, but got multiple!"
-                        )
-                    else:
-                        found = True
-            if required is True and found is False:
-                raise ValueError(f"Expect any of field value from this list {fields}.")
-
-        return values
-
 
 class SubstanceDefinitionRelationship(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -1029,6 +940,7 @@ class SubstanceDefinitionRelationship(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e amount[x]
         one_of_many="amount",
         one_of_many_required=False,
@@ -1048,6 +960,7 @@ class SubstanceDefinitionRelationship(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e amount[x]
         one_of_many="amount",
         one_of_many_required=False,
@@ -1067,6 +980,7 @@ class SubstanceDefinitionRelationship(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e amount[x]
         one_of_many="amount",
         one_of_many_required=False,
@@ -1085,6 +999,7 @@ class SubstanceDefinitionRelationship(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     isDefining: bool = Field(
@@ -1102,6 +1017,7 @@ class SubstanceDefinitionRelationship(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     isDefining__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_isDefining", title="Extension field for ``isDefining``."
@@ -1114,6 +1030,7 @@ class SubstanceDefinitionRelationship(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     source: typing.List[fhirtypes.ReferenceType] = Field(
@@ -1123,6 +1040,7 @@ class SubstanceDefinitionRelationship(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["DocumentReference"],
     )
@@ -1140,6 +1058,7 @@ class SubstanceDefinitionRelationship(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e substanceDefinition[x]
         one_of_many="substanceDefinition",
         one_of_many_required=False,
@@ -1158,6 +1077,7 @@ class SubstanceDefinitionRelationship(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e substanceDefinition[x]
         one_of_many="substanceDefinition",
         one_of_many_required=False,
@@ -1175,6 +1095,7 @@ class SubstanceDefinitionRelationship(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -1199,50 +1120,6 @@ class SubstanceDefinitionRelationship(backboneelement.BackboneElement):
             "source",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_one_of_many_3430(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/formats.html#choice
-        A few elements have a choice of more than one data type for their content.
-        All such elements have a name that takes the form nnn[x].
-        The "nnn" part of the name is constant, and the "[x]" is replaced with
-        the title-cased name of the type that is actually used.
-        The table view shows each of these names explicitly.
-
-        Elements that have a choice of data type cannot repeat - they must have a
-        maximum cardinality of 1. When constructing an instance of an element with a
-        choice of types, the authoring system must create a single element with a
-        data type chosen from among the list of permitted data types.
-        """
-        one_of_many_fields = {
-            "amount": ["amountQuantity", "amountRatio", "amountString"],
-            "substanceDefinition": [
-                "substanceDefinitionCodeableConcept",
-                "substanceDefinitionReference",
-            ],
-        }
-        for prefix, fields in one_of_many_fields.items():
-            assert cls.__fields__[fields[0]].field_info.extra["one_of_many"] == prefix
-            required = (
-                cls.__fields__[fields[0]].field_info.extra["one_of_many_required"]
-                is True
-            )
-            found = False
-            for field in fields:
-                if field in values and values[field] is not None:
-                    if found is True:
-                        raise ValueError(
-                            "Any of one field value is expected from "
-                            f"this list {fields}, but got multiple!"
-                        )
-                    else:
-                        found = True
-            if required is True and found is False:
-                raise ValueError(f"Expect any of field value from this list {fields}.")
-
-        return values
-
 
 class SubstanceDefinitionSourceMaterial(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -1262,6 +1139,7 @@ class SubstanceDefinitionSourceMaterial(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     genus: fhirtypes.CodeableConceptType = Field(
@@ -1277,6 +1155,7 @@ class SubstanceDefinitionSourceMaterial(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     part: fhirtypes.CodeableConceptType = Field(
@@ -1286,6 +1165,7 @@ class SubstanceDefinitionSourceMaterial(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     species: fhirtypes.CodeableConceptType = Field(
@@ -1301,6 +1181,7 @@ class SubstanceDefinitionSourceMaterial(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     type: fhirtypes.CodeableConceptType = Field(
@@ -1316,6 +1197,7 @@ class SubstanceDefinitionSourceMaterial(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -1353,6 +1235,7 @@ class SubstanceDefinitionStructure(backboneelement.BackboneElement):
         description="Molecular formula of this substance, typically using the Hill system.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     molecularFormula__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -1370,6 +1253,7 @@ class SubstanceDefinitionStructure(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     molecularFormulaByMoiety__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -1387,6 +1271,7 @@ class SubstanceDefinitionStructure(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     opticalActivity: fhirtypes.CodeableConceptType = Field(
@@ -1396,6 +1281,7 @@ class SubstanceDefinitionStructure(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     representation: typing.List[
@@ -1407,6 +1293,7 @@ class SubstanceDefinitionStructure(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     sourceDocument: typing.List[fhirtypes.ReferenceType] = Field(
@@ -1416,6 +1303,7 @@ class SubstanceDefinitionStructure(backboneelement.BackboneElement):
         description="The source of information about the structure.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["DocumentReference"],
     )
@@ -1427,6 +1315,7 @@ class SubstanceDefinitionStructure(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     technique: typing.List[fhirtypes.CodeableConceptType] = Field(
@@ -1440,6 +1329,7 @@ class SubstanceDefinitionStructure(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -1487,6 +1377,7 @@ class SubstanceDefinitionStructureRepresentation(backboneelement.BackboneElement
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["DocumentReference"],
     )
@@ -1505,6 +1396,7 @@ class SubstanceDefinitionStructureRepresentation(backboneelement.BackboneElement
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     representation: fhirtypes.String = Field(
@@ -1517,6 +1409,7 @@ class SubstanceDefinitionStructureRepresentation(backboneelement.BackboneElement
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     representation__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_representation", title="Extension field for ``representation``."
@@ -1529,6 +1422,7 @@ class SubstanceDefinitionStructureRepresentation(backboneelement.BackboneElement
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
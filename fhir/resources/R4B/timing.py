@@ -8,7 +8,7 @@ Last updated: 2022-05-28T12:47:40.239+10:00
 """
 import typing
 
-from pydantic import Field, root_validator
+from pydantic import Field
 
 from . import backboneelement, element, fhirtypes
 
@@ -43,6 +43,7 @@ class Timing(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     event: typing.List[typing.Optional[fhirtypes.DateTime]] = Field(
@@ -52,6 +53,7 @@ class Timing(backboneelement.BackboneElement):
         description="Identifies specific times when the event occurs.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     event__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -64,6 +66,7 @@ class Timing(backboneelement.BackboneElement):
         description="A set of rules that describe when the event is scheduled.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -97,6 +100,7 @@ class TimingRepeat(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e bounds[x]
         one_of_many="bounds",
         one_of_many_required=False,
@@ -113,6 +117,7 @@ class TimingRepeat(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e bounds[x]
         one_of_many="bounds",
         one_of_many_required=False,
@@ -129,6 +134,7 @@ class TimingRepeat(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e bounds[x]
         one_of_many="bounds",
         one_of_many_required=False,
@@ -146,6 +152,7 @@ class TimingRepeat(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     count__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_count", title="Extension field for ``count``."
@@ -161,6 +168,7 @@ class TimingRepeat(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     countMax__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_countMax", title="Extension field for ``countMax``."
@@ -176,6 +184,7 @@ class TimingRepeat(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["mon", "tue", "wed", "thu", "fri", "sat", "sun"],
@@ -195,6 +204,7 @@ class TimingRepeat(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     duration__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_duration", title="Extension field for ``duration``."
@@ -210,6 +220,7 @@ class TimingRepeat(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     durationMax__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_durationMax", title="Extension field for ``durationMax``."
@@ -222,6 +233,7 @@ class TimingRepeat(element.Element):
         description="The units of time for the duration, in UCUM units.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["s", "min", "h", "d", "wk", "mo", "a"],
@@ -241,6 +253,7 @@ class TimingRepeat(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     frequency__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_frequency", title="Extension field for ``frequency``."
@@ -257,6 +270,7 @@ class TimingRepeat(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     frequencyMax__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_frequencyMax", title="Extension field for ``frequencyMax``."
@@ -273,6 +287,7 @@ class TimingRepeat(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     offset__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_offset", title="Extension field for ``offset``."
@@ -290,6 +305,7 @@ class TimingRepeat(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     period__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_period", title="Extension field for ``period``."
@@ -306,6 +322,7 @@ class TimingRepeat(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     periodMax__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_periodMax", title="Extension field for ``periodMax``."
@@ -318,6 +335,7 @@ class TimingRepeat(element.Element):
         description="The units of time for the period in UCUM units.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["s", "min", "h", "d", "wk", "mo", "a"],
@@ -333,6 +351,7 @@ class TimingRepeat(element.Element):
         description="Specified time of day for action to take place.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     timeOfDay__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -348,6 +367,7 @@ class TimingRepeat(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     when__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -380,43 +400,3 @@ class TimingRepeat(element.Element):
             "when",
             "offset",
         ]
-
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_one_of_many_1425(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/formats.html#choice
-        A few elements have a choice of more than one data type for their content.
-        All such elements have a name that takes the form nnn[x].
-        The "nnn" part of the name is constant, and the "[x]" is replaced with
-        the title-cased name of the type that is actually used.
-        The table view shows each of these names explicitly.
-
-        Elements that have a choice of data type cannot repeat - they must have a
-        maximum cardinality of 1. When constructing an instance of an element with a
-        choice of types, the authoring system must create a single element with a
-        data type chosen from among the list of permitted data types.
-        """
-        one_of_many_fields = {
-            "bounds": ["boundsDuration", "boundsPeriod", "boundsRange"]
-        }
-        for prefix, fields in one_of_many_fields.items():
-            assert cls.__fields__[fields[0]].field_info.extra["one_of_many"] == prefix
-            required = (
-                cls.__fields__[fields[0]].field_info.extra["one_of_many_required"]
-                is True
-            )
-            found = False
-            for field in fields:
-                if field in values and values[field] is not None:
-                    if found is True:
-                        raise ValueError(
-                            "Any of one field value is expected from "
-                            f"this list {fields}, but got multiple!"
-                        )
-                    else:
-                        found = True
-            if required is True and found is False:
-                raise ValueError(f"Expect any of field value from this list {fields}.")
-
-        return values
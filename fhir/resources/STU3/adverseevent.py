@@ -45,6 +45,7 @@ class AdverseEvent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["AE", "PAE"],
@@ -60,6 +61,7 @@ class AdverseEvent(domainresource.DomainResource):
         description="The date (and perhaps time) when the adverse event occurred.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     date__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_date", title="Extension field for ``date``."
@@ -72,6 +74,7 @@ class AdverseEvent(domainresource.DomainResource):
         description="Describes the adverse event in text.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     description__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_description", title="Extension field for ``description``."
@@ -91,6 +94,7 @@ class AdverseEvent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Practitioner", "Device"],
     )
@@ -106,6 +110,7 @@ class AdverseEvent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     location: fhirtypes.ReferenceType = Field(
@@ -115,6 +120,7 @@ class AdverseEvent(domainresource.DomainResource):
         description="The information about where the adverse event occurred.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Location"],
     )
@@ -129,6 +135,7 @@ class AdverseEvent(domainresource.DomainResource):
         description="Describes the type of outcome from the adverse event.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     reaction: typing.List[fhirtypes.ReferenceType] = Field(
@@ -141,6 +148,7 @@ class AdverseEvent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Condition"],
     )
@@ -155,6 +163,7 @@ class AdverseEvent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Patient", "Practitioner", "RelatedPerson"],
     )
@@ -166,6 +175,7 @@ class AdverseEvent(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["DocumentReference"],
     )
@@ -177,6 +187,7 @@ class AdverseEvent(domainresource.DomainResource):
         description="Describes the seriousness or severity of the adverse event.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     study: typing.List[fhirtypes.ReferenceType] = Field(
@@ -186,6 +197,7 @@ class AdverseEvent(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["ResearchStudy"],
     )
@@ -201,6 +213,7 @@ class AdverseEvent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Patient", "ResearchSubject", "Medication", "Device"],
     )
@@ -212,6 +225,7 @@ class AdverseEvent(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=[
             "Condition",
@@ -233,6 +247,7 @@ class AdverseEvent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     type: fhirtypes.CodeableConceptType = Field(
@@ -245,6 +260,7 @@ class AdverseEvent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -299,6 +315,7 @@ class AdverseEventSuspectEntity(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["causality1", "causality2"],
@@ -314,6 +331,7 @@ class AdverseEventSuspectEntity(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     causalityAuthor: fhirtypes.ReferenceType = Field(
@@ -323,6 +341,7 @@ class AdverseEventSuspectEntity(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Practitioner", "PractitionerRole"],
     )
@@ -334,6 +353,7 @@ class AdverseEventSuspectEntity(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     causalityProductRelatedness: fhirtypes.String = Field(
@@ -343,6 +363,7 @@ class AdverseEventSuspectEntity(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     causalityProductRelatedness__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -357,6 +378,7 @@ class AdverseEventSuspectEntity(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     instance: fhirtypes.ReferenceType = Field(
@@ -370,6 +392,7 @@ class AdverseEventSuspectEntity(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=[
             "Substance",
@@ -33,6 +33,7 @@ class Attachment(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     contentType__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_contentType", title="Extension field for ``contentType``."
@@ -45,6 +46,7 @@ class Attachment(element.Element):
         description="The date that the attachment was first created.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     creation__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_creation", title="Extension field for ``creation``."
@@ -72,6 +74,7 @@ class Attachment(element.Element):
         description="The calculated hash of the data using SHA-1. Represented using base64.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     hash__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_hash", title="Extension field for ``hash``."
@@ -87,6 +90,7 @@ class Attachment(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     language__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_language", title="Extension field for ``language``."
@@ -102,6 +106,7 @@ class Attachment(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     size__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_size", title="Extension field for ``size``."
@@ -114,6 +119,7 @@ class Attachment(element.Element):
         description="A label or set of text to display in place of the data.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     title__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_title", title="Extension field for ``title``."
@@ -126,6 +132,7 @@ class Attachment(element.Element):
         description="An alternative location where the data can be accessed.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     url__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_url", title="Extension field for ``url``."
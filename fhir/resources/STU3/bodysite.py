@@ -33,6 +33,7 @@ class BodySite(domainresource.DomainResource):
         description="Whether this body site is in active use.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     active__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_active", title="Extension field for ``active``."
@@ -45,6 +46,7 @@ class BodySite(domainresource.DomainResource):
         description="Named anatomical location - ideally coded where possible.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     description: fhirtypes.String = Field(
@@ -54,6 +56,7 @@ class BodySite(domainresource.DomainResource):
         description="A summary, charactarization or explanation of the anatomic location.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     description__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_description", title="Extension field for ``description``."
@@ -66,6 +69,7 @@ class BodySite(domainresource.DomainResource):
         description="Identifier for this instance of the anatomical location.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     image: typing.List[fhirtypes.AttachmentType] = Field(
@@ -84,6 +88,7 @@ class BodySite(domainresource.DomainResource):
         description="The person to which the body site belongs.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Patient"],
     )
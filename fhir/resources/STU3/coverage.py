@@ -35,6 +35,7 @@ class Coverage(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Patient"],
     )
@@ -57,6 +58,7 @@ class Coverage(domainresource.DomainResource):
         description="A unique identifier for a dependent under the coverage.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     dependent__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_dependent", title="Extension field for ``dependent``."
@@ -86,6 +88,7 @@ class Coverage(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     network: fhirtypes.String = Field(
@@ -100,6 +103,7 @@ class Coverage(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     network__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_network", title="Extension field for ``network``."
@@ -117,6 +121,7 @@ class Coverage(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     order__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_order", title="Extension field for ``order``."
@@ -134,6 +139,7 @@ class Coverage(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Organization", "Patient", "RelatedPerson"],
     )
@@ -149,6 +155,7 @@ class Coverage(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     policyHolder: fhirtypes.ReferenceType = Field(
@@ -161,6 +168,7 @@ class Coverage(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Patient", "RelatedPerson", "Organization"],
     )
@@ -184,6 +192,7 @@ class Coverage(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     sequence__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_sequence", title="Extension field for ``sequence``."
@@ -196,6 +205,7 @@ class Coverage(domainresource.DomainResource):
         description="The status of the resource instance.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["active", "cancelled", "draft", "entered-in-error"],
@@ -215,6 +225,7 @@ class Coverage(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Patient", "RelatedPerson"],
     )
@@ -226,6 +237,7 @@ class Coverage(domainresource.DomainResource):
         description="The insurer assigned ID for the Subscriber.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     subscriberId__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_subscriberId", title="Extension field for ``subscriberId``."
@@ -242,6 +254,7 @@ class Coverage(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -297,6 +310,7 @@ class CoverageGrouping(backboneelement.BackboneElement):
         description="A short description for the class.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     classDisplay__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_classDisplay", title="Extension field for ``classDisplay``."
@@ -313,6 +327,7 @@ class CoverageGrouping(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     class__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_class", title="Extension field for ``class_fhir``."
@@ -329,6 +344,7 @@ class CoverageGrouping(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     group__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_group", title="Extension field for ``group``."
@@ -341,6 +357,7 @@ class CoverageGrouping(backboneelement.BackboneElement):
         description="A short description for the group.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     groupDisplay__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_groupDisplay", title="Extension field for ``groupDisplay``."
@@ -358,6 +375,7 @@ class CoverageGrouping(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     plan__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_plan", title="Extension field for ``plan``."
@@ -370,6 +388,7 @@ class CoverageGrouping(backboneelement.BackboneElement):
         description="A short description for the plan.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     planDisplay__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_planDisplay", title="Extension field for ``planDisplay``."
@@ -386,6 +405,7 @@ class CoverageGrouping(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     subClass__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_subClass", title="Extension field for ``subClass``."
@@ -398,6 +418,7 @@ class CoverageGrouping(backboneelement.BackboneElement):
         description="A short description for the subclass.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     subClassDisplay__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_subClassDisplay", title="Extension field for ``subClassDisplay``."
@@ -414,6 +435,7 @@ class CoverageGrouping(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     subGroup__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_subGroup", title="Extension field for ``subGroup``."
@@ -426,6 +448,7 @@ class CoverageGrouping(backboneelement.BackboneElement):
         description="A short description for the subgroup.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     subGroupDisplay__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_subGroupDisplay", title="Extension field for ``subGroupDisplay``."
@@ -442,6 +465,7 @@ class CoverageGrouping(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     subPlan__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_subPlan", title="Extension field for ``subPlan``."
@@ -454,6 +478,7 @@ class CoverageGrouping(backboneelement.BackboneElement):
         description="A short description for the subplan.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     subPlanDisplay__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_subPlanDisplay", title="Extension field for ``subPlanDisplay``."
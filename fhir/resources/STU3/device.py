@@ -179,6 +179,7 @@ class Device(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     status: fhirtypes.Code = Field(
@@ -188,6 +189,7 @@ class Device(domainresource.DomainResource):
         description="Status of the Device availability.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["active", "inactive", "entered-in-error", "unknown"],
@@ -215,6 +217,7 @@ class Device(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     url: fhirtypes.Uri = Field(
@@ -304,6 +307,7 @@ class DeviceUdi(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     carrierAIDC__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_carrierAIDC", title="Extension field for ``carrierAIDC``."
@@ -319,6 +323,7 @@ class DeviceUdi(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     carrierHRF__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_carrierHRF", title="Extension field for ``carrierHRF``."
@@ -334,6 +339,7 @@ class DeviceUdi(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     deviceIdentifier__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -401,6 +407,7 @@ class DeviceUdi(backboneelement.BackboneElement):
         description="Name of device as used in labeling or catalog.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     name__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_name", title="Extension field for ``name``."
@@ -35,6 +35,7 @@ class DeviceComponent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     languageCode: fhirtypes.CodeableConceptType = Field(
@@ -51,6 +52,7 @@ class DeviceComponent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     lastSystemChange: fhirtypes.Instant = Field(
@@ -63,6 +65,7 @@ class DeviceComponent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     lastSystemChange__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -83,6 +86,7 @@ class DeviceComponent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=[
@@ -118,6 +122,7 @@ class DeviceComponent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     parameterGroup: fhirtypes.CodeableConceptType = Field(
@@ -130,6 +135,7 @@ class DeviceComponent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     parent: fhirtypes.ReferenceType = Field(
@@ -142,6 +148,7 @@ class DeviceComponent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["DeviceComponent"],
     )
@@ -158,6 +165,7 @@ class DeviceComponent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     source: fhirtypes.ReferenceType = Field(
@@ -170,6 +178,7 @@ class DeviceComponent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Device"],
     )
@@ -184,6 +193,7 @@ class DeviceComponent(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -238,6 +248,7 @@ class DeviceComponentProductionSpecification(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     productionSpec: fhirtypes.String = Field(
@@ -247,6 +258,7 @@ class DeviceComponentProductionSpecification(backboneelement.BackboneElement):
         description="The printable string defining the component.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     productionSpec__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_productionSpec", title="Extension field for ``productionSpec``."
@@ -265,6 +277,7 @@ class DeviceComponentProductionSpecification(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
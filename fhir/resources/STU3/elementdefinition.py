@@ -8,9 +8,7 @@ Last updated: 2019-10-24T11:53:00+11:00
 """
 import typing
 
-from pydantic import Field, root_validator
-from pydantic.error_wrappers import ErrorWrapper, ValidationError
-from pydantic.errors import MissingError, NoneIsNotAllowedError
+from pydantic import Field
 
 from . import element, fhirtypes
 
@@ -34,6 +32,7 @@ class ElementDefinition(element.Element):
         description="Identifies additional names by which this element might also be known.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     alias__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -53,6 +52,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     binding: fhirtypes.ElementDefinitionBindingType = Field(
@@ -65,6 +65,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     code: typing.List[fhirtypes.CodingType] = Field(
@@ -77,6 +78,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     comment: fhirtypes.Markdown = Field(
@@ -90,6 +92,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     comment__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_comment", title="Extension field for ``comment``."
@@ -105,6 +108,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     condition__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -120,6 +124,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     contentReference: fhirtypes.Uri = Field(
@@ -132,6 +137,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     contentReference__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -149,6 +155,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -164,6 +171,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -179,6 +187,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -194,6 +203,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -209,6 +219,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -229,6 +240,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -249,6 +261,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -269,6 +282,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -284,6 +298,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -299,6 +314,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -314,6 +330,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -329,6 +346,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -349,6 +367,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -369,6 +388,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -389,6 +409,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -404,6 +425,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -419,6 +441,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -434,6 +457,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -452,6 +476,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -467,6 +492,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -487,6 +513,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -507,6 +534,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -527,6 +555,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -542,6 +571,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -557,6 +587,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -575,6 +606,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -590,6 +622,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -610,6 +643,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -625,6 +659,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -640,6 +675,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -655,6 +691,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -670,6 +707,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -685,6 +723,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -700,6 +739,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -720,6 +760,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -740,6 +781,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -755,6 +797,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -775,6 +818,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -796,6 +840,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     definition__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_definition", title="Extension field for ``definition``."
@@ -811,6 +856,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     fixedAddress: fhirtypes.AddressType = Field(
@@ -825,6 +871,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -842,6 +889,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -859,6 +907,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -876,6 +925,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -893,6 +943,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -915,6 +966,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -935,6 +987,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -955,6 +1008,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -972,6 +1026,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -989,6 +1044,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1006,6 +1062,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1023,6 +1080,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1043,6 +1101,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1063,6 +1122,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1083,6 +1143,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1100,6 +1161,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1117,6 +1179,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1134,6 +1197,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1154,6 +1218,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1171,6 +1236,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1191,6 +1257,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1211,6 +1278,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1231,6 +1299,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1248,6 +1317,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1265,6 +1335,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1285,6 +1356,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1302,6 +1374,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1324,6 +1397,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1341,6 +1415,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1358,6 +1433,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1375,6 +1451,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1392,6 +1469,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1409,6 +1487,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1426,6 +1505,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1446,6 +1526,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1466,6 +1547,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1483,6 +1565,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1505,6 +1588,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1528,6 +1612,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     isModifier__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_isModifier", title="Extension field for ``isModifier``."
@@ -1543,6 +1628,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     isSummary__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_isSummary", title="Extension field for ``isSummary``."
@@ -1559,6 +1645,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     label__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_label", title="Extension field for ``label``."
@@ -1574,6 +1661,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     max: fhirtypes.String = Field(
@@ -1586,6 +1674,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     max__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_max", title="Extension field for ``max``."
@@ -1602,6 +1691,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     maxLength__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_maxLength", title="Extension field for ``maxLength``."
@@ -1618,6 +1708,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -1637,6 +1728,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -1658,6 +1750,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -1677,6 +1770,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -1696,6 +1790,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -1715,6 +1810,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -1736,6 +1832,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -1752,6 +1849,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -1771,6 +1869,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -1791,6 +1890,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     meaningWhenMissing__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -1805,6 +1905,7 @@ class ElementDefinition(element.Element):
         description="The minimum number of times this element SHALL appear in the instance.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     min__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_min", title="Extension field for ``min``."
@@ -1821,6 +1922,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -1840,6 +1942,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -1861,6 +1964,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -1880,6 +1984,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -1899,6 +2004,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -1918,6 +2024,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -1939,6 +2046,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -1955,6 +2063,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -1974,6 +2083,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -1995,6 +2105,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     mustSupport__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_mustSupport", title="Extension field for ``mustSupport``."
@@ -2011,6 +2122,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     orderMeaning__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_orderMeaning", title="Extension field for ``orderMeaning``."
@@ -2027,6 +2139,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     path__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -2046,6 +2159,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2064,6 +2178,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2082,6 +2197,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2100,6 +2216,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2118,6 +2235,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2141,6 +2259,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2162,6 +2281,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2183,6 +2303,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2201,6 +2322,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2219,6 +2341,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2237,6 +2360,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2255,6 +2379,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2276,6 +2401,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2297,6 +2423,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2318,6 +2445,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2336,6 +2464,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2354,6 +2483,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2372,6 +2502,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2393,6 +2524,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2411,6 +2543,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2432,6 +2565,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2453,6 +2587,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2474,6 +2609,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2492,6 +2628,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2510,6 +2647,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2531,6 +2669,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2549,6 +2688,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2572,6 +2712,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2590,6 +2731,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2608,6 +2750,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2626,6 +2769,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2644,6 +2788,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2662,6 +2807,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2680,6 +2826,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2701,6 +2848,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2722,6 +2870,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2740,6 +2889,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2763,6 +2913,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2781,6 +2932,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["xmlAttr", "xmlText", "typeAttr", "cdaText", "xhtml"],
@@ -2803,6 +2955,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     requirements__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_requirements", title="Extension field for ``requirements``."
@@ -2818,6 +2971,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     short__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_short", title="Extension field for ``short``."
@@ -2835,6 +2989,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     sliceName__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_sliceName", title="Extension field for ``sliceName``."
@@ -2856,6 +3011,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     type: typing.List[fhirtypes.ElementDefinitionTypeType] = Field(
@@ -2868,6 +3024,7 @@ class ElementDefinition(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -3040,246 +3197,6 @@ class ElementDefinition(element.Element):
             "mapping",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_1926(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("path", "path__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_one_of_many_1926(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/formats.html#choice
-        A few elements have a choice of more than one data type for their content.
-        All such elements have a name that takes the form nnn[x].
-        The "nnn" part of the name is constant, and the "[x]" is replaced with
-        the title-cased name of the type that is actually used.
-        The table view shows each of these names explicitly.
-
-        Elements that have a choice of data type cannot repeat - they must have a
-        maximum cardinality of 1. When constructing an instance of an element with a
-        choice of types, the authoring system must create a single element with a
-        data type chosen from among the list of permitted data types.
-        """
-        one_of_many_fields = {
-            "defaultValue": [
-                "defaultValueAddress",
-                "defaultValueAge",
-                "defaultValueAnnotation",
-                "defaultValueAttachment",
-                "defaultValueBase64Binary",
-                "defaultValueBoolean",
-                "defaultValueCode",
-                "defaultValueCodeableConcept",
-                "defaultValueCoding",
-                "defaultValueContactPoint",
-                "defaultValueCount",
-                "defaultValueDate",
-                "defaultValueDateTime",
-                "defaultValueDecimal",
-                "defaultValueDistance",
-                "defaultValueDuration",
-                "defaultValueHumanName",
-                "defaultValueId",
-                "defaultValueIdentifier",
-                "defaultValueInstant",
-                "defaultValueInteger",
-                "defaultValueMarkdown",
-                "defaultValueMeta",
-                "defaultValueMoney",
-                "defaultValueOid",
-                "defaultValuePeriod",
-                "defaultValuePositiveInt",
-                "defaultValueQuantity",
-                "defaultValueRange",
-                "defaultValueRatio",
-                "defaultValueReference",
-                "defaultValueSampledData",
-                "defaultValueSignature",
-                "defaultValueString",
-                "defaultValueTime",
-                "defaultValueTiming",
-                "defaultValueUnsignedInt",
-                "defaultValueUri",
-            ],
-            "fixed": [
-                "fixedAddress",
-                "fixedAge",
-                "fixedAnnotation",
-                "fixedAttachment",
-                "fixedBase64Binary",
-                "fixedBoolean",
-                "fixedCode",
-                "fixedCodeableConcept",
-                "fixedCoding",
-                "fixedContactPoint",
-                "fixedCount",
-                "fixedDate",
-                "fixedDateTime",
-                "fixedDecimal",
-                "fixedDistance",
-                "fixedDuration",
-                "fixedHumanName",
-                "fixedId",
-                "fixedIdentifier",
-                "fixedInstant",
-                "fixedInteger",
-                "fixedMarkdown",
-                "fixedMeta",
-                "fixedMoney",
-                "fixedOid",
-                "fixedPeriod",
-                "fixedPositiveInt",
-                "fixedQuantity",
-                "fixedRange",
-                "fixedRatio",
-                "fixedReference",
-                "fixedSampledData",
-                "fixedSignature",
-                "fixedString",
-                "fixedTime",
-                "fixedTiming",
-                "fixedUnsignedInt",
-                "fixedUri",
-            ],
-            "maxValue": [
-                "maxValueDate",
-                "maxValueDateTime",
-                "maxValueDecimal",
-                "maxValueInstant",
-                "maxValueInteger",
-                "maxValuePositiveInt",
-                "maxValueQuantity",
-                "maxValueTime",
-                "maxValueUnsignedInt",
-            ],
-            "minValue": [
-                "minValueDate",
-                "minValueDateTime",
-                "minValueDecimal",
-                "minValueInstant",
-                "minValueInteger",
-                "minValuePositiveInt",
-                "minValueQuantity",
-                "minValueTime",
-                "minValueUnsignedInt",
-            ],
-            "pattern": [
-                "patternAddress",
-                "patternAge",
-                "patternAnnotation",
-                "patternAttachment",
-                "patternBase64Binary",
-                "patternBoolean",
-                "patternCode",
-                "patternCodeableConcept",
-                "patternCoding",
-                "patternContactPoint",
-                "patternCount",
-                "patternDate",
-                "patternDateTime",
-                "patternDecimal",
-                "patternDistance",
-                "patternDuration",
-                "patternHumanName",
-                "patternId",
-                "patternIdentifier",
-                "patternInstant",
-                "patternInteger",
-                "patternMarkdown",
-                "patternMeta",
-                "patternMoney",
-                "patternOid",
-                "patternPeriod",
-                "patternPositiveInt",
-                "patternQuantity",
-                "patternRange",
-                "patternRatio",
-                "patternReference",
-                "patternSampledData",
-                "patternSignature",
-                "patternString",
-                "patternTime",
-                "patternTiming",
-                "patternUnsignedInt",
-                "patternUri",
-            ],
-        }
-        for prefix, fields in one_of_many_fields.items():
-            assert cls.__fields__[fields[0]].field_info.extra["one_of_many"] == prefix
-            required = (
-                cls.__fields__[fields[0]].field_info.extra["one_of_many_required"]
-                is True
-            )
-            found = False
-            for field in fields:
-                if field in values and values[field] is not None:
-                    if found is True:
-                        raise ValueError(
-                            "Any of one field value is expected from "
-                            f"this list {fields}, but got multiple!"
-                        )
-                    else:
-                        found = True
-            if required is True and found is False:
-                raise ValueError(f"Expect any of field value from this list {fields}.")
-
-        return values
-
 
 class ElementDefinitionBase(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -3304,6 +3221,7 @@ class ElementDefinitionBase(element.Element):
         description="Maximum cardinality of the base element identified by the path.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     max__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -3317,6 +3235,7 @@ class ElementDefinitionBase(element.Element):
         description="Minimum cardinality of the base element identified by the path.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     min__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -3336,6 +3255,7 @@ class ElementDefinitionBase(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     path__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -3350,69 +3270,6 @@ class ElementDefinitionBase(element.Element):
         """
         return ["id", "extension", "path", "min", "max"]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2296(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [
-            ("max", "max__ext"),
-            ("min", "min__ext"),
-            ("path", "path__ext"),
-        ]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class ElementDefinitionBinding(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -3433,6 +3290,7 @@ class ElementDefinitionBinding(element.Element):
         description="Describes the intended use of this particular set of codes.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     description__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_description", title="Extension field for ``description``."
@@ -3449,6 +3307,7 @@ class ElementDefinitionBinding(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -3472,6 +3331,7 @@ class ElementDefinitionBinding(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e valueSet[x]
         one_of_many="valueSet",
         one_of_many_required=False,
@@ -3493,6 +3353,7 @@ class ElementDefinitionBinding(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e valueSet[x]
         one_of_many="valueSet",
         one_of_many_required=False,
@@ -3516,103 +3377,6 @@ class ElementDefinitionBinding(element.Element):
             "valueSetReference",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2618(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("strength", "strength__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_one_of_many_2618(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/formats.html#choice
-        A few elements have a choice of more than one data type for their content.
-        All such elements have a name that takes the form nnn[x].
-        The "nnn" part of the name is constant, and the "[x]" is replaced with
-        the title-cased name of the type that is actually used.
-        The table view shows each of these names explicitly.
-
-        Elements that have a choice of data type cannot repeat - they must have a
-        maximum cardinality of 1. When constructing an instance of an element with a
-        choice of types, the authoring system must create a single element with a
-        data type chosen from among the list of permitted data types.
-        """
-        one_of_many_fields = {"valueSet": ["valueSetReference", "valueSetUri"]}
-        for prefix, fields in one_of_many_fields.items():
-            assert cls.__fields__[fields[0]].field_info.extra["one_of_many"] == prefix
-            required = (
-                cls.__fields__[fields[0]].field_info.extra["one_of_many_required"]
-                is True
-            )
-            found = False
-            for field in fields:
-                if field in values and values[field] is not None:
-                    if found is True:
-                        raise ValueError(
-                            "Any of one field value is expected from "
-                            f"this list {fields}, but got multiple!"
-                        )
-                    else:
-                        found = True
-            if required is True and found is False:
-                raise ValueError(f"Expect any of field value from this list {fields}.")
-
-        return values
-
 
 class ElementDefinitionConstraint(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -3636,6 +3400,7 @@ class ElementDefinitionConstraint(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     expression__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -3652,6 +3417,7 @@ class ElementDefinitionConstraint(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     human__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -3669,6 +3435,7 @@ class ElementDefinitionConstraint(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     key__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -3682,6 +3449,7 @@ class ElementDefinitionConstraint(element.Element):
         description="Description of why this constraint is necessary or appropriate.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     requirements__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_requirements", title="Extension field for ``requirements``."
@@ -3697,6 +3465,7 @@ class ElementDefinitionConstraint(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -3716,6 +3485,7 @@ class ElementDefinitionConstraint(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     source__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_source", title="Extension field for ``source``."
@@ -3731,6 +3501,7 @@ class ElementDefinitionConstraint(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     xpath__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_xpath", title="Extension field for ``xpath``."
@@ -3754,70 +3525,6 @@ class ElementDefinitionConstraint(element.Element):
             "source",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2993(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [
-            ("expression", "expression__ext"),
-            ("human", "human__ext"),
-            ("key", "key__ext"),
-            ("severity", "severity__ext"),
-        ]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class ElementDefinitionExample(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -3838,6 +3545,7 @@ class ElementDefinitionExample(element.Element):
         description="Describes the purpose of this example amoung the set of examples.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     label__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -3854,6 +3562,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -3869,6 +3578,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -3884,6 +3594,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -3899,6 +3610,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -3914,6 +3626,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -3934,6 +3647,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -3952,6 +3666,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -3970,6 +3685,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -3985,6 +3701,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4000,6 +3717,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4015,6 +3733,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4030,6 +3749,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4048,6 +3768,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4066,6 +3787,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4084,6 +3806,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4099,6 +3822,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4114,6 +3838,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4129,6 +3854,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4147,6 +3873,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4162,6 +3889,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4180,6 +3908,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4198,6 +3927,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4216,6 +3946,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4231,6 +3962,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4246,6 +3978,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4264,6 +3997,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4279,6 +4013,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4299,6 +4034,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4314,6 +4050,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4329,6 +4066,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4344,6 +4082,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4359,6 +4098,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4374,6 +4114,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4389,6 +4130,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4407,6 +4149,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4425,6 +4168,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4440,6 +4184,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4460,6 +4205,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -4518,144 +4264,6 @@ class ElementDefinitionExample(element.Element):
             "valueMeta",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2633(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("label", "label__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_one_of_many_2633(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/formats.html#choice
-        A few elements have a choice of more than one data type for their content.
-        All such elements have a name that takes the form nnn[x].
-        The "nnn" part of the name is constant, and the "[x]" is replaced with
-        the title-cased name of the type that is actually used.
-        The table view shows each of these names explicitly.
-
-        Elements that have a choice of data type cannot repeat - they must have a
-        maximum cardinality of 1. When constructing an instance of an element with a
-        choice of types, the authoring system must create a single element with a
-        data type chosen from among the list of permitted data types.
-        """
-        one_of_many_fields = {
-            "value": [
-                "valueAddress",
-                "valueAge",
-                "valueAnnotation",
-                "valueAttachment",
-                "valueBase64Binary",
-                "valueBoolean",
-                "valueCode",
-                "valueCodeableConcept",
-                "valueCoding",
-                "valueContactPoint",
-                "valueCount",
-                "valueDate",
-                "valueDateTime",
-                "valueDecimal",
-                "valueDistance",
-                "valueDuration",
-                "valueHumanName",
-                "valueId",
-                "valueIdentifier",
-                "valueInstant",
-                "valueInteger",
-                "valueMarkdown",
-                "valueMeta",
-                "valueMoney",
-                "valueOid",
-                "valuePeriod",
-                "valuePositiveInt",
-                "valueQuantity",
-                "valueRange",
-                "valueRatio",
-                "valueReference",
-                "valueSampledData",
-                "valueSignature",
-                "valueString",
-                "valueTime",
-                "valueTiming",
-                "valueUnsignedInt",
-                "valueUri",
-            ]
-        }
-        for prefix, fields in one_of_many_fields.items():
-            assert cls.__fields__[fields[0]].field_info.extra["one_of_many"] == prefix
-            required = (
-                cls.__fields__[fields[0]].field_info.extra["one_of_many_required"]
-                is True
-            )
-            found = False
-            for field in fields:
-                if field in values and values[field] is not None:
-                    if found is True:
-                        raise ValueError(
-                            "Any of one field value is expected from "
-                            f"this list {fields}, but got multiple!"
-                        )
-                    else:
-                        found = True
-            if required is True and found is False:
-                raise ValueError(f"Expect any of field value from this list {fields}.")
-
-        return values
-
 
 class ElementDefinitionMapping(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -4676,6 +4284,7 @@ class ElementDefinitionMapping(element.Element):
         description="Comments that provide information about the mapping or its use.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     comment__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_comment", title="Extension field for ``comment``."
@@ -4688,6 +4297,7 @@ class ElementDefinitionMapping(element.Element):
         description="An internal reference to the definition of a mapping.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     identity__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -4701,6 +4311,7 @@ class ElementDefinitionMapping(element.Element):
         description="Identifies the computable language in which mapping.map is expressed.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     language__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_language", title="Extension field for ``language``."
@@ -4716,6 +4327,7 @@ class ElementDefinitionMapping(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     map__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -4730,65 +4342,6 @@ class ElementDefinitionMapping(element.Element):
         """
         return ["id", "extension", "identity", "language", "map", "comment"]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2635(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("identity", "identity__ext"), ("map", "map__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class ElementDefinitionSlicing(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -4819,6 +4372,7 @@ class ElementDefinitionSlicing(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     description__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_description", title="Extension field for ``description``."
@@ -4839,6 +4393,7 @@ class ElementDefinitionSlicing(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     ordered: bool = Field(
@@ -4851,6 +4406,7 @@ class ElementDefinitionSlicing(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     ordered__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_ordered", title="Extension field for ``ordered``."
@@ -4867,6 +4423,7 @@ class ElementDefinitionSlicing(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -4884,65 +4441,6 @@ class ElementDefinitionSlicing(element.Element):
         """
         return ["id", "extension", "discriminator", "description", "ordered", "rules"]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2632(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("rules", "rules__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class ElementDefinitionSlicingDiscriminator(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -4969,6 +4467,7 @@ class ElementDefinitionSlicingDiscriminator(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     path__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -4982,6 +4481,7 @@ class ElementDefinitionSlicingDiscriminator(element.Element):
         description="How the element value is interpreted when discrimination is evaluated.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -4999,65 +4499,6 @@ class ElementDefinitionSlicingDiscriminator(element.Element):
         """
         return ["id", "extension", "type", "path"]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_4011(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("path", "path__ext"), ("type", "type__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class ElementDefinitionType(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -5082,6 +4523,7 @@ class ElementDefinitionType(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["contained", "referenced", "bundled"],
@@ -5103,6 +4545,7 @@ class ElementDefinitionType(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     code__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -5123,6 +4566,7 @@ class ElementDefinitionType(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     profile__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_profile", title="Extension field for ``profile``."
@@ -5142,6 +4586,7 @@ class ElementDefinitionType(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     targetProfile__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_targetProfile", title="Extension field for ``targetProfile``."
@@ -5157,6 +4602,7 @@ class ElementDefinitionType(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["either", "independent", "specific"],
@@ -5180,62 +4626,3 @@ class ElementDefinitionType(element.Element):
             "aggregation",
             "versioning",
         ]
-
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2335(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("code", "code__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
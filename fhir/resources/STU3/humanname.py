@@ -34,6 +34,7 @@ class HumanName(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     family__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_family", title="Extension field for ``family``."
@@ -46,6 +47,7 @@ class HumanName(element.Element):
         description="Given name.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     given__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -61,6 +63,7 @@ class HumanName(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     prefix: typing.List[typing.Optional[fhirtypes.String]] = Field(
@@ -74,6 +77,7 @@ class HumanName(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     prefix__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -90,6 +94,7 @@ class HumanName(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     suffix__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -102,6 +107,7 @@ class HumanName(element.Element):
         description="A full text representation of the name.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     text__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_text", title="Extension field for ``text``."
@@ -114,6 +120,7 @@ class HumanName(element.Element):
         description="Identifies the purpose for this name.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=[
@@ -29,6 +29,7 @@ class Identifier(element.Element):
         description="Organization that issued/manages the identifier.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Organization"],
     )
@@ -40,6 +41,7 @@ class Identifier(element.Element):
         description="Time period during which identifier is/was valid for use.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     system: fhirtypes.Uri = Field(
@@ -52,6 +54,7 @@ class Identifier(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     system__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_system", title="Extension field for ``system``."
@@ -67,6 +70,7 @@ class Identifier(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     use: fhirtypes.Code = Field(
@@ -76,6 +80,7 @@ class Identifier(element.Element):
         description="The purpose of this identifier.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["usual", "official", "temp", "secondary"],
@@ -94,6 +99,7 @@ class Identifier(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     value__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_value", title="Extension field for ``value``."
@@ -33,6 +33,7 @@ class Meta(element.Element):
         description="When the resource last changed - e.g. when the version changed.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     lastUpdated__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_lastUpdated", title="Extension field for ``lastUpdated``."
@@ -50,6 +51,7 @@ class Meta(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     profile__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -65,6 +67,7 @@ class Meta(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     tag: typing.List[fhirtypes.CodingType] = Field(
@@ -79,6 +82,7 @@ class Meta(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     versionId: fhirtypes.Id = Field(
@@ -92,6 +96,7 @@ class Meta(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     versionId__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_versionId", title="Extension field for ``versionId``."
@@ -29,6 +29,7 @@ class Range(element.Element):
         description="The high limit. The boundary is inclusive.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     low: fhirtypes.QuantityType = Field(
@@ -38,6 +39,7 @@ class Range(element.Element):
         description="The low limit. The boundary is inclusive.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -30,6 +30,7 @@ class Ratio(element.Element):
         description="The value of the denominator.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     numerator: fhirtypes.QuantityType = Field(
@@ -39,6 +40,7 @@ class Ratio(element.Element):
         description="The value of the numerator.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
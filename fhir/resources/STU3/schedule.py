@@ -34,6 +34,7 @@ class Schedule(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     active__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_active", title="Extension field for ``active``."
@@ -51,6 +52,7 @@ class Schedule(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=[
             "Patient",
@@ -85,6 +87,7 @@ class Schedule(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     planningHorizon: fhirtypes.PeriodType = Field(
@@ -100,6 +103,7 @@ class Schedule(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     serviceCategory: fhirtypes.CodeableConceptType = Field(
@@ -112,6 +116,7 @@ class Schedule(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     serviceType: typing.List[fhirtypes.CodeableConceptType] = Field(
@@ -121,6 +126,7 @@ class Schedule(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     specialty: typing.List[fhirtypes.CodeableConceptType] = Field(
@@ -133,6 +139,7 @@ class Schedule(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
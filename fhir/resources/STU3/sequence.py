@@ -8,9 +8,7 @@ Last updated: 2019-10-24T11:53:00+11:00
 """
 import typing
 
-from pydantic import Field, root_validator
-from pydantic.error_wrappers import ErrorWrapper, ValidationError
-from pydantic.errors import MissingError, NoneIsNotAllowedError
+from pydantic import Field
 
 from . import backboneelement, domainresource, fhirtypes
 
@@ -41,6 +39,7 @@ class Sequence(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     coordinateSystem__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -56,6 +55,7 @@ class Sequence(domainresource.DomainResource):
         description="The method for sequencing, for example, chip information.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Device"],
     )
@@ -70,6 +70,7 @@ class Sequence(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     observedSeq: fhirtypes.String = Field(
@@ -83,6 +84,7 @@ class Sequence(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     observedSeq__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_observedSeq", title="Extension field for ``observedSeq``."
@@ -95,6 +97,7 @@ class Sequence(domainresource.DomainResource):
         description="The patient whose sequencing results are described by this resource.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Patient"],
     )
@@ -106,6 +109,7 @@ class Sequence(domainresource.DomainResource):
         description="The organization or lab that should be responsible for this result.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Organization"],
     )
@@ -117,6 +121,7 @@ class Sequence(domainresource.DomainResource):
         description="Pointer to next atomic sequence which at most contains one variant.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Sequence"],
     )
@@ -133,6 +138,7 @@ class Sequence(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     quantity: fhirtypes.QuantityType = Field(
@@ -142,6 +148,7 @@ class Sequence(domainresource.DomainResource):
         description="The number of copies of the seqeunce of interest. (RNASeq).",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     readCoverage: fhirtypes.Integer = Field(
@@ -157,6 +164,7 @@ class Sequence(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     readCoverage__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_readCoverage", title="Extension field for ``readCoverage``."
@@ -172,6 +180,7 @@ class Sequence(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     repository: typing.List[fhirtypes.SequenceRepositoryType] = Field(
@@ -187,6 +196,7 @@ class Sequence(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     specimen: fhirtypes.ReferenceType = Field(
@@ -196,6 +206,7 @@ class Sequence(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Specimen"],
     )
@@ -207,6 +218,7 @@ class Sequence(domainresource.DomainResource):
         description="Amino Acid Sequence/ DNA Sequence / RNA Sequence.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["aa", "dna", "rna"],
@@ -228,6 +240,7 @@ class Sequence(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -262,65 +275,6 @@ class Sequence(domainresource.DomainResource):
             "pointer",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_1009(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("coordinateSystem", "coordinateSystem__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class SequenceQuality(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -347,6 +301,7 @@ class SequenceQuality(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     end__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_end", title="Extension field for ``end``."
@@ -362,6 +317,7 @@ class SequenceQuality(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     fScore__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_fScore", title="Extension field for ``fScore``."
@@ -381,6 +337,7 @@ class SequenceQuality(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     gtFP__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_gtFP", title="Extension field for ``gtFP``."
@@ -393,6 +350,7 @@ class SequenceQuality(backboneelement.BackboneElement):
         description="Which method is used to get sequence quality.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     precision: fhirtypes.Decimal = Field(
@@ -402,6 +360,7 @@ class SequenceQuality(backboneelement.BackboneElement):
         description="QUERY.TP / (QUERY.TP + QUERY.FP).",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     precision__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_precision", title="Extension field for ``precision``."
@@ -419,6 +378,7 @@ class SequenceQuality(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     queryFP__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_queryFP", title="Extension field for ``queryFP``."
@@ -437,6 +397,7 @@ class SequenceQuality(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     queryTP__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_queryTP", title="Extension field for ``queryTP``."
@@ -449,6 +410,7 @@ class SequenceQuality(backboneelement.BackboneElement):
         description="TRUTH.TP / (TRUTH.TP + TRUTH.FN).",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     recall__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_recall", title="Extension field for ``recall``."
@@ -465,6 +427,7 @@ class SequenceQuality(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     standardSequence: fhirtypes.CodeableConceptType = Field(
@@ -474,6 +437,7 @@ class SequenceQuality(backboneelement.BackboneElement):
         description="Gold standard sequence used for comparing against.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     start: fhirtypes.Integer = Field(
@@ -486,6 +450,7 @@ class SequenceQuality(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     start__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_start", title="Extension field for ``start``."
@@ -504,6 +469,7 @@ class SequenceQuality(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     truthFN__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_truthFN", title="Extension field for ``truthFN``."
@@ -522,6 +488,7 @@ class SequenceQuality(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     truthTP__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_truthTP", title="Extension field for ``truthTP``."
@@ -534,6 +501,7 @@ class SequenceQuality(backboneelement.BackboneElement):
         description="INDEL / SNP / Undefined variant.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -569,65 +537,6 @@ class SequenceQuality(backboneelement.BackboneElement):
             "fScore",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_1774(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("type", "type__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class SequenceReferenceSeq(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -653,6 +562,7 @@ class SequenceReferenceSeq(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     genomeBuild: fhirtypes.String = Field(
@@ -669,6 +579,7 @@ class SequenceReferenceSeq(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     genomeBuild__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_genomeBuild", title="Extension field for ``genomeBuild``."
@@ -687,6 +598,7 @@ class SequenceReferenceSeq(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     referenceSeqPointer: fhirtypes.ReferenceType = Field(
@@ -696,6 +608,7 @@ class SequenceReferenceSeq(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Sequence"],
     )
@@ -707,6 +620,7 @@ class SequenceReferenceSeq(backboneelement.BackboneElement):
         description='A string like "ACGT".',
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     referenceSeqString__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -725,6 +639,7 @@ class SequenceReferenceSeq(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     strand__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_strand", title="Extension field for ``strand``."
@@ -742,6 +657,7 @@ class SequenceReferenceSeq(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     windowEnd__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -759,6 +675,7 @@ class SequenceReferenceSeq(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     windowStart__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -785,68 +702,6 @@ class SequenceReferenceSeq(backboneelement.BackboneElement):
             "windowEnd",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2229(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [
-            ("windowEnd", "windowEnd__ext"),
-            ("windowStart", "windowStart__ext"),
-        ]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class SequenceRepository(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -872,6 +727,7 @@ class SequenceRepository(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     datasetId__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_datasetId", title="Extension field for ``datasetId``."
@@ -887,6 +743,7 @@ class SequenceRepository(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     name__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_name", title="Extension field for ``name``."
@@ -899,6 +756,7 @@ class SequenceRepository(backboneelement.BackboneElement):
         description="Id of the read in this external repository.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     readsetId__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_readsetId", title="Extension field for ``readsetId``."
@@ -914,6 +772,7 @@ class SequenceRepository(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -933,6 +792,7 @@ class SequenceRepository(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     url__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_url", title="Extension field for ``url``."
@@ -949,6 +809,7 @@ class SequenceRepository(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     variantsetId__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_variantsetId", title="Extension field for ``variantsetId``."
@@ -972,65 +833,6 @@ class SequenceRepository(backboneelement.BackboneElement):
             "readsetId",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2117(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("type", "type__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class SequenceVariant(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -1059,6 +861,7 @@ class SequenceVariant(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     cigar__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_cigar", title="Extension field for ``cigar``."
@@ -1076,6 +879,7 @@ class SequenceVariant(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     end__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_end", title="Extension field for ``end``."
@@ -1096,6 +900,7 @@ class SequenceVariant(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     observedAllele__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_observedAllele", title="Extension field for ``observedAllele``."
@@ -1116,6 +921,7 @@ class SequenceVariant(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     referenceAllele__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_referenceAllele", title="Extension field for ``referenceAllele``."
@@ -1132,6 +938,7 @@ class SequenceVariant(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     start__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_start", title="Extension field for ``start``."
@@ -1144,6 +951,7 @@ class SequenceVariant(backboneelement.BackboneElement):
         description="A pointer to an Observation containing variant information.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Observation"],
     )
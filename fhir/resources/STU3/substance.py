@@ -8,7 +8,7 @@ Last updated: 2019-10-24T11:53:00+11:00
 """
 import typing
 
-from pydantic import Field, root_validator
+from pydantic import Field
 
 from . import backboneelement, domainresource, fhirtypes
 
@@ -33,6 +33,7 @@ class Substance(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     code: fhirtypes.CodeableConceptType = Field(
@@ -42,6 +43,7 @@ class Substance(domainresource.DomainResource):
         description="A code (or set of codes) that identify this substance.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     description: fhirtypes.String = Field(
@@ -54,6 +56,7 @@ class Substance(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     description__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_description", title="Extension field for ``description``."
@@ -66,6 +69,7 @@ class Substance(domainresource.DomainResource):
         description="Unique identifier for the substance.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     ingredient: typing.List[fhirtypes.SubstanceIngredientType] = Field(
@@ -75,6 +79,7 @@ class Substance(domainresource.DomainResource):
         description="A substance can be composed of other substances.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     instance: typing.List[fhirtypes.SubstanceInstanceType] = Field(
@@ -87,6 +92,7 @@ class Substance(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     status: fhirtypes.Code = Field(
@@ -96,6 +102,7 @@ class Substance(domainresource.DomainResource):
         description="A code to indicate if the substance is actively used.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["active", "inactive", "entered-in-error"],
@@ -147,6 +154,7 @@ class SubstanceIngredient(backboneelement.BackboneElement):
         description="The amount of the ingredient in the substance - a concentration ratio.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     substanceCodeableConcept: fhirtypes.CodeableConceptType = Field(
@@ -156,6 +164,7 @@ class SubstanceIngredient(backboneelement.BackboneElement):
         description="Another substance that is a component of this substance.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e substance[x]
         one_of_many="substance",
         one_of_many_required=True,
@@ -168,6 +177,7 @@ class SubstanceIngredient(backboneelement.BackboneElement):
         description="Another substance that is a component of this substance.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e substance[x]
         one_of_many="substance",
         one_of_many_required=True,
@@ -190,46 +200,6 @@ class SubstanceIngredient(backboneelement.BackboneElement):
             "substanceReference",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_one_of_many_2168(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/formats.html#choice
-        A few elements have a choice of more than one data type for their content.
-        All such elements have a name that takes the form nnn[x].
-        The "nnn" part of the name is constant, and the "[x]" is replaced with
-        the title-cased name of the type that is actually used.
-        The table view shows each of these names explicitly.
-
-        Elements that have a choice of data type cannot repeat - they must have a
-        maximum cardinality of 1. When constructing an instance of an element with a
-        choice of types, the authoring system must create a single element with a
-        data type chosen from among the list of permitted data types.
-        """
-        one_of_many_fields = {
-            "substance": ["substanceCodeableConcept", "substanceReference"]
-        }
-        for prefix, fields in one_of_many_fields.items():
-            assert cls.__fields__[fields[0]].field_info.extra["one_of_many"] == prefix
-            required = (
-                cls.__fields__[fields[0]].field_info.extra["one_of_many_required"]
-                is True
-            )
-            found = False
-            for field in fields:
-                if field in values and values[field] is not None:
-                    if found is True:
-                        raise ValueError(
-                            "Any of one field value is expected from "
-                            f"this list {fields}, but got multiple!"
-                        )
-                    else:
-                        found = True
-            if required is True and found is False:
-                raise ValueError(f"Expect any of field value from this list {fields}.")
-
-        return values
-
 
 class SubstanceInstance(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -253,6 +223,7 @@ class SubstanceInstance(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     expiry__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_expiry", title="Extension field for ``expiry``."
@@ -268,6 +239,7 @@ class SubstanceInstance(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     quantity: fhirtypes.QuantityType = Field(
@@ -277,6 +249,7 @@ class SubstanceInstance(backboneelement.BackboneElement):
         description="The amount of the substance.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -8,7 +8,7 @@ Last updated: 2019-10-24T11:53:00+11:00
 """
 import typing
 
-from pydantic import Field, root_validator
+from pydantic import Field
 
 from . import element, fhirtypes
 
@@ -43,6 +43,7 @@ class Timing(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     event: typing.List[fhirtypes.DateTime] = Field(
@@ -52,6 +53,7 @@ class Timing(element.Element):
         description="Identifies specific times when the event occurs.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     event__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -64,6 +66,7 @@ class Timing(element.Element):
         description="A set of rules that describe when the event is scheduled.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -97,6 +100,7 @@ class TimingRepeat(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e bounds[x]
         one_of_many="bounds",
         one_of_many_required=False,
@@ -113,6 +117,7 @@ class TimingRepeat(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e bounds[x]
         one_of_many="bounds",
         one_of_many_required=False,
@@ -129,6 +134,7 @@ class TimingRepeat(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e bounds[x]
         one_of_many="bounds",
         one_of_many_required=False,
@@ -141,6 +147,7 @@ class TimingRepeat(element.Element):
         description="A total count of the desired number of repetitions.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     count__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_count", title="Extension field for ``count``."
@@ -156,6 +163,7 @@ class TimingRepeat(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     countMax__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_countMax", title="Extension field for ``countMax``."
@@ -171,6 +179,7 @@ class TimingRepeat(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["mon", "tue", "wed", "thu", "fri", "sat", "sun"],
@@ -186,6 +195,7 @@ class TimingRepeat(element.Element):
         description="How long this thing happens for when it happens.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     duration__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_duration", title="Extension field for ``duration``."
@@ -198,6 +208,7 @@ class TimingRepeat(element.Element):
         description="The upper limit of how long this thing happens for when it happens.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     durationMax__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_durationMax", title="Extension field for ``durationMax``."
@@ -210,6 +221,7 @@ class TimingRepeat(element.Element):
         description="The units of time for the duration, in UCUM units.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["s", "min", "h", "d", "wk", "mo", "a"],
@@ -228,6 +240,7 @@ class TimingRepeat(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     frequency__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_frequency", title="Extension field for ``frequency``."
@@ -244,6 +257,7 @@ class TimingRepeat(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     frequencyMax__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_frequencyMax", title="Extension field for ``frequencyMax``."
@@ -260,6 +274,7 @@ class TimingRepeat(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     offset__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_offset", title="Extension field for ``offset``."
@@ -276,6 +291,7 @@ class TimingRepeat(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     period__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_period", title="Extension field for ``period``."
@@ -292,6 +308,7 @@ class TimingRepeat(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     periodMax__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_periodMax", title="Extension field for ``periodMax``."
@@ -304,6 +321,7 @@ class TimingRepeat(element.Element):
         description="The units of time for the period in UCUM units.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["s", "min", "h", "d", "wk", "mo", "a"],
@@ -319,6 +337,7 @@ class TimingRepeat(element.Element):
         description="Specified time of day for action to take place.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     timeOfDay__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -331,6 +350,7 @@ class TimingRepeat(element.Element):
         description="Real world events that the occurrence of the event should be tied to.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     when__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -363,43 +383,3 @@ class TimingRepeat(element.Element):
             "when",
             "offset",
         ]
-
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_one_of_many_1425(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/formats.html#choice
-        A few elements have a choice of more than one data type for their content.
-        All such elements have a name that takes the form nnn[x].
-        The "nnn" part of the name is constant, and the "[x]" is replaced with
-        the title-cased name of the type that is actually used.
-        The table view shows each of these names explicitly.
-
-        Elements that have a choice of data type cannot repeat - they must have a
-        maximum cardinality of 1. When constructing an instance of an element with a
-        choice of types, the authoring system must create a single element with a
-        data type chosen from among the list of permitted data types.
-        """
-        one_of_many_fields = {
-            "bounds": ["boundsDuration", "boundsPeriod", "boundsRange"]
-        }
-        for prefix, fields in one_of_many_fields.items():
-            assert cls.__fields__[fields[0]].field_info.extra["one_of_many"] == prefix
-            required = (
-                cls.__fields__[fields[0]].field_info.extra["one_of_many_required"]
-                is True
-            )
-            found = False
-            for field in fields:
-                if field in values and values[field] is not None:
-                    if found is True:
-                        raise ValueError(
-                            "Any of one field value is expected from "
-                            f"this list {fields}, but got multiple!"
-                        )
-                    else:
-                        found = True
-            if required is True and found is False:
-                raise ValueError(f"Expect any of field value from this list {fields}.")
-
-        return values
@@ -1,8 +1,12 @@
 # -*- coding: utf-8 -*-
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
+from fhir.resources.core.diff import PatchOp, diff
 from fhir.resources.core.fhirabstractmodel import FHIRAbstractModel
+from fhir.resources.core.utils import load_file
+from fhir.resources.core.validation import ErrorDetail, validate_obj, validate_raw
+from fhir.resources.core.warmup import warmup
 
 from .fhirtypesvalidators import get_fhir_model_class
 
@@ -11,19 +15,86 @@ __fhir_version__ = "5.0.0"
 
 
 def construct_fhir_element(
-    element_type: str, data: Union[Dict[str, Any], str, bytes, Path]
+    element_type: str,
+    data: Union[Dict[str, Any], str, bytes, Path],
+    *,
+    trusted: bool = False,
+    fail_fast: bool = False,
+    elements: Optional[Union[str, Iterable[str]]] = None,
 ) -> FHIRAbstractModel:
+    """:param trusted: data is coming from trusted source (i.e. validated and
+    stored by own), so model is constructed without any validation.
+    See ``FHIRAbstractModel.construct_trusted`` and ``validate_now``.
+    :param fail_fast: stops at the first error, ``FailFastError`` carries
+    JSON path of the error. See ``FHIRAbstractModel.parse_obj``.
+    :param elements: projection (same as FHIR ``_elements``), only listed
+    and mandatory elements are validated and constructed, others are dropped.
+    See ``FHIRAbstractModel.get_projection``.
+    """
     try:
         klass = get_fhir_model_class(element_type)
     except KeyError:
         raise LookupError(
             f"'{element_type}' is not valid FHIRModel (element type) name!"
         )
+    if trusted:
+        if isinstance(data, (str, bytes)):
+            data = klass.__config__.json_loads(data)
+        elif isinstance(data, Path):
+            data = load_file(data, json_loads=klass.__config__.json_loads, cls=klass)
+            if isinstance(data, FHIRAbstractModel):
+                # XML is always validated
+                return data
+        if elements is not None:
+            data = klass.project(data, elements)
+        return klass.construct_trusted(data)
     if isinstance(data, (str, bytes)):
-        return klass.parse_raw(data, content_type="application/json")
+        return klass.parse_raw(
+            data,
+            content_type="application/json",
+            fail_fast=fail_fast,
+            elements=elements,
+        )
     elif isinstance(data, Path):
-        return klass.parse_file(data)
-    return klass.parse_obj(data)
+        return klass.parse_file(data, fail_fast=fail_fast, elements=elements)
+    return klass.parse_obj(data, fail_fast=fail_fast, elements=elements)
+
+
+def validate(
+    element_type: str, data: Union[Dict[str, Any], str, bytes]
+) -> List[ErrorDetail]:
+    """Validates data without constructing any model (i.e. gatekeeping),
+    returns errors (empty if valid), those are identical to
+    ``ValidationError.errors()`` of ``construct_fhir_element``.
+    """
+    if isinstance(data, (str, bytes)):
+        return validate_bytes(element_type, data)
+    try:
+        klass = get_fhir_model_class(element_type)
+    except KeyError:
+        raise LookupError(
+            f"'{element_type}' is not valid FHIRModel (element type) name!"
+        )
+    return validate_obj(klass, data)
+
+
+def validate_bytes(element_type: str, data: Union[str, bytes]) -> List[ErrorDetail]:
+    """Same as ``validate`` but for raw JSON."""
+    try:
+        klass = get_fhir_model_class(element_type)
+    except KeyError:
+        raise LookupError(
+            f"'{element_type}' is not valid FHIRModel (element type) name!"
+        )
+    return validate_raw(klass, data)
 
 
-__all__ = ["get_fhir_model_class", "construct_fhir_element"]
+__all__ = [
+    "get_fhir_model_class",
+    "construct_fhir_element",
+    "diff",
+    "PatchOp",
+    "validate",
+    "validate_bytes",
+    "warmup",
+]
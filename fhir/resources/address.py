@@ -41,6 +41,7 @@ class Address(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     city__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_city", title="Extension field for ``city``."
@@ -53,6 +54,7 @@ class Address(datatype.DataType):
         description="Country - a nation as commonly understood or generally accepted.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     country__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_country", title="Extension field for ``country``."
@@ -65,6 +67,7 @@ class Address(datatype.DataType):
         description="The name of the administrative area (county).",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     district__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_district", title="Extension field for ``district``."
@@ -81,6 +84,7 @@ class Address(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     line__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -93,6 +97,7 @@ class Address(datatype.DataType):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     postalCode: fhirtypes.String = Field(
@@ -102,6 +107,7 @@ class Address(datatype.DataType):
         description="A postal code designating a region defined by the postal service.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     postalCode__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_postalCode", title="Extension field for ``postalCode``."
@@ -118,6 +124,7 @@ class Address(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     state__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_state", title="Extension field for ``state``."
@@ -134,6 +141,7 @@ class Address(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     text__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_text", title="Extension field for ``text``."
@@ -150,6 +158,7 @@ class Address(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["postal", "physical", "both"],
@@ -165,6 +174,7 @@ class Address(datatype.DataType):
         description="The purpose of this address.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["home", "work", "temp", "old", "billing"],
@@ -33,6 +33,7 @@ class Attachment(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     contentType__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_contentType", title="Extension field for ``contentType``."
@@ -45,6 +46,7 @@ class Attachment(datatype.DataType):
         description="The date that the attachment was first created.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     creation__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_creation", title="Extension field for ``creation``."
@@ -102,6 +104,7 @@ class Attachment(datatype.DataType):
         description="The calculated hash of the data using SHA-1. Represented using base64.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     hash__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_hash", title="Extension field for ``hash``."
@@ -129,6 +132,7 @@ class Attachment(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     language__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_language", title="Extension field for ``language``."
@@ -156,6 +160,7 @@ class Attachment(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     size__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_size", title="Extension field for ``size``."
@@ -168,6 +173,7 @@ class Attachment(datatype.DataType):
         description="A label or set of text to display in place of the data.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     title__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_title", title="Extension field for ``title``."
@@ -180,6 +186,7 @@ class Attachment(datatype.DataType):
         description="A location where the data can be accessed.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     url__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_url", title="Extension field for ``url``."
@@ -30,6 +30,7 @@ class Availability(datatype.DataType):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     notAvailableTime: typing.List[fhirtypes.AvailabilityNotAvailableTimeType] = Field(
@@ -39,6 +40,7 @@ class Availability(datatype.DataType):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -67,6 +69,7 @@ class AvailabilityAvailableTime(element.Element):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     allDay__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_allDay", title="Extension field for ``allDay``."
@@ -79,6 +82,7 @@ class AvailabilityAvailableTime(element.Element):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     availableEndTime__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -93,6 +97,7 @@ class AvailabilityAvailableTime(element.Element):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     availableStartTime__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -107,6 +112,7 @@ class AvailabilityAvailableTime(element.Element):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["mon", "tue", "wed", "thu", "fri", "sat", "sun"],
@@ -148,6 +154,7 @@ class AvailabilityNotAvailableTime(element.Element):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     description__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_description", title="Extension field for ``description``."
@@ -160,6 +167,7 @@ class AvailabilityNotAvailableTime(element.Element):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -46,6 +46,7 @@ class BackboneType(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
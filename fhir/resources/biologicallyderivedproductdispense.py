@@ -8,9 +8,7 @@ Last updated: 2023-03-26T15:21:02.749+11:00
 """
 import typing
 
-from pydantic import Field, root_validator
-from pydantic.error_wrappers import ErrorWrapper, ValidationError
-from pydantic.errors import MissingError, NoneIsNotAllowedError
+from pydantic import Field
 
 from . import backboneelement, domainresource, fhirtypes
 
@@ -39,6 +37,7 @@ class BiologicallyDerivedProductDispense(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["ServiceRequest"],
     )
@@ -53,6 +52,7 @@ class BiologicallyDerivedProductDispense(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Location"],
     )
@@ -68,6 +68,7 @@ class BiologicallyDerivedProductDispense(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     location: fhirtypes.ReferenceType = Field(
@@ -77,6 +78,7 @@ class BiologicallyDerivedProductDispense(domainresource.DomainResource):
         description="The physical location where the dispense was performed.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Location"],
     )
@@ -88,6 +90,7 @@ class BiologicallyDerivedProductDispense(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     note: typing.List[fhirtypes.AnnotationType] = Field(
@@ -97,6 +100,7 @@ class BiologicallyDerivedProductDispense(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     originRelationshipType: fhirtypes.CodeableConceptType = Field(
@@ -109,6 +113,7 @@ class BiologicallyDerivedProductDispense(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     partOf: typing.List[fhirtypes.ReferenceType] = Field(
@@ -118,6 +123,7 @@ class BiologicallyDerivedProductDispense(domainresource.DomainResource):
         description="A larger event of which this particular event is a component.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["BiologicallyDerivedProductDispense"],
     )
@@ -132,6 +138,7 @@ class BiologicallyDerivedProductDispense(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Patient"],
     )
@@ -145,6 +152,7 @@ class BiologicallyDerivedProductDispense(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     preparedDate: fhirtypes.DateTime = Field(
@@ -154,6 +162,7 @@ class BiologicallyDerivedProductDispense(domainresource.DomainResource):
         description="When the product was selected/ matched.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     preparedDate__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_preparedDate", title="Extension field for ``preparedDate``."
@@ -169,6 +178,7 @@ class BiologicallyDerivedProductDispense(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["BiologicallyDerivedProduct"],
     )
@@ -184,6 +194,7 @@ class BiologicallyDerivedProductDispense(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     status: fhirtypes.Code = Field(
@@ -196,6 +207,7 @@ class BiologicallyDerivedProductDispense(domainresource.DomainResource):
         description="A code specifying the state of the dispense event.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -221,6 +233,7 @@ class BiologicallyDerivedProductDispense(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     usageInstruction__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -235,6 +248,7 @@ class BiologicallyDerivedProductDispense(domainresource.DomainResource):
         description="When the product was dispatched for clinical use.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     whenHandedOver__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_whenHandedOver", title="Extension field for ``whenHandedOver``."
@@ -273,65 +287,6 @@ class BiologicallyDerivedProductDispense(domainresource.DomainResource):
             "usageInstruction",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_3680(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("status", "status__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class BiologicallyDerivedProductDispensePerformer(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -350,6 +305,7 @@ class BiologicallyDerivedProductDispensePerformer(backboneelement.BackboneElemen
         description="Identifies the person responsible for the action.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Practitioner"],
     )
@@ -361,6 +317,7 @@ class BiologicallyDerivedProductDispensePerformer(backboneelement.BackboneElemen
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
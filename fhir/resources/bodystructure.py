@@ -33,6 +33,7 @@ class BodyStructure(domainresource.DomainResource):
         description="Whether this body site is in active use.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     active__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_active", title="Extension field for ``active``."
@@ -45,6 +46,7 @@ class BodyStructure(domainresource.DomainResource):
         description="A summary, characterization or explanation of the body structure.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     description__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_description", title="Extension field for ``description``."
@@ -71,6 +73,7 @@ class BodyStructure(domainresource.DomainResource):
         description="Identifier for this instance of the anatomical structure.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     image: typing.List[fhirtypes.AttachmentType] = Field(
@@ -107,6 +110,7 @@ class BodyStructure(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     patient: fhirtypes.ReferenceType = Field(
@@ -116,6 +120,7 @@ class BodyStructure(domainresource.DomainResource):
         description="The person to which the body site belongs.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Patient"],
     )
@@ -208,6 +213,7 @@ class BodyStructureIncludedStructure(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
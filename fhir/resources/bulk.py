@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""Parallel bulk parsing of FHIR resources."""
+import typing
+
+from fhir.resources.core.bulk import ParseOutcome, PayloadType
+from fhir.resources.core.bulk import parse_many as _parse_many
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+FHIR_RELEASE = "R5"
+
+
+def parse_many(
+    payloads: typing.Iterable[PayloadType],
+    *,
+    workers: int = None,
+    chunk_size: int = 64,
+    validate_only: bool = False,
+    resource_types: typing.Optional[typing.Sequence[str]] = None,
+    fail_fast: bool = False,
+) -> typing.Iterator[ParseOutcome]:
+    """Parse and validate raw JSON payloads (bytes, str or dict) in a pool of
+    ``workers`` processes (default number of CPUs, ``0`` means no pool),
+    yields ``ParseOutcome`` in the same order as payloads.
+
+    :param chunk_size: number of payloads sent to a worker at once.
+    :param validate_only: models are not sent back, only validation outcome.
+    :param resource_types: model classes to be imported while warming up
+        workers, default all.
+    :param fail_fast: only the first error of each invalid payload is
+        reported, which is much cheaper for heavily corrupted input.
+    """
+    return _parse_many(
+        payloads,
+        FHIR_RELEASE,
+        workers=workers,
+        chunk_size=chunk_size,
+        validate_only=validate_only,
+        resource_types=resource_types,
+        fail_fast=fail_fast,
+    )
+
+
+__all__ = ["ParseOutcome", "parse_many"]
@@ -33,6 +33,7 @@ class CodeableReference(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     reference: fhirtypes.ReferenceType = Field(
@@ -45,6 +46,7 @@ class CodeableReference(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -30,6 +30,7 @@ class ContactPoint(datatype.DataType):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     rank: fhirtypes.PositiveInt = Field(
@@ -43,6 +44,7 @@ class ContactPoint(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     rank__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_rank", title="Extension field for ``rank``."
@@ -58,6 +60,7 @@ class ContactPoint(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["phone", "fax", "email", "pager", "url", "sms", "other"],
@@ -73,6 +76,7 @@ class ContactPoint(datatype.DataType):
         description="Identifies the purpose for the contact point.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["home", "work", "temp", "old", "mobile"],
@@ -91,6 +95,7 @@ class ContactPoint(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     value__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_value", title="Extension field for ``value``."
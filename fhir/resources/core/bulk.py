@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""Parallel parsing of many raw JSON payloads, backed by a process pool.
+
+Payloads are sent to worker processes in chunks (to amortize IPC cost),
+parsed and validated there and results are yielded in the input order.
+Worker processes are warmed up by importing model classes
+(``fhirtypesvalidators.MODEL_CLASSES``) in advance.
+"""
+import collections
+import itertools
+import os
+import typing
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from pydantic.error_wrappers import ValidationError
+from pydantic.utils import ROOT_KEY
+
+from .fhirabstractmodel import FHIRAbstractModel
+from .utils.common import get_fhir_root_module
+from .warmup import warmup_release
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+PayloadType = typing.Union[bytes, str, typing.Dict[str, typing.Any]]
+
+# FHIR release of the current worker process
+_WORKER_FHIR_RELEASE: typing.Optional[str] = None
+
+
+class ParseOutcome(typing.NamedTuple):
+    """Result of a single payload, ``model`` is ``None`` if validation is failed
+    or only outcome is requested (``validate_only``). ``errors`` are in
+    ``pydantic.ValidationError.errors()`` format."""
+
+    resource_type: typing.Optional[str]
+    model: typing.Optional[FHIRAbstractModel]
+    errors: typing.Optional[typing.List[typing.Dict[str, typing.Any]]]
+
+    @property
+    def valid(self) -> bool:
+        """ """
+        return self.errors is None
+
+
+def warmup_worker(
+    fhir_release: str, resource_types: typing.Optional[typing.Sequence[str]] = None
+):
+    """Process pool initializer, imports all (or given) model classes
+    and fills their caches."""
+    global _WORKER_FHIR_RELEASE
+    _WORKER_FHIR_RELEASE = fhir_release
+    warmup_release(fhir_release, resource_types)
+
+
+def parse_payload(
+    fhir_release: str,
+    payload: PayloadType,
+    validate_only: bool = False,
+    fail_fast: bool = False,
+) -> ParseOutcome:
+    """ """
+    resource_type = None
+    try:
+        if isinstance(payload, (str, bytes)):
+            payload = FHIRAbstractModel.__config__.json_loads(payload)
+        resource_type = payload.get("resourceType", None)  # type: ignore
+        if resource_type is None:
+            raise ValueError("``resourceType`` is missing.")
+        klass = get_fhir_root_module(fhir_release).get_fhir_model_class(resource_type)
+        model = klass.parse_obj(payload, fail_fast=fail_fast)
+    except ValidationError as exc:
+        return ParseOutcome(resource_type, None, exc.errors())
+    except Exception as exc:  # noqa: B902
+        return ParseOutcome(
+            resource_type,
+            None,
+            [{"loc": (ROOT_KEY,), "msg": str(exc), "type": "value_error"}],
+        )
+    if validate_only:
+        model = None
+    return ParseOutcome(resource_type, model, None)
+
+
+def parse_chunk(
+    chunk: typing.List[PayloadType],
+    validate_only: bool = False,
+    fail_fast: bool = False,
+) -> typing.List[ParseOutcome]:
+    """Runs inside worker process."""
+    fhir_release = typing.cast(str, _WORKER_FHIR_RELEASE)
+    return [
+        parse_payload(fhir_release, payload, validate_only, fail_fast)
+        for payload in chunk
+    ]
+
+
+def parse_many(
+    payloads: typing.Iterable[PayloadType],
+    fhir_release: str,
+    *,
+    workers: int = None,
+    chunk_size: int = 64,
+    validate_only: bool = False,
+    resource_types: typing.Optional[typing.Sequence[str]] = None,
+    fail_fast: bool = False,
+) -> typing.Iterator[ParseOutcome]:
+    """Yields ``ParseOutcome`` for each payload (same order as input).
+    Payloads are consumed lazily, at most ``workers * 2`` chunks are pending.
+    ``workers=0`` parses in the current process (no pool)."""
+    if chunk_size < 1:
+        raise ValueError("``chunk_size`` must be greater than 0.")
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    iterator = iter(payloads)
+    chunks = iter(lambda: list(itertools.islice(iterator, chunk_size)), [])
+
+    if workers == 0:
+        for chunk in chunks:
+            for payload in chunk:
+                yield parse_payload(fhir_release, payload, validate_only, fail_fast)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=warmup_worker,
+        initargs=(fhir_release, resource_types),
+    ) as executor:
+        pending: typing.Deque[Future] = collections.deque()
+        for chunk in chunks:
+            pending.append(executor.submit(parse_chunk, chunk, validate_only, fail_fast))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+__all__ = ["ParseOutcome", "parse_many"]
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""Incremental (streaming) parsing of huge JSON ``Bundle``.
+Source is read in chunks and ``entry`` items are decoded and validated
+one by one, so memory usage depends on the biggest entry,
+not on the size of the Bundle."""
+import pathlib
+import re
+import typing
+
+from .fhirabstractmodel import FHIRAbstractModel
+from .utils.common import get_fhir_root_module, normalize_fhir_type_class
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+CHUNK_SIZE = 64 * 1024
+
+WHITESPACES = b" \t\r\n"
+# next structural character outside string
+STRUCTURAL_RE = re.compile(rb'["{}\[\]]')
+# end of string or escape inside string
+STRING_SPECIAL_RE = re.compile(rb'["\\]')
+# end of scalar (number, true, false, null)
+SCALAR_END_RE = re.compile(rb"[\s,}\]]")
+
+SourceType = typing.Union[str, pathlib.Path, typing.IO]
+
+
+class RawJSONStream:
+    """Minimal pull tokenizer, returns raw bytes of JSON values
+    (without decoding them) from a binary stream."""
+
+    def __init__(self, fp: typing.IO, chunk_size: int = CHUNK_SIZE):
+        """ """
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = bytearray()
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> int:
+        """Reads next chunk, consumed bytes are dropped from buffer.
+        Returns shift (number of dropped bytes) for the indexes kept by caller."""
+        if self.eof:
+            raise ValueError("Unexpected end of JSON stream.")
+        shift = self.pos
+        if shift > 0:
+            del self.buf[:shift]
+            self.pos = 0
+        chunk = self.fp.read(self.chunk_size)
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        if not chunk:
+            self.eof = True
+        self.buf += chunk
+        return shift
+
+    def peek(self) -> int:
+        """Skips whitespaces, returns next character (as int) without consuming."""
+        while True:
+            buf = self.buf
+            length = len(buf)
+            pos = self.pos
+            while pos < length and buf[pos] in WHITESPACES:
+                pos += 1
+            self.pos = pos
+            if pos < length:
+                return buf[pos]
+            self.fill()
+
+    def expect(self, char: bytes):
+        """ """
+        if self.peek() != char[0]:
+            raise ValueError(
+                f"Expected {char!r} at position {self.pos}, "
+                f"but got {bytes([self.buf[self.pos]])!r}."
+            )
+        self.pos += 1
+
+    def read_value(self) -> bytes:
+        """Returns raw bytes of next JSON value (object, array, string or scalar)."""
+        first = self.peek()
+        start = self.pos
+        if first == ord('"'):
+            end = self._scan_string(start + 1)
+        elif first in b"{[":
+            end = self._scan_container(start)
+        else:
+            end = self._scan_scalar(start)
+        start = self.pos
+        self.pos = end
+        return bytes(self.buf[start:end])
+
+    def _scan_string(self, idx: int) -> int:
+        """``idx`` is just after opening quote, returns index after closing quote."""
+        while True:
+            match = STRING_SPECIAL_RE.search(self.buf, idx)
+            if match is None or (
+                self.buf[match.start()] == 92 and match.start() + 1 >= len(self.buf)
+            ):
+                idx -= self.fill()
+                continue
+            if self.buf[match.start()] == 92:  # backslash
+                idx = match.start() + 2
+                continue
+            return match.end()
+
+    def _scan_container(self, idx: int) -> int:
+        """ """
+        depth = 0
+        while True:
+            match = STRUCTURAL_RE.search(self.buf, idx)
+            if match is None:
+                idx = len(self.buf) - self.fill()
+                continue
+            char = self.buf[match.start()]
+            idx = match.end()
+            if char == 34:  # quote
+                idx = self._scan_string(idx)
+            elif char in b"{[":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return idx
+
+    def _scan_scalar(self, idx: int) -> int:
+        """ """
+        while True:
+            match = SCALAR_END_RE.search(self.buf, idx)
+            if match is not None:
+                return match.start()
+            if self.eof:
+                return len(self.buf)
+            idx = len(self.buf) - self.fill()
+
+
+class BundleEntryReader:
+    """Iterable of validated ``BundleEntry`` (or entry ``resource`` if
+    ``resources`` is ``True``) from a JSON Bundle.
+
+    Top level Bundle elements (``type``, ``total``, ``link``...) are available
+    as ``header`` (decoded dict) and ``bundle`` (``Bundle`` without entries).
+    Elements are added while reading, so the elements that come after
+    ``entry`` in the document are available at the end of iteration.
+    """
+
+    def __init__(
+        self,
+        bundle_class: typing.Type[FHIRAbstractModel],
+        source: SourceType,
+        *,
+        resources: bool = False,
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        """ """
+        self.bundle_class = bundle_class
+        self.source = source
+        self.resources = resources
+        self.chunk_size = chunk_size
+        self.header: typing.Dict[str, typing.Any] = {}
+        self._bundle: typing.Optional[FHIRAbstractModel] = None
+        self._json_loads = bundle_class.__config__.json_loads
+
+        entry_type = normalize_fhir_type_class(bundle_class.__fields__["entry"].type_)
+        self.entry_class = get_fhir_root_module(
+            entry_type.__fhir_release__
+        ).get_fhir_model_class(entry_type.__resource_type__)
+
+    @property
+    def bundle(self) -> FHIRAbstractModel:
+        """``Bundle`` (validated) from top level elements read so far."""
+        if self._bundle is None:
+            self._bundle = self.bundle_class.parse_obj(self.header)
+        return self._bundle
+
+    def __iter__(self) -> typing.Iterator[FHIRAbstractModel]:
+        """ """
+        if isinstance(self.source, (str, pathlib.Path)):
+            with open(self.source, "rb") as fp:
+                yield from self._iter(fp)
+        else:
+            yield from self._iter(typing.cast(typing.IO, self.source))
+
+    def _iter(self, fp: typing.IO) -> typing.Iterator[FHIRAbstractModel]:
+        """ """
+        stream = RawJSONStream(fp, self.chunk_size)
+        stream.expect(b"{")
+        if stream.peek() == ord("}"):
+            return
+        while True:
+            key = self._json_loads(stream.read_value())
+            stream.expect(b":")
+            if key == "entry" and stream.peek() == ord("["):
+                stream.pos += 1
+                if stream.peek() == ord("]"):
+                    stream.pos += 1
+                else:
+                    while True:
+                        yield self._make_entry(stream.read_value())
+                        if stream.peek() == ord("]"):
+                            stream.pos += 1
+                            break
+                        stream.expect(b",")
+            else:
+                self.header[key] = self._json_loads(stream.read_value())
+                self._bundle = None
+            if stream.peek() == ord("}"):
+                break
+            stream.expect(b",")
+
+    def _make_entry(self, raw: bytes) -> FHIRAbstractModel:
+        """ """
+        entry = self.entry_class.parse_raw(raw)
+        if self.resources:
+            return entry.resource  # type: ignore
+        return entry
+
+
+def iter_bundle_entries(
+    bundle_class: typing.Type[FHIRAbstractModel],
+    source: SourceType,
+    *,
+    resources: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+) -> BundleEntryReader:
+    """ """
+    return BundleEntryReader(
+        bundle_class, source, resources=resources, chunk_size=chunk_size
+    )
+
+
+__all__ = ["BundleEntryReader", "RawJSONStream", "iter_bundle_entries"]
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""Table driven FHIR element constraints (required primitive elements and
+choice of data types), compiled per model class from fields' metadata
+(``element_required``, ``one_of_many``, ``one_of_many_required``)
+and checked by ``FHIRAbstractModel.validate_element_constraints``."""
+import typing
+
+from pydantic.error_wrappers import ErrorWrapper, ValidationError
+from pydantic.errors import MissingError, NoneIsNotAllowedError
+
+if typing.TYPE_CHECKING:
+    from pydantic import BaseModel
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+_missing = object()
+
+
+class RequiredPrimitiveElement(typing.NamedTuple):
+    """ """
+
+    alias: str
+    ext_key: str
+    ext_alias: str
+
+
+class OneOfManyElement(typing.NamedTuple):
+    """ """
+
+    prefix: str
+    fields: typing.Tuple[str, ...]
+    required: bool
+
+
+class ElementConstraints(typing.NamedTuple):
+    """Constraints of fields those are declared by the same class."""
+
+    required_primitives: typing.Tuple[RequiredPrimitiveElement, ...]
+    one_of_many: typing.Tuple[OneOfManyElement, ...]
+
+
+def compile_element_constraints(
+    model_class: typing.Type["BaseModel"],
+) -> typing.Tuple[ElementConstraints, ...]:
+    """Returns constraints for all classes in MRO (base class first),
+    only non-empty tables are included."""
+    tables: typing.List[ElementConstraints] = []
+    for klass in reversed(model_class.__mro__):
+        own_fields = klass.__dict__.get("__annotations__", None)
+        if not own_fields or "__fields__" not in klass.__dict__:
+            continue
+        required_primitives: typing.List[RequiredPrimitiveElement] = []
+        one_of_many: typing.Dict[str, typing.List[str]] = {}
+        one_of_many_required: typing.Dict[str, bool] = {}
+
+        for name in own_fields:
+            field = model_class.__fields__.get(name, None)
+            if field is None:
+                continue
+            extra = field.field_info.extra
+            ext_field = model_class.__fields__.get(f"{name}__ext", None)
+            if extra.get("element_required", False) is True and ext_field is not None:
+                required_primitives.append(
+                    RequiredPrimitiveElement(
+                        alias=field.alias,
+                        ext_key=ext_field.name,
+                        ext_alias=ext_field.alias,
+                    )
+                )
+            prefix = extra.get("one_of_many", None)
+            if prefix:
+                if prefix not in one_of_many:
+                    one_of_many[prefix] = []
+                    one_of_many_required[prefix] = (
+                        extra.get("one_of_many_required", False) is True
+                    )
+                one_of_many[prefix].append(name)
+
+        if required_primitives or one_of_many:
+            tables.append(
+                ElementConstraints(
+                    required_primitives=tuple(required_primitives),
+                    one_of_many=tuple(
+                        OneOfManyElement(
+                            prefix=prefix,
+                            fields=tuple(fields),
+                            required=one_of_many_required[prefix],
+                        )
+                        for prefix, fields in one_of_many.items()
+                    ),
+                )
+            )
+    return tuple(tables)
+
+
+def validate_required_primitive_elements(
+    model_class: typing.Type["BaseModel"],
+    values: typing.Dict[str, typing.Any],
+    required_primitives: typing.Tuple[RequiredPrimitiveElement, ...],
+):
+    """https://www.hl7.org/fhir/extensibility.html#Special-Case
+    In some cases, implementers might find that they do not have appropriate data for
+    an element with minimum cardinality = 1. In this case, the element must be present,
+    but unless the resource or a profile on it has made the actual value of the primitive
+    data type mandatory, it is possible to provide an extension that explains why
+    the primitive value is not present.
+    """
+    errors: typing.List[ErrorWrapper] = []
+    for alias, ext_key, ext_alias in required_primitives:
+        value = values.get(alias, _missing)
+        if value is not _missing and value is not None:
+            continue
+        ext_value = values.get(ext_alias, _missing)
+        missing_ext = True
+        if ext_value is not _missing and ext_value is not None:
+            if isinstance(ext_value, dict):
+                missing_ext = len(ext_value.get("extension", [])) == 0
+            elif (
+                getattr(ext_value.__class__, "get_resource_type", _fallback)()
+                == "FHIRPrimitiveExtension"
+            ):
+                if ext_value.extension and len(ext_value.extension) > 0:
+                    missing_ext = False
+            else:
+                validate_pass = True
+                ext_field = model_class.__fields__[ext_key]
+                for validator in ext_field.type_.__get_validators__():
+                    try:
+                        ext_value = validator(v=ext_value)
+                    except ValidationError as exc:
+                        errors.append(ErrorWrapper(exc, loc=ext_alias))
+                        validate_pass = False
+                if not validate_pass:
+                    continue
+                if ext_value.extension and len(ext_value.extension) > 0:
+                    missing_ext = False
+        if missing_ext:
+            if value is _missing:
+                errors.append(ErrorWrapper(MissingError(), loc=alias))
+            else:
+                errors.append(ErrorWrapper(NoneIsNotAllowedError(), loc=alias))
+    if len(errors) > 0:
+        raise ValidationError(errors, model_class)  # type: ignore
+
+
+def validate_one_of_many(
+    values: typing.Dict[str, typing.Any],
+    one_of_many: typing.Tuple[OneOfManyElement, ...],
+):
+    """https://www.hl7.org/fhir/formats.html#choice
+    A few elements have a choice of more than one data type for their content.
+    All such elements have a name that takes the form nnn[x].
+    The "nnn" part of the name is constant, and the "[x]" is replaced with
+    the title-cased name of the type that is actually used.
+    The table view shows each of these names explicitly.
+
+    Elements that have a choice of data type cannot repeat - they must have a
+    maximum cardinality of 1. When constructing an instance of an element with a
+    choice of types, the authoring system must create a single element with a
+    data type chosen from among the list of permitted data types.
+    """
+    for _, fields, required in one_of_many:
+        found = False
+        for field in fields:
+            if field in values and values[field] is not None:
+                if found is True:
+                    raise ValueError(
+                        "Any of one field value is expected from "
+                        f"this list {list(fields)}, but got multiple!"
+                    )
+                else:
+                    found = True
+        if required is True and found is False:
+            raise ValueError(
+                f"Expect any of field value from this list {list(fields)}."
+            )
+
+
+def _fallback():
+    return ""
+
+
+__all__ = [
+    "ElementConstraints",
+    "OneOfManyElement",
+    "RequiredPrimitiveElement",
+    "compile_element_constraints",
+    "validate_one_of_many",
+    "validate_required_primitive_elements",
+]
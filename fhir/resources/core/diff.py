@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""Structural diff of two FHIR models as JSON Patch (RFC 6902) operations.
+
+Both models are walked through in specification order
+(``FHIRAbstractModel.get_serialization_plan``), including primitive
+extensions (``_birthDate``). Identical (same object) subtrees are skipped,
+others are compared structurally, without any serialization. Cached digests
+(``core.fingerprint``) are deliberately not used as a shortcut, equality of
+digests doesn't cover values changed after hashing.
+Applying the operations in order to ``a.dict()`` results ``b.dict()``.
+"""
+import typing
+
+from .fhirabstractmodel import FHIRAbstractModel
+from .lazy import LazyResource
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+class PatchOp(typing.NamedTuple):
+    """Single JSON Patch operation (``add``, ``remove`` or ``replace``),
+    ``path`` is JSON Pointer, ``value`` is same as of ``dict()``."""
+
+    op: str
+    path: str
+    value: typing.Any = None
+
+    def as_dict(self) -> typing.Dict[str, typing.Any]:
+        """ """
+        if self.op == "remove":
+            return {"op": self.op, "path": self.path}
+        return {"op": self.op, "path": self.path, "value": self.value}
+
+
+def _resolve(v: typing.Any) -> typing.Any:
+    """ """
+    if isinstance(v, LazyResource):
+        return v.resolve()
+    return v
+
+
+def _to_value(v: typing.Any) -> typing.Any:
+    """Same as value of ``dict()``"""
+    return FHIRAbstractModel._fhir_get_value(
+        _resolve(v), by_alias=True, exclude_none=True, exclude_comments=True
+    )
+
+
+def _is_empty(v: typing.Any) -> bool:
+    """Not emitted by ``dict()``, including nested model without any
+    value (i.e. ``Meta()``)."""
+    if v is None:
+        return True
+    if isinstance(v, list):
+        return len(v) == 0
+    if isinstance(v, FHIRAbstractModel):
+        return _is_empty_model(v)
+    return False
+
+
+def _is_empty_model(model: FHIRAbstractModel) -> bool:
+    """Same as ``_to_value(model) is None``, without serialization."""
+    if model.__class__.has_resource_base():
+        # ``resourceType`` is always emitted
+        return False
+    values = model.__dict__
+    for field_key, _, _, ext_key, _ in model.__class__.get_serialization_plan():
+        for key in (field_key, ext_key):
+            if key is None:
+                continue
+            v = values.get(key, None)
+            if v is None:
+                continue
+            if isinstance(v, FHIRAbstractModel):
+                if not _is_empty_model(v):
+                    return False
+            elif not isinstance(v, list) or len(v) > 0:
+                return False
+    return True
+
+
+def _ext_value(v: typing.Any) -> typing.Any:
+    """Primitive extension having only ``fhir_comments`` is not emitted."""
+    if v is None or _to_value(v) is None:
+        return None
+    return v
+
+
+def _escape(key: str) -> str:
+    """JSON Pointer reference token."""
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def is_same(a: typing.Any, b: typing.Any) -> bool:
+    """ """
+    if a is b:
+        return True
+    a, b = _resolve(a), _resolve(b)
+    if isinstance(a, FHIRAbstractModel) or isinstance(b, FHIRAbstractModel):
+        if a.__class__ is not b.__class__:
+            return False
+        return is_same_model(a, b)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(is_same(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def is_same_model(a: FHIRAbstractModel, b: FHIRAbstractModel) -> bool:
+    """Structural comparison, without any serialization."""
+    values_a = a.__dict__
+    values_b = b.__dict__
+    for field_key, _, _, ext_key, _ in a.__class__.get_serialization_plan():
+        for key in (field_key, ext_key):
+            if key is None:
+                continue
+            va = values_a.get(key, None)
+            vb = values_b.get(key, None)
+            if va is vb:
+                continue
+            if key == ext_key:
+                va, vb = _ext_value(va), _ext_value(vb)
+            if _is_empty(va) or _is_empty(vb):
+                if not (_is_empty(va) and _is_empty(vb)):
+                    return False
+            elif not is_same(va, vb):
+                return False
+    return True
+
+
+def diff_value(a: typing.Any, b: typing.Any, path: str, ops: typing.List[PatchOp]):
+    """ """
+    if a is b:
+        return
+    a, b = _resolve(a), _resolve(b)
+    if isinstance(a, FHIRAbstractModel) and a.__class__ is b.__class__:
+        empty_a, empty_b = _is_empty(a), _is_empty(b)
+        if empty_a != empty_b:
+            # i.e. list item, ``None`` in ``dict()``
+            ops.append(PatchOp("replace", path, _to_value(b)))
+        elif not empty_a:
+            diff_model(a, b, path, ops)
+    elif isinstance(a, list) and isinstance(b, list):
+        diff_list(a, b, path, ops)
+    elif not is_same(a, b):
+        ops.append(PatchOp("replace", path, _to_value(b)))
+
+
+def diff_model(
+    a: FHIRAbstractModel, b: FHIRAbstractModel, path: str, ops: typing.List[PatchOp]
+):
+    """ """
+    values_a = a.__dict__
+    values_b = b.__dict__
+    for field_key, alias, _, ext_key, ext_alias in (
+        a.__class__.get_serialization_plan()
+    ):
+        for key, name in ((field_key, alias), (ext_key, ext_alias)):
+            if key is None:
+                continue
+            va = values_a.get(key, None)
+            vb = values_b.get(key, None)
+            if va is vb:
+                continue
+            if key == ext_key:
+                va, vb = _ext_value(va), _ext_value(vb)
+            path_ = f"{path}/{_escape(name)}"
+            if _is_empty(va):
+                if not _is_empty(vb):
+                    ops.append(PatchOp("add", path_, _to_value(vb)))
+            elif _is_empty(vb):
+                ops.append(PatchOp("remove", path_))
+            else:
+                diff_value(va, vb, path_, ops)
+
+
+def diff_list(
+    a: typing.List[typing.Any],
+    b: typing.List[typing.Any],
+    path: str,
+    ops: typing.List[PatchOp],
+):
+    """Common head and tail are skipped, middle items are compared
+    pairwise, then rest of them are removed or added."""
+    len_a, len_b = len(a), len(b)
+    start = 0
+    while start < len_a and start < len_b and is_same(a[start], b[start]):
+        start += 1
+    end = 0
+    while (
+        end < len_a - start
+        and end < len_b - start
+        and is_same(a[len_a - end - 1], b[len_b - end - 1])
+    ):
+        end += 1
+
+    middle_a = len_a - start - end
+    middle_b = len_b - start - end
+    common = min(middle_a, middle_b)
+    for index in range(start, start + common):
+        diff_value(a[index], b[index], f"{path}/{index}", ops)
+    # removes from the back, so that indexes are kept
+    for index in range(start + middle_a - 1, start + common - 1, -1):
+        ops.append(PatchOp("remove", f"{path}/{index}"))
+    for index in range(start + common, start + middle_b):
+        ops.append(PatchOp("add", f"{path}/{index}", _to_value(b[index])))
+
+
+def diff(a: FHIRAbstractModel, b: FHIRAbstractModel) -> typing.List[PatchOp]:
+    """JSON Patch operations, those transform ``a`` into ``b``
+    (both must be instances of the same class)."""
+    if a.__class__ is not b.__class__:
+        raise TypeError(
+            "Both models must be instances of the same class, "
+            f"but got ``{a.__class__.__name__}`` and ``{b.__class__.__name__}``."
+        )
+    ops: typing.List[PatchOp] = []
+    diff_value(a, b, "", ops)
+    return ops
+
+
+__all__ = ["PatchOp", "diff"]
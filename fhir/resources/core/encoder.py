@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+"""Direct JSON encoder for FHIR models.
+
+It writes JSON bytes straight from model attributes (following
+``FHIRAbstractModel.get_serialization_plan``), instead of building the
+intermediate ``OrderedDict`` tree through ``FHIRAbstractModel.dict``.
+Output is exactly the same as ``FHIRAbstractModel.json``.
+"""
+import typing
+from enum import Enum
+
+from pydantic import BaseModel
+from pydantic.utils import sequence_like
+
+from .fhirabstractmodel import FHIR_COMMENTS_FIELD_NAME, FHIRAbstractModel
+from .lazy import LazyResource, can_emit_raw
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+# minimum size of pending bytes, before writing them into stream
+STREAM_BUFFER_SIZE = 64 * 1024
+
+
+class DirectJSONEncoder:
+    """Writes a model as JSON into a byte buffer (optionally flushed
+    into a binary stream while encoding).
+
+    Empty containers are suppressed (``exclude_none``) after they are written,
+    by truncating the buffer back to a rollback mark; only bytes before the
+    outermost pending mark are allowed to be flushed into the stream.
+    """
+
+    def __init__(
+        self,
+        *,
+        by_alias: bool = True,
+        exclude_none: bool = True,
+        exclude_comments: bool = False,
+        default: typing.Callable[[typing.Any], typing.Any] = None,
+        json_dumps: typing.Callable[..., typing.Any] = None,
+        stream: typing.BinaryIO = None,
+        summary: bool = False,
+    ):
+        """ """
+        self.by_alias = by_alias
+        self.exclude_none = exclude_none
+        self.exclude_comments = exclude_comments
+        self.default = default
+        self.stream = stream
+        self.summary = summary
+
+        if json_dumps is None or (
+            getattr(json_dumps, "__qualname__", "") == "orjson_json_dumps"
+        ):
+            if orjson is None:
+                raise ImportError("``orjson`` library is required.")
+            self._dumps = self._orjson_dumps
+            self._item_sep = b","
+            self._key_sep = b":"
+        else:
+            self._json_dumps = json_dumps
+            self._dumps = self._std_dumps
+            self._item_sep = b", "
+            self._key_sep = b": "
+
+        self._keys: typing.Dict[str, bytes] = {}
+        self._buf = bytearray()
+        self._flushed = 0
+        self._floor: typing.Optional[int] = None
+        self._use_enum_values = False
+
+    def encode(self, model: FHIRAbstractModel) -> typing.Optional[bytes]:
+        """Returns JSON bytes or ``None`` if stream is provided."""
+        self._use_enum_values = getattr(
+            model.__class__.Config, "use_enum_values", False
+        )
+        self._write_model(model, drop_empty=False)
+
+        if self.stream is not None:
+            self.stream.write(self._buf)
+            self._buf.clear()
+            return None
+        return bytes(self._buf)
+
+    # Private methods
+    def _orjson_dumps(self, v: typing.Any) -> bytes:
+        return orjson.dumps(v, default=self.default)
+
+    def _std_dumps(self, v: typing.Any) -> bytes:
+        return self._json_dumps(v, default=self.default).encode("utf-8")
+
+    def _key(self, key: str) -> bytes:
+        try:
+            return self._keys[key]
+        except KeyError:
+            encoded = self._dumps(key) + self._key_sep
+            self._keys[key] = encoded
+            return encoded
+
+    def _begin(self) -> int:
+        """Returns rollback mark for the content going to be written."""
+        mark = self._flushed + len(self._buf)
+        if self._floor is None:
+            self._floor = mark
+        return mark
+
+    def _commit(self):
+        """Something is written for sure, so all pending (outer) containers
+        are not empty anymore."""
+        self._floor = None
+
+    def _rollback(self, mark: int):
+        """ """
+        del self._buf[mark - self._flushed :]
+        if self._floor == mark:
+            self._floor = None
+
+    def _maybe_flush(self):
+        """ """
+        if self.stream is None or len(self._buf) < STREAM_BUFFER_SIZE:
+            return
+        limit = len(self._buf)
+        if self._floor is not None:
+            limit = self._floor - self._flushed
+        if limit <= 0:
+            return
+        self.stream.write(self._buf[:limit])
+        del self._buf[:limit]
+        self._flushed += limit
+
+    def _write_model(self, model: FHIRAbstractModel, drop_empty: bool) -> bool:
+        """Same as ``FHIRAbstractModel._fhir_iter``"""
+        mark = self._begin()
+        buf = self._buf
+        buf += b"{"
+        empty = True
+        if model.__class__.has_resource_base():
+            buf += self._key("resourceType")
+            buf += self._dumps(model.resource_type)
+            self._commit()
+            empty = False
+
+        values = model.__dict__
+        by_alias = self.by_alias
+        for field_key, alias, _, ext_key, ext_alias in (
+            model.__class__.get_serialization_plan(self.summary)
+        ):
+            v = values.get(field_key, None)
+            if v is not None or self.exclude_none is False:
+                if self._write_member(
+                    by_alias and alias or field_key, v, empty, self.exclude_none
+                ):
+                    empty = False
+
+            if ext_key is not None:
+                ext_val = values.get(ext_key, None)
+                if ext_val is not None:
+                    if self._write_member(
+                        by_alias and ext_alias or ext_key, ext_val, empty, True
+                    ):
+                        empty = False
+
+        comments = values.get(FHIR_COMMENTS_FIELD_NAME, None)
+        if comments is not None and not self.exclude_comments:
+            if not empty:
+                buf += self._item_sep
+            buf += self._key(FHIR_COMMENTS_FIELD_NAME)
+            buf += self._dumps(comments)
+            self._commit()
+            empty = False
+
+        if empty and drop_empty:
+            self._rollback(mark)
+            return False
+
+        buf += b"}"
+        self._commit()
+        return True
+
+    def _write_member(
+        self, key: str, v: typing.Any, first: bool, drop_empty: bool
+    ) -> bool:
+        """ """
+        mark = self._begin()
+        if not first:
+            self._buf += self._item_sep
+        self._buf += self._key(key)
+        if self._write_value(v, drop_empty):
+            self._maybe_flush()
+            return True
+        self._rollback(mark)
+        return False
+
+    def _write_value(self, v: typing.Any, drop_empty: bool) -> bool:
+        """Same as ``FHIRAbstractModel._fhir_get_value``, returns ``False``
+        if value is evaluated as ``None`` (nothing is written)."""
+        buf = self._buf
+        if isinstance(v, LazyResource):
+            if not self.summary and can_emit_raw(
+                v, self.by_alias, self.exclude_none, self.exclude_comments
+            ):
+                buf += self._dumps(v.raw)
+                self._commit()
+                return True
+            v = v.resolve()
+
+        if isinstance(v, FHIRAbstractModel):
+            return self._write_model(v, drop_empty)
+
+        if isinstance(v, BaseModel):
+            value = FHIRAbstractModel._fhir_get_value(
+                v,
+                by_alias=self.by_alias,
+                exclude_none=self.exclude_none,
+                exclude_comments=self.exclude_comments,
+            )
+            if value is None:
+                return False
+            buf += self._dumps(value)
+
+        elif isinstance(v, dict):
+            if drop_empty and len(v) == 0:
+                return False
+            buf += b"{"
+            self._commit()
+            for idx, (k_, v_) in enumerate(v.items()):
+                if idx > 0:
+                    buf += self._item_sep
+                buf += self._key(k_)
+                if not self._write_value(v_, self.exclude_none):
+                    buf += b"null"
+            buf += b"}"
+
+        elif sequence_like(v):
+            if drop_empty and len(v) == 0:
+                return False
+            buf += b"["
+            self._commit()
+            for idx, v_ in enumerate(v):
+                if idx > 0:
+                    buf += self._item_sep
+                if not self._write_value(v_, self.exclude_none):
+                    buf += b"null"
+                self._maybe_flush()
+            buf += b"]"
+
+        elif v is None:
+            if drop_empty:
+                return False
+            buf += b"null"
+
+        elif isinstance(v, Enum) and self._use_enum_values:
+            buf += self._dumps(v.value)
+
+        else:
+            buf += self._dumps(v)
+
+        self._commit()
+        return True
+
+
+def json_dumps(
+    model: FHIRAbstractModel,
+    *,
+    by_alias: bool = True,
+    exclude_none: bool = True,
+    exclude_comments: bool = False,
+    default: typing.Callable[[typing.Any], typing.Any] = None,
+    stream: typing.BinaryIO = None,
+    summary: bool = False,
+) -> typing.Optional[bytes]:
+    """Encode model as JSON bytes, without any intermediate dict.
+    If ``stream`` is provided, bytes are written into it and ``None`` is returned.
+    With ``summary``, only summary elements are written.
+    """
+    encoder = DirectJSONEncoder(
+        by_alias=by_alias,
+        exclude_none=exclude_none,
+        exclude_comments=exclude_comments,
+        default=default or model.__json_encoder__,
+        json_dumps=model.__config__.json_dumps,
+        stream=stream,
+        summary=summary,
+    )
+    return encoder.encode(model)
+
+
+__all__ = ["DirectJSONEncoder", "json_dumps"]
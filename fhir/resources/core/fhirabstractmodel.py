@@ -6,18 +6,42 @@ import logging
 import pathlib
 import typing
 from collections import OrderedDict
+from contextlib import contextmanager
 from enum import Enum
 from functools import lru_cache
 
-from pydantic import BaseModel, Extra, Field
+from pydantic import BaseModel, Extra, Field, PrivateAttr
 from pydantic.class_validators import ROOT_VALIDATOR_CONFIG_KEY, root_validator
 from pydantic.error_wrappers import ErrorWrapper, ValidationError
 from pydantic.errors import ConfigError, PydanticValueError
-from pydantic.fields import ModelField
+from pydantic.fields import SHAPE_LIST, ModelField
+from pydantic.main import validate_model
 from pydantic.parse import Protocol
 from pydantic.utils import ROOT_KEY, sequence_like
 
-from .utils import is_primitive_type, load_file, load_str_bytes, xml_dumps, yaml_dumps
+from .constraints import (
+    ElementConstraints,
+    compile_element_constraints,
+    validate_one_of_many,
+    validate_required_primitive_elements,
+)
+from .lazy import LazyResource, can_emit_raw
+from .utils import (
+    is_primitive_type,
+    load_file,
+    load_str_bytes,
+    xml_dump,
+    xml_dumps,
+    yaml_dumps,
+)
+from .utils.common import (
+    FHIR_XML_NS,
+    XHTML_NS,
+    get_fhir_root_module,
+    get_fhir_type_name,
+    is_polymorphic_type,
+    normalize_fhir_type_class,
+)
 
 try:
     import orjson
@@ -57,6 +81,55 @@ logger = logging.getLogger(__name__)
 FHIR_COMMENTS_FIELD_NAME = "fhir_comments"
 
 
+class SerializationPlanItem(typing.NamedTuple):
+    """Single element entry of ``FHIRAbstractModel.get_serialization_plan``"""
+
+    field_key: str
+    alias: str
+    is_primitive: bool
+    ext_key: typing.Optional[str]
+    ext_alias: typing.Optional[str]
+
+
+class ElementDecoder(typing.NamedTuple):
+    """Single entry of ``FHIRAbstractModel.get_decode_table``"""
+
+    field_key: str
+    is_list: bool
+    # value is FHIR model (JSON object), otherwise used as it is.
+    is_model: bool
+    # actual model class is decided by ``resourceType`` of value.
+    polymorphic: bool
+    fhir_release: typing.Optional[str]
+    type_name: typing.Optional[str]
+
+    def get_model_class(
+        self, value: typing.Any = None
+    ) -> typing.Type["FHIRAbstractModel"]:
+        """ """
+        root_module = get_fhir_root_module(typing.cast(str, self.fhir_release))
+        if self.polymorphic and isinstance(value, dict) and "resourceType" in value:
+            return root_module.get_fhir_model_class(value["resourceType"])
+        return root_module.get_fhir_model_class(self.type_name)
+
+
+class XMLElementDecoder(typing.NamedTuple):
+    """Single entry of ``FHIRAbstractModel.get_xml_decode_table``"""
+
+    field_key: str
+    is_list: bool
+    # primitive ``xhtml`` (``div``), whole element is the value.
+    is_xhtml: bool
+    # ``None`` for primitive values (``value`` attribute).
+    model_class: typing.Optional[typing.Type["FHIRAbstractModel"]]
+    # actual model class is decided by name of the child element (``Resource``).
+    polymorphic: bool
+    fhir_release: typing.Optional[str]
+    # primitive extension (``FHIRPrimitiveExtension``) of primitive value
+    ext_key: typing.Optional[str]
+    ext_class: typing.Optional[typing.Type["FHIRAbstractModel"]]
+
+
 class WrongResourceType(PydanticValueError):
     code = "wrong.resource_type"
     msg_template = "Wrong ResourceType: {error}"
@@ -71,6 +144,19 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
         None, alias="fhir_comments", element_property=False
     )
 
+    # compiled at class creation, see ``core.constraints``
+    __element_constraints__: typing.ClassVar[typing.Tuple[ElementConstraints, ...]] = ()
+
+    # cached digests, see ``core.fingerprint``
+    _fingerprints: typing.Optional[typing.Dict[str, typing.Any]] = PrivateAttr(None)
+    # names of fields assigned inside ``batch_update``, validated at exit
+    _pending_fields: typing.Optional[typing.Set[str]] = PrivateAttr(None)
+
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None:
+        """ """
+        super().__init_subclass__(**kwargs)
+        cls.__element_constraints__ = compile_element_constraints(cls)
+
     def __init__(__pydantic_self__, **data: typing.Any) -> None:
         """ """
         resource_type = data.pop("resource_type", None)
@@ -104,6 +190,20 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
 
         BaseModel.__init__(__pydantic_self__, **data)
 
+    def __setattr__(self, name, value):
+        """Assignment is validated (``validate_assignment``) and cached
+        digests (``fingerprint``) are dropped. Inside ``batch_update``
+        validation is deferred until exit."""
+        pending = self._pending_fields
+        if pending is not None and name in self.__fields__:
+            self.__dict__[name] = value
+            self.__fields_set__.add(name)
+            pending.add(name)
+        else:
+            super().__setattr__(name, value)
+        if self._fingerprints is not None:
+            object.__setattr__(self, "_fingerprints", None)
+
     @classmethod
     def add_root_validator(
         cls: typing.Type["Model"],
@@ -171,6 +271,19 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
         setattr(validator, "__manually_injected__", True)  # noqa:B010
         setattr(cls, func_name, validator)
 
+    @root_validator(pre=True, allow_reuse=True)
+    def validate_element_constraints(
+        cls, values: typing.Dict[str, typing.Any]
+    ) -> typing.Dict[str, typing.Any]:
+        """Required primitive elements and choice of data types (``one_of_many``)
+        are checked in one pass, from the base class to this class."""
+        for required_primitives, one_of_many in cls.__element_constraints__:
+            if required_primitives:
+                validate_required_primitive_elements(cls, values, required_primitives)
+            if one_of_many:
+                validate_one_of_many(values, one_of_many)
+        return values
+
     @classmethod
     def element_properties(
         cls: typing.Type["Model"],
@@ -188,7 +301,7 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
         return []
 
     @classmethod
-    @lru_cache(maxsize=1024, typed=True)
+    @lru_cache(maxsize=None, typed=True)
     def has_resource_base(cls: typing.Type["Model"]) -> bool:
         """ """
         # xxx: calculate metrics, other than cache it!
@@ -214,6 +327,191 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
             f.alias: fname for fname, f in cls.__fields__.items() if f.alias in aliases
         }
 
+    @classmethod
+    @lru_cache(maxsize=None, typed=True)
+    def get_serialization_plan(
+        cls: typing.Type["FHIRAbstractModel"], summary: bool = False
+    ) -> typing.Tuple[SerializationPlanItem, ...]:
+        """Precompiled (per class) plan, used by serializer to walk through
+        elements in specification order without any further lookups.
+
+        :param summary: only summary elements (``summary_element_property``,
+            same as FHIR ``_summary=true``). Element having no summary element
+            at all (i.e. ``Extension``) is included fully.
+        """
+        if summary is True:
+            plan_ = tuple(
+                item
+                for item in cls.get_serialization_plan()
+                if cls.__fields__[item.field_key].field_info.extra.get(
+                    "summary_element_property", False
+                )
+            )
+            return plan_ or cls.get_serialization_plan()
+
+        alias_maps = cls.get_alias_mapping()
+        plan = []
+        for prop_name in cls.elements_sequence():
+            field_key = alias_maps[prop_name]
+            field = cls.__fields__[field_key]
+            is_primitive = is_primitive_type(field)
+            ext_key, ext_alias = None, None
+            if is_primitive and f"{field_key}__ext" in cls.__fields__:
+                ext_key = f"{field_key}__ext"
+                ext_alias = cls.__fields__[ext_key].alias
+            plan.append(
+                SerializationPlanItem(
+                    field_key, field.alias, is_primitive, ext_key, ext_alias
+                )
+            )
+        return tuple(plan)
+
+    @classmethod
+    @lru_cache(maxsize=None, typed=True)
+    def get_decode_table(
+        cls: typing.Type["FHIRAbstractModel"],
+    ) -> typing.Dict[str, ElementDecoder]:
+        """Mappings between JSON key (both alias and field name) and
+        ``ElementDecoder``"""
+        table = {}
+        for field_key, field in cls.__fields__.items():
+            if field_key == "resource_type":
+                continue
+            type_ = None
+            if field_key != FHIR_COMMENTS_FIELD_NAME and not is_primitive_type(field):
+                type_ = normalize_fhir_type_class(field.type_)
+            is_model = hasattr(type_, "__resource_type__")
+            decoder = ElementDecoder(
+                field_key,
+                field.shape == SHAPE_LIST,
+                is_model,
+                is_model and is_polymorphic_type(type_),
+                is_model and type_.__fhir_release__ or None,
+                is_model and type_.fhir_type_name() or None,
+            )
+            table[field.alias] = decoder
+            table[field_key] = decoder
+        return table
+
+    @classmethod
+    @lru_cache(maxsize=None, typed=True)
+    def get_xml_decode_table(
+        cls: typing.Type["FHIRAbstractModel"],
+    ) -> typing.Dict[str, XMLElementDecoder]:
+        """Mappings between XML tag of child element (both qualified, i.e.
+        ``{http://hl7.org/fhir}name``, and local name) and ``XMLElementDecoder``,
+        target classes are resolved ahead."""
+        table = {}
+        decode_table = cls.get_decode_table()  # type: ignore
+        for field_key, alias, is_primitive, ext_key, _ in cls.get_serialization_plan():
+            decoder = decode_table[field_key]
+            field = cls.__fields__[field_key]
+            is_xhtml = is_primitive and get_fhir_type_name(field.type_) == "xhtml"
+            model_class = None
+            if decoder.is_model:
+                model_class = decoder.get_model_class()
+            ext_class = None
+            if is_xhtml:
+                # children are XHTML content
+                ext_key = None
+            elif ext_key is not None:
+                ext_class = decode_table[ext_key].get_model_class()
+            xml_decoder = XMLElementDecoder(
+                field_key,
+                decoder.is_list,
+                is_xhtml,
+                model_class,
+                decoder.polymorphic,
+                decoder.fhir_release,
+                ext_key,
+                ext_class,
+            )
+            namespace = XHTML_NS if is_xhtml else FHIR_XML_NS
+            table["{" + namespace + "}" + alias] = xml_decoder
+            table[alias] = xml_decoder
+        return table
+
+    @classmethod
+    def get_projection(
+        cls: typing.Type["FHIRAbstractModel"],
+        elements: typing.Union[str, typing.Iterable[str]],
+    ) -> typing.FrozenSet[str]:
+        """JSON keys to be kept by projection, same as FHIR ``_elements``
+        search parameter: listed elements (choice of data types could be listed
+        by name i.e. ``effective`` or ``effective[x]``), mandatory elements
+        and primitive extensions (i.e. ``_birthDate``) of those.
+
+        Elements usually come from client (``_elements``), so those are
+        normalized (order and duplicates don't matter) and the cache is bounded.
+        Comma separated string (i.e. ``"id,subject"``) is accepted as well.
+        """
+        if isinstance(elements, str):
+            elements = [element.strip() for element in elements.split(",")]
+            elements = [element for element in elements if element]
+        return cls._get_projection(tuple(sorted(set(elements))))
+
+    @classmethod
+    @lru_cache(maxsize=1024, typed=True)
+    def _get_projection(
+        cls: typing.Type["FHIRAbstractModel"], elements: typing.Tuple[str, ...]
+    ) -> typing.FrozenSet[str]:
+        """ """
+        sequence = cls.elements_sequence()
+        alias_maps = cls.get_alias_mapping()
+        choices: typing.Dict[str, typing.List[str]] = {}
+        required = [f.alias for f in cls.__fields__.values() if f.required]
+        for table in cls.__element_constraints__:
+            for primitive in table.required_primitives:
+                required.append(primitive.alias)
+            for choice in table.one_of_many:
+                aliases = [cls.__fields__[name].alias for name in choice.fields]
+                choices[choice.prefix] = aliases
+                if choice.required:
+                    required.extend(aliases)
+
+        keys = {"resourceType", "resource_type"}
+        for element in elements:
+            name = element[:-3] if element.endswith("[x]") else element
+            if name in choices:
+                keys.update(choices[name])
+            elif name in sequence:
+                keys.add(name)
+            else:
+                raise ValueError(
+                    f"``{element}`` is not valid element of ``{cls.__name__}``."
+                )
+        keys.update(required)
+        for alias in list(keys):
+            ext_key = f"{alias_maps.get(alias, alias)}__ext"
+            if ext_key in cls.__fields__:
+                keys.add(cls.__fields__[ext_key].alias)
+        return frozenset(keys)
+
+    @classmethod
+    def project(
+        cls: typing.Type["FHIRAbstractModel"],
+        obj: typing.Any,
+        elements: typing.Union[str, typing.Iterable[str]],
+    ) -> typing.Any:
+        """Returns copy of JSON object with projected elements only,
+        see ``get_projection``."""
+        if not isinstance(obj, dict):
+            return obj
+        keys = cls.get_projection(elements)
+        return {key: value for key, value in obj.items() if key in keys}
+
+    @classmethod
+    @lru_cache(maxsize=None, typed=True)
+    def get_default_values(
+        cls: typing.Type["FHIRAbstractModel"],
+    ) -> typing.Dict[str, typing.Any]:
+        """Default values of all fields (don't mutate it)."""
+        return {
+            field_key: field.get_default()
+            for field_key, field in cls.__fields__.items()
+            if not field.required
+        }
+
     @classmethod
     def get_json_encoder(cls) -> typing.Callable[[typing.Any], typing.Any]:
         """ """
@@ -228,6 +526,8 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
         encoding: str = "utf8",
         proto: Protocol = None,
         allow_pickle: bool = False,
+        fail_fast: bool = False,
+        elements: typing.Union[str, typing.Iterable[str]] = None,
         **extra,
     ) -> "Model":
         extra.update({"cls": cls})
@@ -240,7 +540,7 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
             json_loads=cls.__config__.json_loads,
             **extra,
         )
-        return cls.parse_obj(obj)
+        return cls.parse_obj(obj, fail_fast=fail_fast, elements=elements)
 
     @classmethod
     def parse_raw(
@@ -251,8 +551,12 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
         encoding: str = "utf8",
         proto: Protocol = None,
         allow_pickle: bool = False,
+        fail_fast: bool = False,
+        elements: typing.Union[str, typing.Iterable[str]] = None,
         **extra,
     ) -> "Model":
+        """:param fail_fast: stops at the first error, see ``parse_obj``.
+        :param elements: projection, see ``parse_obj``."""
         extra.update({"cls": cls})
         try:
             obj = load_str_bytes(
@@ -266,7 +570,289 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
             )
         except (ValueError, TypeError, UnicodeDecodeError) as e:  # noqa: B014
             raise ValidationError([ErrorWrapper(e, loc=ROOT_KEY)], cls)
-        return cls.parse_obj(obj)
+        return cls.parse_obj(obj, fail_fast=fail_fast, elements=elements)
+
+    @classmethod
+    def parse_obj(
+        cls: typing.Type["Model"],
+        obj: typing.Any,
+        *,
+        fail_fast: bool = False,
+        elements: typing.Union[str, typing.Iterable[str]] = None,
+    ) -> "Model":
+        """:param fail_fast: stops at the first error and raises lightweight
+        ``FailFastError`` (``ValidationError`` with single error, located by
+        JSON path from the root), see ``core.validation.construct_fail_fast``.
+        :param elements: only listed (and mandatory) elements are validated
+        and constructed, others are dropped, see ``get_projection``.
+        """
+        if elements is not None:
+            obj = cls.project(obj, elements)  # type: ignore
+        if fail_fast is True:
+            from .validation import construct_fail_fast
+
+            return construct_fail_fast(cls, obj)  # type: ignore
+        return super().parse_obj(obj)  # type: ignore
+
+    @classmethod
+    def construct_trusted(
+        cls: typing.Type["Model"], obj: typing.Dict[str, typing.Any]
+    ) -> "Model":
+        """Recursively constructs model (including all nested models) from
+        trusted data, without running any validator.
+        Primitive values are kept as they are provided (i.e. date as ``str``),
+        unknown keys are ignored. ``validate_now`` could be used later on,
+        to have fully validated model."""
+        table = cls.get_decode_table()  # type: ignore
+        values = {}
+        for key, value in obj.items():
+            decoder = table.get(key, None)
+            if decoder is None:
+                continue
+            if decoder.is_model and value is not None:
+                if decoder.is_list and isinstance(value, list):
+                    value = [
+                        isinstance(v, dict)
+                        and decoder.get_model_class(v).construct_trusted(v)
+                        or v
+                        for v in value
+                    ]
+                elif isinstance(value, dict):
+                    value = decoder.get_model_class(value).construct_trusted(value)
+            values[decoder.field_key] = value
+
+        # same as ``BaseModel.construct`` but with precomputed defaults
+        model = cls.__new__(cls)
+        fields_values = cls.get_default_values().copy()  # type: ignore
+        fields_values.update(values)
+        object.__setattr__(model, "__dict__", fields_values)
+        object.__setattr__(model, "__fields_set__", set(values.keys()))
+        model._init_private_attributes()
+        return model
+
+    def validate_now(self: "Model") -> "Model":
+        """Fully validates (in place) the model, that might be constructed
+        by ``construct_trusted``. ``ValidationError`` is raised on failure."""
+        data = self.dict(by_alias=True, exclude_none=True, exclude_comments=False)
+        data.pop("resourceType", None)
+        values, fields_set, error = validate_model(self.__class__, data)
+        if error:
+            raise error
+        object.__setattr__(self, "__dict__", values)
+        object.__setattr__(self, "__fields_set__", fields_set)
+        object.__setattr__(self, "_fingerprints", None)
+        return self
+
+    @contextmanager
+    def batch_update(self: "Model") -> typing.Iterator["Model"]:
+        """Assignments inside the context are not validated one by one,
+        instead all of them are validated at once at exit (root validators
+        are run only once). Top level lists are copied at entry, so that
+        in-place changes of them (i.e. ``patient.name.append(...)``) are
+        validated at exit as well. On any error the model's own values
+        (assignments and top level lists) are rolled back to previous state
+        and the error is raised; in-place changes of nested elements (i.e.
+        ``patient.name[0].given.append(...)``) are not rolled back.
+
+        Example::
+            >>> with patient.batch_update():
+            ...     patient.active = True
+            ...     patient.gender = "female"
+        """
+        if self._pending_fields is not None:
+            # nested, outermost context validates
+            yield self
+            return
+        state = self.__dict__
+        fields_set = self.__fields_set__
+        fingerprints = self._fingerprints
+        working = {
+            key: (value.copy() if isinstance(value, list) else value)
+            for key, value in state.items()
+        }
+        object.__setattr__(self, "__dict__", working)
+        object.__setattr__(self, "__fields_set__", fields_set.copy())
+        object.__setattr__(self, "_pending_fields", set())
+        try:
+            yield self
+            pending = self._pending_fields
+            for key, value in state.items():
+                if not isinstance(value, list) or key in pending:
+                    continue
+                items = self.__dict__.get(key, None)
+                if len(items) != len(value) or any(
+                    item is not original for item, original in zip(items, value)
+                ):
+                    # changed in place
+                    pending.add(key)
+            values = self._validate_pending_fields()
+        except BaseException:
+            object.__setattr__(self, "__dict__", state)
+            object.__setattr__(self, "__fields_set__", fields_set)
+            object.__setattr__(self, "_fingerprints", fingerprints)
+            raise
+        finally:
+            object.__setattr__(self, "_pending_fields", None)
+        object.__setattr__(self, "__dict__", values)
+        object.__setattr__(self, "_fingerprints", None)
+
+    def update(self: "Model", **fields: typing.Any) -> "Model":
+        """Assigns multiple fields (by field name) at once, validated
+        together like ``batch_update``."""
+        with self.batch_update():
+            for name, value in fields.items():
+                setattr(self, name, value)
+        return self
+
+    def _validate_pending_fields(self) -> typing.Dict[str, typing.Any]:
+        """Same as ``validate_assignment`` of pydantic, but for all fields
+        those are assigned inside ``batch_update``."""
+        cls = self.__class__
+        new_values = self.__dict__.copy()
+        errors: typing.List[ErrorWrapper] = []
+        for validator in cls.__pre_root_validators__:
+            try:
+                new_values = validator(cls, new_values)
+            except (ValueError, TypeError, AssertionError) as exc:
+                raise ValidationError([ErrorWrapper(exc, loc=ROOT_KEY)], cls)
+
+        pending = typing.cast(typing.Set[str], self._pending_fields)
+        # like ``validate_model``, validators see previously validated fields
+        values = {k: v for k, v in new_values.items() if k not in pending}
+        for name, field in cls.__fields__.items():
+            if name not in pending:
+                continue
+            if not field.field_info.allow_mutation:
+                raise TypeError(
+                    f'"{name}" has allow_mutation set to False and cannot be assigned'
+                )
+            value, error = field.validate(new_values[name], values, loc=name, cls=cls)
+            if error:
+                errors.append(error)
+            else:
+                new_values[name] = values[name] = value
+        if errors:
+            raise ValidationError(errors, cls)
+
+        for skip_on_failure, validator in cls.__post_root_validators__:
+            if skip_on_failure and errors:
+                continue
+            try:
+                new_values = validator(cls, new_values)
+            except (ValueError, TypeError, AssertionError) as exc:
+                errors.append(ErrorWrapper(exc, loc=ROOT_KEY))
+        if errors:
+            raise ValidationError(errors, cls)
+        return new_values
+
+    def clone(
+        self: "Model", update: typing.Optional[typing.Dict[str, typing.Any]] = None
+    ) -> "Model":
+        """Copy-on-write copy: nested elements are shared with this model,
+        only top level values are copied (lists are shallow copied), so time
+        and memory do not depend on the size of nested elements.
+
+        Values of nested elements are given by path (``update``), then only
+        models (and lists) on the path are copied, everything else stays
+        shared.
+
+        Warning: nested elements reached by attribute access are the shared
+        ones, i.e. ``variant = template.clone()`` then
+        ``variant.meta.versionId = "2"`` changes ``meta`` of the template and
+        of every other variant as well. Assigning a top level field or
+        changing a top level list of the clone doesn't affect the template.
+
+        :param update: value by dotted path of field names, list items by
+            index, i.e. ``{"meta.versionId": "2", "name.0.family": "Doe"}``.
+            Values are validated same as assignment.
+
+        Example::
+            >>> variant = template.clone({"id": "p1", "meta.versionId": "2"})
+        """
+        model = self._clone()
+        if not update:
+            return model
+        # models and lists those belong to the clone (already copied)
+        owned = {id(model)}
+        owned.update(id(v) for v in model.__dict__.values() if isinstance(v, list))
+        for path, value in update.items():
+            model._clone_path_assign(path, value, owned)
+        return model
+
+    def _clone(self: "Model") -> "Model":
+        """ """
+        model = self.__class__.__new__(self.__class__)
+        values = {
+            key: (value.copy() if isinstance(value, list) else value)
+            for key, value in self.__dict__.items()
+        }
+        object.__setattr__(model, "__dict__", values)
+        object.__setattr__(model, "__fields_set__", self.__fields_set__.copy())
+        model._init_private_attributes()
+        return model
+
+    def _clone_path_assign(
+        self, path: str, value: typing.Any, owned: typing.Set[int]
+    ) -> None:
+        """Copies models and lists on the path (those are not owned yet)
+        and assigns the value to the last one."""
+        *parents, last = path.split(".")
+        owner: typing.Any = self
+        name: typing.Any = None
+        target: typing.Any = self
+        for token in parents:
+            if isinstance(target, list):
+                key: typing.Any = int(token)
+                child = target[key]
+            else:
+                key = token
+                if key not in target.__fields__:
+                    raise ValueError(f"``{path}``: unknown field ``{key}``.")
+                child = target.__dict__.get(key, None)
+            if isinstance(child, LazyResource):
+                child = child.resolve()
+            if child is None:
+                raise ValueError(f"``{path}``: ``{token}`` has no value.")
+            if id(child) not in owned:
+                if isinstance(child, list):
+                    child = child.copy()
+                else:
+                    child = child._clone()
+                owned.add(id(child))
+                if isinstance(target, list):
+                    target[key] = child
+                else:
+                    target.__dict__[key] = child
+                    object.__setattr__(target, "_fingerprints", None)
+            if isinstance(target, FHIRAbstractModel):
+                owner, name = target, key
+            target = child
+
+        if not isinstance(target, list):
+            setattr(target, last, value)
+            return
+        # single item of list is validated against the list's field
+        field = owner.__fields__[name]
+        validator = field.sub_fields[0] if field.sub_fields else field
+        value, errors = validator.validate(
+            value, owner.__dict__, loc=(name, int(last)), cls=owner.__class__
+        )
+        if errors:
+            raise ValidationError([errors], owner.__class__)
+        target[int(last)] = value
+        object.__setattr__(owner, "_fingerprints", None)
+
+    def fingerprint(self, algorithm: str = "blake2b") -> str:
+        """Content hash (hex digest) of canonical form, that is computed
+        directly from model attributes without serialization. Digests of
+        nested models are cached, after assignment (or in-place change of list)
+        only changed path is hashed again. See ``core.fingerprint``.
+
+        :param algorithm: any algorithm name of ``hashlib``.
+        """
+        from .fingerprint import fingerprint
+
+        return fingerprint(self, algorithm)
 
     def yaml(  # type: ignore
         self,
@@ -286,10 +872,14 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
         if exclude_none is None:
             exclude_none = True
 
-        data = self.dict(
-            by_alias=by_alias,
-            exclude_none=exclude_none,
-            exclude_comments=exclude_comments,
+        # untouched lazy resources are emitted as their raw data
+        data = OrderedDict(
+            self._fhir_iter(
+                by_alias=by_alias,
+                exclude_none=exclude_none,
+                exclude_comments=exclude_comments,
+                emit_raw=True,
+            )
         )
         if self.__custom_root_type__:
             data = data[ROOT_KEY]
@@ -307,15 +897,26 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
         pretty_print=False,
         xml_declaration=True,
         return_bytes: bool = False,
+        stream: typing.Union[str, pathlib.Path, typing.IO[bytes]] = None,
         **dumps_kwargs: typing.Any,
-    ) -> typing.Union[str, bytes]:
-        """ """
+    ) -> typing.Union[str, bytes, None]:
+        """
+        :param stream: file path or binary stream, XML is written into it
+            incrementally (one top level element, also one ``Bundle.entry``
+            at a time) instead of building the whole document in memory.
+            Nothing is returned in that case.
+        :param dumps_kwargs: i.e. ``strip_text=True``, same for both with and
+            without ``stream``.
+        """
         params = {
             "with_comments": not exclude_comments,
             "xml_declaration": xml_declaration,
             "pretty_print": pretty_print,
         }
         params.update(dumps_kwargs)
+        if stream is not None:
+            xml_dump(self, stream, **params)
+            return None
 
         xml_string = xml_dumps(self, **params)
         if return_bytes is False:
@@ -331,10 +932,20 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
         exclude_comments: bool = False,
         encoder: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None,
         return_bytes: bool = False,
+        engine: str = "default",
+        summary: bool = False,
         **dumps_kwargs: typing.Any,
     ) -> typing.Union[str, bytes]:
         """Fully overridden method but codes are copied from BaseMode and business logic added
         in according to support ``fhir_comments``filter and other FHIR specific requirments.
+
+        :param engine: ``default`` builds the whole ``dict`` first, then dumps it.
+            ``direct`` writes JSON bytes directly from model attributes (lower
+            memory and allocation for large resources), the output is identical.
+            ``direct`` engine doesn't support any dumps kwargs (i.e. ``indent``),
+            in that case it falls back to ``default``.
+        :param summary: only summary elements are serialized (FHIR ``_summary=true``),
+            see ``get_serialization_plan``.
         """
         if by_alias is None:
             by_alias = True
@@ -342,6 +953,30 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
         if exclude_none is None:
             exclude_none = True
 
+        if engine == "direct":
+            if len(dumps_kwargs) == 0 and not self.__custom_root_type__:
+                from .encoder import json_dumps as direct_json_dumps
+
+                result = direct_json_dumps(
+                    self,
+                    by_alias=by_alias,
+                    exclude_none=exclude_none,
+                    exclude_comments=exclude_comments,
+                    default=encoder,
+                    summary=summary,
+                )
+                if typing.TYPE_CHECKING:
+                    result = typing.cast(bytes, result)
+                if return_bytes is False:
+                    return result.decode()
+                return result
+            logger.debug(
+                "``direct`` engine doesn't support dumps kwargs, "
+                "fall back to ``default`` engine."
+            )
+        elif engine != "default":
+            raise ValueError(f"Unknown JSON engine '{engine}'.")
+
         if (
             getattr(self.__config__.json_dumps, "__qualname__", "")
             == "orjson_json_dumps"
@@ -370,10 +1005,15 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
 
             dumps_kwargs["return_bytes"] = return_bytes
 
-        data = self.dict(
-            by_alias=by_alias,
-            exclude_none=exclude_none,
-            exclude_comments=exclude_comments,
+        # untouched lazy resources are emitted as their raw data
+        data = OrderedDict(
+            self._fhir_iter(
+                by_alias=by_alias,
+                exclude_none=exclude_none,
+                exclude_comments=exclude_comments,
+                emit_raw=True,
+                summary=summary,
+            )
         )
         if self.__custom_root_type__:
             data = data[ROOT_KEY]
@@ -403,12 +1043,15 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
         by_alias: bool = True,
         exclude_none: bool = True,
         exclude_comments: bool = False,
+        summary: bool = False,
         **pydantic_extra,
     ) -> OrderedDict:
         """important!
         there is no impact on ``pydantic_extra`` we keep it as backward compatibility.
         @see issues https://github.com/nazrulworld/fhir.resources/issues/90
         & https://github.com/nazrulworld/fhir.resources/issues/89
+
+        :param summary: only summary elements, see ``json``.
         """
         if len(pydantic_extra) > 0:
             logger.warning(
@@ -422,60 +1065,92 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
                 by_alias=by_alias,
                 exclude_none=exclude_none,
                 exclude_comments=exclude_comments,
+                summary=summary,
             )
         )
 
     # Private methods
     def _fhir_iter(
-        self, *, by_alias: bool, exclude_none: bool, exclude_comments: bool
+        self,
+        *,
+        by_alias: bool,
+        exclude_none: bool,
+        exclude_comments: bool,
+        emit_raw: bool = False,
+        summary: bool = False,
     ) -> "TupleGenerator":
         if self.__class__.has_resource_base():
             yield "resourceType", self.resource_type
 
-        alias_maps = self.get_alias_mapping()
-        for prop_name in self.elements_sequence():
-            field_key = alias_maps[prop_name]
-
-            field = self.__fields__[field_key]
-            is_primitive = is_primitive_type(field)
-            v = self.__dict__.get(field_key, None)
-            dict_key = by_alias and field.alias or field_key
+        values = self.__dict__
+        for field_key, alias, _, ext_key, ext_alias in (
+            self.__class__.get_serialization_plan(summary)
+        ):
+            v = values.get(field_key, None)
             if v is not None:
                 v = self._fhir_get_value(
                     v,
                     by_alias=by_alias,
                     exclude_none=exclude_none,
                     exclude_comments=exclude_comments,
+                    emit_raw=emit_raw,
+                    summary=summary,
                 )
 
-            if v is not None or (exclude_none is False and v is None):
-                yield dict_key, v
+            if v is not None or exclude_none is False:
+                yield by_alias and alias or field_key, v
 
             # looking for comments or primitive extension for primitive data type
-            if is_primitive:
-                ext_key = f"{field_key}__ext"
-                ext_val = self.__dict__.get(ext_key, None)
+            if ext_key is not None:
+                ext_val = values.get(ext_key, None)
                 if ext_val is not None:
-                    dict_key_ = by_alias and self.__fields__[ext_key].alias or ext_key
                     ext_val = self._fhir_get_value(
                         ext_val,
                         by_alias=by_alias,
                         exclude_none=exclude_none,
                         exclude_comments=exclude_comments,
+                        emit_raw=emit_raw,
+                        summary=summary,
                     )
                     if ext_val is not None and len(ext_val) > 0:
-                        yield dict_key_, ext_val
+                        yield by_alias and ext_alias or ext_key, ext_val
         # looking for comments
-        comments = self.__dict__.get(FHIR_COMMENTS_FIELD_NAME, None)
+        comments = values.get(FHIR_COMMENTS_FIELD_NAME, None)
         if comments is not None and not exclude_comments:
             yield FHIR_COMMENTS_FIELD_NAME, comments
 
     @classmethod
     @typing.no_type_check
     def _fhir_get_value(
-        cls, v: typing.Any, by_alias: bool, exclude_none: bool, exclude_comments: bool
+        cls,
+        v: typing.Any,
+        by_alias: bool,
+        exclude_none: bool,
+        exclude_comments: bool,
+        emit_raw: bool = False,
+        summary: bool = False,
     ) -> typing.Any:
-        if isinstance(v, (FHIRAbstractModel, BaseModel)):
+        if isinstance(v, LazyResource):
+            if (
+                emit_raw
+                and not summary
+                and can_emit_raw(v, by_alias, exclude_none, exclude_comments)
+            ):
+                return v.raw
+            v = v.resolve()
+
+        if (emit_raw or summary) and isinstance(v, FHIRAbstractModel):
+            value = OrderedDict(
+                v._fhir_iter(
+                    by_alias=by_alias,
+                    exclude_none=exclude_none,
+                    exclude_comments=exclude_comments,
+                    emit_raw=emit_raw,
+                    summary=summary,
+                )
+            )
+
+        elif isinstance(v, (FHIRAbstractModel, BaseModel)):
             v_dict = v.dict(
                 by_alias=by_alias,
                 exclude_none=exclude_none,
@@ -492,6 +1167,8 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
                     by_alias=by_alias,
                     exclude_none=exclude_none,
                     exclude_comments=exclude_comments,
+                    emit_raw=emit_raw,
+                    summary=summary,
                 )
                 for k_, v_ in v.items()
             }
@@ -502,6 +1179,8 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
                     by_alias=by_alias,
                     exclude_none=exclude_none,
                     exclude_comments=exclude_comments,
+                    emit_raw=emit_raw,
+                    summary=summary,
                 )
                 for v_ in v
             )
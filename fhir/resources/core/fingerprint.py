@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""Content hash (fingerprint) of FHIR models.
+
+Canonical form is hashed directly from model attributes (following
+``FHIRAbstractModel.get_serialization_plan``), as Merkle tree: digest of
+a model covers its primitive values (dumped at once as one JSON array) and
+the digests of nested models.
+
+Digest is cached per model along with the nested models and the items of
+the lists it was computed from. Assignment (``validate_assignment``) drops
+the cache of the assigned model; in-place change of a list (i.e.
+``name.append`` or ``name[0].given.append``) is detected by comparing the
+list items (by identity) with the cached ones. Cached digests are
+revalidated by walking through cached nested models only, so after any
+change only models on the path of the change are hashed again.
+"""
+import hashlib
+import json
+import operator
+import typing
+from functools import lru_cache
+
+from .fhirabstractmodel import FHIRAbstractModel
+from .lazy import LazyResource
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+DEFAULT_ALGORITHM = "blake2b"
+
+
+class CachedDigest(typing.NamedTuple):
+    """Entry of ``FHIRAbstractModel._fingerprints``"""
+
+    digest: bytes
+    # model's ``__dict__`` (``copy``, ``validate_now`` replace it)
+    values: typing.Dict[str, typing.Any]
+    # nested models and their digests (serialization order)
+    children: typing.Tuple[FHIRAbstractModel, ...]
+    child_digests: typing.Tuple[bytes, ...]
+    # list values and their items, to detect in-place changes
+    lists: typing.Tuple[typing.Tuple[typing.List[typing.Any], tuple], ...]
+
+
+class ElementKey(typing.NamedTuple):
+    """ """
+
+    key: str
+    alias: str
+    is_model: bool
+
+
+def _dumps(v: typing.Any) -> bytes:
+    """Canonical JSON bytes."""
+    default = FHIRAbstractModel.__json_encoder__
+    if orjson is not None:
+        return orjson.dumps(v, default=default)
+    return json.dumps(
+        v, default=default, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+@lru_cache(maxsize=None)
+def get_element_keys(
+    model_class: typing.Type[FHIRAbstractModel],
+) -> typing.Tuple[ElementKey, ...]:
+    """Element keys in serialization order, including primitive extensions."""
+    table = model_class.get_decode_table()  # type: ignore
+    keys = []
+    for field_key, alias, _, ext_key, ext_alias in (
+        model_class.get_serialization_plan()
+    ):
+        keys.append(ElementKey(field_key, alias, table[field_key].is_model))
+        if ext_key is not None:
+            keys.append(ElementKey(ext_key, ext_alias, True))
+    return tuple(keys)
+
+
+@lru_cache(maxsize=None)
+def get_element_aliases(
+    model_class: typing.Type[FHIRAbstractModel],
+) -> typing.Tuple[typing.Tuple[str, bool], ...]:
+    """(alias, is_model) in order of ``get_element_keys``."""
+    return tuple(
+        (alias, is_model) for _, alias, is_model in get_element_keys(model_class)
+    )
+
+
+@lru_cache(maxsize=None)
+def get_hash_constructor(algorithm: str) -> typing.Callable[[bytes], typing.Any]:
+    """``hashlib.blake2b`` etc. directly, others by ``hashlib.new``."""
+    if algorithm in hashlib.algorithms_guaranteed:
+        return getattr(hashlib, algorithm)
+    hashlib.new(algorithm)  # raises for unknown algorithm
+    return lambda data: hashlib.new(algorithm, data)
+
+
+@lru_cache(maxsize=None)
+def get_values_getter(
+    model_class: typing.Type[FHIRAbstractModel],
+) -> typing.Callable[[typing.Dict[str, typing.Any]], typing.Tuple[typing.Any, ...]]:
+    """All element values at once (in order of ``get_element_keys``)."""
+    keys = [key for key, _, _ in get_element_keys(model_class)]
+    if len(keys) == 1:
+        getter = operator.itemgetter(keys[0])
+        return lambda values: (getter(values),)
+    return operator.itemgetter(*keys)
+
+
+def compute_digest(model: FHIRAbstractModel, algorithm: str) -> bytes:
+    """Hashes canonical form of the model: JSON array of the resource type,
+    then alias and value of each element having value; nested model is
+    represented by ``0`` in the array and its digest is hashed after the
+    array (in order), a not validated value (i.e. ``dict`` appended in place
+    to list of models) is dumped as it is."""
+    klass = model.__class__
+    values = model.__dict__
+    try:
+        element_values = get_values_getter(klass)(values)
+    except KeyError:
+        # incomplete ``__dict__`` (i.e. ``construct`` with some values)
+        element_values = tuple(
+            values.get(key, None) for key, _, _ in get_element_keys(klass)
+        )
+    payload: typing.List[typing.Any] = [
+        klass.has_resource_base() and model.resource_type or None
+    ]
+    children: typing.List[FHIRAbstractModel] = []
+    lists = []
+    for (alias, is_model), v in zip(get_element_aliases(klass), element_values):
+        if v is None:
+            continue
+        if isinstance(v, list):
+            if len(v) == 0:
+                continue
+            lists.append((v, tuple(v)))
+            if is_model:
+                v = [_child_value(item, children) for item in v]
+        elif is_model:
+            v = _child_value(v, children)
+        payload.append(alias)
+        payload.append(v)
+
+    child_digests = tuple(get_digest(child, algorithm) for child in children)
+    hasher = get_hash_constructor(algorithm)(_dumps(payload))
+    for digest in child_digests:
+        hasher.update(digest)
+    digest = hasher.digest()
+
+    cache = model._fingerprints
+    if cache is None:
+        cache = {}
+        object.__setattr__(model, "_fingerprints", cache)
+    cache[algorithm] = CachedDigest(
+        digest, values, tuple(children), child_digests, tuple(lists)
+    )
+    return digest
+
+
+def _child_value(v: typing.Any, children: typing.List[FHIRAbstractModel]):
+    """ """
+    if isinstance(v, LazyResource):
+        v = v.resolve()
+    if isinstance(v, FHIRAbstractModel):
+        children.append(v)
+        return 0
+    return v
+
+
+def get_digest(model: FHIRAbstractModel, algorithm: str) -> bytes:
+    """Returns (cached) digest of the model."""
+    cache = model._fingerprints
+    cached = cache is not None and cache.get(algorithm, None) or None
+    if cached is None or cached.values is not model.__dict__:
+        return compute_digest(model, algorithm)
+    for items, snapshot in cached.lists:
+        if len(items) != len(snapshot) or not all(
+            map(operator.is_, items, snapshot)
+        ):
+            return compute_digest(model, algorithm)
+    for child, digest in zip(cached.children, cached.child_digests):
+        if get_digest(child, algorithm) is not digest:
+            return compute_digest(model, algorithm)
+    return cached.digest
+
+
+def fingerprint(model: FHIRAbstractModel, algorithm: str = DEFAULT_ALGORITHM) -> str:
+    """Hex digest of content hash (any ``hashlib`` algorithm)."""
+    return get_digest(model, algorithm).hex()
+
+
+__all__ = ["fingerprint"]
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""Lazy Bundle entries: ``entry.resource`` keeps its raw data and is validated
+into the concrete model class on first attribute access (result is cached).
+Untouched resources are serialized back by ``json`` as they are (``dict`` and
+comparison always work with validated models)."""
+import typing
+
+from pydantic.error_wrappers import ErrorWrapper, ValidationError
+from pydantic.utils import ROOT_KEY
+
+from .utils import load_str_bytes
+from .utils.common import get_fhir_root_module, normalize_fhir_type_class
+
+if typing.TYPE_CHECKING:
+    from pydantic.types import StrBytes
+
+    from .fhirabstractmodel import FHIRAbstractModel
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+class LazyResource:
+    """Placeholder of a not yet validated resource.
+
+    ``isinstance(lazy, Patient)`` works without validation (the class is decided
+    by ``resourceType``), any other attribute access validates the raw data.
+    """
+
+    __slots__ = ("_raw", "_fhir_release", "_model")
+
+    def __init__(self, raw: typing.Dict[str, typing.Any], fhir_release: str):
+        """ """
+        object.__setattr__(self, "_raw", raw)
+        object.__setattr__(self, "_fhir_release", fhir_release)
+        object.__setattr__(self, "_model", None)
+
+    @property  # type: ignore
+    def __class__(self) -> typing.Type["FHIRAbstractModel"]:  # type: ignore
+        """ """
+        return self.get_model_class()
+
+    def get_model_class(self) -> typing.Type["FHIRAbstractModel"]:
+        """ """
+        model = object.__getattribute__(self, "_model")
+        if model is not None:
+            return model.__class__
+        raw = object.__getattribute__(self, "_raw")
+        return get_fhir_root_module(
+            object.__getattribute__(self, "_fhir_release")
+        ).get_fhir_model_class(raw.get("resourceType", "Resource"))
+
+    @property
+    def is_resolved(self) -> bool:
+        """ """
+        return object.__getattribute__(self, "_model") is not None
+
+    @property
+    def raw(self) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """Raw data, ``None`` once resolved (the model might be changed)."""
+        return object.__getattribute__(self, "_raw")
+
+    def resolve(self) -> "FHIRAbstractModel":
+        """Validates raw data into model (one time only)."""
+        model = object.__getattribute__(self, "_model")
+        if model is None:
+            model = self.get_model_class().parse_obj(
+                object.__getattribute__(self, "_raw")
+            )
+            object.__setattr__(self, "_model", model)
+            object.__setattr__(self, "_raw", None)
+        return model
+
+    def __getattr__(self, name: str) -> typing.Any:
+        """ """
+        if name == "__post_root_validators__":
+            # ``isinstance`` check of pydantic's ModelMetaclass
+            return getattr(self.get_model_class(), name)
+        return getattr(self.resolve(), name)
+
+    def __setattr__(self, name: str, value: typing.Any):
+        """ """
+        setattr(self.resolve(), name, value)
+
+    def __eq__(self, other: typing.Any) -> bool:
+        """ """
+        if isinstance(other, LazyResource):
+            other = other.resolve()
+        return self.resolve() == other
+
+    def __reduce__(self):
+        """ """
+        model = object.__getattribute__(self, "_model")
+        if model is not None:
+            return _restore_resource, (model,)
+        return LazyResource, (
+            object.__getattribute__(self, "_raw"),
+            object.__getattribute__(self, "_fhir_release"),
+        )
+
+    def __repr__(self) -> str:
+        """ """
+        model = object.__getattribute__(self, "_model")
+        if model is not None:
+            return repr(model)
+        return f"<LazyResource {self.get_model_class().__name__}>"
+
+
+def _restore_resource(model: "FHIRAbstractModel") -> "FHIRAbstractModel":
+    """ """
+    return model
+
+
+def make_lazy_entries(
+    bundle_class: typing.Type["FHIRAbstractModel"], obj: typing.Any
+) -> typing.Any:
+    """Returns (shallow) copy of Bundle data, where ``entry.resource`` values
+    are replaced by ``LazyResource``."""
+    if not isinstance(obj, dict) or not isinstance(obj.get("entry", None), list):
+        return obj
+    entry_type = normalize_fhir_type_class(bundle_class.__fields__["entry"].type_)
+    fhir_release = entry_type.__fhir_release__
+    entries = []
+    for entry in obj["entry"]:
+        if isinstance(entry, dict) and isinstance(entry.get("resource", None), dict):
+            entry = entry.copy()
+            entry["resource"] = LazyResource(entry["resource"], fhir_release)
+        entries.append(entry)
+    obj = obj.copy()
+    obj["entry"] = entries
+    return obj
+
+
+def parse_raw_lazy_entries(
+    bundle_class: typing.Type["FHIRAbstractModel"],
+    b: "StrBytes",
+    **kwargs: typing.Any,
+) -> "FHIRAbstractModel":
+    """Same as ``FHIRAbstractModel.parse_raw`` but entries are lazy."""
+    fail_fast = kwargs.pop("fail_fast", False)
+    elements = kwargs.pop("elements", None)
+    kwargs.setdefault("cls", bundle_class)
+    try:
+        obj = load_str_bytes(b, json_loads=bundle_class.__config__.json_loads, **kwargs)
+    except (ValueError, TypeError, UnicodeDecodeError) as e:  # noqa: B014
+        raise ValidationError([ErrorWrapper(e, loc=ROOT_KEY)], bundle_class)
+    if isinstance(obj, bundle_class):
+        # i.e. XML, already validated
+        return obj
+    return bundle_class.parse_obj(
+        make_lazy_entries(bundle_class, obj), fail_fast=fail_fast, elements=elements
+    )
+
+
+def can_emit_raw(
+    value: typing.Any, by_alias: bool, exclude_none: bool, exclude_comments: bool
+) -> bool:
+    """Untouched raw data could be emitted as it is, only with default
+    serialization options."""
+    return (
+        value.raw is not None
+        and by_alias is True
+        and exclude_none is True
+        and exclude_comments is False
+    )
+
+
+__all__ = [
+    "LazyResource",
+    "make_lazy_entries",
+    "parse_raw_lazy_entries",
+]
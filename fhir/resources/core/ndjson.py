@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""Streaming reader for NDJSON (newline delimited JSON) files, i.e. FHIR Bulk Data
+``$export`` output. Lines are read one by one (bounded memory), gzip compressed
+input is detected automatically."""
+import gzip
+import io
+import pathlib
+import typing
+
+from .fhirabstractmodel import FHIRAbstractModel
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+GZIP_MAGIC = b"\x1f\x8b"
+ON_ERROR_CHOICES = ("collect", "raise", "ignore")
+DEFAULT_MAX_ERRORS = 1000
+
+SourceType = typing.Union[str, pathlib.Path, typing.IO]
+
+
+class NDJSONError(ValueError):
+    """Error of a single line, original exception is available as ``error``."""
+
+    def __init__(self, line_number: int, error: Exception, resource_type: str = None):
+        """ """
+        self.line_number = line_number
+        self.error = error
+        self.resource_type = resource_type
+        super().__init__(f"line {line_number}: {error.__class__.__name__}: {error}")
+
+
+class NDJSONReader:
+    """Iterable of FHIR models from NDJSON source.
+    With ``on_error="collect"``, invalid lines are skipped and
+    errors (``NDJSONError``) are available at ``errors``
+    (while iterating and after iteration). Only first ``max_errors`` errors
+    are kept (``None`` for no limit), ``error_count`` counts all of them.
+    Both are reset when iteration starts again.
+    """
+
+    def __init__(
+        self,
+        source: SourceType,
+        get_fhir_model_class: typing.Callable[[str], typing.Type[FHIRAbstractModel]],
+        *,
+        resource_type: str = None,
+        on_error: str = "collect",
+        max_errors: typing.Optional[int] = DEFAULT_MAX_ERRORS,
+    ):
+        """ """
+        if on_error not in ON_ERROR_CHOICES:
+            raise ValueError(
+                f"Invalid value '{on_error}' for ``on_error``, "
+                f"allowed values are {ON_ERROR_CHOICES}"
+            )
+        if max_errors is not None and max_errors < 0:
+            raise ValueError("``max_errors`` must not be negative.")
+        self.source = source
+        self.resource_type = resource_type
+        self.on_error = on_error
+        self.max_errors = max_errors
+        self.errors: typing.List[NDJSONError] = []
+        self.error_count = 0
+        self._get_fhir_model_class = get_fhir_model_class
+        self._json_loads = FHIRAbstractModel.__config__.json_loads
+
+    def __iter__(self) -> typing.Iterator[FHIRAbstractModel]:
+        """ """
+        self.errors = []
+        self.error_count = 0
+        with self._open() as fp:
+            for line_number, line in enumerate(fp, start=1):
+                if not line.strip():
+                    continue
+                resource_type = self.resource_type
+                try:
+                    data = self._json_loads(line)
+                    resource_type = data.get("resourceType", resource_type)
+                    if (
+                        self.resource_type is not None
+                        and resource_type != self.resource_type
+                    ):
+                        raise ValueError(
+                            f"Expected resource type ``{self.resource_type}``, "
+                            f"but got ``{resource_type}``."
+                        )
+                    if resource_type is None:
+                        raise ValueError("``resourceType`` is missing.")
+                    klass = self._get_fhir_model_class(resource_type)
+                    model = klass.parse_obj(data)
+                except Exception as exc:  # noqa: B902
+                    error = NDJSONError(line_number, exc, resource_type)
+                    if self.on_error == "raise":
+                        raise error from exc
+                    if self.on_error == "collect":
+                        self.error_count += 1
+                        if (
+                            self.max_errors is None
+                            or len(self.errors) < self.max_errors
+                        ):
+                            self.errors.append(error)
+                    continue
+                yield model
+
+    def _open(self) -> typing.ContextManager[typing.IO]:
+        """ """
+        if isinstance(self.source, (str, pathlib.Path)):
+            with open(self.source, "rb") as fp:
+                magic = fp.read(2)
+            if magic == GZIP_MAGIC:
+                return typing.cast(typing.IO, gzip.open(self.source, "rb"))
+            return open(self.source, "rb")
+
+        fp = self.source
+        if isinstance(fp, io.TextIOBase):
+            return _NonClosing(fp)
+        if hasattr(fp, "peek"):
+            magic = fp.peek(2)[:2]  # type: ignore
+        elif fp.seekable():
+            position = fp.tell()
+            magic = fp.read(2)
+            fp.seek(position)
+        else:
+            fp = io.BufferedReader(fp)  # type: ignore
+            magic = fp.peek(2)[:2]  # type: ignore
+        if magic == GZIP_MAGIC:
+            return typing.cast(typing.IO, gzip.GzipFile(fileobj=fp, mode="rb"))
+        return _NonClosing(fp)
+
+
+class _NonClosing:
+    """Context manager which doesn't close provided file object."""
+
+    def __init__(self, fp: typing.IO):
+        """ """
+        self.fp = fp
+
+    def __enter__(self) -> typing.IO:
+        """ """
+        return self.fp
+
+    def __exit__(self, *exc_info):
+        """ """
+        return False
+
+
+def iter_resources(
+    source: SourceType,
+    get_fhir_model_class: typing.Callable[[str], typing.Type[FHIRAbstractModel]],
+    *,
+    resource_type: str = None,
+    on_error: str = "collect",
+    max_errors: typing.Optional[int] = DEFAULT_MAX_ERRORS,
+) -> NDJSONReader:
+    """ """
+    return NDJSONReader(
+        source,
+        get_fhir_model_class,
+        resource_type=resource_type,
+        on_error=on_error,
+        max_errors=max_errors,
+    )
+
+
+__all__ = ["NDJSONError", "NDJSONReader", "iter_resources"]
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""Thread safe lazy registry of model classes (``fhirtypesvalidators.MODEL_CLASSES``).
+Lookup of already imported class is lock free (O(1)), only first lookup
+(module import) is serialized by double-checked locking, so concurrent
+threads never race into import of the same module (also safe without GIL)."""
+import importlib
+import threading
+import typing
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+ModelClassesType = typing.Dict[str, typing.Tuple[typing.Optional[type], str]]
+
+
+class ModelClassRegistry:
+    """``model_classes`` table: model name -> (class or ``None``, module name).
+    Set of keys never changes, only values are replaced (atomic) after import."""
+
+    def __init__(self, model_classes: ModelClassesType, package: str):
+        """ """
+        self.model_classes = model_classes
+        self.package = package
+        # reentrant, importing model module could lookup other model classes
+        self._lock = threading.RLock()
+
+    def get(self, model_name: str) -> typing.Any:
+        """Raises ``KeyError`` for unknown model name."""
+        klass, module_name = self.model_classes[model_name]
+        if klass is not None:
+            return klass
+        with self._lock:
+            klass, module_name = self.model_classes[model_name]
+            if klass is None:
+                klass = self.load(model_name, module_name)
+                self.model_classes[model_name] = (klass, module_name)
+        return klass
+
+    def load(self, model_name: str, module_name: str) -> type:
+        """ """
+        module = importlib.import_module(module_name, package=self.package)
+        return getattr(module, model_name)
+
+    def __contains__(self, model_name: str) -> bool:
+        """ """
+        return model_name in self.model_classes
+
+    def __len__(self) -> int:
+        """ """
+        return len(self.model_classes)
+
+
+__all__ = ["ModelClassRegistry"]
@@ -39,7 +39,7 @@ except ImportError:
 
 
 try:
-    from .xml import xml_dumps, xml_loads
+    from .xml import xml_dump, xml_dumps, xml_loads
 except ImportError:
 
     def raise_lxml_import_error():
@@ -60,6 +60,17 @@ except ImportError:
     ):
         raise_lxml_import_error()
 
+    @no_type_check
+    def xml_dump(
+        model: "FHIRAbstractModel",  # noqa: F821
+        stream,
+        *,
+        pretty_print=False,
+        xml_declaration=True,
+        with_comments=True,
+    ):
+        raise_lxml_import_error()
+
     @no_type_check
     def xml_loads(cls, b, xmlparser=None):
         raise_lxml_import_error()
@@ -1,4 +1,6 @@
 # _*_ coding: utf-8 _*_
+import importlib
+import typing
 from functools import lru_cache
 
 from pydantic.fields import ModelField
@@ -6,6 +8,17 @@ from pydantic.typing import get_args, get_origin
 
 __author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
 
+FHIR_XML_NS = "http://hl7.org/fhir"
+XHTML_NS = "http://www.w3.org/1999/xhtml"
+
+FHIR_ROOT_MODULES: typing.Dict[str, typing.Any] = {
+    "R5": None,
+    "R4": None,
+    "R4B": None,
+    "STU3": None,
+    "DSTU2": None,
+}
+
 
 @lru_cache(maxsize=1024, typed=True)
 def is_list_type(field: ModelField) -> bool:
@@ -16,7 +29,7 @@ def is_list_type(field: ModelField) -> bool:
     return False
 
 
-@lru_cache(maxsize=1024, typed=True)
+@lru_cache(maxsize=None, typed=True)
 def is_primitive_type(field: ModelField) -> bool:
     """ """
     origin = get_origin(field.type_)
@@ -36,7 +49,7 @@ def is_primitive_type(field: ModelField) -> bool:
     return out
 
 
-@lru_cache(maxsize=512, typed=True)
+@lru_cache(maxsize=None, typed=True)
 def get_fhir_type_name(type_):
     """ """
     try:
@@ -66,3 +79,22 @@ def normalize_fhir_type_class(type_):
                 return normalize_fhir_type_class(tp_)
     else:
         return type_
+
+
+def get_fhir_root_module(fhir_release: str):
+    """ """
+    if FHIR_ROOT_MODULES[fhir_release] is None:
+        mod_name = "fhir.resources"
+        if fhir_release != "R5":
+            mod_name += f".{fhir_release}"
+        FHIR_ROOT_MODULES[fhir_release] = importlib.import_module(mod_name)
+
+    return FHIR_ROOT_MODULES[fhir_release]
+
+
+@lru_cache(maxsize=512, typed=True)
+def is_polymorphic_type(type_) -> bool:
+    """Type (i.e. ``ResourceType``) that accepts any subtype, actual class
+    is decided by ``resourceType`` of value."""
+    klass = normalize_fhir_type_class(type_)
+    return any(cl.__name__ == "AbstractBaseType" for cl in getattr(klass, "__mro__", []))
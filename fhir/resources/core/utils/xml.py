@@ -1,8 +1,11 @@
 # _*_ coding: utf-8 _*_
-import importlib
+import itertools
 import logging
+import os
+import threading
 import typing
 from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import copy
 from pathlib import Path
 
@@ -10,10 +13,21 @@ from lxml import etree  # type: ignore
 from lxml.etree import QName  # type: ignore
 from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON
 
-from .common import get_fhir_type_name, is_primitive_type, normalize_fhir_type_class
+from .common import (  # noqa: F401
+    FHIR_ROOT_MODULES,
+    FHIR_XML_NS,
+    XHTML_NS,
+    get_fhir_root_module,
+    get_fhir_type_name,
+    is_primitive_type,
+    normalize_fhir_type_class,
+)
 
 if typing.TYPE_CHECKING:
-    from fhir.resources.core.fhirabstractmodel import FHIRAbstractModel
+    from fhir.resources.core.fhirabstractmodel import (
+        FHIRAbstractModel,
+        SerializationPlanItem,
+    )
     from pydantic.fields import ModelField
 
 __author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
@@ -26,16 +40,8 @@ DictStrBytes = typing.Dict[str, StrBytes]
 DictStrNoneKey = typing.Dict[typing.Union[str, None], str]
 DictStrBytesNoneKey = typing.Dict[StrNone, StrBytes]
 TupleStrKeyVal = typing.Tuple[str, StrBytes]
-ROOT_NS = "http://hl7.org/fhir"
-XHTML_NS = "http://www.w3.org/1999/xhtml"
+ROOT_NS = FHIR_XML_NS
 EMPTY_VALUE = None
-FHIR_ROOT_MODULES: typing.Dict[str, typing.Any] = {
-    "R5": None,
-    "R4": None,
-    "R4B": None,
-    "STU3": None,
-    "DSTU2": None,
-}
 LOG = logging.getLogger(__name__)
 
 
@@ -67,18 +73,6 @@ def get_fhir_model_class(field, check=True):
     return mod.get_fhir_model_class(get_fhir_type_name(field.type_))
 
 
-def get_fhir_root_module(fhir_release: str):
-    """ """
-    global FHIR_ROOT_MODULES
-    if FHIR_ROOT_MODULES[fhir_release] is None:
-        mod_name = "fhir.resources"
-        if fhir_release != "R5":
-            mod_name += f".{fhir_release}"
-        FHIR_ROOT_MODULES[fhir_release] = importlib.import_module(mod_name)
-
-    return FHIR_ROOT_MODULES[fhir_release]
-
-
 class SimpleNodeStorage:
     __slots__ = ("__storage__", "node")
     if typing.TYPE_CHECKING:
@@ -664,6 +658,10 @@ class Node:
         parent_child = None
         if get_fhir_type_name(field_type) == "Resource":
             # special case
+            from ..lazy import LazyResource
+
+            if isinstance(value, LazyResource):
+                value = value.resolve()
             parent_child = child
             child = Node.create(value.resource_type)
             parent_child.children.append(child)
@@ -835,21 +833,16 @@ class Node:
         element: typing.Union["Node", etree._Element, bytes],
         xsd_file: Path = None,
         xmlparser: etree.XMLParser = None,
+        fhir_release: str = None,
     ):
-        """ """
-        if isinstance(element, cls):
-            element_str = element.to_string(pretty_print=False)
-        elif isinstance(element, etree._Element):
-            element_str = etree.tostring(element)
-        else:
-            element_str = element
+        """Schema is compiled once per process (``XML_SCHEMAS``) and parser
+        is reused per thread, see ``XMLSchemaCache``."""
+        element_str = get_xml_bytes(element)
         if xmlparser is None and xsd_file is None:
             raise ValueError("Any of `xsd_file` or `parser` is required")
 
         if xmlparser is None:
-            assert xsd_file and xsd_file.exists() and xsd_file.is_file()
-            schema = etree.XMLSchema(file=str(xsd_file))
-            xmlparser = etree.XMLParser(schema=schema)
+            xmlparser = XML_SCHEMAS.get_parser(xsd_file, fhir_release)
 
         try:
             etree.fromstring(element_str, parser=xmlparser)
@@ -1011,6 +1004,386 @@ class Node:
         return self.to_string(pretty_print=False)
 
 
+def get_comments_value(
+    comments: typing.List[str],
+) -> typing.Union[str, typing.List[str]]:
+    """``fhir_comments`` value, single comment is kept as string."""
+    if len(comments) == 1:
+        return comments[0]
+    return comments
+
+
+def is_xhtml_element(element: etree._Element) -> bool:
+    """ """
+    return element.tag.startswith("{" + XHTML_NS + "}")
+
+
+def iter_child_elements(
+    element: etree._Element,
+) -> typing.Iterator[typing.Tuple[etree._Element, typing.Optional[typing.List[str]]]]:
+    """Child elements along with the comments those are preceding them
+    (trailing comments are dropped, same as ``Node.from_element``)."""
+    comments: typing.Optional[typing.List[str]] = None
+    for child in element:
+        if isinstance(child, etree._Comment):
+            if comments is None:
+                comments = list()
+            comments.append(child.text or "")
+            continue
+        if not isinstance(child.tag, str):
+            # processing instruction or entity
+            continue
+        yield child, comments
+        if not is_xhtml_element(child):
+            comments = None
+
+
+def element_to_fhir(
+    element: etree._Element,
+    klass: typing.Type["FHIRAbstractModel"],
+    comments: typing.List[str] = None,
+) -> "FHIRAbstractModel":
+    """Decodes lxml element directly into FHIR model, the same result as
+    ``Node.from_element(element).to_fhir(klass)`` but without building
+    intermediate ``Node`` tree. Child elements are looked up in
+    ``klass.get_xml_decode_table``.
+
+    :param comments: XML comments those are preceding the element.
+    """
+    resource_type = klass.get_resource_type()
+    if resource_type == "Resource":
+        fhir_release = klass.get_decode_table()["meta"].fhir_release
+        return resource_to_fhir(element, typing.cast(str, fhir_release))
+
+    params: typing.Dict[str, typing.Any] = {"resource_type": resource_type}
+    if comments:
+        params["fhir_comments"] = get_comments_value(comments)
+
+    if resource_type == "Extension":
+        for name, val in element.attrib.items():
+            if name != "value":
+                params[name] = val
+
+    decode_table = klass.get_xml_decode_table()
+    list_fields: typing.Set[str] = set()
+    primitive_ext_list_values: typing.Dict[str, typing.Dict[int, typing.Any]] = {}
+    child_comments: typing.Optional[typing.List[str]] = None
+    for child in element:
+        tag = child.tag
+        if tag is etree.Comment:
+            if child_comments is None:
+                child_comments = list()
+            child_comments.append(child.text or "")
+            continue
+        if not isinstance(tag, str):
+            # processing instruction or entity
+            continue
+        decoder = decode_table.get(tag, None)
+        if decoder is None:
+            decoder = decode_table[QName(child).localname]
+
+        field_name = decoder.field_key
+        if decoder.is_xhtml:
+            # comments are kept for the next element
+            value = etree.tostring(child)
+        elif decoder.polymorphic:
+            value = resource_to_fhir(
+                child, typing.cast(str, decoder.fhir_release), child_comments
+            )
+        elif decoder.model_class is not None:
+            value = element_to_fhir(child, decoder.model_class, child_comments)
+        else:
+            value = child.get("value")
+
+        if decoder.is_list:
+            if field_name not in params:
+                params[field_name] = list()
+                list_fields.add(field_name)
+            params[field_name].append(value)
+        else:
+            params[field_name] = value
+
+        if decoder.ext_class is not None and (len(child) > 0 or child_comments):
+            primitive_ext = primitive_ext_to_fhir(
+                child, decoder.ext_class, child_comments
+            )
+            if primitive_ext is not None and decoder.is_list:
+                primitive_ext_list_values.setdefault(decoder.ext_key, {})[
+                    len(params[field_name]) - 1
+                ] = primitive_ext
+            elif primitive_ext is not None:
+                params[decoder.ext_key] = primitive_ext
+        if not decoder.is_xhtml:
+            child_comments = None
+
+    # treatment for list type primitive ext
+    for p_ext_name, exts in primitive_ext_list_values.items():
+        size = len(params[p_ext_name[:-5]])
+        params[p_ext_name] = [exts.get(idx, None) for idx in range(size)]
+
+    for field_name in list_fields:
+        if all([v is None for v in params[field_name]]):
+            del params[field_name]
+
+    return klass(**params)
+
+
+def resource_to_fhir(
+    element: etree._Element,
+    fhir_release: str,
+    comments: typing.List[str] = None,
+) -> "FHIRAbstractModel":
+    """Decodes resource container element (i.e. ``contained``, ``resource``),
+    actual model class is decided by name of its first child element."""
+    for child, child_comments in iter_child_elements(element):
+        klass = get_fhir_root_module(fhir_release).get_fhir_model_class(
+            QName(child).localname
+        )
+        return element_to_fhir(child, klass, child_comments)
+    # empty container
+    klass = get_fhir_root_module(fhir_release).get_fhir_model_class("Resource")
+    params: typing.Dict[str, typing.Any] = {}
+    if comments:
+        params["fhir_comments"] = get_comments_value(comments)
+    return klass(**params)
+
+
+def primitive_ext_to_fhir(
+    element: etree._Element,
+    ext_class: typing.Type["FHIRAbstractModel"],
+    comments: typing.Optional[typing.List[str]],
+) -> typing.Optional["FHIRAbstractModel"]:
+    """``FHIRPrimitiveExtension`` from child elements (``extension``) of
+    primitive element, comments are preceding the primitive element."""
+    extension_class = ext_class.get_xml_decode_table()["extension"].model_class
+    extensions = [
+        element_to_fhir(child, typing.cast(typing.Any, extension_class), child_comments)
+        for child, child_comments in iter_child_elements(element)
+    ]
+    if len(extensions) == 0 and not comments:
+        return None
+    params: typing.Dict[str, typing.Any] = {}
+    if comments:
+        params["fhir_comments"] = get_comments_value(comments)
+    if len(extensions) > 0:
+        params["extension"] = extensions
+    return ext_class(**params)
+
+
+class XMLBundleEntryReader:
+    """Iterable of validated ``BundleEntry`` (or entry ``resource`` if
+    ``resources`` is ``True``) from a XML Bundle, parsed incrementally by
+    ``etree.iterparse``.
+
+    Each ``entry`` element is decoded at its end event, then it is removed
+    from the tree along with the comments preceding it, so memory usage
+    depends on the biggest entry, not on the size of the Bundle. Other top
+    level elements (``type``, ``total``, ``link``...) are kept, ``bundle``
+    is decoded from them (elements after ``entry`` in the document are
+    available at the end of iteration).
+    """
+
+    def __init__(
+        self,
+        bundle_class: typing.Type["FHIRAbstractModel"],
+        source: typing.Union[str, Path, typing.IO],
+        *,
+        resources: bool = False,
+    ):
+        """ """
+        self.bundle_class = bundle_class
+        self.source = source
+        self.resources = resources
+        self.entry_class = bundle_class.get_decode_table()["entry"].get_model_class()
+        self._root: typing.Optional[etree._Element] = None
+        self._bundle: typing.Optional["FHIRAbstractModel"] = None
+
+    @property
+    def bundle(self) -> "FHIRAbstractModel":
+        """``Bundle`` (validated) from top level elements read so far."""
+        if self._bundle is None:
+            if self._root is None:
+                self._bundle = self.bundle_class()
+            else:
+                self._bundle = element_to_fhir(self._root, self.bundle_class)
+        return self._bundle
+
+    def __iter__(self) -> typing.Iterator["FHIRAbstractModel"]:
+        """ """
+        source = self.source
+        if isinstance(source, Path):
+            source = str(source)
+        context = etree.iterparse(
+            source, events=("end",), tag=str(QName(ROOT_NS, "entry"))
+        )
+        for _, element in context:
+            parent = element.getparent()
+            if parent.getparent() is not None:
+                # entry of nested Bundle (``entry.resource``)
+                continue
+            self._root = parent
+            self._bundle = None
+            comments: typing.List[etree._Comment] = []
+            for sibling in element.itersiblings(preceding=True):
+                if not isinstance(sibling, etree._Comment):
+                    break
+                comments.insert(0, sibling)
+
+            entry = element_to_fhir(
+                element,
+                self.entry_class,
+                [comment.text or "" for comment in comments] or None,
+            )
+            element.clear()
+            for comment in comments:
+                parent.remove(comment)
+            parent.remove(element)
+
+            if self.resources:
+                yield entry.resource  # type: ignore
+            else:
+                yield entry
+        self._root = context.root
+        self._bundle = None
+
+
+def append_comments(
+    element: etree._Element, comments: typing.Union[str, typing.List[str], None]
+) -> None:
+    """``fhir_comments`` as XML comments (children of the element)."""
+    if not comments:
+        return
+    if isinstance(comments, str):
+        comments = [comments]
+    for comment in comments:
+        element.append(etree.Comment(comment))
+
+
+def append_fhir_elements(
+    element: etree._Element, model: "FHIRAbstractModel", with_comments: bool = True
+) -> None:
+    """Elements of the model (in specification order) as children of
+    the element, the same output as ``Node.from_fhir_obj`` then
+    ``Node.to_xml``, but lxml elements are built directly."""
+    for item in model.__class__.get_serialization_plan():
+        append_fhir_element(element, model, item, with_comments)
+
+
+def append_fhir_element(
+    element: etree._Element,
+    model: "FHIRAbstractModel",
+    item: "SerializationPlanItem",
+    with_comments: bool = True,
+) -> None:
+    """Single element (all values if list) of the model."""
+    field_key, alias, is_primitive, ext_key, _ = item
+    values = model.__dict__
+    value = values.get(field_key, None)
+    if (
+        alias in ("url", "id")
+        and value
+        and model.__class__.get_resource_type() == "Extension"
+    ):
+        element.set(alias, value)
+        return
+    ext = None
+    if ext_key is not None:
+        ext = values.get(ext_key, None)
+    if ext is None and value is None:
+        return
+
+    decoder = model.__class__.get_xml_decode_table()[alias]
+    if decoder.is_xhtml and value:
+        xhtml_element = etree.fromstring(value)
+        if xhtml_element.nsmap.get(None, None) != XHTML_NS:
+            raise ValueError(
+                f"``{alias}`` is expected in XHTML namespace ({XHTML_NS})."
+            )
+        element.append(xhtml_element)
+        return
+
+    if not is_primitive:
+        if not isinstance(value, list):
+            value = [value]
+        for value_ in value:
+            append_model_element(
+                element, alias, value_, decoder.polymorphic, with_comments
+            )
+        return
+
+    field_type = model.__class__.__fields__[field_key].type_
+    if isinstance(value, list) or (value is None and isinstance(ext, list)):
+        exts = ext
+        if ext and not isinstance(ext, list):
+            exts = [ext]
+        if exts is None:
+            exts = []
+        if value is None:
+            value = [None] * len(exts)
+        if len(value) < len(exts):
+            LOG.warning(f"Some {(len(exts) - len(value))} extension(s) are ignored.")
+        for idx, val in enumerate(value):
+            ext_ = idx < len(exts) and exts[idx] or None
+            if ext_ is None and val is None:
+                continue
+            append_primitive_element(
+                element, alias, field_type, val, ext_, with_comments
+            )
+    else:
+        append_primitive_element(element, alias, field_type, value, ext, with_comments)
+
+
+def append_primitive_element(
+    element: etree._Element,
+    alias: str,
+    field_type: typing.Any,
+    value: typing.Any,
+    ext: typing.Optional["FHIRAbstractModel"],
+    with_comments: bool = True,
+) -> None:
+    """Primitive value (``value`` attribute) along with its extensions,
+    comments of primitive extension are preceding the element."""
+    if ext is not None and with_comments:
+        append_comments(element, ext.__dict__.get("fhir_comments", None))
+    child = etree.SubElement(element, alias)
+    if value is not None:
+        value = xml_represent(field_type, value)
+        if value:
+            child.set("value", value)
+    if ext is not None:
+        for extension in ext.__dict__.get("extension", None) or []:
+            append_model_element(child, "extension", extension, False, with_comments)
+
+
+def append_model_element(
+    element: etree._Element,
+    alias: str,
+    value: "FHIRAbstractModel",
+    polymorphic: bool,
+    with_comments: bool = True,
+) -> None:
+    """Complex element, resource is wrapped (i.e. ``<contained><Patient>``)."""
+    from ..lazy import LazyResource
+
+    if isinstance(value, LazyResource):
+        value = value.resolve()
+    if with_comments:
+        append_comments(element, value.__dict__.get("fhir_comments", None))
+    child = etree.SubElement(element, alias)
+    if polymorphic:
+        child = etree.SubElement(child, value.resource_type)
+    append_fhir_elements(child, value, with_comments)
+
+
+def model_to_element(
+    model: "FHIRAbstractModel", with_comments: bool = True
+) -> etree._Element:
+    """Whole lxml tree of the model (resource)."""
+    element = etree.Element(model.resource_type, nsmap={None: ROOT_NS})
+    append_fhir_elements(element, model, with_comments)
+    return element
+
+
 def xml_dumps(
     model: "FHIRAbstractModel",
     *,
@@ -1020,13 +1393,260 @@ def xml_dumps(
     strip_text=False,
 ):
     """ """
-    node = Node.from_fhir_obj(model)
-    return node.to_string(
-        pretty_print=pretty_print,
-        xml_declaration=xml_declaration,
-        with_comments=with_comments,
-        strip_text=strip_text,
-    )
+    # comments are dropped and text is stripped while building the tree,
+    # ``with_comments`` and ``strip_text`` of ``etree.tostring`` are only
+    # supported by C14N serialisation.
+    element = model_to_element(model, with_comments)
+    if strip_text:
+        strip_element_text(element)
+    params = {"encoding": "utf-8", "method": "xml", "pretty_print": pretty_print}
+    if xml_declaration:
+        params["xml_declaration"] = '<?xml version="1.0" encoding="UTF-8"?>'
+    return etree.tostring(element, **params)
+
+
+def xml_dump(
+    model: "FHIRAbstractModel",
+    stream: typing.Union[str, Path, typing.IO],
+    *,
+    pretty_print=False,
+    xml_declaration=True,
+    with_comments=True,
+    strip_text=False,
+) -> None:
+    """Incremental XML serialization (``etree.xmlfile``) into file path or
+    binary stream. Top level elements are built and written one at a time,
+    also each item of list (i.e. ``Bundle.entry``), so memory usage
+    depends on the biggest element, not on the size of the model."""
+    if isinstance(stream, (str, Path)):
+        with open(stream, "wb") as fp:
+            return xml_dump(
+                model,
+                fp,
+                pretty_print=pretty_print,
+                xml_declaration=xml_declaration,
+                with_comments=with_comments,
+                strip_text=strip_text,
+            )
+    klass = model.__class__
+    table = klass.get_xml_decode_table()
+    with etree.xmlfile(stream, encoding="utf-8") as xf:
+        if xml_declaration:
+            xf.write_declaration()
+        with xf.element(model.resource_type, nsmap={None: ROOT_NS}):
+            for item in klass.get_serialization_plan():
+                value = model.__dict__.get(item.field_key, None)
+                if item.is_primitive or not isinstance(value, list):
+                    scratch = etree.Element(model.resource_type)
+                    append_fhir_element(scratch, model, item, with_comments)
+                    write_children(xf, scratch, pretty_print, strip_text)
+                    continue
+                polymorphic = table[item.alias].polymorphic
+                for value_ in value:
+                    scratch = etree.Element(model.resource_type)
+                    append_model_element(
+                        scratch, item.alias, value_, polymorphic, with_comments
+                    )
+                    write_children(xf, scratch, pretty_print, strip_text)
+            if pretty_print:
+                xf.write("\n")
+    if pretty_print:
+        # same as libxml2 pretty print, trailing newline after the root
+        stream.write(b"\n")
+
+
+def indent_element(element: etree._Element, level: int = 0) -> None:
+    """Indents the element's subtree the same way libxml2's pretty print does,
+    elements having mixed content (i.e. xhtml narrative) are left untouched."""
+    if len(element) == 0 or element.text or any(child.tail for child in element):
+        return
+    indentation = "\n" + "  " * (level + 1)
+    element.text = indentation
+    for child in element:
+        child.tail = indentation
+        indent_element(child, level + 1)
+    child.tail = indentation[:-2]
+
+
+def strip_element_text(element: etree._Element) -> None:
+    """Strips leading and trailing whitespace of text content (in place),
+    same as ``strip_text`` of C14N 2.0 serialisation; comments and
+    processing instructions are left as they are."""
+    for node in element.iter():
+        if node.text and isinstance(node.tag, str):
+            node.text = node.text.strip() or None
+        if node.tail and node is not element:
+            node.tail = node.tail.strip() or None
+
+
+def write_children(
+    xf: typing.Any,
+    element: etree._Element,
+    pretty_print: bool = False,
+    strip_text: bool = False,
+) -> None:
+    """Writes (detached) children of the element into ``etree.xmlfile``."""
+    for child in element:
+        if strip_text:
+            strip_element_text(child)
+        if pretty_print:
+            indent_element(child, level=1)
+            xf.write("\n  ")
+        xf.write(child)
+
+
+class XMLSchemaCache:
+    """Process wide cache of compiled XSD schemas keyed by
+    (FHIR release, absolute xsd path), compilation (i.e. ``fhir-single.xsd``)
+    is serialized by double-checked locking. ``etree.XMLSchema`` is safe to
+    share between threads but ``etree.XMLParser`` is not, so schema bound
+    parsers are pooled per thread."""
+
+    def __init__(self):
+        """ """
+        self._schemas: typing.Dict[typing.Tuple[StrNone, str], etree.XMLSchema] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @staticmethod
+    def make_key(
+        xsd_file: typing.Union[str, Path], fhir_release: str = None
+    ) -> typing.Tuple[StrNone, str]:
+        """ """
+        return fhir_release, str(Path(xsd_file).resolve())
+
+    def get_schema(
+        self, xsd_file: typing.Union[str, Path], fhir_release: str = None
+    ) -> etree.XMLSchema:
+        """ """
+        key = self.make_key(xsd_file, fhir_release)
+        schema = self._schemas.get(key, None)
+        if schema is not None:
+            return schema
+        with self._lock:
+            schema = self._schemas.get(key, None)
+            if schema is None:
+                if not Path(key[1]).is_file():
+                    raise FileNotFoundError(f"XSD file {xsd_file} doesn't exist.")
+                schema = etree.XMLSchema(file=key[1])
+                self._schemas[key] = schema
+        return schema
+
+    def get_parser(
+        self, xsd_file: typing.Union[str, Path], fhir_release: str = None
+    ) -> etree.XMLParser:
+        """Schema bound parser of the current thread."""
+        key = self.make_key(xsd_file, fhir_release)
+        parsers = getattr(self._local, "parsers", None)
+        if parsers is None:
+            parsers = self._local.parsers = {}
+        parser = parsers.get(key, None)
+        if parser is None:
+            parser = etree.XMLParser(schema=self.get_schema(xsd_file, fhir_release))
+            parsers[key] = parser
+        return parser
+
+    def clear(self):
+        """Parsers of other threads are discarded along with their threads."""
+        with self._lock:
+            self._schemas.clear()
+        self._local.parsers = {}
+
+    def __len__(self) -> int:
+        """ """
+        return len(self._schemas)
+
+
+XML_SCHEMAS = XMLSchemaCache()
+
+
+class XSDValidationOutcome(typing.NamedTuple):
+    """Result of a single document, ``error`` is the same message as of
+    ``ValueError`` raised by ``Node.validate``."""
+
+    error: StrNone
+
+    @property
+    def valid(self) -> bool:
+        """ """
+        return self.error is None
+
+
+def get_xml_bytes(
+    element: typing.Union["Node", etree._Element, "FHIRAbstractModel", bytes]
+) -> bytes:
+    """ """
+    if isinstance(element, Node):
+        return element.to_string(pretty_print=False)
+    if isinstance(element, etree._Element):
+        return etree.tostring(element)
+    if isinstance(element, (str, bytes)):
+        return element
+    return xml_dumps(element)
+
+
+def validate_document(
+    element: typing.Union["Node", etree._Element, "FHIRAbstractModel", bytes],
+    xsd_file: typing.Union[str, Path],
+    fhir_release: str = None,
+) -> XSDValidationOutcome:
+    """ """
+    try:
+        Node.validate(element, xsd_file=Path(xsd_file), fhir_release=fhir_release)
+    except ValueError as exc:
+        return XSDValidationOutcome(str(exc))
+    return XSDValidationOutcome(None)
+
+
+def validate_chunk(
+    chunk: typing.List[typing.Any],
+    xsd_file: typing.Union[str, Path],
+    fhir_release: str = None,
+) -> typing.List[XSDValidationOutcome]:
+    """Runs inside worker thread, with the thread's own parser."""
+    return [validate_document(element, xsd_file, fhir_release) for element in chunk]
+
+
+def validate_many(
+    elements: typing.Iterable[
+        typing.Union["Node", etree._Element, "FHIRAbstractModel", bytes]
+    ],
+    xsd_file: typing.Union[str, Path],
+    *,
+    fhir_release: str = None,
+    workers: int = None,
+    chunk_size: int = 16,
+) -> typing.Iterator[XSDValidationOutcome]:
+    """Yields ``XSDValidationOutcome`` for each document (same order as input)
+    against the cached schema. lxml releases the GIL while parsing and
+    validating, so documents are fanned out over a thread pool;
+    ``workers=0`` validates in the current thread (no pool). Elements
+    are consumed lazily, at most ``workers * 2`` chunks are pending."""
+    if chunk_size < 1:
+        raise ValueError("``chunk_size`` must be greater than 0.")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    # compiled once, before fanning out
+    XML_SCHEMAS.get_schema(xsd_file, fhir_release)
+
+    iterator = iter(elements)
+    chunks = iter(lambda: list(itertools.islice(iterator, chunk_size)), [])
+
+    if workers == 0:
+        for chunk in chunks:
+            yield from validate_chunk(chunk, xsd_file, fhir_release)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: typing.Deque[Future] = deque()
+        for chunk in chunks:
+            pending.append(
+                executor.submit(validate_chunk, chunk, xsd_file, fhir_release)
+            )
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
 
 
 def xml_loads(
@@ -1034,8 +1654,18 @@ def xml_loads(
 ) -> "FHIRAbstractModel":
     """ """
     root = etree.fromstring(b, parser=xmlparser)
-    node = Node.from_element(root)
-    return node.to_fhir(cls)
-
-
-__all__ = ["xml_dumps", "xml_loads"]
+    return element_to_fhir(root, cls)
+
+
+__all__ = [
+    "XML_SCHEMAS",
+    "XMLBundleEntryReader",
+    "XMLSchemaCache",
+    "XSDValidationOutcome",
+    "element_to_fhir",
+    "model_to_element",
+    "xml_dump",
+    "validate_many",
+    "xml_dumps",
+    "xml_loads",
+]
@@ -0,0 +1,456 @@
+# -*- coding: utf-8 -*-
+"""Validation only (no model is constructed) of raw data.
+
+Payload is walked through against class fields (``get_decode_table``),
+primitive values are validated by the fields' validators, nested elements
+are walked recursively and root validators (element constraints) are run
+on the values, the same way as ``pydantic.main.validate_model`` does.
+Errors are identical to ``ValidationError.errors()`` of ``parse_obj``.
+"""
+import typing
+
+from pydantic import Extra
+from pydantic.error_wrappers import ErrorWrapper, ValidationError
+from pydantic.errors import ExtraError, MissingError
+from pydantic.utils import ROOT_KEY
+
+from .fhirabstractmodel import FHIRAbstractModel, WrongResourceType
+from .utils import load_str_bytes
+
+if typing.TYPE_CHECKING:
+    from pydantic.types import StrBytes
+
+    from .fhirabstractmodel import ElementDecoder
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+_missing = object()
+
+ErrorsType = typing.List[typing.Union[ErrorWrapper, typing.List[typing.Any]]]
+
+
+class NotWalkable(TypeError):
+    """Data couldn't be walked through, field's validators should be used."""
+
+
+class ErrorDetail(typing.NamedTuple):
+    """Single error, same as item of ``pydantic.ValidationError.errors()``."""
+
+    loc: typing.Tuple[typing.Union[int, str], ...]
+    msg: str
+    type: str
+    ctx: typing.Optional[typing.Dict[str, typing.Any]] = None
+
+    def as_dict(self) -> typing.Dict[str, typing.Any]:
+        """ """
+        error = {"loc": self.loc, "msg": self.msg, "type": self.type}
+        if self.ctx is not None:
+            error["ctx"] = self.ctx
+        return error
+
+
+def to_error_details(exc: ValidationError) -> typing.List[ErrorDetail]:
+    """ """
+    return [
+        ErrorDetail(
+            loc=error["loc"],
+            msg=error["msg"],
+            type=error["type"],
+            ctx=error.get("ctx", None),
+        )
+        for error in exc.errors()
+    ]
+
+
+def validate_obj(
+    klass: typing.Type[FHIRAbstractModel], obj: typing.Any
+) -> typing.List[ErrorDetail]:
+    """Same errors as ``klass.parse_obj(obj)``, empty list if valid."""
+    if not isinstance(obj, dict):
+        try:
+            obj = dict(obj)
+        except (TypeError, ValueError):
+            exc = TypeError(
+                f"{klass.__name__} expected dict not {obj.__class__.__name__}"
+            )
+            return to_error_details(
+                ValidationError([ErrorWrapper(exc, loc=ROOT_KEY)], klass)
+            )
+    try:
+        errors = walk_model(klass, obj)
+    except NotWalkable as exc:
+        # same as ``parse_obj``
+        raise TypeError(str(exc))
+    if errors:
+        return to_error_details(ValidationError(errors, klass))
+    return []
+
+
+def validate_raw(
+    klass: typing.Type[FHIRAbstractModel], b: "StrBytes"
+) -> typing.List[ErrorDetail]:
+    """Same errors as ``klass.parse_raw(b)``, empty list if valid."""
+    try:
+        obj = load_str_bytes(
+            b,
+            content_type="application/json",
+            json_loads=klass.__config__.json_loads,
+            cls=klass,
+        )
+    except (ValueError, TypeError, UnicodeDecodeError) as e:  # noqa: B014
+        return to_error_details(ValidationError([ErrorWrapper(e, loc=ROOT_KEY)], klass))
+    return validate_obj(klass, obj)
+
+
+def check_resource_type(
+    klass: typing.Type[FHIRAbstractModel], data: typing.Dict[str, typing.Any]
+) -> typing.Optional[WrongResourceType]:
+    """Same as ``FHIRAbstractModel.__init__``, ``resourceType`` is checked
+    before anything else."""
+    if not all(isinstance(key, str) for key in data):
+        # ``klass(**data)`` fails before any validation
+        raise NotWalkable("keywords must be strings")
+    resource_type = data.get("resource_type", None)
+    if "resourceType" in data:
+        resource_type = data["resourceType"]
+    expected_resource_type = klass.__fields__["resource_type"].default
+    if resource_type is not None and resource_type != expected_resource_type:
+        error = (
+            f"``{klass.__module__}.{klass.__name__}`` "
+            f"expects resource type ``{expected_resource_type}``, "
+            f"but got ``{resource_type}``. "
+            "Make sure resource type name is correct and right "
+            "ModelClass has been chosen."
+        )
+        return WrongResourceType(error=error)
+    return None
+
+
+def strip_resource_type(
+    data: typing.Dict[str, typing.Any]
+) -> typing.Dict[str, typing.Any]:
+    """ """
+    if "resource_type" in data or "resourceType" in data:
+        return {
+            key: value
+            for key, value in data.items()
+            if key not in ("resource_type", "resourceType")
+        }
+    return data
+
+
+def walk_model(
+    klass: typing.Type[FHIRAbstractModel], data: typing.Dict[str, typing.Any]
+) -> ErrorsType:
+    """Mirrors ``FHIRAbstractModel.__init__`` and ``pydantic.main.validate_model``,
+    returns errors (``ErrorWrapper``) to be wrapped by ``ValidationError``."""
+    wrong_resource_type = check_resource_type(klass, data)
+    if wrong_resource_type is not None:
+        return [ErrorWrapper(wrong_resource_type, loc="resource_type")]
+    data = strip_resource_type(data)
+
+    fields = klass.__fields__
+    config = klass.__config__
+    for validator in klass.__pre_root_validators__:
+        try:
+            data = validator(klass, data)
+        except (ValueError, TypeError, AssertionError) as exc:
+            return [ErrorWrapper(exc, loc=ROOT_KEY)]
+
+    table = klass.get_decode_table()  # type: ignore
+    values: typing.Dict[str, typing.Any] = {}
+    errors: ErrorsType = []
+    names_used = set()
+    for name, field in fields.items():
+        value = data.get(field.alias, _missing)
+        using_name = False
+        if (
+            value is _missing
+            and config.allow_population_by_field_name
+            and field.alt_alias
+        ):
+            value = data.get(field.name, _missing)
+            using_name = True
+
+        if value is _missing:
+            if field.required:
+                errors.append(ErrorWrapper(MissingError(), loc=field.alias))
+                continue
+            value = field.get_default()
+            if not config.validate_all and not field.validate_always:
+                values[name] = value
+                continue
+        else:
+            names_used.add(field.name if using_name else field.alias)
+
+        decoder = table.get(name, None)
+        if decoder is not None and decoder.is_model:
+            errors_ = walk_element(decoder, value, field.alias)
+            if errors_ is not None:
+                if errors_:
+                    errors.extend(errors_)
+                else:
+                    # raw value stands in for the model (root validators
+                    # only check presence of elements)
+                    values[name] = value
+                continue
+
+        v_, errors_ = field.validate(value, values, loc=field.alias, cls=klass)
+        if isinstance(errors_, ErrorWrapper):
+            errors.append(errors_)
+        elif isinstance(errors_, list):
+            errors.extend(errors_)
+        else:
+            values[name] = v_
+
+    if config.extra is not Extra.ignore:
+        extra = data.keys() - names_used
+        if extra and config.extra is not Extra.allow:
+            for f in sorted(extra):
+                errors.append(ErrorWrapper(ExtraError(), loc=f))
+
+    for skip_on_failure, validator in klass.__post_root_validators__:
+        if skip_on_failure and errors:
+            continue
+        try:
+            values = validator(klass, values)
+        except (ValueError, TypeError, AssertionError) as exc:
+            errors.append(ErrorWrapper(exc, loc=ROOT_KEY))
+    return errors
+
+
+def walk_element(
+    decoder: "ElementDecoder", value: typing.Any, alias: str
+) -> typing.Optional[ErrorsType]:
+    """Walks through raw JSON object (or list of JSON objects) of model field.
+    ``None`` means value is not walkable (i.e. model instance or unknown
+    ``resourceType``), field's validators should be used instead."""
+    if decoder.is_list:
+        if not isinstance(value, list):
+            return None
+        items = [((alias, index), item) for index, item in enumerate(value)]
+    else:
+        items = [(alias, value)]
+
+    nested = []
+    for loc, item in items:
+        if not isinstance(item, dict):
+            return None
+        try:
+            nested.append((loc, decoder.get_model_class(item), item))
+        except (KeyError, TypeError):
+            return None
+
+    errors: ErrorsType = []
+    for loc, klass, item in nested:
+        try:
+            errors_ = walk_model(klass, item)
+        except NotWalkable:
+            return None
+        if errors_:
+            # same as ``ValidationError`` is raised by ``fhir_model_validator``
+            errors.append(ErrorWrapper(ValidationError(errors_, klass), loc=loc))
+    return errors
+
+
+class FailFastError(ValidationError):
+    """Raised by ``fail_fast=True`` parsing, carries only the first error
+    with flat location (JSON path) from the root, no nested ``ValidationError``
+    (one per element level) is built."""
+
+    def __init__(
+        self,
+        exc: Exception,
+        loc: typing.Tuple[typing.Union[int, str], ...],
+        model: typing.Type[FHIRAbstractModel],
+    ) -> None:
+        """ """
+        super().__init__([ErrorWrapper(exc, loc=loc)], model)
+
+    @property
+    def loc(self) -> typing.Tuple[typing.Union[int, str], ...]:
+        """ """
+        return self.raw_errors[0].loc_tuple()  # type: ignore
+
+    @property
+    def json_path(self) -> str:
+        """i.e. ``$.entry[3].resource.birthDate``"""
+        path = "$"
+        for item in self.loc:
+            if isinstance(item, int):
+                path += f"[{item}]"
+            elif item != ROOT_KEY:
+                path += f".{item}"
+        return path
+
+
+class FirstError(Exception):
+    """Internal signal of ``build_model``, location is relative to the root."""
+
+    def __init__(
+        self, loc: typing.Tuple[typing.Union[int, str], ...], exc: Exception
+    ) -> None:
+        """ """
+        super().__init__(loc, exc)
+        self.loc = loc
+        self.exc = exc
+
+
+def first_error(
+    errors: typing.Any, loc: typing.Tuple[typing.Union[int, str], ...]
+) -> FirstError:
+    """Same order as ``pydantic.error_wrappers.flatten_errors``."""
+    while True:
+        if isinstance(errors, list):
+            errors = errors[0]
+        elif isinstance(errors.exc, ValidationError):
+            loc = loc + errors.loc_tuple()
+            errors = errors.exc.raw_errors
+        else:
+            return FirstError(loc + errors.loc_tuple(), errors.exc)
+
+
+def construct_fail_fast(
+    klass: typing.Type[FHIRAbstractModel], obj: typing.Any
+) -> FHIRAbstractModel:
+    """Same as ``klass.parse_obj(obj)``, but stops at the first error and
+    raises ``FailFastError`` (always the first one of ``ValidationError.errors()``
+    of ``parse_obj``)."""
+    if not isinstance(obj, dict):
+        try:
+            obj = dict(obj)
+        except (TypeError, ValueError):
+            exc = TypeError(
+                f"{klass.__name__} expected dict not {obj.__class__.__name__}"
+            )
+            raise FailFastError(exc, (ROOT_KEY,), klass)
+    try:
+        return build_model(klass, obj, ())
+    except FirstError as error:
+        raise FailFastError(error.exc, error.loc, klass)
+    except NotWalkable as exc:
+        # same as ``parse_obj``
+        raise TypeError(str(exc))
+
+
+def build_model(
+    klass: typing.Type[FHIRAbstractModel],
+    data: typing.Dict[str, typing.Any],
+    path: typing.Tuple[typing.Union[int, str], ...],
+) -> FHIRAbstractModel:
+    """Fail fast variant of ``walk_model``, model is constructed from
+    validated values (like ``BaseModel.__init__``), nested models are built
+    directly instead of by the fields' validators."""
+    wrong_resource_type = check_resource_type(klass, data)
+    if wrong_resource_type is not None:
+        raise FirstError(path + ("resource_type",), wrong_resource_type)
+    data = strip_resource_type(data)
+
+    fields = klass.__fields__
+    config = klass.__config__
+    for validator in klass.__pre_root_validators__:
+        try:
+            data = validator(klass, data)
+        except (ValueError, TypeError, AssertionError) as exc:
+            raise first_error(ErrorWrapper(exc, loc=ROOT_KEY), path)
+
+    table = klass.get_decode_table()  # type: ignore
+    values: typing.Dict[str, typing.Any] = {}
+    fields_set = set()
+    names_used = set()
+    for name, field in fields.items():
+        value = data.get(field.alias, _missing)
+        using_name = False
+        if (
+            value is _missing
+            and config.allow_population_by_field_name
+            and field.alt_alias
+        ):
+            value = data.get(field.name, _missing)
+            using_name = True
+
+        if value is _missing:
+            if field.required:
+                raise FirstError(path + (field.alias,), MissingError())
+            value = field.get_default()
+            if not config.validate_all and not field.validate_always:
+                values[name] = value
+                continue
+        else:
+            fields_set.add(name)
+            names_used.add(field.name if using_name else field.alias)
+
+        decoder = table.get(name, None)
+        if decoder is not None and decoder.is_model:
+            v_ = build_element(decoder, value, path + (field.alias,))
+            if v_ is not _missing:
+                values[name] = v_
+                continue
+
+        v_, errors_ = field.validate(value, values, loc=field.alias, cls=klass)
+        if errors_:
+            raise first_error(errors_, path)
+        values[name] = v_
+
+    if config.extra is not Extra.ignore:
+        extra = data.keys() - names_used
+        if extra:
+            fields_set |= extra
+            if config.extra is Extra.allow:
+                for f in extra:
+                    values[f] = data[f]
+            else:
+                raise FirstError(path + (sorted(extra)[0],), ExtraError())
+
+    for _, validator in klass.__post_root_validators__:
+        try:
+            values = validator(klass, values)
+        except (ValueError, TypeError, AssertionError) as exc:
+            raise first_error(ErrorWrapper(exc, loc=ROOT_KEY), path)
+
+    model = klass.__new__(klass)
+    object.__setattr__(model, "__dict__", values)
+    object.__setattr__(model, "__fields_set__", fields_set)
+    model._init_private_attributes()
+    return model
+
+
+def build_element(
+    decoder: "ElementDecoder",
+    value: typing.Any,
+    loc: typing.Tuple[typing.Union[int, str], ...],
+) -> typing.Any:
+    """Fail fast variant of ``walk_element``, returns model (or list of models)
+    or ``_missing`` if value is not walkable."""
+    if decoder.is_list:
+        if not isinstance(value, list):
+            return _missing
+        items = [(loc + (index,), item) for index, item in enumerate(value)]
+    else:
+        items = [(loc, value)]
+
+    nested = []
+    for loc_, item in items:
+        if not isinstance(item, dict):
+            return _missing
+        try:
+            nested.append((loc_, decoder.get_model_class(item), item))
+        except (KeyError, TypeError):
+            return _missing
+
+    try:
+        models = [build_model(klass, item, loc_) for loc_, klass, item in nested]
+    except NotWalkable:
+        return _missing
+    if decoder.is_list:
+        return models
+    return models[0]
+
+
+__all__ = [
+    "ErrorDetail",
+    "FailFastError",
+    "construct_fail_fast",
+    "validate_obj",
+    "validate_raw",
+]
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""Ahead of time import of model classes and filling of per class caches,
+i.e. in master process of pre-fork servers (gunicorn, uwsgi), so workers
+don't pay that cost on first requests and share the memory pages."""
+import gc
+import sys
+import time
+import typing
+
+from .fhirabstractmodel import FHIR_COMMENTS_FIELD_NAME, FHIRAbstractModel
+from .utils.common import get_fhir_root_module, get_fhir_type_name, is_primitive_type
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # not available on windows
+    resource = None  # type: ignore
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+# releases those are based on ``fhir.resources.core.fhirabstractmodel``
+WARMUP_RELEASES = ("R5", "R4B", "STU3")
+
+
+class WarmupReport(typing.NamedTuple):
+    """``memory`` is growth of peak RSS (bytes), ``None`` if not available."""
+
+    releases: typing.Tuple[str, ...]
+    model_classes: int
+    fields: int
+    elapsed: float
+    memory: typing.Optional[int]
+    frozen: int
+
+    def __str__(self) -> str:
+        """ """
+        memory = "n/a"
+        if self.memory is not None:
+            memory = f"{self.memory / 1024 / 1024:.1f} MB"
+        return (
+            f"warmup {', '.join(self.releases)}: {self.model_classes} model classes, "
+            f"{self.fields} fields in {self.elapsed:.2f}s, memory {memory}, "
+            f"{self.frozen} objects frozen"
+        )
+
+
+def get_peak_rss() -> typing.Optional[int]:
+    """Peak resident set size in bytes."""
+    if resource is None:  # pragma: no cover
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != "darwin":
+        # kilobytes on linux
+        peak *= 1024
+    return peak
+
+
+def warmup_model_class(klass: typing.Type[FHIRAbstractModel]) -> int:
+    """Fills class level caches, returns number of fields."""
+    klass.has_resource_base()
+    klass.get_resource_type()
+    klass.get_alias_mapping()
+    klass.get_serialization_plan()
+    for field_key, field in klass.__fields__.items():
+        if field_key in ("resource_type", FHIR_COMMENTS_FIELD_NAME):
+            continue
+        is_primitive_type(field)
+        get_fhir_type_name(field.type_)
+    return len(klass.__fields__)
+
+
+def warmup_release(
+    fhir_release: str, resource_types: typing.Optional[typing.Sequence[str]] = None
+) -> typing.Tuple[int, int]:
+    """Imports all (or given) model classes of release and fills their caches.
+    Returns number of model classes and fields."""
+    if fhir_release not in WARMUP_RELEASES:
+        raise ValueError(
+            f"Warmup is not supported for FHIR release '{fhir_release}', "
+            f"supported releases are {WARMUP_RELEASES}"
+        )
+    validators = get_fhir_root_module(fhir_release).fhirtypesvalidators
+    if resource_types is None:
+        resource_types = list(validators.MODEL_CLASSES.keys())
+    fields = 0
+    for resource_type in resource_types:
+        fields += warmup_model_class(validators.get_fhir_model_class(resource_type))
+    return len(resource_types), fields
+
+
+def warmup(
+    resource_types: typing.Optional[typing.Sequence[str]] = None,
+    releases: typing.Sequence[str] = ("R5",),
+    *,
+    freeze: bool = False,
+) -> WarmupReport:
+    """Imports model classes (all or ``resource_types``) of given releases and
+    fills their caches. With ``freeze``, all objects are moved to permanent
+    generation of garbage collector (``gc.freeze``), so forked workers don't
+    touch (copy) those memory pages while collecting garbage.
+    """
+    started = time.perf_counter()
+    peak_rss = get_peak_rss()
+    model_classes = fields = 0
+    for fhir_release in releases:
+        counts = warmup_release(fhir_release, resource_types)
+        model_classes += counts[0]
+        fields += counts[1]
+
+    frozen = 0
+    if freeze:
+        gc.collect()
+        gc.freeze()
+        frozen = gc.get_freeze_count()
+
+    memory = None
+    if peak_rss is not None:
+        memory = typing.cast(int, get_peak_rss()) - peak_rss
+    return WarmupReport(
+        releases=tuple(releases),
+        model_classes=model_classes,
+        fields=fields,
+        elapsed=time.perf_counter() - started,
+        memory=memory,
+        frozen=frozen,
+    )
+
+
+__all__ = ["WarmupReport", "warmup"]
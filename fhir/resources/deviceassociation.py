@@ -30,6 +30,7 @@ class DeviceAssociation(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["BodyStructure"],
     )
@@ -41,6 +42,7 @@ class DeviceAssociation(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     device: fhirtypes.ReferenceType = Field(
@@ -50,6 +52,7 @@ class DeviceAssociation(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Device"],
     )
@@ -61,6 +64,7 @@ class DeviceAssociation(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     operation: typing.List[fhirtypes.DeviceAssociationOperationType] = Field(
@@ -73,6 +77,7 @@ class DeviceAssociation(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     period: fhirtypes.PeriodType = Field(
@@ -82,6 +87,7 @@ class DeviceAssociation(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     status: fhirtypes.CodeableConceptType = Field(
@@ -91,6 +97,7 @@ class DeviceAssociation(domainresource.DomainResource):
         description="Indicates the state of the Device association.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     statusReason: typing.List[fhirtypes.CodeableConceptType] = Field(
@@ -100,6 +107,7 @@ class DeviceAssociation(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     subject: fhirtypes.ReferenceType = Field(
@@ -112,6 +120,7 @@ class DeviceAssociation(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=[
             "Patient",
@@ -166,6 +175,7 @@ class DeviceAssociationOperation(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Patient", "Practitioner", "RelatedPerson"],
     )
@@ -177,6 +187,7 @@ class DeviceAssociationOperation(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     status: fhirtypes.CodeableConceptType = Field(
@@ -186,6 +197,7 @@ class DeviceAssociationOperation(backboneelement.BackboneElement):
         description="Device operational condition corresponding to the association.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
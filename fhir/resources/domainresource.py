@@ -76,6 +76,7 @@ class DomainResource(resource.Resource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     text: fhirtypes.NarrativeType = Field(
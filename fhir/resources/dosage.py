@@ -8,7 +8,7 @@ Last updated: 2023-03-26T15:21:02.749+11:00
 """
 import typing
 
-from pydantic import Field, root_validator
+from pydantic import Field
 
 from . import backbonetype, element, fhirtypes
 
@@ -41,6 +41,7 @@ class Dosage(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     asNeeded: bool = Field(
@@ -53,6 +54,7 @@ class Dosage(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     asNeeded__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_asNeeded", title="Extension field for ``asNeeded``."
@@ -68,6 +70,7 @@ class Dosage(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     doseAndRate: typing.List[fhirtypes.DosageDoseAndRateType] = Field(
@@ -84,6 +87,7 @@ class Dosage(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     maxDosePerAdministration: fhirtypes.QuantityType = Field(
@@ -93,6 +97,7 @@ class Dosage(backbonetype.BackboneType):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     maxDosePerLifetime: fhirtypes.QuantityType = Field(
@@ -102,6 +107,7 @@ class Dosage(backbonetype.BackboneType):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     maxDosePerPeriod: typing.List[fhirtypes.RatioType] = Field(
@@ -111,6 +117,7 @@ class Dosage(backbonetype.BackboneType):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     method: fhirtypes.CodeableConceptType = Field(
@@ -120,6 +127,7 @@ class Dosage(backbonetype.BackboneType):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     patientInstruction: fhirtypes.String = Field(
@@ -129,6 +137,7 @@ class Dosage(backbonetype.BackboneType):
         description="Instructions in terms that are understood by the patient or consumer.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     patientInstruction__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -143,6 +152,7 @@ class Dosage(backbonetype.BackboneType):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     sequence: fhirtypes.Integer = Field(
@@ -155,6 +165,7 @@ class Dosage(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     sequence__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_sequence", title="Extension field for ``sequence``."
@@ -167,6 +178,7 @@ class Dosage(backbonetype.BackboneType):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     text: fhirtypes.String = Field(
@@ -176,6 +188,7 @@ class Dosage(backbonetype.BackboneType):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     text__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_text", title="Extension field for ``text``."
@@ -188,6 +201,7 @@ class Dosage(backbonetype.BackboneType):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -237,6 +251,7 @@ class DosageDoseAndRate(element.Element):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e dose[x]
         one_of_many="dose",
         one_of_many_required=False,
@@ -249,6 +264,7 @@ class DosageDoseAndRate(element.Element):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e dose[x]
         one_of_many="dose",
         one_of_many_required=False,
@@ -261,6 +277,7 @@ class DosageDoseAndRate(element.Element):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e rate[x]
         one_of_many="rate",
         one_of_many_required=False,
@@ -273,6 +290,7 @@ class DosageDoseAndRate(element.Element):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e rate[x]
         one_of_many="rate",
         one_of_many_required=False,
@@ -285,6 +303,7 @@ class DosageDoseAndRate(element.Element):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e rate[x]
         one_of_many="rate",
         one_of_many_required=False,
@@ -299,6 +318,7 @@ class DosageDoseAndRate(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -317,44 +337,3 @@ class DosageDoseAndRate(element.Element):
             "rateRange",
             "rateQuantity",
         ]
-
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_one_of_many_1830(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/formats.html#choice
-        A few elements have a choice of more than one data type for their content.
-        All such elements have a name that takes the form nnn[x].
-        The "nnn" part of the name is constant, and the "[x]" is replaced with
-        the title-cased name of the type that is actually used.
-        The table view shows each of these names explicitly.
-
-        Elements that have a choice of data type cannot repeat - they must have a
-        maximum cardinality of 1. When constructing an instance of an element with a
-        choice of types, the authoring system must create a single element with a
-        data type chosen from among the list of permitted data types.
-        """
-        one_of_many_fields = {
-            "dose": ["doseQuantity", "doseRange"],
-            "rate": ["rateQuantity", "rateRange", "rateRatio"],
-        }
-        for prefix, fields in one_of_many_fields.items():
-            assert cls.__fields__[fields[0]].field_info.extra["one_of_many"] == prefix
-            required = (
-                cls.__fields__[fields[0]].field_info.extra["one_of_many_required"]
-                is True
-            )
-            found = False
-            for field in fields:
-                if field in values and values[field] is not None:
-                    if found is True:
-                        raise ValueError(
-                            "Any of one field value is expected from "
-                            f"this list {fields}, but got multiple!"
-                        )
-                    else:
-                        found = True
-            if required is True and found is False:
-                raise ValueError(f"Expect any of field value from this list {fields}.")
-
-        return values
@@ -8,9 +8,7 @@ Last updated: 2023-03-26T15:21:02.749+11:00
 """
 import typing
 
-from pydantic import Field, root_validator
-from pydantic.error_wrappers import ErrorWrapper, ValidationError
-from pydantic.errors import MissingError, NoneIsNotAllowedError
+from pydantic import Field
 
 from . import backbonetype, element, fhirtypes
 
@@ -34,6 +32,7 @@ class ElementDefinition(backbonetype.BackboneType):
         description="Identifies additional names by which this element might also be known.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     alias__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -55,6 +54,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     binding: fhirtypes.ElementDefinitionBindingType = Field(
@@ -67,6 +67,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     code: typing.List[fhirtypes.CodingType] = Field(
@@ -79,6 +80,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     comment: fhirtypes.Markdown = Field(
@@ -93,6 +95,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     comment__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_comment", title="Extension field for ``comment``."
@@ -108,6 +111,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     condition__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -123,6 +127,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     contentReference: fhirtypes.Uri = Field(
@@ -138,6 +143,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     contentReference__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -155,6 +161,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -170,6 +177,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -185,6 +193,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -200,6 +209,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -215,6 +225,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -230,6 +241,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -250,6 +262,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -270,6 +283,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -290,6 +304,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -310,6 +325,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -325,6 +341,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -340,6 +357,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -355,6 +373,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -370,6 +389,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -385,6 +405,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -400,6 +421,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -415,6 +437,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -435,6 +458,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -455,6 +479,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -475,6 +500,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -490,6 +516,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -505,6 +532,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -520,6 +548,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -535,6 +564,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -550,6 +580,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -565,6 +596,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -583,6 +615,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -598,6 +631,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -618,6 +652,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -638,6 +673,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -658,6 +694,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -678,6 +715,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -693,6 +731,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -708,6 +747,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -726,6 +766,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -741,6 +782,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -756,6 +798,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -776,6 +819,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -791,6 +835,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -806,6 +851,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -821,6 +867,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -836,6 +883,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -851,6 +899,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -866,6 +915,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -881,6 +931,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -896,6 +947,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -916,6 +968,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -936,6 +989,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -951,6 +1005,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -966,6 +1021,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -986,6 +1042,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1004,6 +1061,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1022,6 +1080,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1037,6 +1096,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e defaultValue[x]
         one_of_many="defaultValue",
         one_of_many_required=False,
@@ -1061,6 +1121,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     definition__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_definition", title="Extension field for ``definition``."
@@ -1076,6 +1137,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     fixedAddress: fhirtypes.AddressType = Field(
@@ -1091,6 +1153,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1109,6 +1172,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1127,6 +1191,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1145,6 +1210,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1163,6 +1229,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1181,6 +1248,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1204,6 +1272,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1225,6 +1294,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1246,6 +1316,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1267,6 +1338,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1285,6 +1357,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1303,6 +1376,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1321,6 +1395,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1339,6 +1414,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1357,6 +1433,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1375,6 +1452,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1393,6 +1471,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1414,6 +1493,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1435,6 +1515,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1456,6 +1537,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1474,6 +1556,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1492,6 +1575,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1510,6 +1594,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1528,6 +1613,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1546,6 +1632,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1564,6 +1651,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1585,6 +1673,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1603,6 +1692,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1624,6 +1714,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1645,6 +1736,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1666,6 +1758,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1687,6 +1780,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1705,6 +1799,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1723,6 +1818,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1744,6 +1840,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1762,6 +1859,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1780,6 +1878,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1803,6 +1902,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1821,6 +1921,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1839,6 +1940,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1857,6 +1959,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1875,6 +1978,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1893,6 +1997,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1911,6 +2016,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1929,6 +2035,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1947,6 +2054,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1968,6 +2076,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -1989,6 +2098,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -2007,6 +2117,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -2025,6 +2136,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -2048,6 +2160,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -2069,6 +2182,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -2090,6 +2204,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -2108,6 +2223,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e fixed[x]
         one_of_many="fixed",
         one_of_many_required=False,
@@ -2133,6 +2249,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     isModifier__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_isModifier", title="Extension field for ``isModifier``."
@@ -2148,6 +2265,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     isModifierReason__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -2165,6 +2283,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     isSummary__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_isSummary", title="Extension field for ``isSummary``."
@@ -2181,6 +2300,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     label__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_label", title="Extension field for ``label``."
@@ -2196,6 +2316,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     max: fhirtypes.String = Field(
@@ -2208,6 +2329,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     max__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_max", title="Extension field for ``max``."
@@ -2229,6 +2351,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     maxLength__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_maxLength", title="Extension field for ``maxLength``."
@@ -2245,6 +2368,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -2264,6 +2388,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -2285,6 +2410,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -2304,6 +2430,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -2323,6 +2450,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -2342,6 +2470,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -2363,6 +2492,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -2384,6 +2514,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -2400,6 +2531,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -2419,6 +2551,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e maxValue[x]
         one_of_many="maxValue",
         one_of_many_required=False,
@@ -2439,6 +2572,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     meaningWhenMissing__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -2453,6 +2587,7 @@ class ElementDefinition(backbonetype.BackboneType):
         description="The minimum number of times this element SHALL appear in the instance.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     min__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_min", title="Extension field for ``min``."
@@ -2469,6 +2604,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -2488,6 +2624,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -2509,6 +2646,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -2528,6 +2666,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -2547,6 +2686,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -2566,6 +2706,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -2587,6 +2728,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -2608,6 +2750,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -2624,6 +2767,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -2643,6 +2787,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e minValue[x]
         one_of_many="minValue",
         one_of_many_required=False,
@@ -2666,6 +2811,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     mustHaveValue__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_mustHaveValue", title="Extension field for ``mustHaveValue``."
@@ -2685,6 +2831,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     mustSupport__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_mustSupport", title="Extension field for ``mustSupport``."
@@ -2701,6 +2848,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     orderMeaning__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_orderMeaning", title="Extension field for ``orderMeaning``."
@@ -2717,6 +2865,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     path__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -2751,6 +2900,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2784,6 +2934,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2817,6 +2968,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2850,6 +3002,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2883,6 +3036,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2916,6 +3070,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2954,6 +3109,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -2990,6 +3146,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3028,6 +3185,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3064,6 +3222,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3097,6 +3256,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3130,6 +3290,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3163,6 +3324,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3196,6 +3358,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3229,6 +3392,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3262,6 +3426,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3295,6 +3460,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3331,6 +3497,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3367,6 +3534,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3403,6 +3571,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3436,6 +3605,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3469,6 +3639,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3502,6 +3673,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3535,6 +3707,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3568,6 +3741,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3601,6 +3775,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3637,6 +3812,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3670,6 +3846,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3706,6 +3883,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3742,6 +3920,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3780,6 +3959,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3816,6 +3996,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3849,6 +4030,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3882,6 +4064,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3918,6 +4101,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3951,6 +4135,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -3984,6 +4169,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -4022,6 +4208,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -4055,6 +4242,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -4088,6 +4276,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -4121,6 +4310,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -4154,6 +4344,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -4187,6 +4378,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -4220,6 +4412,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -4253,6 +4446,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -4286,6 +4480,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -4322,6 +4517,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -4358,6 +4554,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -4391,6 +4588,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -4424,6 +4622,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -4462,6 +4661,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -4498,6 +4698,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -4534,6 +4735,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -4567,6 +4769,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e pattern[x]
         one_of_many="pattern",
         one_of_many_required=False,
@@ -4587,6 +4790,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["xmlAttr", "xmlText", "typeAttr", "cdaText", "xhtml"],
@@ -4609,6 +4813,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     requirements__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_requirements", title="Extension field for ``requirements``."
@@ -4624,6 +4829,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     short__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_short", title="Extension field for ``short``."
@@ -4645,6 +4851,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     sliceIsConstraining__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -4664,6 +4871,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     sliceName__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_sliceName", title="Extension field for ``sliceName``."
@@ -4685,6 +4893,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     type: typing.List[fhirtypes.ElementDefinitionTypeType] = Field(
@@ -4697,6 +4906,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     valueAlternatives: typing.List[typing.Optional[fhirtypes.Canonical]] = Field(
@@ -4709,6 +4919,7 @@ class ElementDefinition(backbonetype.BackboneType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["StructureDefinition"],
     )
@@ -4945,296 +5156,6 @@ class ElementDefinition(backbonetype.BackboneType):
             "mapping",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_1926(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("path", "path__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_one_of_many_1926(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/formats.html#choice
-        A few elements have a choice of more than one data type for their content.
-        All such elements have a name that takes the form nnn[x].
-        The "nnn" part of the name is constant, and the "[x]" is replaced with
-        the title-cased name of the type that is actually used.
-        The table view shows each of these names explicitly.
-
-        Elements that have a choice of data type cannot repeat - they must have a
-        maximum cardinality of 1. When constructing an instance of an element with a
-        choice of types, the authoring system must create a single element with a
-        data type chosen from among the list of permitted data types.
-        """
-        one_of_many_fields = {
-            "defaultValue": [
-                "defaultValueAddress",
-                "defaultValueAge",
-                "defaultValueAnnotation",
-                "defaultValueAttachment",
-                "defaultValueAvailability",
-                "defaultValueBase64Binary",
-                "defaultValueBoolean",
-                "defaultValueCanonical",
-                "defaultValueCode",
-                "defaultValueCodeableConcept",
-                "defaultValueCodeableReference",
-                "defaultValueCoding",
-                "defaultValueContactDetail",
-                "defaultValueContactPoint",
-                "defaultValueCount",
-                "defaultValueDataRequirement",
-                "defaultValueDate",
-                "defaultValueDateTime",
-                "defaultValueDecimal",
-                "defaultValueDistance",
-                "defaultValueDosage",
-                "defaultValueDuration",
-                "defaultValueExpression",
-                "defaultValueExtendedContactDetail",
-                "defaultValueHumanName",
-                "defaultValueId",
-                "defaultValueIdentifier",
-                "defaultValueInstant",
-                "defaultValueInteger",
-                "defaultValueInteger64",
-                "defaultValueMarkdown",
-                "defaultValueMeta",
-                "defaultValueMoney",
-                "defaultValueOid",
-                "defaultValueParameterDefinition",
-                "defaultValuePeriod",
-                "defaultValuePositiveInt",
-                "defaultValueQuantity",
-                "defaultValueRange",
-                "defaultValueRatio",
-                "defaultValueRatioRange",
-                "defaultValueReference",
-                "defaultValueRelatedArtifact",
-                "defaultValueSampledData",
-                "defaultValueSignature",
-                "defaultValueString",
-                "defaultValueTime",
-                "defaultValueTiming",
-                "defaultValueTriggerDefinition",
-                "defaultValueUnsignedInt",
-                "defaultValueUri",
-                "defaultValueUrl",
-                "defaultValueUsageContext",
-                "defaultValueUuid",
-            ],
-            "fixed": [
-                "fixedAddress",
-                "fixedAge",
-                "fixedAnnotation",
-                "fixedAttachment",
-                "fixedAvailability",
-                "fixedBase64Binary",
-                "fixedBoolean",
-                "fixedCanonical",
-                "fixedCode",
-                "fixedCodeableConcept",
-                "fixedCodeableReference",
-                "fixedCoding",
-                "fixedContactDetail",
-                "fixedContactPoint",
-                "fixedCount",
-                "fixedDataRequirement",
-                "fixedDate",
-                "fixedDateTime",
-                "fixedDecimal",
-                "fixedDistance",
-                "fixedDosage",
-                "fixedDuration",
-                "fixedExpression",
-                "fixedExtendedContactDetail",
-                "fixedHumanName",
-                "fixedId",
-                "fixedIdentifier",
-                "fixedInstant",
-                "fixedInteger",
-                "fixedInteger64",
-                "fixedMarkdown",
-                "fixedMeta",
-                "fixedMoney",
-                "fixedOid",
-                "fixedParameterDefinition",
-                "fixedPeriod",
-                "fixedPositiveInt",
-                "fixedQuantity",
-                "fixedRange",
-                "fixedRatio",
-                "fixedRatioRange",
-                "fixedReference",
-                "fixedRelatedArtifact",
-                "fixedSampledData",
-                "fixedSignature",
-                "fixedString",
-                "fixedTime",
-                "fixedTiming",
-                "fixedTriggerDefinition",
-                "fixedUnsignedInt",
-                "fixedUri",
-                "fixedUrl",
-                "fixedUsageContext",
-                "fixedUuid",
-            ],
-            "maxValue": [
-                "maxValueDate",
-                "maxValueDateTime",
-                "maxValueDecimal",
-                "maxValueInstant",
-                "maxValueInteger",
-                "maxValueInteger64",
-                "maxValuePositiveInt",
-                "maxValueQuantity",
-                "maxValueTime",
-                "maxValueUnsignedInt",
-            ],
-            "minValue": [
-                "minValueDate",
-                "minValueDateTime",
-                "minValueDecimal",
-                "minValueInstant",
-                "minValueInteger",
-                "minValueInteger64",
-                "minValuePositiveInt",
-                "minValueQuantity",
-                "minValueTime",
-                "minValueUnsignedInt",
-            ],
-            "pattern": [
-                "patternAddress",
-                "patternAge",
-                "patternAnnotation",
-                "patternAttachment",
-                "patternAvailability",
-                "patternBase64Binary",
-                "patternBoolean",
-                "patternCanonical",
-                "patternCode",
-                "patternCodeableConcept",
-                "patternCodeableReference",
-                "patternCoding",
-                "patternContactDetail",
-                "patternContactPoint",
-                "patternCount",
-                "patternDataRequirement",
-                "patternDate",
-                "patternDateTime",
-                "patternDecimal",
-                "patternDistance",
-                "patternDosage",
-                "patternDuration",
-                "patternExpression",
-                "patternExtendedContactDetail",
-                "patternHumanName",
-                "patternId",
-                "patternIdentifier",
-                "patternInstant",
-                "patternInteger",
-                "patternInteger64",
-                "patternMarkdown",
-                "patternMeta",
-                "patternMoney",
-                "patternOid",
-                "patternParameterDefinition",
-                "patternPeriod",
-                "patternPositiveInt",
-                "patternQuantity",
-                "patternRange",
-                "patternRatio",
-                "patternRatioRange",
-                "patternReference",
-                "patternRelatedArtifact",
-                "patternSampledData",
-                "patternSignature",
-                "patternString",
-                "patternTime",
-                "patternTiming",
-                "patternTriggerDefinition",
-                "patternUnsignedInt",
-                "patternUri",
-                "patternUrl",
-                "patternUsageContext",
-                "patternUuid",
-            ],
-        }
-        for prefix, fields in one_of_many_fields.items():
-            assert cls.__fields__[fields[0]].field_info.extra["one_of_many"] == prefix
-            required = (
-                cls.__fields__[fields[0]].field_info.extra["one_of_many_required"]
-                is True
-            )
-            found = False
-            for field in fields:
-                if field in values and values[field] is not None:
-                    if found is True:
-                        raise ValueError(
-                            "Any of one field value is expected from "
-                            f"this list {fields}, but got multiple!"
-                        )
-                    else:
-                        found = True
-            if required is True and found is False:
-                raise ValueError(f"Expect any of field value from this list {fields}.")
-
-        return values
-
 
 class ElementDefinitionBase(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -5261,6 +5182,7 @@ class ElementDefinitionBase(element.Element):
         description="Maximum cardinality of the base element identified by the path.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     max__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -5274,6 +5196,7 @@ class ElementDefinitionBase(element.Element):
         description="Minimum cardinality of the base element identified by the path.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     min__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -5293,6 +5216,7 @@ class ElementDefinitionBase(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     path__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -5307,69 +5231,6 @@ class ElementDefinitionBase(element.Element):
         """
         return ["id", "extension", "path", "min", "max"]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2296(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [
-            ("max", "max__ext"),
-            ("min", "min__ext"),
-            ("path", "path__ext"),
-        ]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class ElementDefinitionBinding(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -5394,6 +5255,7 @@ class ElementDefinitionBinding(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     description: fhirtypes.Markdown = Field(
@@ -5403,6 +5265,7 @@ class ElementDefinitionBinding(element.Element):
         description="Describes the intended use of this particular set of codes.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     description__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_description", title="Extension field for ``description``."
@@ -5419,6 +5282,7 @@ class ElementDefinitionBinding(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -5438,6 +5302,7 @@ class ElementDefinitionBinding(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["ValueSet"],
     )
@@ -5453,65 +5318,6 @@ class ElementDefinitionBinding(element.Element):
         """
         return ["id", "extension", "strength", "description", "valueSet", "additional"]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2618(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("strength", "strength__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class ElementDefinitionBindingAdditional(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -5536,6 +5342,7 @@ class ElementDefinitionBindingAdditional(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     any__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_any", title="Extension field for ``any``."
@@ -5551,6 +5358,7 @@ class ElementDefinitionBindingAdditional(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     documentation__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_documentation", title="Extension field for ``documentation``."
@@ -5566,6 +5374,7 @@ class ElementDefinitionBindingAdditional(element.Element):
         description="The use of this additional binding.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -5593,6 +5402,7 @@ class ElementDefinitionBindingAdditional(element.Element):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     shortDoco__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_shortDoco", title="Extension field for ``shortDoco``."
@@ -5611,6 +5421,7 @@ class ElementDefinitionBindingAdditional(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     valueSet: fhirtypes.Canonical = Field(
@@ -5620,6 +5431,7 @@ class ElementDefinitionBindingAdditional(element.Element):
         description="The valueSet that is being bound for the purpose.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["ValueSet"],
@@ -5645,65 +5457,6 @@ class ElementDefinitionBindingAdditional(element.Element):
             "any",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_3640(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("purpose", "purpose__ext"), ("valueSet", "valueSet__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class ElementDefinitionConstraint(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -5727,6 +5480,7 @@ class ElementDefinitionConstraint(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     expression__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_expression", title="Extension field for ``expression``."
@@ -5742,6 +5496,7 @@ class ElementDefinitionConstraint(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     human__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -5759,6 +5514,7 @@ class ElementDefinitionConstraint(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     key__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -5772,6 +5528,7 @@ class ElementDefinitionConstraint(element.Element):
         description="Description of why this constraint is necessary or appropriate.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     requirements__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_requirements", title="Extension field for ``requirements``."
@@ -5787,6 +5544,7 @@ class ElementDefinitionConstraint(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -5806,6 +5564,7 @@ class ElementDefinitionConstraint(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["StructureDefinition"],
     )
@@ -5823,6 +5582,7 @@ class ElementDefinitionConstraint(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     suppress__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_suppress", title="Extension field for ``suppress``."
@@ -5846,69 +5606,6 @@ class ElementDefinitionConstraint(element.Element):
             "source",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2993(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [
-            ("human", "human__ext"),
-            ("key", "key__ext"),
-            ("severity", "severity__ext"),
-        ]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class ElementDefinitionExample(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -5929,6 +5626,7 @@ class ElementDefinitionExample(element.Element):
         description="Describes the purpose of this example among the set of examples.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     label__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -5945,6 +5643,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5960,6 +5659,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5975,6 +5675,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -5990,6 +5691,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6005,6 +5707,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6020,6 +5723,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6040,6 +5744,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6058,6 +5763,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6076,6 +5782,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6094,6 +5801,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6109,6 +5817,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6124,6 +5833,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6139,6 +5849,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6154,6 +5865,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6169,6 +5881,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6184,6 +5897,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6199,6 +5913,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6217,6 +5932,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6235,6 +5951,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6253,6 +5970,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6268,6 +5986,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6283,6 +6002,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6298,6 +6018,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6313,6 +6034,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6328,6 +6050,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6343,6 +6066,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6361,6 +6085,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6376,6 +6101,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6394,6 +6120,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6412,6 +6139,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6430,6 +6158,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6448,6 +6177,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6463,6 +6193,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6478,6 +6209,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6496,6 +6228,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6511,6 +6244,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6526,6 +6260,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6546,6 +6281,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6561,6 +6297,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6576,6 +6313,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6591,6 +6329,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6606,6 +6345,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6621,6 +6361,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6636,6 +6377,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6651,6 +6393,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6666,6 +6409,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6684,6 +6428,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6702,6 +6447,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6717,6 +6463,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6732,6 +6479,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6752,6 +6500,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6770,6 +6519,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6788,6 +6538,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6803,6 +6554,7 @@ class ElementDefinitionExample(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=True,
@@ -6877,160 +6629,6 @@ class ElementDefinitionExample(element.Element):
             "valueMeta",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2633(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("label", "label__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_one_of_many_2633(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/formats.html#choice
-        A few elements have a choice of more than one data type for their content.
-        All such elements have a name that takes the form nnn[x].
-        The "nnn" part of the name is constant, and the "[x]" is replaced with
-        the title-cased name of the type that is actually used.
-        The table view shows each of these names explicitly.
-
-        Elements that have a choice of data type cannot repeat - they must have a
-        maximum cardinality of 1. When constructing an instance of an element with a
-        choice of types, the authoring system must create a single element with a
-        data type chosen from among the list of permitted data types.
-        """
-        one_of_many_fields = {
-            "value": [
-                "valueAddress",
-                "valueAge",
-                "valueAnnotation",
-                "valueAttachment",
-                "valueAvailability",
-                "valueBase64Binary",
-                "valueBoolean",
-                "valueCanonical",
-                "valueCode",
-                "valueCodeableConcept",
-                "valueCodeableReference",
-                "valueCoding",
-                "valueContactDetail",
-                "valueContactPoint",
-                "valueCount",
-                "valueDataRequirement",
-                "valueDate",
-                "valueDateTime",
-                "valueDecimal",
-                "valueDistance",
-                "valueDosage",
-                "valueDuration",
-                "valueExpression",
-                "valueExtendedContactDetail",
-                "valueHumanName",
-                "valueId",
-                "valueIdentifier",
-                "valueInstant",
-                "valueInteger",
-                "valueInteger64",
-                "valueMarkdown",
-                "valueMeta",
-                "valueMoney",
-                "valueOid",
-                "valueParameterDefinition",
-                "valuePeriod",
-                "valuePositiveInt",
-                "valueQuantity",
-                "valueRange",
-                "valueRatio",
-                "valueRatioRange",
-                "valueReference",
-                "valueRelatedArtifact",
-                "valueSampledData",
-                "valueSignature",
-                "valueString",
-                "valueTime",
-                "valueTiming",
-                "valueTriggerDefinition",
-                "valueUnsignedInt",
-                "valueUri",
-                "valueUrl",
-                "valueUsageContext",
-                "valueUuid",
-            ]
-        }
-        for prefix, fields in one_of_many_fields.items():
-            assert cls.__fields__[fields[0]].field_info.extra["one_of_many"] == prefix
-            required = (
-                cls.__fields__[fields[0]].field_info.extra["one_of_many_required"]
-                is True
-            )
-            found = False
-            for field in fields:
-                if field in values and values[field] is not None:
-                    if found is True:
-                        raise ValueError(
-                            "Any of one field value is expected from "
-                            f"this list {fields}, but got multiple!"
-                        )
-                    else:
-                        found = True
-            if required is True and found is False:
-                raise ValueError(f"Expect any of field value from this list {fields}.")
-
-        return values
-
 
 class ElementDefinitionMapping(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -7051,6 +6649,7 @@ class ElementDefinitionMapping(element.Element):
         description="Comments that provide information about the mapping or its use.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     comment__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_comment", title="Extension field for ``comment``."
@@ -7063,6 +6662,7 @@ class ElementDefinitionMapping(element.Element):
         description="An internal reference to the definition of a mapping.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     identity__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -7076,6 +6676,7 @@ class ElementDefinitionMapping(element.Element):
         description="Identifies the computable language in which mapping.map is expressed.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     language__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_language", title="Extension field for ``language``."
@@ -7091,6 +6692,7 @@ class ElementDefinitionMapping(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     map__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -7105,65 +6707,6 @@ class ElementDefinitionMapping(element.Element):
         """
         return ["id", "extension", "identity", "language", "map", "comment"]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2635(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("identity", "identity__ext"), ("map", "map__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class ElementDefinitionSlicing(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -7194,6 +6737,7 @@ class ElementDefinitionSlicing(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     description__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_description", title="Extension field for ``description``."
@@ -7214,6 +6758,7 @@ class ElementDefinitionSlicing(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     ordered: bool = Field(
@@ -7226,6 +6771,7 @@ class ElementDefinitionSlicing(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     ordered__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_ordered", title="Extension field for ``ordered``."
@@ -7242,6 +6788,7 @@ class ElementDefinitionSlicing(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -7259,65 +6806,6 @@ class ElementDefinitionSlicing(element.Element):
         """
         return ["id", "extension", "discriminator", "description", "ordered", "rules"]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2632(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("rules", "rules__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class ElementDefinitionSlicingDiscriminator(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -7345,6 +6833,7 @@ class ElementDefinitionSlicingDiscriminator(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     path__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -7358,6 +6847,7 @@ class ElementDefinitionSlicingDiscriminator(element.Element):
         description="How the element value is interpreted when discrimination is evaluated.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -7375,65 +6865,6 @@ class ElementDefinitionSlicingDiscriminator(element.Element):
         """
         return ["id", "extension", "type", "path"]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_4011(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("path", "path__ext"), ("type", "type__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class ElementDefinitionType(element.Element):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -7458,6 +6889,7 @@ class ElementDefinitionType(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["contained", "referenced", "bundled"],
@@ -7479,6 +6911,7 @@ class ElementDefinitionType(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     code__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -7500,6 +6933,7 @@ class ElementDefinitionType(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["StructureDefinition", "ImplementationGuide"],
     )
@@ -7527,6 +6961,7 @@ class ElementDefinitionType(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["StructureDefinition", "ImplementationGuide"],
     )
@@ -7546,6 +6981,7 @@ class ElementDefinitionType(element.Element):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["either", "independent", "specific"],
@@ -7569,62 +7005,3 @@ class ElementDefinitionType(element.Element):
             "aggregation",
             "versioning",
         ]
-
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2335(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("code", "code__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
@@ -34,6 +34,7 @@ class Expression(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     description__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_description", title="Extension field for ``description``."
@@ -46,6 +47,7 @@ class Expression(datatype.DataType):
         description="An expression in the specified language that returns a value.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     expression__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_expression", title="Extension field for ``expression``."
@@ -58,6 +60,7 @@ class Expression(datatype.DataType):
         description="The media type of the language for the expression.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["text/cql", "text/fhirpath", "application/x-fhir-query", "etc."],
@@ -76,6 +79,7 @@ class Expression(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     name__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_name", title="Extension field for ``name``."
@@ -88,6 +92,7 @@ class Expression(datatype.DataType):
         description="A URI that defines where the expression is found.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     reference__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_reference", title="Extension field for ``reference``."
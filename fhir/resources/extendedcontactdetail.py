@@ -32,6 +32,7 @@ class ExtendedContactDetail(datatype.DataType):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     name: typing.List[fhirtypes.HumanNameType] = Field(
@@ -44,6 +45,7 @@ class ExtendedContactDetail(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     organization: fhirtypes.ReferenceType = Field(
@@ -57,6 +59,7 @@ class ExtendedContactDetail(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Organization"],
     )
@@ -68,6 +71,7 @@ class ExtendedContactDetail(datatype.DataType):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     purpose: fhirtypes.CodeableConceptType = Field(
@@ -77,6 +81,7 @@ class ExtendedContactDetail(datatype.DataType):
         description="The purpose/type of contact.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     telecom: typing.List[fhirtypes.ContactPointType] = Field(
@@ -86,6 +91,7 @@ class ExtendedContactDetail(datatype.DataType):
         description="The contact details application for the purpose defined.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -34,6 +34,7 @@ class HealthcareService(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     active__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_active", title="Extension field for ``active``."
@@ -74,6 +75,7 @@ class HealthcareService(domainresource.DomainResource):
         description="Identifies the broad category of service being performed or delivered.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     characteristic: typing.List[fhirtypes.CodeableConceptType] = Field(
@@ -98,6 +100,7 @@ class HealthcareService(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     comment__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_comment", title="Extension field for ``comment``."
@@ -195,6 +198,7 @@ class HealthcareService(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     location: typing.List[fhirtypes.ReferenceType] = Field(
@@ -204,6 +208,7 @@ class HealthcareService(domainresource.DomainResource):
         description="The location(s) where this healthcare service may be provided.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Location"],
     )
@@ -218,6 +223,7 @@ class HealthcareService(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     name__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_name", title="Extension field for ``name``."
@@ -248,6 +254,7 @@ class HealthcareService(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     program: typing.List[fhirtypes.CodeableConceptType] = Field(
@@ -266,6 +273,7 @@ class HealthcareService(domainresource.DomainResource):
         description="The organization that provides this healthcare service.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Organization"],
     )
@@ -304,6 +312,7 @@ class HealthcareService(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     type: typing.List[fhirtypes.CodeableConceptType] = Field(
@@ -313,6 +322,7 @@ class HealthcareService(domainresource.DomainResource):
         description="The specific type of service that may be delivered or performed.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -8,9 +8,7 @@ Last updated: 2023-03-26T15:21:02.749+11:00
 """
 import typing
 
-from pydantic import Field, root_validator
-from pydantic.error_wrappers import ErrorWrapper, ValidationError
-from pydantic.errors import MissingError, NoneIsNotAllowedError
+from pydantic import Field
 
 from . import backboneelement, domainresource, fhirtypes
 
@@ -37,6 +35,7 @@ class Ingredient(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     allergenicIndicator__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -66,6 +65,7 @@ class Ingredient(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=[
             "MedicinalProductDefinition",
@@ -88,6 +88,7 @@ class Ingredient(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     group: fhirtypes.CodeableConceptType = Field(
@@ -101,6 +102,7 @@ class Ingredient(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     identifier: fhirtypes.IdentifierType = Field(
@@ -114,6 +116,7 @@ class Ingredient(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     manufacturer: typing.List[fhirtypes.IngredientManufacturerType] = Field(
@@ -130,6 +133,7 @@ class Ingredient(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     role: fhirtypes.CodeableConceptType = Field(
@@ -142,6 +146,7 @@ class Ingredient(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     status: fhirtypes.Code = Field(
@@ -154,6 +159,7 @@ class Ingredient(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
@@ -170,6 +176,7 @@ class Ingredient(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -199,65 +206,6 @@ class Ingredient(domainresource.DomainResource):
             "substance",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_1222(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("status", "status__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
 
 class IngredientManufacturer(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -282,6 +230,7 @@ class IngredientManufacturer(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Organization"],
     )
@@ -298,6 +247,7 @@ class IngredientManufacturer(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["allowed", "possible", "actual"],
@@ -332,6 +282,7 @@ class IngredientSubstance(backboneelement.BackboneElement):
         description="A code or full resource that represents the ingredient's substance.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["SubstanceDefinition"],
     )
@@ -352,6 +303,7 @@ class IngredientSubstance(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -389,6 +341,7 @@ class IngredientSubstanceStrength(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     concentrationCodeableConcept: fhirtypes.CodeableConceptType = Field(
@@ -398,6 +351,7 @@ class IngredientSubstanceStrength(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e concentration[x]
         one_of_many="concentration",
         one_of_many_required=False,
@@ -410,6 +364,7 @@ class IngredientSubstanceStrength(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e concentration[x]
         one_of_many="concentration",
         one_of_many_required=False,
@@ -422,6 +377,7 @@ class IngredientSubstanceStrength(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e concentration[x]
         one_of_many="concentration",
         one_of_many_required=False,
@@ -434,6 +390,7 @@ class IngredientSubstanceStrength(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e concentration[x]
         one_of_many="concentration",
         one_of_many_required=False,
@@ -446,6 +403,7 @@ class IngredientSubstanceStrength(backboneelement.BackboneElement):
         description="The country or countries for which the strength range applies.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     measurementPoint: fhirtypes.String = Field(
@@ -460,6 +418,7 @@ class IngredientSubstanceStrength(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     measurementPoint__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -481,6 +440,7 @@ class IngredientSubstanceStrength(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e presentation[x]
         one_of_many="presentation",
         one_of_many_required=False,
@@ -500,6 +460,7 @@ class IngredientSubstanceStrength(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e presentation[x]
         one_of_many="presentation",
         one_of_many_required=False,
@@ -519,6 +480,7 @@ class IngredientSubstanceStrength(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e presentation[x]
         one_of_many="presentation",
         one_of_many_required=False,
@@ -538,6 +500,7 @@ class IngredientSubstanceStrength(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e presentation[x]
         one_of_many="presentation",
         one_of_many_required=False,
@@ -560,6 +523,7 @@ class IngredientSubstanceStrength(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     textConcentration: fhirtypes.String = Field(
@@ -576,6 +540,7 @@ class IngredientSubstanceStrength(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     textConcentration__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -597,6 +562,7 @@ class IngredientSubstanceStrength(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     textPresentation__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -630,57 +596,6 @@ class IngredientSubstanceStrength(backboneelement.BackboneElement):
             "referenceStrength",
         ]
 
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_one_of_many_2993(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/formats.html#choice
-        A few elements have a choice of more than one data type for their content.
-        All such elements have a name that takes the form nnn[x].
-        The "nnn" part of the name is constant, and the "[x]" is replaced with
-        the title-cased name of the type that is actually used.
-        The table view shows each of these names explicitly.
-
-        Elements that have a choice of data type cannot repeat - they must have a
-        maximum cardinality of 1. When constructing an instance of an element with a
-        choice of types, the authoring system must create a single element with a
-        data type chosen from among the list of permitted data types.
-        """
-        one_of_many_fields = {
-            "concentration": [
-                "concentrationCodeableConcept",
-                "concentrationQuantity",
-                "concentrationRatio",
-                "concentrationRatioRange",
-            ],
-            "presentation": [
-                "presentationCodeableConcept",
-                "presentationQuantity",
-                "presentationRatio",
-                "presentationRatioRange",
-            ],
-        }
-        for prefix, fields in one_of_many_fields.items():
-            assert cls.__fields__[fields[0]].field_info.extra["one_of_many"] == prefix
-            required = (
-                cls.__fields__[fields[0]].field_info.extra["one_of_many_required"]
-                is True
-            )
-            found = False
-            for field in fields:
-                if field in values and values[field] is not None:
-                    if found is True:
-                        raise ValueError(
-                            "Any of one field value is expected from "
-                            f"this list {fields}, but got multiple!"
-                        )
-                    else:
-                        found = True
-            if required is True and found is False:
-                raise ValueError(f"Expect any of field value from this list {fields}.")
-
-        return values
-
 
 class IngredientSubstanceStrengthReferenceStrength(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -706,6 +621,7 @@ class IngredientSubstanceStrengthReferenceStrength(backboneelement.BackboneEleme
         description="The country or countries for which the strength range applies.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     measurementPoint: fhirtypes.String = Field(
@@ -715,6 +631,7 @@ class IngredientSubstanceStrengthReferenceStrength(backboneelement.BackboneEleme
         description="For when strength is measured at a particular point or distance.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     measurementPoint__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -729,6 +646,7 @@ class IngredientSubstanceStrengthReferenceStrength(backboneelement.BackboneEleme
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e strength[x]
         one_of_many="strength",
         one_of_many_required=True,
@@ -741,6 +659,7 @@ class IngredientSubstanceStrengthReferenceStrength(backboneelement.BackboneEleme
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e strength[x]
         one_of_many="strength",
         one_of_many_required=True,
@@ -753,6 +672,7 @@ class IngredientSubstanceStrengthReferenceStrength(backboneelement.BackboneEleme
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e strength[x]
         one_of_many="strength",
         one_of_many_required=True,
@@ -765,6 +685,7 @@ class IngredientSubstanceStrengthReferenceStrength(backboneelement.BackboneEleme
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["SubstanceDefinition"],
     )
@@ -786,43 +707,3 @@ class IngredientSubstanceStrengthReferenceStrength(backboneelement.BackboneEleme
             "measurementPoint",
             "country",
         ]
-
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_one_of_many_4751(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/formats.html#choice
-        A few elements have a choice of more than one data type for their content.
-        All such elements have a name that takes the form nnn[x].
-        The "nnn" part of the name is constant, and the "[x]" is replaced with
-        the title-cased name of the type that is actually used.
-        The table view shows each of these names explicitly.
-
-        Elements that have a choice of data type cannot repeat - they must have a
-        maximum cardinality of 1. When constructing an instance of an element with a
-        choice of types, the authoring system must create a single element with a
-        data type chosen from among the list of permitted data types.
-        """
-        one_of_many_fields = {
-            "strength": ["strengthQuantity", "strengthRatio", "strengthRatioRange"]
-        }
-        for prefix, fields in one_of_many_fields.items():
-            assert cls.__fields__[fields[0]].field_info.extra["one_of_many"] == prefix
-            required = (
-                cls.__fields__[fields[0]].field_info.extra["one_of_many_required"]
-                is True
-            )
-            found = False
-            for field in fields:
-                if field in values and values[field] is not None:
-                    if found is True:
-                        raise ValueError(
-                            "Any of one field value is expected from "
-                            f"this list {fields}, but got multiple!"
-                        )
-                    else:
-                        found = True
-            if required is True and found is False:
-                raise ValueError(f"Expect any of field value from this list {fields}.")
-
-        return values
@@ -34,6 +34,7 @@ class MarketingStatus(backbonetype.BackboneType):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     dateRange: fhirtypes.PeriodType = Field(
@@ -51,6 +52,7 @@ class MarketingStatus(backbonetype.BackboneType):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     jurisdiction: fhirtypes.CodeableConceptType = Field(
@@ -66,6 +68,7 @@ class MarketingStatus(backbonetype.BackboneType):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     restoreDate: fhirtypes.DateTime = Field(
@@ -83,6 +86,7 @@ class MarketingStatus(backbonetype.BackboneType):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     restoreDate__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_restoreDate", title="Extension field for ``restoreDate``."
@@ -99,6 +103,7 @@ class MarketingStatus(backbonetype.BackboneType):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
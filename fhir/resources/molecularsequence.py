@@ -8,7 +8,7 @@ Last updated: 2023-03-26T15:21:02.749+11:00
 """
 import typing
 
-from pydantic import Field, root_validator
+from pydantic import Field
 
 from . import backboneelement, domainresource, fhirtypes
 
@@ -30,6 +30,7 @@ class MolecularSequence(domainresource.DomainResource):
         description="The method for sequencing, for example, chip information.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Device"],
     )
@@ -50,6 +51,7 @@ class MolecularSequence(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Resource"],
     )
@@ -67,6 +69,7 @@ class MolecularSequence(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     identifier: typing.List[fhirtypes.IdentifierType] = Field(
@@ -76,6 +79,7 @@ class MolecularSequence(domainresource.DomainResource):
         description="A unique identifier for this particular sequence instance.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     literal: fhirtypes.String = Field(
@@ -85,6 +89,7 @@ class MolecularSequence(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     literal__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_literal", title="Extension field for ``literal``."
@@ -97,6 +102,7 @@ class MolecularSequence(domainresource.DomainResource):
         description="The organization or lab that should be responsible for this result.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Organization"],
     )
@@ -108,6 +114,7 @@ class MolecularSequence(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     specimen: fhirtypes.ReferenceType = Field(
@@ -117,6 +124,7 @@ class MolecularSequence(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Specimen"],
     )
@@ -128,6 +136,7 @@ class MolecularSequence(domainresource.DomainResource):
         description="Indicates the subject this sequence is associated too.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=[
             "Patient",
@@ -145,6 +154,7 @@ class MolecularSequence(domainresource.DomainResource):
         description="Amino Acid Sequence/ DNA Sequence / RNA Sequence.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["aa", "dna", "rna"],
@@ -203,6 +213,7 @@ class MolecularSequenceRelative(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     edit: typing.List[fhirtypes.MolecularSequenceRelativeEditType] = Field(
@@ -212,6 +223,7 @@ class MolecularSequenceRelative(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     ordinalPosition: fhirtypes.Integer = Field(
@@ -251,6 +263,7 @@ class MolecularSequenceRelative(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -293,6 +306,7 @@ class MolecularSequenceRelativeEdit(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     end__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_end", title="Extension field for ``end``."
@@ -311,6 +325,7 @@ class MolecularSequenceRelativeEdit(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     replacedSequence__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -331,6 +346,7 @@ class MolecularSequenceRelativeEdit(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     replacementSequence__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -349,6 +365,7 @@ class MolecularSequenceRelativeEdit(backboneelement.BackboneElement):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     start__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_start", title="Extension field for ``start``."
@@ -395,6 +412,7 @@ class MolecularSequenceRelativeStartingSequence(backboneelement.BackboneElement)
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     genomeAssembly: fhirtypes.CodeableConceptType = Field(
@@ -404,6 +422,7 @@ class MolecularSequenceRelativeStartingSequence(backboneelement.BackboneElement)
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     orientation: fhirtypes.Code = Field(
@@ -418,6 +437,7 @@ class MolecularSequenceRelativeStartingSequence(backboneelement.BackboneElement)
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["sense", "antisense"],
@@ -433,6 +453,7 @@ class MolecularSequenceRelativeStartingSequence(backboneelement.BackboneElement)
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e sequence[x]
         one_of_many="sequence",
         one_of_many_required=False,
@@ -445,6 +466,7 @@ class MolecularSequenceRelativeStartingSequence(backboneelement.BackboneElement)
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e sequence[x]
         one_of_many="sequence",
         one_of_many_required=False,
@@ -459,6 +481,7 @@ class MolecularSequenceRelativeStartingSequence(backboneelement.BackboneElement)
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e sequence[x]
         one_of_many="sequence",
         one_of_many_required=False,
@@ -478,6 +501,7 @@ class MolecularSequenceRelativeStartingSequence(backboneelement.BackboneElement)
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["watson", "crick"],
@@ -496,6 +520,7 @@ class MolecularSequenceRelativeStartingSequence(backboneelement.BackboneElement)
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     windowEnd__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_windowEnd", title="Extension field for ``windowEnd``."
@@ -511,6 +536,7 @@ class MolecularSequenceRelativeStartingSequence(backboneelement.BackboneElement)
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     windowStart__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_windowStart", title="Extension field for ``windowStart``."
@@ -536,47 +562,3 @@ class MolecularSequenceRelativeStartingSequence(backboneelement.BackboneElement)
             "orientation",
             "strand",
         ]
-
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_one_of_many_4432(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/formats.html#choice
-        A few elements have a choice of more than one data type for their content.
-        All such elements have a name that takes the form nnn[x].
-        The "nnn" part of the name is constant, and the "[x]" is replaced with
-        the title-cased name of the type that is actually used.
-        The table view shows each of these names explicitly.
-
-        Elements that have a choice of data type cannot repeat - they must have a
-        maximum cardinality of 1. When constructing an instance of an element with a
-        choice of types, the authoring system must create a single element with a
-        data type chosen from among the list of permitted data types.
-        """
-        one_of_many_fields = {
-            "sequence": [
-                "sequenceCodeableConcept",
-                "sequenceReference",
-                "sequenceString",
-            ]
-        }
-        for prefix, fields in one_of_many_fields.items():
-            assert cls.__fields__[fields[0]].field_info.extra["one_of_many"] == prefix
-            required = (
-                cls.__fields__[fields[0]].field_info.extra["one_of_many_required"]
-                is True
-            )
-            found = False
-            for field in fields:
-                if field in values and values[field] is not None:
-                    if found is True:
-                        raise ValueError(
-                            "Any of one field value is expected from "
-                            f"this list {fields}, but got multiple!"
-                        )
-                    else:
-                        found = True
-            if required is True and found is False:
-                raise ValueError(f"Expect any of field value from this list {fields}.")
-
-        return values
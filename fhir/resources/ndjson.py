@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""Streaming reader for FHIR Bulk Data (NDJSON) files."""
+import typing
+
+from fhir.resources.core.ndjson import (
+    DEFAULT_MAX_ERRORS,
+    NDJSONError,
+    NDJSONReader,
+    SourceType,
+)
+from fhir.resources.core.ndjson import iter_resources as _iter_resources
+
+from .fhirtypesvalidators import get_fhir_model_class
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def iter_resources(
+    source: SourceType,
+    *,
+    resource_type: str = None,
+    on_error: str = "collect",
+    max_errors: typing.Optional[int] = DEFAULT_MAX_ERRORS,
+) -> NDJSONReader:
+    """Iterate FHIR models from a NDJSON file path or file object
+    (gzip compressed input is detected automatically).
+
+    :param resource_type: if provided, every line must be of this resource type.
+    :param on_error: ``collect`` (default) skips invalid lines and keeps
+        ``NDJSONError`` (with line number) at ``errors`` of the returned reader,
+        ``raise`` raises ``NDJSONError`` and ``ignore`` just skips invalid lines.
+    :param max_errors: at most this many errors are kept at ``errors``
+        (``None`` for no limit), ``error_count`` of the reader counts all.
+    """
+    return _iter_resources(
+        source,
+        get_fhir_model_class,
+        resource_type=resource_type,
+        on_error=on_error,
+        max_errors=max_errors,
+    )
+
+
+__all__ = ["NDJSONError", "NDJSONReader", "iter_resources"]
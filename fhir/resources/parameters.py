@@ -8,9 +8,7 @@ Last updated: 2023-03-26T15:21:02.749+11:00
 """
 import typing
 
-from pydantic import Field, root_validator
-from pydantic.error_wrappers import ErrorWrapper, ValidationError
-from pydantic.errors import MissingError, NoneIsNotAllowedError
+from pydantic import Field
 
 from . import backboneelement, fhirtypes, resource
 
@@ -35,6 +33,7 @@ class Parameters(resource.Resource):
         description="A parameter passed to or received from the operation.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -64,6 +63,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="The name of the parameter (reference to the operation definition).",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         element_required=True,
     )
     name__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
@@ -77,6 +77,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="A named part of a multi-part parameter.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     resource: fhirtypes.ResourceType = Field(
@@ -86,6 +87,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a whole resource.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     valueAddress: fhirtypes.AddressType = Field(
@@ -95,6 +97,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -107,6 +110,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -119,6 +123,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -131,6 +136,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -143,6 +149,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -155,6 +162,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -172,6 +180,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -187,6 +196,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -202,6 +212,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -217,6 +228,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -229,6 +241,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -241,6 +254,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -253,6 +267,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -265,6 +280,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -277,6 +293,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -289,6 +306,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -301,6 +319,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -316,6 +335,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -331,6 +351,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -346,6 +367,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -358,6 +380,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -370,6 +393,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -382,6 +406,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -394,6 +419,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -406,6 +432,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -418,6 +445,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -433,6 +461,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -445,6 +474,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -460,6 +490,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -475,6 +506,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -490,6 +522,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -505,6 +538,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -517,6 +551,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -529,6 +564,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -544,6 +580,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -556,6 +593,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -568,6 +606,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -585,6 +624,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -597,6 +637,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -609,6 +650,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -621,6 +663,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -633,6 +676,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -645,6 +689,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -657,6 +702,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -669,6 +715,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -681,6 +728,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -696,6 +744,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -711,6 +760,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -723,6 +773,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -735,6 +786,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -752,6 +804,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -767,6 +820,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -782,6 +836,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -794,6 +849,7 @@ class ParametersParameter(backboneelement.BackboneElement):
         description="Conveys the content if the parameter is a data type.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e value[x]
         one_of_many="value",
         one_of_many_required=False,
@@ -870,157 +926,3 @@ class ParametersParameter(backboneelement.BackboneElement):
             "resource",
             "part",
         ]
-
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_required_primitive_elements_2167(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/extensibility.html#Special-Case
-        In some cases, implementers might find that they do not have appropriate data for
-        an element with minimum cardinality = 1. In this case, the element must be present,
-        but unless the resource or a profile on it has made the actual value of the primitive
-        data type mandatory, it is possible to provide an extension that explains why
-        the primitive value is not present.
-        """
-        required_fields = [("name", "name__ext")]
-        _missing = object()
-
-        def _fallback():
-            return ""
-
-        errors: typing.List["ErrorWrapper"] = []
-        for name, ext in required_fields:
-            field = cls.__fields__[name]
-            ext_field = cls.__fields__[ext]
-            value = values.get(field.alias, _missing)
-            if value not in (_missing, None):
-                continue
-            ext_value = values.get(ext_field.alias, _missing)
-            missing_ext = True
-            if ext_value not in (_missing, None):
-                if isinstance(ext_value, dict):
-                    missing_ext = len(ext_value.get("extension", [])) == 0
-                elif (
-                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
-                    == "FHIRPrimitiveExtension"
-                ):
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-                else:
-                    validate_pass = True
-                    for validator in ext_field.type_.__get_validators__():
-                        try:
-                            ext_value = validator(v=ext_value)
-                        except ValidationError as exc:
-                            errors.append(ErrorWrapper(exc, loc=ext_field.alias))
-                            validate_pass = False
-                    if not validate_pass:
-                        continue
-                    if ext_value.extension and len(ext_value.extension) > 0:
-                        missing_ext = False
-            if missing_ext:
-                if value is _missing:
-                    errors.append(ErrorWrapper(MissingError(), loc=field.alias))
-                else:
-                    errors.append(
-                        ErrorWrapper(NoneIsNotAllowedError(), loc=field.alias)
-                    )
-        if len(errors) > 0:
-            raise ValidationError(errors, cls)  # type: ignore
-
-        return values
-
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_one_of_many_2167(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/formats.html#choice
-        A few elements have a choice of more than one data type for their content.
-        All such elements have a name that takes the form nnn[x].
-        The "nnn" part of the name is constant, and the "[x]" is replaced with
-        the title-cased name of the type that is actually used.
-        The table view shows each of these names explicitly.
-
-        Elements that have a choice of data type cannot repeat - they must have a
-        maximum cardinality of 1. When constructing an instance of an element with a
-        choice of types, the authoring system must create a single element with a
-        data type chosen from among the list of permitted data types.
-        """
-        one_of_many_fields = {
-            "value": [
-                "valueAddress",
-                "valueAge",
-                "valueAnnotation",
-                "valueAttachment",
-                "valueAvailability",
-                "valueBase64Binary",
-                "valueBoolean",
-                "valueCanonical",
-                "valueCode",
-                "valueCodeableConcept",
-                "valueCodeableReference",
-                "valueCoding",
-                "valueContactDetail",
-                "valueContactPoint",
-                "valueCount",
-                "valueDataRequirement",
-                "valueDate",
-                "valueDateTime",
-                "valueDecimal",
-                "valueDistance",
-                "valueDosage",
-                "valueDuration",
-                "valueExpression",
-                "valueExtendedContactDetail",
-                "valueHumanName",
-                "valueId",
-                "valueIdentifier",
-                "valueInstant",
-                "valueInteger",
-                "valueInteger64",
-                "valueMarkdown",
-                "valueMeta",
-                "valueMoney",
-                "valueOid",
-                "valueParameterDefinition",
-                "valuePeriod",
-                "valuePositiveInt",
-                "valueQuantity",
-                "valueRange",
-                "valueRatio",
-                "valueRatioRange",
-                "valueReference",
-                "valueRelatedArtifact",
-                "valueSampledData",
-                "valueSignature",
-                "valueString",
-                "valueTime",
-                "valueTiming",
-                "valueTriggerDefinition",
-                "valueUnsignedInt",
-                "valueUri",
-                "valueUrl",
-                "valueUsageContext",
-                "valueUuid",
-            ]
-        }
-        for prefix, fields in one_of_many_fields.items():
-            assert cls.__fields__[fields[0]].field_info.extra["one_of_many"] == prefix
-            required = (
-                cls.__fields__[fields[0]].field_info.extra["one_of_many_required"]
-                is True
-            )
-            found = False
-            for field in fields:
-                if field in values and values[field] is not None:
-                    if found is True:
-                        raise ValueError(
-                            "Any of one field value is expected from "
-                            f"this list {fields}, but got multiple!"
-                        )
-                    else:
-                        found = True
-            if required is True and found is False:
-                raise ValueError(f"Expect any of field value from this list {fields}.")
-
-        return values
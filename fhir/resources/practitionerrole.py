@@ -36,6 +36,7 @@ class PractitionerRole(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     active__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_active", title="Extension field for ``active``."
@@ -75,6 +76,7 @@ class PractitionerRole(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     communication: typing.List[fhirtypes.CodeableConceptType] = Field(
@@ -143,6 +145,7 @@ class PractitionerRole(domainresource.DomainResource):
         description="Business Identifiers that are specific to a role/location.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     location: typing.List[fhirtypes.ReferenceType] = Field(
@@ -152,6 +155,7 @@ class PractitionerRole(domainresource.DomainResource):
         description="The location(s) at which this practitioner provides care.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Location"],
     )
@@ -163,6 +167,7 @@ class PractitionerRole(domainresource.DomainResource):
         description="The organization where the Practitioner performs the roles associated.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Organization"],
     )
@@ -180,6 +185,7 @@ class PractitionerRole(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     practitioner: fhirtypes.ReferenceType = Field(
@@ -192,6 +198,7 @@ class PractitionerRole(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=["Practitioner"],
     )
@@ -206,6 +213,7 @@ class PractitionerRole(domainresource.DomainResource):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
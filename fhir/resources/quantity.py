@@ -34,6 +34,7 @@ class Quantity(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     code__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_code", title="Extension field for ``code``."
@@ -51,6 +52,7 @@ class Quantity(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Enum values can be used in validation,
         # but use in your own responsibilities, read official FHIR documentation.
         enum_values=["\u003c", "\u003c=", "\u003e=", "\u003e", "ad"],
@@ -69,6 +71,7 @@ class Quantity(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     system__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_system", title="Extension field for ``system``."
@@ -81,6 +84,7 @@ class Quantity(datatype.DataType):
         description="A human-readable form of the unit.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     unit__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_unit", title="Extension field for ``unit``."
@@ -96,6 +100,7 @@ class Quantity(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     value__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_value", title="Extension field for ``value``."
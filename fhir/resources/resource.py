@@ -32,6 +32,7 @@ class Resource(base.Base):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     implicitRules: fhirtypes.Uri = Field(
@@ -46,6 +47,7 @@ class Resource(base.Base):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     implicitRules__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_implicitRules", title="Extension field for ``implicitRules``."
@@ -74,6 +76,7 @@ class Resource(base.Base):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
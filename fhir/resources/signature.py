@@ -53,6 +53,7 @@ class Signature(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=[
             "Practitioner",
@@ -108,6 +109,7 @@ class Signature(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     when: fhirtypes.Instant = Field(
@@ -117,6 +119,7 @@ class Signature(datatype.DataType):
         description="When the digital signature was signed.",
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     when__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_when", title="Extension field for ``when``."
@@ -132,6 +135,7 @@ class Signature(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # note: Listed Resource Type(s) should be allowed as Reference.
         enum_reference_types=[
             "Practitioner",
@@ -39,6 +39,7 @@ class SubstanceNucleicAcid(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     areaOfHybridisation__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -59,6 +60,7 @@ class SubstanceNucleicAcid(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     numberOfSubunits__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -73,6 +75,7 @@ class SubstanceNucleicAcid(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     sequenceType: fhirtypes.CodeableConceptType = Field(
@@ -85,6 +88,7 @@ class SubstanceNucleicAcid(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     subunit: typing.List[fhirtypes.SubstanceNucleicAcidSubunitType] = Field(
@@ -98,6 +102,7 @@ class SubstanceNucleicAcid(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -147,6 +152,7 @@ class SubstanceNucleicAcidSubunit(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     length: fhirtypes.Integer = Field(
@@ -156,6 +162,7 @@ class SubstanceNucleicAcidSubunit(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     length__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_length", title="Extension field for ``length``."
@@ -168,6 +175,7 @@ class SubstanceNucleicAcidSubunit(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     sequence: fhirtypes.String = Field(
@@ -181,6 +189,7 @@ class SubstanceNucleicAcidSubunit(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     sequence__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_sequence", title="Extension field for ``sequence``."
@@ -193,6 +202,7 @@ class SubstanceNucleicAcidSubunit(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     subunit: fhirtypes.Integer = Field(
@@ -207,6 +217,7 @@ class SubstanceNucleicAcidSubunit(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     subunit__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_subunit", title="Extension field for ``subunit``."
@@ -219,6 +230,7 @@ class SubstanceNucleicAcidSubunit(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     threePrime: fhirtypes.CodeableConceptType = Field(
@@ -233,6 +245,7 @@ class SubstanceNucleicAcidSubunit(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -281,6 +294,7 @@ class SubstanceNucleicAcidSubunitLinkage(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     connectivity__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_connectivity", title="Extension field for ``connectivity``."
@@ -293,6 +307,7 @@ class SubstanceNucleicAcidSubunitLinkage(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     name: fhirtypes.String = Field(
@@ -305,6 +320,7 @@ class SubstanceNucleicAcidSubunitLinkage(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     name__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_name", title="Extension field for ``name``."
@@ -317,6 +333,7 @@ class SubstanceNucleicAcidSubunitLinkage(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     residueSite__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_residueSite", title="Extension field for ``residueSite``."
@@ -359,6 +376,7 @@ class SubstanceNucleicAcidSubunitSugar(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     name: fhirtypes.String = Field(
@@ -371,6 +389,7 @@ class SubstanceNucleicAcidSubunitSugar(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     name__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_name", title="Extension field for ``name``."
@@ -387,6 +406,7 @@ class SubstanceNucleicAcidSubunitSugar(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     residueSite__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_residueSite", title="Extension field for ``residueSite``."
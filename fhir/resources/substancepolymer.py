@@ -30,6 +30,7 @@ class SubstancePolymer(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     copolymerConnectivity: typing.List[fhirtypes.CodeableConceptType] = Field(
@@ -39,6 +40,7 @@ class SubstancePolymer(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     geometry: fhirtypes.CodeableConceptType = Field(
@@ -51,6 +53,7 @@ class SubstancePolymer(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     identifier: fhirtypes.IdentifierType = Field(
@@ -63,6 +66,7 @@ class SubstancePolymer(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     modification: fhirtypes.String = Field(
@@ -76,6 +80,7 @@ class SubstancePolymer(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     modification__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_modification", title="Extension field for ``modification``."
@@ -88,6 +93,7 @@ class SubstancePolymer(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     repeat: typing.List[fhirtypes.SubstancePolymerRepeatType] = Field(
@@ -97,6 +103,7 @@ class SubstancePolymer(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -144,6 +151,7 @@ class SubstancePolymerMonomerSet(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     startingMaterial: typing.List[
@@ -158,6 +166,7 @@ class SubstancePolymerMonomerSet(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -186,6 +195,7 @@ class SubstancePolymerMonomerSetStartingMaterial(backboneelement.BackboneElement
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     category: fhirtypes.CodeableConceptType = Field(
@@ -195,6 +205,7 @@ class SubstancePolymerMonomerSetStartingMaterial(backboneelement.BackboneElement
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     code: fhirtypes.CodeableConceptType = Field(
@@ -204,6 +215,7 @@ class SubstancePolymerMonomerSetStartingMaterial(backboneelement.BackboneElement
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     isDefining: bool = Field(
@@ -216,6 +228,7 @@ class SubstancePolymerMonomerSetStartingMaterial(backboneelement.BackboneElement
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     isDefining__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_isDefining", title="Extension field for ``isDefining``."
@@ -255,6 +268,7 @@ class SubstancePolymerRepeat(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     averageMolecularFormula__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -269,6 +283,7 @@ class SubstancePolymerRepeat(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     repeatUnitAmountType: fhirtypes.CodeableConceptType = Field(
@@ -281,6 +296,7 @@ class SubstancePolymerRepeat(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -316,6 +332,7 @@ class SubstancePolymerRepeatRepeatUnit(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     amount__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_amount", title="Extension field for ``amount``."
@@ -333,6 +350,7 @@ class SubstancePolymerRepeatRepeatUnit(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     orientation: fhirtypes.CodeableConceptType = Field(
@@ -345,6 +363,7 @@ class SubstancePolymerRepeatRepeatUnit(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     structuralRepresentation: typing.List[
@@ -356,6 +375,7 @@ class SubstancePolymerRepeatRepeatUnit(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     unit: fhirtypes.String = Field(
@@ -365,6 +385,7 @@ class SubstancePolymerRepeatRepeatUnit(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     unit__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_unit", title="Extension field for ``unit``."
@@ -410,6 +431,7 @@ class SubstancePolymerRepeatRepeatUnitDegreeOfPolymerisation(
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     average__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_average", title="Extension field for ``average``."
@@ -422,6 +444,7 @@ class SubstancePolymerRepeatRepeatUnitDegreeOfPolymerisation(
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     high__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_high", title="Extension field for ``high``."
@@ -434,6 +457,7 @@ class SubstancePolymerRepeatRepeatUnitDegreeOfPolymerisation(
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     low__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_low", title="Extension field for ``low``."
@@ -449,6 +473,7 @@ class SubstancePolymerRepeatRepeatUnitDegreeOfPolymerisation(
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -489,6 +514,7 @@ class SubstancePolymerRepeatRepeatUnitStructuralRepresentation(
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     format: fhirtypes.CodeableConceptType = Field(
@@ -501,6 +527,7 @@ class SubstancePolymerRepeatRepeatUnitStructuralRepresentation(
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     representation: fhirtypes.String = Field(
@@ -513,6 +540,7 @@ class SubstancePolymerRepeatRepeatUnitStructuralRepresentation(
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     representation__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_representation", title="Extension field for ``representation``."
@@ -525,6 +553,7 @@ class SubstancePolymerRepeatRepeatUnitStructuralRepresentation(
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
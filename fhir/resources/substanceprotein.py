@@ -45,6 +45,7 @@ class SubstanceProtein(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     disulfideLinkage__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -66,6 +67,7 @@ class SubstanceProtein(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     numberOfSubunits__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -84,6 +86,7 @@ class SubstanceProtein(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     subunit: typing.List[fhirtypes.SubstanceProteinSubunitType] = Field(
@@ -102,6 +105,7 @@ class SubstanceProtein(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -150,6 +154,7 @@ class SubstanceProteinSubunit(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     cTerminalModification__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -167,6 +172,7 @@ class SubstanceProteinSubunit(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     length: fhirtypes.Integer = Field(
@@ -176,6 +182,7 @@ class SubstanceProteinSubunit(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     length__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_length", title="Extension field for ``length``."
@@ -191,6 +198,7 @@ class SubstanceProteinSubunit(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     nTerminalModification__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -208,6 +216,7 @@ class SubstanceProteinSubunit(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     sequence: fhirtypes.String = Field(
@@ -226,6 +235,7 @@ class SubstanceProteinSubunit(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     sequence__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_sequence", title="Extension field for ``sequence``."
@@ -247,6 +257,7 @@ class SubstanceProteinSubunit(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     subunit: fhirtypes.Integer = Field(
@@ -261,6 +272,7 @@ class SubstanceProteinSubunit(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     subunit__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_subunit", title="Extension field for ``subunit``."
@@ -49,6 +49,7 @@ class SubstanceSourceMaterial(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     developmentStage: fhirtypes.CodeableConceptType = Field(
@@ -62,6 +63,7 @@ class SubstanceSourceMaterial(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     fractionDescription: typing.List[
@@ -83,6 +85,7 @@ class SubstanceSourceMaterial(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     geographicalLocation: typing.List[typing.Optional[fhirtypes.String]] = Field(
@@ -95,6 +98,7 @@ class SubstanceSourceMaterial(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     geographicalLocation__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -116,6 +120,7 @@ class SubstanceSourceMaterial(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     organismId: fhirtypes.IdentifierType = Field(
@@ -128,6 +133,7 @@ class SubstanceSourceMaterial(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     organismName: fhirtypes.String = Field(
@@ -140,6 +146,7 @@ class SubstanceSourceMaterial(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     organismName__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_organismName", title="Extension field for ``organismName``."
@@ -156,6 +163,7 @@ class SubstanceSourceMaterial(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     parentSubstanceName: typing.List[typing.Optional[fhirtypes.String]] = Field(
@@ -165,6 +173,7 @@ class SubstanceSourceMaterial(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     parentSubstanceName__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -183,6 +192,7 @@ class SubstanceSourceMaterial(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     sourceMaterialClass: fhirtypes.CodeableConceptType = Field(
@@ -195,6 +205,7 @@ class SubstanceSourceMaterial(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     sourceMaterialState: fhirtypes.CodeableConceptType = Field(
@@ -204,6 +215,7 @@ class SubstanceSourceMaterial(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     sourceMaterialType: fhirtypes.CodeableConceptType = Field(
@@ -217,6 +229,7 @@ class SubstanceSourceMaterial(domainresource.DomainResource):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -278,6 +291,7 @@ class SubstanceSourceMaterialFractionDescription(backboneelement.BackboneElement
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     fraction__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_fraction", title="Extension field for ``fraction``."
@@ -294,6 +308,7 @@ class SubstanceSourceMaterialFractionDescription(backboneelement.BackboneElement
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -325,6 +340,7 @@ class SubstanceSourceMaterialOrganism(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     family: fhirtypes.CodeableConceptType = Field(
@@ -334,6 +350,7 @@ class SubstanceSourceMaterialOrganism(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     genus: fhirtypes.CodeableConceptType = Field(
@@ -347,6 +364,7 @@ class SubstanceSourceMaterialOrganism(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     hybrid: fhirtypes.SubstanceSourceMaterialOrganismHybridType = Field(
@@ -356,6 +374,7 @@ class SubstanceSourceMaterialOrganism(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     intraspecificDescription: fhirtypes.String = Field(
@@ -370,6 +389,7 @@ class SubstanceSourceMaterialOrganism(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     intraspecificDescription__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -384,6 +404,7 @@ class SubstanceSourceMaterialOrganism(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     organismGeneral: fhirtypes.SubstanceSourceMaterialOrganismOrganismGeneralType = Field(
@@ -393,6 +414,7 @@ class SubstanceSourceMaterialOrganism(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     species: fhirtypes.CodeableConceptType = Field(
@@ -406,6 +428,7 @@ class SubstanceSourceMaterialOrganism(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -451,6 +474,7 @@ class SubstanceSourceMaterialOrganismAuthor(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     authorDescription__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -471,6 +495,7 @@ class SubstanceSourceMaterialOrganismAuthor(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -505,6 +530,7 @@ class SubstanceSourceMaterialOrganismHybrid(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     maternalOrganismId: fhirtypes.String = Field(
@@ -519,6 +545,7 @@ class SubstanceSourceMaterialOrganismHybrid(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     maternalOrganismId__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -538,6 +565,7 @@ class SubstanceSourceMaterialOrganismHybrid(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     maternalOrganismName__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -555,6 +583,7 @@ class SubstanceSourceMaterialOrganismHybrid(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     paternalOrganismId__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -572,6 +601,7 @@ class SubstanceSourceMaterialOrganismHybrid(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     paternalOrganismName__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None,
@@ -614,6 +644,7 @@ class SubstanceSourceMaterialOrganismOrganismGeneral(backboneelement.BackboneEle
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     kingdom: fhirtypes.CodeableConceptType = Field(
@@ -623,6 +654,7 @@ class SubstanceSourceMaterialOrganismOrganismGeneral(backboneelement.BackboneEle
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     order: fhirtypes.CodeableConceptType = Field(
@@ -632,6 +664,7 @@ class SubstanceSourceMaterialOrganismOrganismGeneral(backboneelement.BackboneEle
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     phylum: fhirtypes.CodeableConceptType = Field(
@@ -641,6 +674,7 @@ class SubstanceSourceMaterialOrganismOrganismGeneral(backboneelement.BackboneEle
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -677,6 +711,7 @@ class SubstanceSourceMaterialPartDescription(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     partLocation: fhirtypes.CodeableConceptType = Field(
@@ -690,6 +725,7 @@ class SubstanceSourceMaterialPartDescription(backboneelement.BackboneElement):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     @classmethod
@@ -8,7 +8,7 @@ Last updated: 2023-03-26T15:21:02.749+11:00
 """
 import typing
 
-from pydantic import Field, root_validator
+from pydantic import Field
 
 from . import datatype, fhirtypes
 
@@ -30,6 +30,7 @@ class VirtualServiceDetail(datatype.DataType):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     additionalInfo__ext: typing.List[
         typing.Union[fhirtypes.FHIRPrimitiveExtensionType, None]
@@ -48,6 +49,7 @@ class VirtualServiceDetail(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e address[x]
         one_of_many="address",
         one_of_many_required=False,
@@ -64,6 +66,7 @@ class VirtualServiceDetail(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e address[x]
         one_of_many="address",
         one_of_many_required=False,
@@ -80,6 +83,7 @@ class VirtualServiceDetail(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e address[x]
         one_of_many="address",
         one_of_many_required=False,
@@ -99,6 +103,7 @@ class VirtualServiceDetail(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
         # Choice of Data Types. i.e address[x]
         one_of_many="address",
         one_of_many_required=False,
@@ -117,6 +122,7 @@ class VirtualServiceDetail(datatype.DataType):
         ),
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
 
     maxParticipants: fhirtypes.PositiveInt = Field(
@@ -126,6 +132,7 @@ class VirtualServiceDetail(datatype.DataType):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     maxParticipants__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_maxParticipants", title="Extension field for ``maxParticipants``."
@@ -138,6 +145,7 @@ class VirtualServiceDetail(datatype.DataType):
         description=None,
         # if property is element of this resource.
         element_property=True,
+        summary_element_property=True,
     )
     sessionKey__ext: fhirtypes.FHIRPrimitiveExtensionType = Field(
         None, alias="_sessionKey", title="Extension field for ``sessionKey``."
@@ -161,48 +169,3 @@ class VirtualServiceDetail(datatype.DataType):
             "maxParticipants",
             "sessionKey",
         ]
-
-    @root_validator(pre=True, allow_reuse=True)
-    def validate_one_of_many_2253(
-        cls, values: typing.Dict[str, typing.Any]
-    ) -> typing.Dict[str, typing.Any]:
-        """https://www.hl7.org/fhir/formats.html#choice
-        A few elements have a choice of more than one data type for their content.
-        All such elements have a name that takes the form nnn[x].
-        The "nnn" part of the name is constant, and the "[x]" is replaced with
-        the title-cased name of the type that is actually used.
-        The table view shows each of these names explicitly.
-
-        Elements that have a choice of data type cannot repeat - they must have a
-        maximum cardinality of 1. When constructing an instance of an element with a
-        choice of types, the authoring system must create a single element with a
-        data type chosen from among the list of permitted data types.
-        """
-        one_of_many_fields = {
-            "address": [
-                "addressContactPoint",
-                "addressExtendedContactDetail",
-                "addressString",
-                "addressUrl",
-            ]
-        }
-        for prefix, fields in one_of_many_fields.items():
-            assert cls.__fields__[fields[0]].field_info.extra["one_of_many"] == prefix
-            required = (
-                cls.__fields__[fields[0]].field_info.extra["one_of_many_required"]
-                is True
-            )
-            found = False
-            for field in fields:
-                if field in values and values[field] is not None:
-                    if found is True:
-                        raise ValueError(
-                            "Any of one field value is expected from "
-                            f"this list {fields}, but got multiple!"
-                        )
-                    else:
-                        found = True
-            if required is True and found is False:
-                raise ValueError(f"Expect any of field value from this list {fields}.")
-
-        return values
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""Streaming reader for huge FHIR XML Bundle documents."""
+import pathlib
+import typing
+
+from fhir.resources.core.utils.xml import XMLBundleEntryReader
+
+from .fhirtypesvalidators import get_fhir_model_class
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def iter_bundle_entries(
+    source: typing.Union[str, pathlib.Path, typing.IO], *, resources: bool = False
+) -> XMLBundleEntryReader:
+    """Incrementally parses XML Bundle from file path or binary stream and
+    yields validated ``BundleEntry`` (or entry ``resource``) one at a time.
+    Processed elements are cleared, memory usage is bounded by the biggest
+    entry. Other top level elements are available as ``bundle`` of the
+    returned reader.
+    """
+    return XMLBundleEntryReader(
+        get_fhir_model_class("Bundle"), source, resources=resources
+    )
+
+
+__all__ = ["XMLBundleEntryReader", "iter_bundle_entries"]
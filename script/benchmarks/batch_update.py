@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Enrichment of N Patients (12 fields are assigned to each), one by one
+(each assignment is validated) vs ``batch_update`` and ``update``
+(validated once per resource).
+
+Usage: python batch_update.py [--release R5] [--entries N] [--repeat N]
+"""
+import argparse
+import importlib
+import sys
+import time
+
+ENRICHMENT = {
+    "language": "en",
+    "active": True,
+    "gender": "male",
+    "birthDate": "1974-12-25",
+    "deceasedBoolean": False,
+    "multipleBirthBoolean": False,
+    "identifier": [{"system": "urn:oid:1.2.36.146.595.217.0.1", "value": "12345"}],
+    "telecom": [{"system": "phone", "value": "(03) 5555 6473", "use": "work"}],
+    "address": [{"line": ["534 Erewhon St"], "city": "PleasantVille"}],
+    "maritalStatus": {"coding": [{"code": "M"}]},
+    "communication": [{"language": {"text": "English"}}],
+    "generalPractitioner": [{"reference": "Practitioner/1"}],
+}
+
+
+def best_of(func, repeat):
+    """ """
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--entries", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    mod_name = "fhir.resources"
+    if args.release != "R5":
+        mod_name += f".{args.release}"
+    root_module = importlib.import_module(mod_name)
+    patients = [
+        root_module.construct_fhir_element("Patient", {"id": f"p{idx}"})
+        for idx in range(args.entries)
+    ]
+
+    def one_by_one():
+        for patient in patients:
+            for name, value in ENRICHMENT.items():
+                setattr(patient, name, value)
+
+    def batch_update():
+        for patient in patients:
+            with patient.batch_update():
+                for name, value in ENRICHMENT.items():
+                    setattr(patient, name, value)
+
+    def update():
+        for patient in patients:
+            patient.update(**ENRICHMENT)
+
+    for label, func in (
+        ("one by one", one_by_one),
+        ("batch_update", batch_update),
+        ("update", update),
+    ):
+        elapsed = best_of(func, args.repeat)
+        sys.stdout.write(f"{label:>12}: {elapsed * 1000:.1f}ms\n")
+    return 0
+
+
+if "__main__" == __name__:
+    sys.exit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Scaling of ``fhir.resources.bulk.parse_many`` from 1 to N worker processes.
+
+Usage: python bulk_scaling.py [--release R5] [--payloads N] [--max-workers N]
+                              [--chunk-size N] [--validate-only]
+"""
+import argparse
+import importlib
+import os
+import sys
+import time
+
+PATIENT = (
+    '{"resourceType":"Patient","id":"p%d","active":true,'
+    '"name":[{"family":"Chalmers","given":["Peter","James"]}],'
+    '"gender":"male","birthDate":"1974-12-25"}'
+)
+OBSERVATION = (
+    '{"resourceType":"Observation","id":"o%d","status":"final",'
+    '"code":{"coding":[{"system":"http://loinc.org","code":"15074-8"}]},'
+    '"subject":{"reference":"Patient/p%d"},'
+    '"valueQuantity":{"value":6.3,"unit":"mmol/l"}}'
+)
+
+
+def make_payloads(count: int):
+    """ """
+    return [
+        (idx % 2 and OBSERVATION % (idx, idx) or PATIENT % idx).encode("utf-8")
+        for idx in range(count)
+    ]
+
+
+def timeit(bulk, payloads, workers, chunk_size, validate_only):
+    """Includes pool start up and warm up cost."""
+    started = time.perf_counter()
+    invalid = 0
+    for outcome in bulk.parse_many(
+        payloads,
+        workers=workers,
+        chunk_size=chunk_size,
+        validate_only=validate_only,
+        resource_types=["Patient", "Observation"],
+    ):
+        invalid += not outcome.valid
+    assert invalid == 0
+    return time.perf_counter() - started
+
+
+def main():
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--payloads", type=int, default=50000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("--validate-only", action="store_true")
+    args = parser.parse_args()
+
+    mod_name = "fhir.resources"
+    if args.release != "R5":
+        mod_name += f".{args.release}"
+    bulk = importlib.import_module(mod_name + ".bulk")
+    payloads = make_payloads(args.payloads)
+
+    workers_list = [0]
+    workers = 1
+    while workers < args.max_workers:
+        workers_list.append(workers)
+        workers *= 2
+    workers_list.append(args.max_workers)
+
+    baseline = None
+    for workers in workers_list:
+        elapsed = timeit(bulk, payloads, workers, args.chunk_size, args.validate_only)
+        if baseline is None:
+            baseline = elapsed
+        label = workers and f"{workers} worker(s)" or "in process"
+        sys.stdout.write(
+            f"{label:>14}: {elapsed:.2f}s, "
+            f"{args.payloads / elapsed:.0f} resources/s "
+            f"({baseline / elapsed:.2f}x)\n"
+        )
+    return 0
+
+
+if "__main__" == __name__:
+    sys.exit(main())
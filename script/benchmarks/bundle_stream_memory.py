@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Peak memory (``tracemalloc``) and time of ``Bundle.iter_entries`` (streaming)
+versus ``Bundle.parse_file``, for growing searchset Bundles.
+
+Usage: python bundle_stream_memory.py [--release R5] [--sizes 1000,10000,50000]
+                                      [--skip-full]
+"""
+import argparse
+import importlib
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+PATIENT = (
+    '{"fullUrl":"http://example.org/fhir/Patient/p%d","resource":'
+    '{"resourceType":"Patient","id":"p%d","active":true,'
+    '"name":[{"family":"Chalmers","given":["Peter","James"]}],'
+    '"gender":"male","birthDate":"1974-12-25"},"search":{"mode":"match"}}'
+)
+
+
+def write_bundle(path: str, entries: int):
+    """ """
+    with open(path, "w") as fp:
+        fp.write(
+            '{"resourceType":"Bundle","type":"searchset",'
+            f'"total":{entries},"entry":['
+        )
+        for idx in range(entries):
+            if idx > 0:
+                fp.write(",")
+            fp.write(PATIENT % (idx, idx))
+        fp.write("]}")
+
+
+def measure(func):
+    """ """
+    tracemalloc.start()
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024)
+
+
+def main():
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--sizes", default="1000,10000,50000")
+    parser.add_argument("--skip-full", action="store_true")
+    args = parser.parse_args()
+
+    mod_name = "fhir.resources"
+    if args.release != "R5":
+        mod_name += f".{args.release}"
+    bundle_class = importlib.import_module(mod_name + ".bundle").Bundle
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in map(int, args.sizes.split(",")):
+            path = os.path.join(tmp_dir, f"bundle-{size}.json")
+            write_bundle(path, size)
+            file_size = os.path.getsize(path) / (1024 * 1024)
+
+            def stream():
+                for _ in bundle_class.iter_entries(path):
+                    pass
+
+            elapsed, peak = measure(stream)
+            sys.stdout.write(
+                f"{size} entries ({file_size:.1f} MB) "
+                f"iter_entries: {elapsed:.2f}s, peak {peak:.1f} MB\n"
+            )
+            if not args.skip_full:
+                elapsed, peak = measure(lambda: bundle_class.parse_file(path))
+                sys.stdout.write(
+                    f"{size} entries ({file_size:.1f} MB) "
+                    f"parse_file:   {elapsed:.2f}s, peak {peak:.1f} MB\n"
+                )
+    return 0
+
+
+if "__main__" == __name__:
+    sys.exit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Microbenchmark for polymorphic field (``Bundle.entry.resource``) validation,
+with the per fhir type cached validator chain versus building the chain
+(``make_generic_validator``) for every value.
+
+Usage: python bundle_validator_chain.py [--release R5] [--entries N] [--rounds N]
+"""
+import argparse
+import importlib
+import sys
+import time
+
+from pydantic.class_validators import make_generic_validator
+
+
+def make_searchset(entries: int):
+    """Searchset Bundle with ``entries`` small Patient/Observation resources."""
+    entry = []
+    for idx in range(entries):
+        if idx % 2:
+            resource = {
+                "resourceType": "Patient",
+                "id": f"p{idx}",
+                "active": True,
+                "name": [{"family": "Chalmers", "given": ["Peter", "James"]}],
+                "birthDate": "1974-12-25",
+            }
+        else:
+            resource = {
+                "resourceType": "Observation",
+                "id": f"o{idx}",
+                "status": "final",
+                "code": {"coding": [{"system": "http://loinc.org", "code": "15074-8"}]},
+                "valueQuantity": {"value": 6.3, "unit": "mmol/l"},
+            }
+        entry.append(
+            {
+                "fullUrl": f"http://example.org/fhir/{resource['id']}",
+                "resource": resource,
+                "search": {"mode": "match"},
+            }
+        )
+    return {"resourceType": "Bundle", "type": "searchset", "entry": entry}
+
+
+def uncached_run_validator_for_fhir_type(validators_module):
+    """``run_validator_for_fhir_type`` as it was before cached chain."""
+
+    def run_validator_for_fhir_type(model_type_cls, v, values, config, field):
+        cls = validators_module.get_fhir_model_class(model_type_cls.__resource_type__)
+        for validator in model_type_cls.__get_validators__():
+            func = make_generic_validator(validator)
+            v = func(cls, v, values, config, field)
+        return v
+
+    return run_validator_for_fhir_type
+
+
+def timeit(bundle_class, data, rounds):
+    """ """
+    best = None
+    for _ in range(rounds):
+        started = time.perf_counter()
+        bundle_class.parse_obj(data)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    mod_name = "fhir.resources"
+    if args.release != "R5":
+        mod_name += f".{args.release}"
+    fhirtypes = importlib.import_module(mod_name + ".fhirtypes")
+    validators_module = importlib.import_module(mod_name + ".fhirtypesvalidators")
+    bundle_class = validators_module.get_fhir_model_class("Bundle")
+    data = make_searchset(args.entries)
+
+    # warm up
+    bundle_class.parse_obj(make_searchset(2))
+
+    cached = timeit(bundle_class, data, args.rounds)
+
+    cached_func = fhirtypes.run_validator_for_fhir_type
+    fhirtypes.run_validator_for_fhir_type = uncached_run_validator_for_fhir_type(
+        validators_module
+    )
+    try:
+        uncached = timeit(bundle_class, data, args.rounds)
+    finally:
+        fhirtypes.run_validator_for_fhir_type = cached_func
+
+    sys.stdout.write(
+        f"searchset Bundle with {args.entries} entries (best of {args.rounds})\n"
+        f"uncached chain: {uncached:.3f}s\n"
+        f"cached chain:   {cached:.3f}s ({uncached / cached:.2f}x)\n"
+    )
+    return 0
+
+
+if "__main__" == __name__:
+    sys.exit(main())
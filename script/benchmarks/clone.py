@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Fan out of one template resource into N variants (``id`` and
+``meta.versionId`` are changed), ``copy(deep=True)`` and ``copy()`` (nested
+``meta`` is copied by hand, otherwise it is shared with the template) vs
+``clone`` (path update), time and memory (tracemalloc) retained by the
+variants.
+
+Usage: python clone.py [--release R5] [--variants N] [--repeat N]
+"""
+import argparse
+import importlib
+import sys
+import time
+import tracemalloc
+
+
+def make_template():
+    """Patient with many nested elements."""
+    return {
+        "resourceType": "Patient",
+        "id": "template",
+        "meta": {"versionId": "1", "profile": ["http://example.org/Patient"]},
+        "identifier": [
+            {
+                "system": f"urn:oid:1.2.36.146.595.217.0.{idx}",
+                "value": f"{idx}",
+                "type": {"coding": [{"system": "http://example.org", "code": "MR"}]},
+            }
+            for idx in range(5)
+        ],
+        "extension": [
+            {"url": f"http://example.org/ext/{idx}", "valueCode": "code"}
+            for idx in range(10)
+        ],
+        "name": [{"family": "Chalmers", "given": ["Peter", "James"]}],
+        "telecom": [{"system": "phone", "value": "(03) 5555 6473"}],
+        "gender": "male",
+        "birthDate": "1974-12-25",
+        "address": [{"line": ["534 Erewhon St"], "city": "PleasantVille"}],
+        "maritalStatus": {"coding": [{"system": "http://example.org", "code": "M"}]},
+        "generalPractitioner": [{"reference": "Practitioner/1"}],
+    }
+
+
+def deep_copy(template, idx):
+    """ """
+    variant = template.copy(deep=True)
+    variant.id = f"p{idx}"
+    variant.meta.versionId = f"{idx}"
+    return variant
+
+
+def shallow_copy(template, idx):
+    """ """
+    variant = template.copy(update={"meta": template.meta.copy()})
+    variant.id = f"p{idx}"
+    variant.meta.versionId = f"{idx}"
+    return variant
+
+
+def clone(template, idx):
+    """ """
+    return template.clone({"id": f"p{idx}", "meta.versionId": f"{idx}"})
+
+
+def measure(func, template, count, repeat):
+    """Returns best time and memory retained by the variants."""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        [func(template, idx) for idx in range(count)]
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    tracemalloc.start()
+    variants = [func(template, idx) for idx in range(count)]
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del variants
+    return best, retained
+
+
+def main():
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--variants", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    mod_name = "fhir.resources"
+    if args.release != "R5":
+        mod_name += f".{args.release}"
+    root_module = importlib.import_module(mod_name)
+    template = root_module.construct_fhir_element("Patient", make_template())
+
+    for label, func in (
+        ("copy(deep=True)", deep_copy),
+        ("copy()", shallow_copy),
+        ("clone", clone),
+    ):
+        elapsed, retained = measure(func, template, args.variants, args.repeat)
+        sys.stdout.write(
+            f"{label:>16}: {elapsed * 1000:.1f}ms, "
+            f"memory {retained / 1024 / 1024:.1f} MB\n"
+        )
+    return 0
+
+
+if "__main__" == __name__:
+    sys.exit(main())
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""``diff`` of stored and incoming versions of Bundle (N entries, few of
+them are changed) vs generic diff of two ``dict()`` outputs (best of N).
+
+Usage: python diff.py [--release R5] [--entries N] [--changed N] [--repeat N]
+"""
+import argparse
+import copy
+import importlib
+import sys
+import time
+
+
+def make_bundle(count: int):
+    """ """
+    entries = []
+    for idx in range(count):
+        entries.append(
+            {
+                "fullUrl": f"https://example.org/Patient/p{idx}",
+                "resource": {
+                    "resourceType": "Patient",
+                    "id": f"p{idx}",
+                    "active": True,
+                    "name": [{"family": "Chalmers", "given": ["Peter", "James"]}],
+                    "telecom": [{"system": "phone", "value": "(03) 5555 6473"}],
+                    "gender": "male",
+                    "birthDate": "1974-12-25",
+                    "address": [{"line": ["534 Erewhon St"], "city": "PleasantVille"}],
+                },
+            }
+        )
+    return {"resourceType": "Bundle", "type": "collection", "entry": entries}
+
+
+def dict_diff(a, b, path, ops):
+    """Generic diff (today's approach)."""
+    if a == b:
+        return
+    if isinstance(a, dict) and isinstance(b, dict):
+        for key in a.keys() | b.keys():
+            if key not in b:
+                ops.append(("remove", f"{path}/{key}"))
+            elif key not in a:
+                ops.append(("add", f"{path}/{key}", b[key]))
+            else:
+                dict_diff(a[key], b[key], f"{path}/{key}", ops)
+    elif isinstance(a, list) and isinstance(b, list) and len(a) == len(b):
+        for idx, (a_, b_) in enumerate(zip(a, b)):
+            dict_diff(a_, b_, f"{path}/{idx}", ops)
+    else:
+        ops.append(("replace", path, b))
+
+
+def measure(func, repeat):
+    """ """
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--entries", type=int, default=5000)
+    parser.add_argument("--changed", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    mod_name = "fhir.resources"
+    if args.release != "R5":
+        mod_name += f".{args.release}"
+    root_module = importlib.import_module(mod_name)
+    from fhir.resources.core.diff import diff
+
+    data = make_bundle(args.entries)
+    changed = copy.deepcopy(data)
+    step = max(args.entries // args.changed, 1)
+    for idx in range(0, args.entries, step):
+        changed["entry"][idx]["resource"]["birthDate"] = "1975-01-01"
+
+    stored = root_module.construct_fhir_element("Bundle", data)
+    incoming = root_module.construct_fhir_element("Bundle", changed)
+
+    def generic():
+        ops = []
+        dict_diff(stored.dict(), incoming.dict(), "", ops)
+        return ops
+
+    for label, func in (
+        ("dict() diff", generic),
+        ("diff", lambda: diff(stored, incoming)),
+    ):
+        elapsed, ops = measure(func, args.repeat)
+        sys.stdout.write(f"{label:>14}: {elapsed * 1000:.1f}ms ({len(ops)} ops)\n")
+    return 0
+
+
+if "__main__" == __name__:
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""``construct_fhir_element(..., fail_fast=True)`` vs default (all errors
+are collected) on deliberately corrupted dataset, where every payload
+with ``--corrupted`` ratio has several errors deep inside.
+
+Usage: python fail_fast.py [--release R5] [--resources N] [--corrupted 0.3]
+"""
+import argparse
+import copy
+import importlib
+import random
+import sys
+import time
+
+from pydantic import ValidationError
+
+OBSERVATION = {
+    "resourceType": "Observation",
+    "id": "ob1",
+    "status": "final",
+    "code": {"coding": [{"system": "http://loinc.org", "code": "85354-9"}]},
+    "subject": {"reference": "Patient/p1"},
+    "effectiveDateTime": "2023-07-01T10:30:00+02:00",
+    "component": [
+        {
+            "code": {"coding": [{"system": "http://loinc.org", "code": "8480-6"}]},
+            "valueQuantity": {"value": 107, "unit": "mmHg", "code": "mm[Hg]"},
+        }
+        for _ in range(10)
+    ],
+    "note": [{"text": "Blood pressure reading"} for _ in range(5)],
+}
+
+
+def corrupt(payload, rnd):
+    """Several errors at different levels."""
+    payload["status"] = "unknown-status"
+    for component in payload["component"]:
+        component["valueQuantity"]["value"] = "not a number"
+        component["code"]["coding"][0]["system"] = 1
+    payload["note"][rnd.randrange(len(payload["note"]))]["time"] = "yesterday"
+    payload["effectiveDateTime"] = "01.07.2023"
+    return payload
+
+
+def make_dataset(count, corrupted, seed=42):
+    """ """
+    rnd = random.Random(seed)
+    dataset = []
+    for idx in range(count):
+        payload = copy.deepcopy(OBSERVATION)
+        payload["id"] = f"ob{idx}"
+        if rnd.random() < corrupted:
+            payload = corrupt(payload, rnd)
+        dataset.append(payload)
+    return dataset
+
+
+def run(root_module, dataset, fail_fast):
+    """Returns elapsed time and number of invalid payloads."""
+    invalid = 0
+    started = time.perf_counter()
+    for payload in dataset:
+        try:
+            root_module.construct_fhir_element(
+                "Observation", payload, fail_fast=fail_fast
+            )
+        except ValidationError as exc:
+            exc.errors()
+            invalid += 1
+    return time.perf_counter() - started, invalid
+
+
+def main():
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--resources", type=int, default=5000)
+    parser.add_argument("--corrupted", type=float, default=0.3)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    mod_name = "fhir.resources"
+    if args.release != "R5":
+        mod_name += f".{args.release}"
+    root_module = importlib.import_module(mod_name)
+
+    for corrupted in (0.0, args.corrupted, 1.0):
+        dataset = make_dataset(args.resources, corrupted)
+        for label, fail_fast in (("default", False), ("fail_fast", True)):
+            elapsed, invalid = min(
+                run(root_module, dataset, fail_fast) for _ in range(args.repeat)
+            )
+            sys.stdout.write(
+                f"{int(corrupted * 100):>3}% corrupted {label:>10}: "
+                f"{elapsed:.3f}s ({invalid} invalid)\n"
+            )
+    return 0
+
+
+if "__main__" == __name__:
+    sys.exit(main())
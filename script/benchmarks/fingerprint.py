@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""``fingerprint`` vs hashing of ``json(sort_keys=True)``, for Bundle of
+N Patients: first time (cold), again (warm, all digests are cached) and
+after changing one element of one entry.
+
+Usage: python fingerprint.py [--release R5] [--entries N] [--repeat N]
+"""
+import argparse
+import hashlib
+import importlib
+import sys
+import time
+
+
+def make_bundle(count: int):
+    """ """
+    entries = []
+    for idx in range(count):
+        entries.append(
+            {
+                "fullUrl": f"https://example.org/Patient/p{idx}",
+                "resource": {
+                    "resourceType": "Patient",
+                    "id": f"p{idx}",
+                    "active": True,
+                    "name": [{"family": "Chalmers", "given": ["Peter", "James"]}],
+                    "telecom": [{"system": "phone", "value": "(03) 5555 6473"}],
+                    "gender": "male",
+                    "birthDate": "1974-12-25",
+                    "address": [{"line": ["534 Erewhon St"], "city": "PleasantVille"}],
+                },
+            }
+        )
+    return {"resourceType": "Bundle", "type": "collection", "entry": entries}
+
+
+def best_of(func, repeat, setup=None):
+    """ """
+    best = None
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--entries", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    mod_name = "fhir.resources"
+    if args.release != "R5":
+        mod_name += f".{args.release}"
+    root_module = importlib.import_module(mod_name)
+    data = make_bundle(args.entries)
+    bundle = root_module.construct_fhir_element("Bundle", data)
+    patient = bundle.entry[args.entries // 2].resource
+    counter = iter(range(sys.maxsize))
+
+    def json_hash():
+        hashlib.blake2b(bundle.json(sort_keys=True, return_bytes=True)).hexdigest()
+
+    fresh = []
+
+    def construct():
+        fresh[:] = [root_module.construct_fhir_element("Bundle", data)]
+
+    def cold():
+        fresh[0].fingerprint()
+
+    def change():
+        patient.birthDate = f"19{next(counter) % 100:02d}-12-25"
+
+    results = (
+        ("json(sort_keys=True)", best_of(json_hash, args.repeat)),
+        # newly constructed bundle each round, construction is not measured
+        ("fingerprint cold", best_of(cold, args.repeat, construct)),
+        ("fingerprint warm", best_of(bundle.fingerprint, args.repeat)),
+        ("fingerprint changed", best_of(bundle.fingerprint, args.repeat, change)),
+    )
+    for label, elapsed in results:
+        sys.stdout.write(f"{label:>20}: {elapsed * 1000:.1f}ms\n")
+    return 0
+
+
+if "__main__" == __name__:
+    sys.exit(main())
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Self import time of ``fhirtypesvalidators`` and ``fhirtypes`` per FHIR
+release (``python -X importtime``, best of N runs in fresh interpreters).
+Validator functions and ``*Type`` classes are created on demand (PEP 562).
+
+Usage: python import_time.py [--repeat N]
+"""
+import argparse
+import subprocess
+import sys
+
+PACKAGES = ("fhir.resources", "fhir.resources.R4B", "fhir.resources.STU3")
+
+
+def get_import_times(module_name: str) -> dict:
+    """Returns ``{module: self time in microseconds}`` from ``-X importtime``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, _, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(self_time)
+    return times
+
+
+def main():
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for package in PACKAGES:
+        module_names = (package + ".fhirtypesvalidators", package + ".fhirtypes")
+        best = dict.fromkeys(module_names, sys.maxsize)
+        for _ in range(args.repeat):
+            times = get_import_times(package + ".fhirtypes")
+            for module_name in module_names:
+                best[module_name] = min(best[module_name], times[module_name])
+        for module_name, self_time in best.items():
+            sys.stdout.write(f"{module_name:>40}: {self_time / 1000:.1f}ms\n")
+    return 0
+
+
+if "__main__" == __name__:
+    sys.exit(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Throughput (lines per second) of ``fhir.resources.ndjson.iter_resources``
+on a synthetic Bulk Data NDJSON file.
+
+Usage: python ndjson_throughput.py [--release R5] [--lines N] [--gzip]
+"""
+import argparse
+import gzip
+import importlib
+import os
+import sys
+import tempfile
+import time
+
+PATIENT = (
+    '{"resourceType":"Patient","id":"p%d","active":true,'
+    '"name":[{"family":"Chalmers","given":["Peter","James"]}],'
+    '"gender":"male","birthDate":"1974-12-25"}\n'
+)
+OBSERVATION = (
+    '{"resourceType":"Observation","id":"o%d","status":"final",'
+    '"code":{"coding":[{"system":"http://loinc.org","code":"15074-8"}]},'
+    '"subject":{"reference":"Patient/p%d"},'
+    '"valueQuantity":{"value":6.3,"unit":"mmol/l"}}\n'
+)
+
+
+def write_corpus(path: str, lines: int, compress: bool):
+    """Every 1000th line is invalid (on purpose) to exercise error collection."""
+    opener = gzip.open if compress else open
+    with opener(path, "wt") as fp:  # type: ignore
+        for idx in range(lines):
+            if idx % 1000 == 999:
+                fp.write('{"resourceType":"Patient","birthDate":"wrong"}\n')
+            elif idx % 2:
+                fp.write(OBSERVATION % (idx, idx))
+            else:
+                fp.write(PATIENT % idx)
+
+
+def main():
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--lines", type=int, default=1000000)
+    parser.add_argument("--gzip", action="store_true")
+    args = parser.parse_args()
+
+    mod_name = "fhir.resources"
+    if args.release != "R5":
+        mod_name += f".{args.release}"
+    ndjson = importlib.import_module(mod_name + ".ndjson")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "export.ndjson" + (args.gzip and ".gz" or ""))
+        write_corpus(path, args.lines, args.gzip)
+        size = os.path.getsize(path)
+
+        reader = ndjson.iter_resources(path)
+        count = 0
+        started = time.perf_counter()
+        for _ in reader:
+            count += 1
+        elapsed = time.perf_counter() - started
+
+    sys.stdout.write(
+        f"{args.lines} lines ({size / (1024 * 1024):.1f} MB"
+        f"{args.gzip and ', gzip' or ''}) in {elapsed:.2f}s\n"
+        f"{args.lines / elapsed:.0f} lines/s, "
+        f"{count} resources, {len(reader.errors)} errors collected\n"
+    )
+    return 0
+
+
+if "__main__" == __name__:
+    sys.exit(main())
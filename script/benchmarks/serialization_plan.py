@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Compare ``FHIRAbstractModel.json()`` output and speed between the legacy
+(per element lookup) serializer and the precompiled serialization plan.
+
+Usage: python serialization_plan.py [EXAMPLES_DIR] [--release R5] [--rounds N]
+
+``EXAMPLES_DIR`` defaults to ``$FHIR_UNITTEST_DATADIR`` (the extracted
+examples archive used by the unittests) or ``tests/static``.
+"""
+import argparse
+import importlib
+import os
+import pathlib
+import sys
+import time
+
+from fhir.resources.core.fhirabstractmodel import (
+    FHIR_COMMENTS_FIELD_NAME,
+    FHIRAbstractModel,
+)
+from fhir.resources.core.utils import is_primitive_type
+
+ROOT_PATH = pathlib.Path(os.path.abspath(__file__)).parents[2]
+
+
+def legacy_fhir_iter(self, *, by_alias, exclude_none, exclude_comments):
+    """``FHIRAbstractModel._fhir_iter`` as it was before serialization plan."""
+    if self.__class__.has_resource_base():
+        yield "resourceType", self.resource_type
+
+    alias_maps = self.get_alias_mapping()
+    for prop_name in self.elements_sequence():
+        field_key = alias_maps[prop_name]
+
+        field = self.__fields__[field_key]
+        is_primitive = is_primitive_type(field)
+        v = self.__dict__.get(field_key, None)
+        dict_key = by_alias and field.alias or field_key
+        if v is not None:
+            v = self._fhir_get_value(
+                v,
+                by_alias=by_alias,
+                exclude_none=exclude_none,
+                exclude_comments=exclude_comments,
+            )
+
+        if v is not None or (exclude_none is False and v is None):
+            yield dict_key, v
+
+        if is_primitive:
+            ext_key = f"{field_key}__ext"
+            ext_val = self.__dict__.get(ext_key, None)
+            if ext_val is not None:
+                dict_key_ = by_alias and self.__fields__[ext_key].alias or ext_key
+                ext_val = self._fhir_get_value(
+                    ext_val,
+                    by_alias=by_alias,
+                    exclude_none=exclude_none,
+                    exclude_comments=exclude_comments,
+                )
+                if ext_val is not None and len(ext_val) > 0:
+                    yield dict_key_, ext_val
+    comments = self.__dict__.get(FHIR_COMMENTS_FIELD_NAME, None)
+    if comments is not None and not exclude_comments:
+        yield FHIR_COMMENTS_FIELD_NAME, comments
+
+
+def load_corpus(directory: pathlib.Path, release: str):
+    """ """
+    mod_name = "fhir.resources"
+    if release != "R5":
+        mod_name += f".{release}"
+    construct_fhir_element = importlib.import_module(mod_name).construct_fhir_element
+    models = []
+    for path in sorted(directory.glob("*.json")):
+        try:
+            data = FHIRAbstractModel.__config__.json_loads(path.read_bytes())
+            models.append(
+                (path.name, construct_fhir_element(data["resourceType"], data))
+            )
+        except Exception as exc:  # noqa: B902
+            sys.stderr.write(f"skipped {path.name}: {exc.__class__.__name__}\n")
+    return models
+
+
+def timeit(models, rounds):
+    """ """
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for _, model in models:
+            model.json(return_bytes=True)
+    return time.perf_counter() - started
+
+
+def main():
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "directory",
+        nargs="?",
+        default=os.environ.get(
+            "FHIR_UNITTEST_DATADIR", str(ROOT_PATH / "tests" / "static")
+        ),
+    )
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    models = load_corpus(pathlib.Path(args.directory), args.release)
+    if not models:
+        sys.stderr.write(f"No example found at {args.directory}\n")
+        return 1
+
+    planned = timeit(models, args.rounds)
+    new_outputs = [model.json(return_bytes=True) for _, model in models]
+
+    # switch back to legacy serializer
+    planned_fhir_iter = FHIRAbstractModel._fhir_iter
+    FHIRAbstractModel._fhir_iter = legacy_fhir_iter  # type: ignore
+    try:
+        legacy = timeit(models, args.rounds)
+        legacy_outputs = [model.json(return_bytes=True) for _, model in models]
+    finally:
+        FHIRAbstractModel._fhir_iter = planned_fhir_iter  # type: ignore
+
+    mismatches = [
+        name
+        for (name, _), new, old in zip(models, new_outputs, legacy_outputs)
+        if new != old
+    ]
+    for name in mismatches:
+        sys.stderr.write(f"output mismatch: {name}\n")
+
+    sys.stdout.write(
+        f"{len(models)} resources x {args.rounds} rounds\n"
+        f"legacy: {legacy:.3f}s\n"
+        f"plan:   {planned:.3f}s ({legacy / planned:.2f}x)\n"
+        f"byte for byte identical: {len(mismatches) == 0}\n"
+    )
+    return mismatches and 1 or 0
+
+
+if "__main__" == __name__:
+    sys.exit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""``json(summary=True)`` (FHIR ``_summary=true``) vs full ``json``,
+time and response size for searchset Bundle of N Patients.
+
+Usage: python summary.py [--release R5] [--entries N] [--repeat N]
+"""
+import argparse
+import importlib
+import sys
+import time
+
+NARRATIVE = (
+    '<div xmlns="http://www.w3.org/1999/xhtml">'
+    + "<p>Peter James Chalmers, born 1974-12-25, 534 Erewhon St</p>" * 20
+    + "</div>"
+)
+
+
+def make_bundle(count: int):
+    """ """
+    entries = []
+    for idx in range(count):
+        entries.append(
+            {
+                "fullUrl": f"https://example.org/Patient/p{idx}",
+                "resource": {
+                    "resourceType": "Patient",
+                    "id": f"p{idx}",
+                    "text": {"status": "generated", "div": NARRATIVE},
+                    "extension": [
+                        {
+                            "url": "http://example.org/fhir/StructureDefinition/ext",
+                            "valueString": "x" * 200,
+                        }
+                    ],
+                    "active": True,
+                    "name": [{"family": "Chalmers", "given": ["Peter", "James"]}],
+                    "telecom": [{"system": "phone", "value": "(03) 5555 6473"}],
+                    "gender": "male",
+                    "birthDate": "1974-12-25",
+                    "address": [{"line": ["534 Erewhon St"], "city": "PleasantVille"}],
+                    "contact": [
+                        {
+                            "relationship": [{"coding": [{"code": "N"}]}],
+                            "name": {"family": "du Marché", "given": ["Bénédicte"]},
+                            "telecom": [{"system": "phone", "value": "+33 555"}],
+                        }
+                    ],
+                    "communication": [
+                        {"language": {"coding": [{"code": "nl-NL"}]}, "preferred": True}
+                    ],
+                },
+                "search": {"mode": "match"},
+            }
+        )
+    return {"resourceType": "Bundle", "type": "searchset", "entry": entries}
+
+
+def main():
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--entries", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    mod_name = "fhir.resources"
+    if args.release != "R5":
+        mod_name += f".{args.release}"
+    root_module = importlib.import_module(mod_name)
+    bundle = root_module.construct_fhir_element("Bundle", make_bundle(args.entries))
+
+    for engine in ("default", "direct"):
+        for summary in (False, True):
+            best = None
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                result = bundle.json(engine=engine, summary=summary)
+                elapsed = time.perf_counter() - started
+                best = elapsed if best is None else min(best, elapsed)
+            sys.stdout.write(
+                f"{engine:>8} summary={summary!s:<5}: {best:.3f}s, "
+                f"{len(result) / 1024:.0f} KB\n"
+            )
+    return 0
+
+
+if "__main__" == __name__:
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Concurrency stress of model class registry (``get_fhir_model_class``):
+N threads start at the same time (cold, nothing imported yet) and parse
+mixed resource types, then the same again (warm).
+
+Usage: python threaded_parsing.py [--release R5] [--threads 32] [--rounds N]
+"""
+import argparse
+import importlib
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+RESOURCES = [
+    {"resourceType": "Patient", "id": "p1", "active": True},
+    {"resourceType": "Practitioner", "id": "pr1", "active": True},
+    {"resourceType": "PractitionerRole", "id": "prr1", "active": True},
+    {"resourceType": "Organization", "id": "o1", "name": "ACME"},
+    {"resourceType": "Location", "id": "l1", "name": "Ward 1"},
+    {"resourceType": "Device", "id": "d1"},
+    {"resourceType": "Person", "id": "pe1", "active": True},
+    {"resourceType": "HealthcareService", "id": "h1", "active": True},
+    {
+        "resourceType": "Observation",
+        "id": "ob1",
+        "status": "final",
+        "code": {"coding": [{"system": "http://loinc.org", "code": "15074-8"}]},
+    },
+]
+BUNDLE = {
+    "resourceType": "Bundle",
+    "type": "collection",
+    "entry": [{"resource": resource} for resource in RESOURCES],
+}
+
+
+def parse_all(root_module, barrier, rounds):
+    """Returns model classes those are used by this thread."""
+    if barrier is not None:
+        barrier.wait()
+    classes = set()
+    for _ in range(rounds):
+        for payload in RESOURCES + [BUNDLE]:
+            klass = root_module.get_fhir_model_class(payload["resourceType"])
+            model = klass.parse_obj(payload)
+            classes.add(model.__class__)
+    return classes
+
+
+def run(root_module, threads, rounds, cold):
+    """ """
+    barrier = threading.Barrier(threads) if cold else None
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(
+            executor.map(
+                lambda _: parse_all(root_module, barrier, rounds), range(threads)
+            )
+        )
+    elapsed = time.perf_counter() - started
+    # every thread must get the same class object for the same resource type
+    by_name = {}
+    for classes in results:
+        for klass in classes:
+            assert by_name.setdefault(klass.__name__, klass) is klass, klass
+    return elapsed
+
+
+def main():
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    mod_name = "fhir.resources"
+    if args.release != "R5":
+        mod_name += f".{args.release}"
+    root_module = importlib.import_module(mod_name)
+    parses = args.threads * args.rounds * (len(RESOURCES) + 1)
+
+    for label, cold in (("cold", True), ("warm", False)):
+        elapsed = run(root_module, args.threads, args.rounds, cold)
+        sys.stdout.write(
+            f"{label}: {args.threads} threads, {parses} parses in {elapsed:.2f}s "
+            f"({parses / elapsed:.0f} parses/s)\n"
+        )
+    return 0
+
+
+if "__main__" == __name__:
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Compare validated ``construct_fhir_element`` with the trusted
+(no validation) fast-construct path.
+
+Usage: python trusted_construct.py [EXAMPLES_DIR] [--release R5] [--rounds N]
+
+``EXAMPLES_DIR`` defaults to ``$FHIR_UNITTEST_DATADIR`` (the extracted
+examples archive used by the unittests) or ``tests/static``.
+"""
+import argparse
+import importlib
+import os
+import pathlib
+import sys
+import time
+
+from fhir.resources.core.fhirabstractmodel import FHIRAbstractModel
+
+ROOT_PATH = pathlib.Path(os.path.abspath(__file__)).parents[2]
+
+
+def load_corpus(directory: pathlib.Path, construct_fhir_element):
+    """Returns only valid examples (parsed as python objects)."""
+    corpus = []
+    for path in sorted(directory.glob("*.json")):
+        try:
+            data = FHIRAbstractModel.__config__.json_loads(path.read_bytes())
+            construct_fhir_element(data["resourceType"], data)
+        except Exception as exc:  # noqa: B902
+            sys.stderr.write(f"skipped {path.name}: {exc.__class__.__name__}\n")
+            continue
+        corpus.append((path.name, data))
+    return corpus
+
+
+def timeit(corpus, rounds, construct):
+    """ """
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for _, data in corpus:
+            construct(data["resourceType"], data)
+    return time.perf_counter() - started
+
+
+def main():
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "directory",
+        nargs="?",
+        default=os.environ.get(
+            "FHIR_UNITTEST_DATADIR", str(ROOT_PATH / "tests" / "static")
+        ),
+    )
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    mod_name = "fhir.resources"
+    if args.release != "R5":
+        mod_name += f".{args.release}"
+    construct_fhir_element = importlib.import_module(mod_name).construct_fhir_element
+
+    corpus = load_corpus(pathlib.Path(args.directory), construct_fhir_element)
+    if not corpus:
+        sys.stderr.write(f"No example found at {args.directory}\n")
+        return 1
+
+    def construct_trusted(element_type, data):
+        return construct_fhir_element(element_type, data, trusted=True)
+
+    # warm up class level caches
+    timeit(corpus, 1, construct_trusted)
+
+    validated = timeit(corpus, args.rounds, construct_fhir_element)
+    trusted = timeit(corpus, args.rounds, construct_trusted)
+
+    mismatches = []
+    for name, data in corpus:
+        model = construct_trusted(data["resourceType"], data)
+        if model.validate_now() != construct_fhir_element(data["resourceType"], data):
+            mismatches.append(name)
+            sys.stderr.write(f"model mismatch: {name}\n")
+
+    sys.stdout.write(
+        f"{len(corpus)} resources x {args.rounds} rounds\n"
+        f"validated: {validated:.3f}s\n"
+        f"trusted:   {trusted:.3f}s ({validated / trusted:.2f}x)\n"
+        f"equal after validate_now: {len(mismatches) == 0}\n"
+    )
+    return mismatches and 1 or 0
+
+
+if "__main__" == __name__:
+    sys.exit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""``validate`` (no model is constructed) vs ``construct_fhir_element``,
+time and peak memory (tracemalloc) for searchset Bundle of N entries.
+
+Usage: python validate_only.py [--release R5] [--entries N] [--repeat N]
+"""
+import argparse
+import importlib
+import sys
+import time
+import tracemalloc
+
+
+def make_bundle(count: int):
+    """ """
+    entries = []
+    for idx in range(count):
+        entries.append(
+            {
+                "fullUrl": f"https://example.org/Patient/p{idx}",
+                "resource": {
+                    "resourceType": "Patient",
+                    "id": f"p{idx}",
+                    "active": True,
+                    "name": [{"family": "Chalmers", "given": ["Peter", "James"]}],
+                    "telecom": [{"system": "phone", "value": "(03) 5555 6473"}],
+                    "gender": "male",
+                    "birthDate": "1974-12-25",
+                    "address": [{"line": ["534 Erewhon St"], "city": "PleasantVille"}],
+                },
+                "search": {"mode": "match"},
+            }
+        )
+    return {"resourceType": "Bundle", "type": "searchset", "entry": entries}
+
+
+def measure(func, repeat):
+    """Returns best time and peak memory."""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--entries", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    mod_name = "fhir.resources"
+    if args.release != "R5":
+        mod_name += f".{args.release}"
+    root_module = importlib.import_module(mod_name)
+    bundle = make_bundle(args.entries)
+
+    def construct():
+        root_module.construct_fhir_element("Bundle", bundle)
+
+    def validate():
+        assert root_module.validate("Bundle", bundle) == []
+
+    for label, func in (("construct", construct), ("validate", validate)):
+        elapsed, peak = measure(func, args.repeat)
+        sys.stdout.write(
+            f"{label:>10}: {elapsed:.3f}s, peak memory {peak / 1024 / 1024:.1f} MB\n"
+        )
+    return 0
+
+
+if "__main__" == __name__:
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""XML Bundle of N entries from file, ``parse_file`` (whole document) vs
+``xml.iter_bundle_entries`` (streaming), time and peak RSS. lxml memory is
+not visible to tracemalloc, so each mode runs in own process.
+
+Usage: python xml_bundle_stream.py [--release R5] [--entries N]
+"""
+import argparse
+import importlib
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def make_entry(idx: int) -> bytes:
+    """ """
+    return (
+        f"<entry><fullUrl value=\"https://example.org/Patient/p{idx}\"/>"
+        f"<resource><Patient><id value=\"p{idx}\"/><active value=\"true\"/>"
+        "<name><family value=\"Chalmers\"/><given value=\"Peter\"/>"
+        "<given value=\"James\"/></name>"
+        "<telecom><system value=\"phone\"/><value value=\"(03) 5555 6473\"/></telecom>"
+        "<gender value=\"male\"/><birthDate value=\"1974-12-25\"/>"
+        "<address><line value=\"534 Erewhon St\"/><city value=\"PleasantVille\"/>"
+        "</address></Patient></resource></entry>"
+    ).encode()
+
+
+def write_bundle(path: str, count: int):
+    """ """
+    with open(path, "wb") as fp:
+        fp.write(b'<Bundle xmlns="http://hl7.org/fhir"><type value="collection"/>')
+        for idx in range(count):
+            fp.write(make_entry(idx))
+        fp.write(b"</Bundle>")
+
+
+def run(mode: str, release: str, path: str):
+    """ """
+    mod_name = "fhir.resources"
+    if release != "R5":
+        mod_name += f".{release}"
+    started = time.perf_counter()
+    if mode == "parse_file":
+        root_module = importlib.import_module(mod_name)
+        bundle = root_module.get_fhir_model_class("Bundle").parse_file(path)
+        count = len(bundle.entry)
+    else:
+        xml_module = importlib.import_module(mod_name + ".xml")
+        count = sum(1 for _ in xml_module.iter_bundle_entries(path))
+    elapsed = time.perf_counter() - started
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    sys.stdout.write(
+        f"{mode:>20}: {count} entries, {elapsed:.2f}s, peak RSS {peak:.0f} MB\n"
+    )
+
+
+def main():
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--entries", type=int, default=50000)
+    parser.add_argument("--mode", help=argparse.SUPPRESS)
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run(args.mode, args.release, args.path)
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "bundle.xml")
+        write_bundle(path, args.entries)
+        size = os.path.getsize(path) / 1024 / 1024
+        sys.stdout.write(f"{args.entries} entries, {size:.1f} MB\n")
+        sys.stdout.flush()
+        for mode in ("parse_file", "iter_bundle_entries"):
+            subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    "--release",
+                    args.release,
+                    "--mode",
+                    mode,
+                    "--path",
+                    path,
+                ],
+                check=True,
+            )
+    return 0
+
+
+if "__main__" == __name__:
+    sys.exit(main())
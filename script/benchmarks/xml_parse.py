@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""XML parsing of the fixtures (``tests/static/*.xml``), through the
+intermediate ``Node`` tree (``Node.from_element`` then ``Node.to_fhir``) vs
+direct decoding of lxml elements (``xml_loads``), time and peak memory
+(tracemalloc). JSON parsing of the same resource is the baseline.
+
+Usage: python xml_parse.py [--release R5] [--number N]
+"""
+import argparse
+import importlib
+import pathlib
+import sys
+import time
+import tracemalloc
+
+from lxml import etree
+
+from fhir.resources.core.utils.xml import Node, xml_loads
+
+STATIC_PATH = pathlib.Path(__file__).parents[2] / "tests" / "static"
+
+
+def measure(func, number):
+    """Returns time per call and peak memory."""
+    started = time.perf_counter()
+    for _ in range(number):
+        func()
+    elapsed = (time.perf_counter() - started) / number
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    mod_name = "fhir.resources"
+    if args.release != "R5":
+        mod_name += f".{args.release}"
+    root_module = importlib.import_module(mod_name)
+
+    for path in sorted(STATIC_PATH.glob("*.xml")):
+        data = path.read_bytes()
+        klass = root_module.get_fhir_model_class(
+            etree.QName(etree.fromstring(data)).localname
+        )
+
+        def node():
+            Node.from_element(etree.fromstring(data)).to_fhir(klass)
+
+        def direct():
+            xml_loads(klass, data)
+
+        json_data = xml_loads(klass, data).json()
+
+        def json():
+            klass.parse_raw(json_data)
+
+        sys.stdout.write(f"{path.name}\n")
+        for label, func in (("Node", node), ("direct", direct), ("json", json)):
+            elapsed, peak = measure(func, args.number)
+            sys.stdout.write(
+                f"{label:>10}: {elapsed * 1000:.2f}ms, "
+                f"peak memory {peak / 1024:.0f} KB\n"
+            )
+    return 0
+
+
+if "__main__" == __name__:
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Bundle of N entries to XML file, ``xml()`` (whole document in memory)
+vs ``xml(stream=...)`` (incremental ``etree.xmlfile``), time and peak RSS
+growth over the already loaded model. lxml memory is not visible to
+tracemalloc, so each mode runs in own process.
+
+Usage: python xml_stream_write.py [--release R5] [--entries N]
+"""
+import argparse
+import importlib
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def make_entry(idx: int) -> dict:
+    """ """
+    return {
+        "fullUrl": f"https://example.org/Patient/p{idx}",
+        "resource": {
+            "resourceType": "Patient",
+            "id": f"p{idx}",
+            "active": True,
+            "name": [{"family": "Chalmers", "given": ["Peter", "James"]}],
+            "telecom": [{"system": "phone", "value": "(03) 5555 6473"}],
+            "gender": "male",
+            "birthDate": "1974-12-25",
+            "address": [{"line": ["534 Erewhon St"], "city": "PleasantVille"}],
+        },
+    }
+
+
+def run(mode: str, release: str, count: int, path: str):
+    """ """
+    mod_name = "fhir.resources"
+    if release != "R5":
+        mod_name += f".{release}"
+    root_module = importlib.import_module(mod_name)
+    bundle = root_module.construct_fhir_element(
+        "Bundle",
+        {
+            "resourceType": "Bundle",
+            "type": "collection",
+            "entry": [make_entry(idx) for idx in range(count)],
+        },
+    )
+    loaded = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    started = time.perf_counter()
+    if mode == "xml":
+        with open(path, "wb") as fp:
+            fp.write(bundle.xml(return_bytes=True))
+    else:
+        with open(path, "wb") as fp:
+            bundle.xml(stream=fp)
+    elapsed = time.perf_counter() - started
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    size = os.path.getsize(path) / 1024 / 1024
+    sys.stdout.write(
+        f"{mode:>16}: {size:.1f} MB written, {elapsed:.2f}s, "
+        f"peak RSS +{peak - loaded:.0f} MB (model loaded {loaded:.0f} MB)\n"
+    )
+
+
+def main():
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--entries", type=int, default=100000)
+    parser.add_argument("--mode", help=argparse.SUPPRESS)
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run(args.mode, args.release, args.entries, args.path)
+        return 0
+
+    sys.stdout.write(f"{args.entries} entries\n")
+    sys.stdout.flush()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "bundle.xml")
+        for mode in ("xml", "xml(stream=fp)"):
+            subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    "--release",
+                    args.release,
+                    "--entries",
+                    str(args.entries),
+                    "--mode",
+                    mode,
+                    "--path",
+                    path,
+                ],
+                check=True,
+            )
+    return 0
+
+
+if "__main__" == __name__:
+    sys.exit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""XSD validation of N XML documents against ``fhir-single.xsd``:
+schema compiled per call (former ``Node.validate``), cached schema with
+per thread parser (``XML_SCHEMAS``) and ``validate_many`` over a thread pool.
+
+Usage: python xsd_validate.py [--documents N] [--workers N]
+"""
+import argparse
+import pathlib
+import sys
+import time
+
+from lxml import etree
+
+from fhir.resources.core.utils.xml import XML_SCHEMAS, Node, validate_many
+from fhir.resources.R4B.observation import Observation
+from fhir.resources.R4B.patient import Patient
+
+STATIC_PATH = pathlib.Path(__file__).parents[2] / "tests" / "static"
+XSD_FILE = STATIC_PATH / "xsd" / "fhir" / "fhir-single.xsd"
+
+
+def validate_uncached(document: bytes):
+    """ """
+    schema = etree.XMLSchema(file=str(XSD_FILE))
+    etree.fromstring(document, parser=etree.XMLParser(schema=schema))
+
+
+def measure(label: str, func, count: int):
+    """ """
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    sys.stdout.write(
+        f"{label:>28}: {elapsed:.2f}s ({elapsed / count * 1000:.3f} ms/document)\n"
+    )
+
+
+def main():
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    patient = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    observation = Observation.parse_file(STATIC_PATH / "Observation.json")
+    documents = [
+        patient.xml(return_bytes=True),
+        observation.xml(return_bytes=True),
+    ] * (args.documents // 2)
+    count = len(documents)
+    uncached = documents[: max(count // 100, 1)]
+
+    measure(
+        "compiled per call (1%)",
+        lambda: [validate_uncached(document) for document in uncached],
+        len(uncached),
+    )
+    started = time.perf_counter()
+    XML_SCHEMAS.get_schema(XSD_FILE)
+    sys.stdout.write(f"{'first compile':>28}: {time.perf_counter() - started:.2f}s\n")
+    measure(
+        "Node.validate (cached)",
+        lambda: [Node.validate(document, xsd_file=XSD_FILE) for document in documents],
+        count,
+    )
+    measure(
+        "validate_many workers=0",
+        lambda: list(validate_many(documents, XSD_FILE, workers=0)),
+        count,
+    )
+    measure(
+        f"validate_many workers={args.workers}",
+        lambda: list(validate_many(documents, XSD_FILE, workers=args.workers)),
+        count,
+    )
+    return 0
+
+
+if "__main__" == __name__:
+    sys.exit(main())
@@ -0,0 +1,66 @@
+# _*_ coding: utf-8 _*_
+import pytest
+
+from fhir.resources.R4B.bulk import parse_many
+from fhir.resources.R4B.observation import Observation
+from fhir.resources.R4B.patient import Patient
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def make_payloads():
+    """ """
+    patient = (STATIC_PATH / "Patient-with-ext.json").read_bytes()
+    observation = (STATIC_PATH / "Observation.json").read_text()
+    return [
+        patient,
+        observation,
+        b'{"resourceType": "Patient", "birthDate": "wrong"}',
+        b"{invalid json",
+        {"resourceType": "Patient", "active": True},
+    ] * 3
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_parse_many(workers):
+    """ """
+    outcomes = list(parse_many(make_payloads(), workers=workers, chunk_size=2))
+    assert len(outcomes) == 15
+    assert [o.valid for o in outcomes[:5]] == [True, True, False, False, True]
+    assert isinstance(outcomes[0].model, Patient)
+    assert isinstance(outcomes[6].model, Observation)
+    assert outcomes[0].model == Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    assert outcomes[2].resource_type == "Patient"
+    assert outcomes[2].errors[0]["loc"] == ("birthDate",)
+    assert outcomes[3].resource_type is None
+    assert outcomes[3].model is None
+
+
+def test_parse_many_validate_only():
+    """ """
+    outcomes = list(
+        parse_many(
+            make_payloads(),
+            workers=1,
+            validate_only=True,
+            resource_types=["Patient", "Observation"],
+        )
+    )
+    assert [o.valid for o in outcomes[:5]] == [True, True, False, False, True]
+    assert all(o.model is None for o in outcomes)
+
+    with pytest.raises(ValueError):
+        list(parse_many([], chunk_size=0))
+
+
+def test_parse_many_fail_fast():
+    """ """
+    payloads = [{"resourceType": "Patient", "birthDate": "wrong", "active": {}}]
+    outcomes = list(parse_many(payloads, workers=0))
+    assert len(outcomes[0].errors) == 2
+    outcomes = list(parse_many(payloads + make_payloads(), workers=0, fail_fast=True))
+    assert len(outcomes[0].errors) == 1
+    assert outcomes[0].errors[0]["loc"] == ("active",)
+    assert [o.valid for o in outcomes[1:6]] == [True, True, False, False, True]
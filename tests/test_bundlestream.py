@@ -0,0 +1,84 @@
+# _*_ coding: utf-8 _*_
+import io
+
+import pytest
+
+from fhir.resources.core.bundlestream import RawJSONStream
+from fhir.resources.R4B.bundle import Bundle, BundleEntry
+from fhir.resources.R4B.observation import Observation
+from fhir.resources.R4B.patient import Patient
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+@pytest.fixture
+def bundle():
+    """ """
+    patient = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    observation = Observation.parse_file(STATIC_PATH / "Observation.json")
+    return Bundle(
+        id="b1",
+        type="searchset",
+        total=3,
+        link=[{"relation": "self", "url": "http://example.org/fhir/Patient"}],
+        entry=[
+            {"fullUrl": "http://example.org/fhir/Patient/1", "resource": patient},
+            {"resource": observation, "search": {"mode": "include"}},
+            {"fullUrl": "urn:uuid:x\\\"y]}", "resource": patient},
+        ],
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+def test_raw_json_stream(chunk_size):
+    """ """
+    data = b' { "a" : [1, {"b": "x\\\\\\"}"}], "c": -1.5e3 , "d" :true}'
+    stream = RawJSONStream(io.BytesIO(data), chunk_size)
+    stream.expect(b"{")
+    assert stream.read_value() == b'"a"'
+    stream.expect(b":")
+    assert stream.read_value() == b'[1, {"b": "x\\\\\\"}"}]'
+    stream.expect(b",")
+    assert stream.read_value() == b'"c"'
+    stream.expect(b":")
+    assert stream.read_value() == b"-1.5e3"
+    stream.expect(b",")
+    stream.read_value()
+    stream.expect(b":")
+    assert stream.read_value() == b"true"
+    stream.expect(b"}")
+
+
+@pytest.mark.parametrize("chunk_size", [3, 64 * 1024])
+def test_bundle_iter_entries(tmp_path, bundle, chunk_size):
+    """ """
+    path = tmp_path / "bundle.json"
+    path.write_bytes(bundle.json(return_bytes=True, indent=2))
+
+    reader = Bundle.iter_entries(path)
+    reader.chunk_size = chunk_size
+    entries = []
+    for entry in reader:
+        assert isinstance(entry, BundleEntry)
+        # header elements (before ``entry``) are already available
+        assert reader.bundle.total == 3
+        entries.append(entry)
+    assert entries == bundle.entry
+    assert reader.bundle.link == bundle.link
+    assert reader.bundle.entry is None
+
+    resources = list(
+        Bundle.iter_entries(io.BytesIO(bundle.json(return_bytes=True)), resources=True)
+    )
+    assert [r.resource_type for r in resources] == ["Patient", "Observation", "Patient"]
+
+
+def test_bundle_iter_entries_invalid():
+    """ """
+    reader = Bundle.iter_entries(io.BytesIO(b'{"resourceType": "Bundle", "entry": []}'))
+    assert list(reader) == []
+
+    with pytest.raises(ValueError):
+        list(Bundle.iter_entries(io.BytesIO(b'{"type": "searchset", "entry": [{}')))
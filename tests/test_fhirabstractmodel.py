@@ -0,0 +1,531 @@
+# _*_ coding: utf-8 _*_
+import datetime
+import io
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from fhir.resources.core import encoder
+from fhir.resources.R4B.bundle import Bundle
+from fhir.resources.R4B.observation import Observation
+from fhir.resources.R4B.patient import Patient
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def test_serialization_plan():
+    """ """
+    plan = Patient.get_serialization_plan()
+    assert [item.alias for item in plan] == Patient.elements_sequence()
+    assert Patient.get_serialization_plan() is plan
+
+    plan_map = {item.alias: item for item in plan}
+    assert plan_map["birthDate"].is_primitive is True
+    assert plan_map["birthDate"].ext_key == "birthDate__ext"
+    assert plan_map["birthDate"].ext_alias == "_birthDate"
+    assert plan_map["name"].is_primitive is False
+    assert plan_map["name"].ext_key is None
+
+
+def test_serialization_with_plan():
+    """ """
+    patient = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    data = patient.dict()
+    assert list(data.keys())[0] == "resourceType"
+    assert "_active" in data and "_gender" in data
+    assert "active__ext" in patient.dict(by_alias=False)
+    assert Patient.parse_raw(patient.json()) == patient
+
+    observation = Observation.parse_file(STATIC_PATH / "Observation.json")
+    keys = [k for k in observation.dict().keys() if k != "resourceType"]
+    sequence = Observation.elements_sequence()
+    assert keys == sorted(keys, key=sequence.index)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{}, {"exclude_none": False}, {"by_alias": False}, {"exclude_comments": True}],
+)
+def test_json_direct_engine(params):
+    """ """
+    patient = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    observation = Observation.parse_file(STATIC_PATH / "Observation.json")
+    bundle = Bundle(
+        type="searchset",
+        entry=[{"resource": patient}, {"resource": observation}, {}],
+    )
+    empties = Patient(active=True, address=[], name=[{}], fhir_comments=["a", "b"])
+
+    for model in (patient, observation, bundle, empties):
+        expected = model.json(return_bytes=True, **params)
+        assert model.json(engine="direct", return_bytes=True, **params) == expected
+        assert model.json(engine="direct", **params) == expected.decode()
+
+        stream = io.BytesIO()
+        assert encoder.json_dumps(model, stream=stream, **params) is None
+        assert stream.getvalue() == expected
+
+    # dumps kwargs are not supported by direct engine, fall back to default.
+    assert bundle.json(engine="direct", indent=2) == bundle.json(indent=2)
+    with pytest.raises(ValueError):
+        bundle.json(engine="unknown")
+
+
+def test_json_direct_engine_stream_flush(monkeypatch):
+    """ """
+    monkeypatch.setattr(encoder, "STREAM_BUFFER_SIZE", 1)
+    patient = Patient(active=True, address=[{}], name=[{"text": "x"}, {}])
+    bundle = Bundle(type="collection", entry=[{"resource": patient}, {}, {}])
+    stream = io.BytesIO()
+    encoder.json_dumps(bundle, stream=stream)
+    assert stream.getvalue() == bundle.json(return_bytes=True)
+
+
+def test_construct_trusted():
+    """ """
+    data = Patient.__config__.json_loads(
+        (STATIC_PATH / "Patient-with-ext.json").read_bytes()
+    )
+    patient = Patient.construct_trusted(data)
+    assert patient.name[0].__class__.__name__ == "HumanName"
+    assert patient.active__ext.extension[0].url is not None
+    # primitives are kept as is, no coercion
+    assert patient.birthDate == data["birthDate"]
+    assert patient.validate_now() == Patient.parse_obj(data)
+
+    bundle = Bundle.construct_trusted(
+        {
+            "resourceType": "Bundle",
+            "type": "collection",
+            "entry": [{"resource": data}],
+            "unknown": "ignored",
+        }
+    )
+    assert isinstance(bundle.entry[0].resource, Patient)
+    assert "unknown" not in bundle.__dict__
+
+
+def test_construct_trusted_validate_now():
+    """ """
+    from fhir.resources.R4B import construct_fhir_element
+
+    path = STATIC_PATH / "Observation.json"
+    observation = construct_fhir_element("Observation", path, trusted=True)
+    assert observation.validate_now() == construct_fhir_element(
+        "Observation", path.read_bytes()
+    )
+    assert construct_fhir_element(
+        "Observation", path.read_text(), trusted=True
+    ).validate_now() == Observation.parse_file(path)
+
+    patient = construct_fhir_element("Patient", {"birthDate": "wrong"}, trusted=True)
+    assert patient.birthDate == "wrong"
+    with pytest.raises(ValueError):
+        patient.validate_now()
+
+
+def test_validator_chain_cache():
+    """ """
+    from fhir.resources.R4B import fhirtypes, fhirtypesvalidators
+
+    cls, validators = fhirtypesvalidators.get_validator_chain(fhirtypes.PatientType)
+    assert cls is Patient
+    assert fhirtypesvalidators.get_validator_chain(fhirtypes.PatientType)[1] is (
+        validators
+    )
+    observation = Observation.parse_file(STATIC_PATH / "Observation.json")
+    bundle = Bundle(
+        type="collection",
+        entry=[{"resource": observation}, {"resource": observation.dict()}],
+    )
+    assert bundle.entry[0].resource == bundle.entry[1].resource
+    assert fhirtypes.ObservationType in fhirtypesvalidators.VALIDATOR_CHAINS
+
+
+def test_element_constraints():
+    """ """
+    from pydantic import ValidationError
+
+    from fhir.resources.R4B.patient import PatientLink
+
+    (constraints,) = Patient.__element_constraints__
+    assert constraints.required_primitives == ()
+    assert [item.prefix for item in constraints.one_of_many] == [
+        "deceased",
+        "multipleBirth",
+    ]
+    assert PatientLink.__element_constraints__[0].required_primitives[0] == (
+        "type",
+        "type__ext",
+        "_type",
+    )
+
+    with pytest.raises(ValidationError) as exc_info:
+        Patient(deceasedBoolean=True, deceasedDateTime="2011-01-01")
+    assert "but got multiple!" in str(exc_info.value)
+
+    with pytest.raises(ValidationError) as exc_info:
+        PatientLink(other={"reference": "Patient/1"})
+    assert exc_info.value.errors()[0]["loc"] == ("__root__", "type")
+
+    link = PatientLink(
+        other={"reference": "Patient/1"},
+        _type={"extension": [{"url": "http://example.org", "valueString": "x"}]},
+    )
+    assert link.type is None
+
+
+def test_projection():
+    """ """
+    from pydantic import ValidationError
+
+    from fhir.resources.R4B import construct_fhir_element
+
+    keys = Observation.get_projection(("id", "subject", "effective[x]"))
+    # mandatory elements are always kept
+    assert {"status", "_status", "code"} <= keys
+    assert {"effectiveDateTime", "_effectiveDateTime", "effectivePeriod"} <= keys
+    assert "component" not in keys
+    assert Observation.get_projection(("id", "subject", "effective[x]")) is keys
+    # normalized cache key, order and duplicates don't matter
+    assert Observation.get_projection(["subject", "id", "id", "effective[x]"]) is keys
+    assert Observation._get_projection.cache_info().maxsize is not None
+    # FHIR ``_elements`` as it is
+    assert Observation.get_projection("subject, id,effective[x]") is keys
+
+    data = (STATIC_PATH / "Observation.json").read_text()
+    observation = Observation.parse_raw(data)
+    elements = ["id", "subject", "code", "effectiveDateTime"]
+    projected = construct_fhir_element("Observation", data, elements=elements)
+    assert projected.component is None
+    assert projected.valueQuantity is None
+    assert projected.status == observation.status
+    assert projected.subject == observation.subject
+    assert projected.effectiveDateTime == observation.effectiveDateTime
+    assert projected.__fields_set__ == {
+        "id",
+        "status",
+        "code",
+        "subject",
+        "effectiveDateTime",
+    }
+
+    # dropped elements are not validated at all
+    obj = observation.dict()
+    obj["component"] = "invalid"
+    with pytest.raises(ValidationError):
+        Observation.parse_obj(obj)
+    assert Observation.parse_obj(obj, elements=elements).component is None
+    trusted = construct_fhir_element(
+        "Observation", obj, trusted=True, elements=elements
+    )
+    assert trusted.component is None
+
+    with pytest.raises(ValueError):
+        Observation.get_projection(("unknown",))
+
+
+def test_summary():
+    """ """
+    from fhir.resources.R4B.extension import Extension
+
+    assert Patient.__fields__["birthDate"].field_info.extra[
+        "summary_element_property"
+    ]
+    assert "summary_element_property" not in (
+        Patient.__fields__["contact"].field_info.extra
+    )
+    plan = Patient.get_serialization_plan(summary=True)
+    assert [item.alias for item in plan][:3] == ["id", "meta", "implicitRules"]
+    assert "text" not in [item.alias for item in plan]
+    # no summary element at all
+    assert Extension.get_serialization_plan(summary=True) == (
+        Extension.get_serialization_plan()
+    )
+
+    patient = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    patient.text = {"status": "generated", "div": "<div>Peter</div>"}
+    data = patient.dict(summary=True)
+    assert "text" not in data
+    assert "contained" not in data
+    assert data["birthDate"] == patient.dict()["birthDate"]
+    assert data["_active"] == patient.dict()["_active"]
+    assert patient.json(summary=True) == patient.json(summary=True, engine="direct")
+
+    bundle = Bundle.parse_obj(
+        {
+            "resourceType": "Bundle",
+            "type": "searchset",
+            "entry": [{"resource": patient.dict()}],
+        }
+    )
+    for b in (bundle, Bundle.parse_raw(bundle.json(), lazy_entries=True)):
+        resource = b.dict(summary=True)["entry"][0]["resource"]
+        assert resource == data
+
+
+def test_fingerprint():
+    """ """
+    patient = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    digest = patient.fingerprint()
+    assert digest == Patient.parse_raw(patient.json()).fingerprint()
+    assert digest == Patient.construct_trusted(patient.dict()).fingerprint()
+    assert digest != patient.fingerprint(algorithm="sha256")
+    assert len(patient.fingerprint(algorithm="sha256")) == 64
+
+    # only changed path is hashed again
+    address = patient.address[0]._fingerprints["blake2b"]
+    name = patient.name[0]._fingerprints["blake2b"]
+    patient.name[0].family = "Chalmers Jr."
+    changed = patient.fingerprint()
+    assert changed != digest
+    assert patient.address[0]._fingerprints["blake2b"].digest is address.digest
+    assert patient.name[0]._fingerprints["blake2b"].digest != name.digest
+
+    patient.name[0].family = "Chalmers"
+    assert patient.fingerprint() == digest
+
+    copied = patient.copy(update={"gender": "female"})
+    assert copied.fingerprint() != digest
+    assert patient.fingerprint() == digest
+
+    patient.name = patient.name[:1]
+    assert patient.fingerprint() != digest
+
+    # in-place changes of lists
+    other = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    patient = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    assert other.fingerprint() == patient.fingerprint() == digest
+    patient.name[0].given.append("B")
+    assert patient.fingerprint() != digest
+    patient.name[0].given.pop()
+    assert patient.fingerprint() == digest
+    patient.name[0].given[0] = "Pete"
+    assert patient.fingerprint() != digest
+    patient.name[0].given[0] = "Peter"
+    assert patient.fingerprint() == digest
+    patient.name.append({"family": "Doe"})
+    assert patient.fingerprint() != other.fingerprint()
+    assert other.fingerprint() == digest
+
+
+def apply_patch(doc, ops):
+    """Minimal JSON Patch applier (add, remove, replace)."""
+    for op in ops:
+        *parents, last = op.path.split("/")[1:]
+        target = doc
+        for token in parents:
+            target = target[int(token) if isinstance(target, list) else token]
+        if isinstance(target, list):
+            last = int(last)
+            if op.op == "add":
+                target.insert(last, op.value)
+                continue
+        if op.op == "remove":
+            del target[last]
+        else:
+            target[last] = op.value
+    return doc
+
+
+def test_diff():
+    """ """
+    from fhir.resources import PatchOp, diff
+
+    data = (STATIC_PATH / "Patient-with-ext.json").read_text()
+    stored = Patient.parse_raw(data)
+    incoming = Patient.parse_raw(data)
+    assert diff(stored, incoming) == []
+
+    incoming.gender = "female"
+    incoming.birthDate__ext = {"extension": [{"url": "http://x", "valueCode": "y"}]}
+    incoming.name = incoming.name + [{"family": "Chalmers"}]
+    incoming.address = None
+    ops = diff(stored, incoming)
+    assert ops == [
+        PatchOp("add", "/name/2", {"family": "Chalmers"}),
+        PatchOp("replace", "/gender", "female"),
+        PatchOp("add", "/_birthDate", incoming.dict()["_birthDate"]),
+        PatchOp("remove", "/address"),
+    ]
+    assert ops[3].as_dict() == {"op": "remove", "path": "/address"}
+
+    # cached digests don't hide in-place changes
+    stored.fingerprint()
+    incoming.fingerprint()
+    assert diff(stored, incoming) == ops
+    incoming.name.append({"family": "Doe"})
+    assert PatchOp("add", "/name/3", {"family": "Doe"}) in diff(stored, incoming)
+    incoming.name.pop()
+    incoming.name[0].given.append("B")
+    assert PatchOp("add", "/name/0/given/2", "B") in diff(stored, incoming)
+    incoming.name[0].given.pop()
+
+    incoming.name = [{"family": "Chalmers"}, incoming.name[1]]
+    incoming.name[1].given = ["Jim", "Jimmy"]
+    ops = diff(stored, incoming)
+    patched = apply_patch(json.loads(stored.json(exclude_comments=True)), ops)
+    assert patched == json.loads(incoming.json(exclude_comments=True))
+
+    # nested models without any value are not emitted by dict()
+    for a, b, expected in (
+        (
+            Patient(meta={}, active=True),
+            Patient(meta={"versionId": "2"}, active=True),
+            [PatchOp("add", "/meta", {"versionId": "2"})],
+        ),
+        (Patient(active=True), Patient(meta={}, active=True), []),
+        (
+            Patient(name=[{}]),
+            Patient(name=[{"family": "Doe"}]),
+            [PatchOp("replace", "/name/0", {"family": "Doe"})],
+        ),
+    ):
+        ops = diff(a, b)
+        assert ops == expected
+        patched = apply_patch(json.loads(a.json()), ops)
+        assert patched == json.loads(b.json())
+
+    with pytest.raises(TypeError):
+        diff(stored, Observation.parse_file(STATIC_PATH / "Observation.json"))
+
+
+def test_batch_update():
+    """ """
+    patient = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    digest = patient.fingerprint()
+
+    with patient.batch_update():
+        patient.active = False
+        patient.birthDate = "2000-01-01"
+        # not validated yet
+        assert patient.birthDate == "2000-01-01"
+        with patient.batch_update():
+            patient.maritalStatus = {"text": "Married"}
+    assert patient.birthDate == datetime.date(2000, 1, 1)
+    assert patient.maritalStatus.text == "Married"
+    assert {"active", "birthDate", "maritalStatus"} <= patient.__fields_set__
+    assert patient.fingerprint() != digest
+
+    # rolled back on error
+    data = patient.json()
+    digest = patient.fingerprint()
+    with pytest.raises(ValidationError) as exc_info:
+        with patient.batch_update():
+            patient.gender = "female"
+            patient.birthDate = "wrong"
+    assert exc_info.value.errors()[0]["loc"] == ("birthDate",)
+    assert patient.json() == data
+    assert patient.fingerprint() == digest
+
+    # in-place change of top level list is rolled back too
+    names = patient.name
+    count = len(names)
+    with pytest.raises(ValidationError):
+        with patient.batch_update():
+            patient.name.append({"family": "y"})
+            patient.birthDate = "wrong"
+    assert patient.name is names
+    assert len(patient.name) == count
+    assert patient.json() == data
+
+    # and validated at exit
+    with pytest.raises(ValidationError) as exc_info:
+        with patient.batch_update():
+            patient.name.append({"family": 1, "wrong": True})
+    assert exc_info.value.errors()[0]["loc"][0] == "name"
+    assert len(patient.name) == count
+    with patient.batch_update():
+        patient.name.append({"family": "y"})
+    assert patient.name[-1].family == "y"
+    assert patient.name[:count] == names
+    assert patient.json() != data
+    patient.name = names
+    assert patient.json() == data
+
+    with pytest.raises(ValidationError) as exc_info:
+        patient.update(gender="female", deceasedDateTime="2020")
+    assert exc_info.value.errors()[0]["loc"] == ("__root__",)
+    assert patient.gender == "male"
+
+    with pytest.raises(RuntimeError):
+        with patient.batch_update():
+            patient.gender = "female"
+            raise RuntimeError
+    assert patient.gender == "male"
+
+    assert patient.update(gender="female", deceasedBoolean=False) is patient
+    assert patient.gender == "female"
+    assert patient.json() != data
+
+
+def test_clone():
+    """ """
+    from fhir.resources import diff
+
+    template = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    data = template.json()
+    digest = template.fingerprint()
+
+    variant = template.clone()
+    assert variant.__class__ is Patient
+    assert variant.json() == data
+    assert variant.__fields_set__ == template.__fields_set__
+    assert variant.fingerprint() == digest
+    # nested elements are shared
+    assert variant.maritalStatus is template.maritalStatus
+    assert variant.name is not template.name
+    assert variant.name[0] is template.name[0]
+
+    variant.id = "variant"
+    variant.name = variant.name + [{"family": "Jim"}]
+    assert template.json() == data
+
+    # nested values by path, only the path is copied
+    variant = variant.clone(
+        {
+            "maritalStatus.text": "Married",
+            "name.0.given.1": "Jimmy",
+            "name.1.family": "Chalmers",
+            "name.2": {"family": "Jimmy"},
+        }
+    )
+    assert template.json() == data
+    assert template.fingerprint() == digest
+    assert [op.path for op in diff(template, variant)] == [
+        "/id",
+        "/name/0/given/1",
+        "/name/1/family",
+        "/name/2",
+        "/maritalStatus/text",
+    ]
+    assert variant.name[2].family == "Jimmy"
+    assert variant.maritalStatus is not template.maritalStatus
+    assert template.name[0].given == ["Peter", "James"]
+    assert variant.address[0] is template.address[0]
+
+    variants = [template.clone({"meta.versionId": str(idx)}) for idx in range(2)]
+    assert [v.meta.versionId for v in variants] == ["0", "1"]
+    assert variants[0].meta.tag[0] is template.meta.tag[0]
+    assert template.meta.versionId is None
+
+    # documented: nested elements reached by attribute access are shared
+    shared = template.clone()
+    shared.meta.versionId = "shared"
+    assert template.meta.versionId == "shared"
+    assert variants[0].meta.versionId == "0"
+    shared.meta.versionId = None
+    # top level assignments and lists are not shared
+    shared.gender = "other"
+    shared.name.append({"family": "Doe"})
+    assert template.gender == "male"
+    assert len(template.name) == 2
+
+    with pytest.raises(ValidationError):
+        template.clone({"birthDate": "invalid"})
+    with pytest.raises(ValueError):
+        template.clone({"photo.0.title": "empty"})
+    assert template.json() == data
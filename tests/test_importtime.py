@@ -0,0 +1,73 @@
+# _*_ coding: utf-8 _*_
+import json
+import subprocess
+import sys
+
+import pytest
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+PACKAGES = ("fhir.resources", "fhir.resources.R4B", "fhir.resources.STU3")
+
+# runs in fresh interpreter, other tests might have created types already
+LAZY_CHECK = """
+import json
+from {package} import fhirtypes, fhirtypesvalidators
+
+def created():
+    types = [
+        name for name in fhirtypes.__all__
+        if name not in fhirtypes.BASE_TYPES and name in vars(fhirtypes)
+    ]
+    validators = [
+        name for name in fhirtypesvalidators.__all__
+        if name in vars(fhirtypesvalidators)
+    ]
+    return types + validators
+
+before = created()
+fhirtypes.PatientType
+fhirtypesvalidators.observation_validator
+print(json.dumps([before, created()]))
+"""
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+def test_fhirtypes_created_on_demand(package):
+    """Import time is measured by ``script/benchmarks/import_time.py``, here
+    only checks that ``*Type`` classes and validator functions are not
+    created at import, but on attribute access."""
+    result = subprocess.run(
+        [sys.executable, "-c", LAZY_CHECK.format(package=package)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    before, after = json.loads(result.stdout)
+    assert before == []
+    assert sorted(after) == ["PatientType", "observation_validator"]
+
+
+def test_lazy_fhirtypes():
+    """ """
+    from fhir.resources.R4B import fhirtypes, fhirtypesvalidators
+
+    patient_type = fhirtypes.PatientType
+    assert patient_type is fhirtypes.get_fhir_type_class("Patient")
+    assert patient_type.__resource_type__ == "Patient"
+    assert patient_type.__fhir_release__ == "R4B"
+    assert "PatientType" in fhirtypes.__all__
+    assert "PatientType" in dir(fhirtypes)
+
+    validator = fhirtypesvalidators.patient_validator
+    assert validator is fhirtypesvalidators.patient_validator
+    assert validator.__name__ == "patient_validator"
+    assert validator({"resourceType": "Patient", "active": True}).active is True
+    assert "patient_validator" in fhirtypesvalidators.__all__
+
+    with pytest.raises(AttributeError):
+        fhirtypes.NoSuchResourceType
+    with pytest.raises(AttributeError):
+        fhirtypesvalidators.nosuchresource_validator
+    with pytest.raises(LookupError):
+        fhirtypes.get_fhir_type_class("NoSuchResource")
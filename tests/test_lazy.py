@@ -0,0 +1,106 @@
+# _*_ coding: utf-8 _*_
+import copy
+import pickle
+
+import pytest
+from pydantic import Field, ValidationError
+
+from fhir.resources.core.lazy import LazyResource
+from fhir.resources.patient import Patient as R5Patient
+from fhir.resources.R4B import fhirtypes
+from fhir.resources.R4B.backboneelement import BackboneElement
+from fhir.resources.R4B.bundle import Bundle, BundleEntry
+from fhir.resources.R4B.observation import Observation
+from fhir.resources.R4B.patient import Patient
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+class PatientHolder(BackboneElement):
+    """ """
+
+    patient: fhirtypes.PatientType = Field(
+        None, alias="patient", element_property=True
+    )
+
+
+@pytest.fixture
+def raw_bundle():
+    """ """
+    patient = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    observation = Observation.parse_file(STATIC_PATH / "Observation.json")
+    return Bundle(
+        type="searchset",
+        total=2,
+        entry=[{"resource": patient}, {"resource": observation}],
+    ).json(return_bytes=True)
+
+
+def test_lazy_entries(raw_bundle):
+    """ """
+    bundle = Bundle.parse_raw(raw_bundle, lazy_entries=True)
+    lazy = bundle.entry[0].resource
+    assert type(lazy) is LazyResource
+    assert isinstance(lazy, Patient)
+    assert lazy.is_resolved is False
+
+    # untouched entries are emitted as they are
+    assert bundle.json(return_bytes=True) == raw_bundle
+    assert bundle.json(engine="direct", return_bytes=True) == raw_bundle
+    assert bundle.entry[1].resource.is_resolved is False
+
+    assert lazy.name[0].family == "Chalmers"
+    assert lazy.is_resolved is True
+    assert lazy.resolve() is lazy.resolve()
+    lazy.active = False
+    assert Bundle.parse_raw(bundle.json()).entry[0].resource.active is False
+
+    assert bundle == Bundle.parse_raw(bundle.json())
+    assert bundle.dict(by_alias=False) == Bundle.parse_raw(bundle.json()).dict(
+        by_alias=False
+    )
+
+
+def test_lazy_entries_deferred_validation(raw_bundle):
+    """ """
+    bundle = Bundle.parse_raw(
+        b'{"resourceType": "Bundle", "type": "collection", "entry": '
+        b'[{"resource": {"resourceType": "Patient", "birthDate": "wrong"}}]}',
+        lazy_entries=True,
+    )
+    with pytest.raises(ValidationError):
+        bundle.entry[0].resource.birthDate
+
+    bundle = Bundle.parse_raw(raw_bundle, lazy_entries=True)
+    for copied in (copy.deepcopy(bundle), pickle.loads(pickle.dumps(bundle))):
+        assert copied.json(return_bytes=True) == raw_bundle
+        assert isinstance(copied.entry[1].resource, Observation)
+
+
+def test_lazy_entries_resource_type(raw_bundle):
+    """ """
+    bundle = Bundle.parse_raw(raw_bundle, lazy_entries=True)
+    lazy_patient, lazy_observation = (entry.resource for entry in bundle.entry)
+
+    # any resource is allowed, validation is still deferred
+    entry = BundleEntry(resource=lazy_observation)
+    assert entry.resource is lazy_observation
+    assert lazy_observation.is_resolved is False
+
+    holder = PatientHolder(patient=lazy_patient)
+    assert holder.patient.name[0].family == "Chalmers"
+    with pytest.raises(ValidationError) as exc_info:
+        PatientHolder(patient=lazy_observation)
+    assert exc_info.value.errors()[0]["loc"][0] == "patient"
+
+    # resource of other release is checked like a validated one
+    lazy_r5 = LazyResource({"resourceType": "Patient", "active": True}, "R5")
+    assert isinstance(lazy_r5, R5Patient)
+    with pytest.raises(ValidationError) as exc_info:
+        BundleEntry(resource=lazy_r5)
+    assert exc_info.value.errors()[0]["loc"][0] == "resource"
+    with pytest.raises(ValidationError):
+        entry.resource = lazy_r5
+    assert entry.resource is lazy_observation
@@ -0,0 +1,105 @@
+# _*_ coding: utf-8 _*_
+import gzip
+import io
+
+import pytest
+
+from fhir.resources.R4B.ndjson import NDJSONError, iter_resources
+from fhir.resources.R4B.observation import Observation
+from fhir.resources.R4B.patient import Patient
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+@pytest.fixture
+def ndjson_content():
+    """ """
+    patient = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    observation = Observation.parse_file(STATIC_PATH / "Observation.json")
+    lines = [
+        patient.json(),
+        "",
+        '{"resourceType": "Patient", "gender": 1',
+        observation.json(),
+        '{"resourceType": "Patient", "birthDate": "wrong"}',
+        patient.json(),
+    ]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def test_iter_resources_collect_errors(tmp_path, ndjson_content):
+    """ """
+    path = tmp_path / "export.ndjson"
+    path.write_bytes(ndjson_content)
+    reader = iter_resources(path)
+    models = list(reader)
+    assert [m.resource_type for m in models] == ["Patient", "Observation", "Patient"]
+    assert [e.line_number for e in reader.errors] == [3, 5]
+    assert reader.errors[1].resource_type == "Patient"
+    assert isinstance(reader.errors[0], NDJSONError)
+
+    reader = iter_resources(str(path), on_error="ignore")
+    assert len(list(reader)) == 3
+    assert reader.errors == []
+
+
+def test_iter_resources_errors_bounded(tmp_path, ndjson_content):
+    """ """
+    path = tmp_path / "export.ndjson"
+    path.write_bytes(ndjson_content * 3)
+
+    reader = iter_resources(path)
+    errors = reader.errors
+    assert len(list(reader)) == 9
+    assert len(reader.errors) == reader.error_count == 6
+    # errors are reset when iterating again, not appended twice
+    assert len(list(reader)) == 9
+    assert len(reader.errors) == reader.error_count == 6
+    assert errors == []
+
+    reader = iter_resources(path, max_errors=2)
+    assert len(list(reader)) == 9
+    assert [e.line_number for e in reader.errors] == [3, 5]
+    assert reader.error_count == 6
+
+    reader = iter_resources(path, max_errors=None)
+    assert len(list(reader)) == 9
+    assert len(reader.errors) == 6
+
+    with pytest.raises(ValueError):
+        iter_resources(path, max_errors=-1)
+
+
+def test_iter_resources_gzip_and_fileobj(tmp_path, ndjson_content):
+    """ """
+    path = tmp_path / "export.ndjson.gz"
+    path.write_bytes(gzip.compress(ndjson_content))
+    assert len(list(iter_resources(path))) == 3
+
+    for fp in (
+        io.BytesIO(gzip.compress(ndjson_content)),
+        io.BytesIO(ndjson_content),
+        io.StringIO(ndjson_content.decode("utf-8")),
+    ):
+        reader = iter_resources(fp)
+        assert len(list(reader)) == 3
+        assert len(reader.errors) == 2
+        assert fp.closed is False
+
+
+def test_iter_resources_resource_type(ndjson_content):
+    """ """
+    reader = iter_resources(
+        io.BytesIO(ndjson_content), resource_type="Patient", on_error="collect"
+    )
+    assert all(isinstance(m, Patient) for m in reader)
+    assert [e.line_number for e in reader.errors] == [3, 4, 5]
+
+    with pytest.raises(NDJSONError) as exc_info:
+        list(iter_resources(io.BytesIO(ndjson_content), on_error="raise"))
+    assert exc_info.value.line_number == 3
+
+    with pytest.raises(ValueError):
+        iter_resources(io.BytesIO(ndjson_content), on_error="unknown")
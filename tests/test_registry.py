@@ -0,0 +1,62 @@
+# _*_ coding: utf-8 _*_
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fhir.resources.core.registry import ModelClassRegistry
+from fhir.resources.R4B import fhirtypesvalidators
+from fhir.resources.R4B.patient import Patient
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+class CountingRegistry(ModelClassRegistry):
+    """Slow loader, to widen the race window."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.loaded = []
+
+    def load(self, model_name, module_name):
+        self.loaded.append(model_name)
+        time.sleep(0.01)
+        return super().load(model_name, module_name)
+
+
+def test_registry_concurrent_first_lookup():
+    """ """
+    registry = CountingRegistry(
+        {
+            "Patient": (None, ".patient"),
+            "Observation": (None, ".observation"),
+        },
+        "fhir.resources.R4B",
+    )
+    barrier = threading.Barrier(16)
+
+    def lookup(idx):
+        barrier.wait()
+        return registry.get(idx % 2 and "Observation" or "Patient")
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        classes = list(executor.map(lookup, range(16)))
+
+    assert sorted(registry.loaded) == ["Observation", "Patient"]
+    assert set(classes) == {Patient, registry.get("Observation")}
+    assert registry.model_classes["Patient"] == (Patient, ".patient")
+    assert "Patient" in registry
+    assert len(registry) == 2
+
+    with pytest.raises(KeyError):
+        registry.get("NoSuchResource")
+
+
+def test_get_fhir_model_class():
+    """ """
+    assert fhirtypesvalidators.get_fhir_model_class("Patient") is Patient
+    assert fhirtypesvalidators.MODEL_CLASSES["Patient"][0] is Patient
+    assert fhirtypesvalidators.MODEL_CLASS_REGISTRY.model_classes is (
+        fhirtypesvalidators.MODEL_CLASSES
+    )
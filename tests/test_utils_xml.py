@@ -2,6 +2,7 @@ import sys
 from http import client
 
 import lxml.etree  # type: ignore
+import pytest
 
 from fhir.resources.core import utils
 from fhir.resources.R4B.observation import Observation
@@ -108,3 +109,194 @@ def test_model_obj_xml_file():
     patient.contained[1].text = None
     patient3.contained[1].text = None
     assert patient3 == patient
+
+
+def test_element_to_fhir():
+    """ """
+    for filename in ("Patient-with-ext.xml", "patient-example-animal(animal).xml"):
+        element = lxml.etree.fromstring((STATIC_PATH / filename).read_bytes())
+        patient = utils.xml.element_to_fhir(element, Patient)
+        assert patient == utils.xml.Node.from_element(element).to_fhir(Patient)
+
+    # comments and extensions of list primitive values are kept by position
+    data = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json").dict()
+    data["name"][1]["given"] = [None, "Jimmy"]
+    data["name"][1]["_given"] = [
+        {
+            "fhir_comments": ["first", "second"],
+            "extension": [{"url": "http://example.org", "valueString": "Jim"}],
+        },
+        None,
+    ]
+    patient = Patient.parse_obj(data)
+    patient_ = Patient.parse_raw(
+        patient.xml(return_bytes=True), content_type="text/xml"
+    )
+    assert patient_.name[1].given == [None, "Jimmy"]
+    assert patient_.name[1].given__ext[0].fhir_comments == ["first", "second"]
+    assert patient_.name[1].given__ext[1] is None
+    assert patient_.gender__ext.fhir_comments == patient.gender__ext.fhir_comments
+
+
+def test_iter_bundle_entries(tmp_path):
+    """ """
+    from fhir.resources.R4B import xml
+    from fhir.resources.R4B.bundle import Bundle
+
+    patient = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    nested = {
+        "resourceType": "Bundle",
+        "type": "collection",
+        "entry": [{"resource": {"resourceType": "Patient", "id": "nested"}}],
+    }
+    bundle = Bundle.parse_obj(
+        {
+            "type": "collection",
+            "total": 3,
+            "entry": [
+                {"fhir_comments": "first", "resource": patient.dict()},
+                {"resource": nested},
+                {"fullUrl": "urn:uuid:1", "resource": {"resourceType": "Patient"}},
+            ],
+            "signature": {
+                "type": [{"code": "1.2.840.10065.1.12.1.1"}],
+                "when": "2020-01-01T00:00:00Z",
+                "who": {"reference": "Practitioner/1"},
+            },
+        }
+    )
+    path = tmp_path / "bundle.xml"
+    path.write_bytes(bundle.xml(return_bytes=True))
+
+    reader = xml.iter_bundle_entries(path)
+    entries = list(reader)
+    assert [entry.json() for entry in entries] == [
+        entry.json() for entry in Bundle.parse_file(path).entry
+    ]
+    assert entries[0].fhir_comments == "first"
+    assert entries[1].resource.entry[0].resource.id == "nested"
+    assert reader.bundle.entry is None
+    assert reader.bundle.total == 3
+    assert reader.bundle.signature.who.reference == "Practitioner/1"
+
+    with path.open("rb") as fp:
+        resources = list(xml.iter_bundle_entries(fp, resources=True))
+    assert [resource.resource_type for resource in resources] == [
+        "Patient",
+        "Bundle",
+        "Patient",
+    ]
+
+
+def test_xml_decode_table():
+    """ """
+    from fhir.resources.R4B.fhirprimitiveextension import FHIRPrimitiveExtension
+    from fhir.resources.R4B.humanname import HumanName
+    from fhir.resources.R4B.narrative import Narrative
+
+    table = Patient.get_xml_decode_table()
+    assert table["{http://hl7.org/fhir}name"] is table["name"]
+    assert table["name"].field_key == "name"
+    assert table["name"].is_list is True
+    assert table["name"].model_class is HumanName
+    assert table["birthDate"].model_class is None
+    assert table["birthDate"].ext_key == "birthDate__ext"
+    assert table["birthDate"].ext_class is FHIRPrimitiveExtension
+    assert table["contained"].polymorphic is True
+    assert table["contained"].fhir_release == "R4B"
+
+    table = Narrative.get_xml_decode_table()
+    assert table["{http://www.w3.org/1999/xhtml}div"].is_xhtml is True
+    assert table["div"].ext_key is None
+
+
+def test_model_xml_stream(tmp_path):
+    """ """
+    from io import BytesIO
+
+    from fhir.resources.R4B.bundle import Bundle
+
+    patient = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    observation = Observation.parse_file(STATIC_PATH / "Observation.json")
+    bundle = Bundle.parse_obj(
+        {
+            "type": "collection",
+            "entry": [
+                {"fhir_comments": "first", "resource": patient.dict()},
+                {"resource": observation.dict()},
+            ],
+        }
+    )
+    for model in (patient, observation, bundle):
+        for params in (
+            {},
+            {"pretty_print": True},
+            {"exclude_comments": True, "xml_declaration": False},
+            {"strip_text": True},
+            {"strip_text": True, "pretty_print": True},
+        ):
+            stream = BytesIO()
+            assert model.xml(stream=stream, **params) is None
+            assert stream.getvalue() == model.xml(return_bytes=True, **params)
+
+    # dumps kwargs are honored with stream as well
+    stripped = patient.xml(return_bytes=True, strip_text=True)
+    assert stripped != patient.xml(return_bytes=True)
+    assert b"<div xmlns=\"http://www.w3.org/1999/xhtml\"><table><tbody>" in stripped
+    assert Patient.parse_raw(stripped, content_type="text/xml").name == patient.name
+    for kwargs in ({}, {"stream": BytesIO()}):
+        with pytest.raises(TypeError):
+            patient.xml(unknown=True, **kwargs)
+
+    path = tmp_path / "bundle.xml"
+    bundle.xml(stream=path)
+    assert path.read_bytes() == bundle.xml(return_bytes=True)
+    entries = Bundle.parse_file(path).entry
+    assert entries[0].fhir_comments == "first"
+    assert entries[1].resource.code == observation.code
+
+
+def test_xml_schema_cache():
+    """ """
+    import threading
+
+    from fhir.resources.core.utils.xml import (
+        XML_SCHEMAS,
+        XMLSchemaCache,
+        validate_many,
+    )
+
+    cache = XMLSchemaCache()
+    xsd_file = FHIR_XSD_DIR / "fhir-single.xsd"
+    schema = cache.get_schema(xsd_file)
+    assert cache.get_schema(str(xsd_file)) is schema
+    assert cache.get_schema(xsd_file, "R4B") is not schema
+    assert len(cache) == 2
+    parser = cache.get_parser(xsd_file)
+    assert cache.get_parser(xsd_file) is parser
+    parsers = []
+    thread = threading.Thread(
+        target=lambda: parsers.append(cache.get_parser(xsd_file))
+    )
+    thread.start()
+    thread.join()
+    assert parsers[0] is not parser
+    with pytest.raises(FileNotFoundError):
+        cache.get_schema(FHIR_XSD_DIR / "unknown.xsd")
+
+    patient = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    observation = Observation.parse_file(STATIC_PATH / "Observation.json")
+    invalid = b'<Patient xmlns="http://hl7.org/fhir"><unknown/></Patient>'
+    documents = [patient, invalid, observation.xml(return_bytes=True)] * 4
+    for workers in (0, 2):
+        outcomes = list(
+            validate_many(documents, xsd_file, workers=workers, chunk_size=2)
+        )
+        assert [outcome.valid for outcome in outcomes] == [True, False, True] * 4
+        assert "unknown" in outcomes[1].error
+    # Node.validate reuses the process wide cache
+    schema = XML_SCHEMAS.get_schema(xsd_file)
+    with pytest.raises(ValueError):
+        utils.xml.Node.validate(invalid, xsd_file=xsd_file)
+    utils.xml.Node.validate(patient.xml(return_bytes=True), xsd_file=xsd_file)
+    assert XML_SCHEMAS.get_schema(xsd_file) is schema
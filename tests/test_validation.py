@@ -0,0 +1,134 @@
+# _*_ coding: utf-8 _*_
+import copy
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from fhir.resources.core.validation import FailFastError
+from fhir.resources.R4B import construct_fhir_element, validate, validate_bytes
+from fhir.resources.R4B.bundle import Bundle
+from fhir.resources.R4B.patient import Patient
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def get_errors(element_type, data):
+    """Errors of ``construct_fhir_element``."""
+    try:
+        construct_fhir_element(element_type, copy.deepcopy(data))
+    except ValidationError as exc:
+        return exc.errors()
+    return []
+
+
+def make_payloads():
+    """ """
+    patient = json.loads((STATIC_PATH / "Patient-with-ext.json").read_text())
+    observation = json.loads((STATIC_PATH / "Observation.json").read_text())
+
+    invalid_patient = copy.deepcopy(patient)
+    invalid_patient["birthDate"] = "wrong"
+    invalid_patient["name"][0]["family"] = ["Chalmers"]
+    invalid_patient["name"].append({"given": "Peter", "unknown": 1})
+    invalid_patient["deceasedDateTime"] = "2020"
+    invalid_patient["deceasedBoolean"] = True
+    invalid_patient["unknown"] = True
+
+    invalid_observation = copy.deepcopy(observation)
+    invalid_observation.pop("status")
+    invalid_observation["code"] = "wrong"
+
+    return [
+        ("Patient", patient),
+        ("Observation", observation),
+        ("Patient", invalid_patient),
+        ("Observation", invalid_observation),
+        ("Patient", {"resourceType": "Observation"}),
+        ("Patient", [1, 2]),
+        (
+            "Bundle",
+            {
+                "resourceType": "Bundle",
+                "type": "collection",
+                "entry": [
+                    {"resource": patient},
+                    {"resource": invalid_patient},
+                    {"resource": invalid_observation},
+                    {"resource": "wrong"},
+                    {"request": {"method": "GET"}},
+                ],
+            },
+        ),
+    ]
+
+
+@pytest.mark.parametrize("element_type,data", make_payloads())
+def test_validate(element_type, data):
+    """ """
+    expected = get_errors(element_type, data)
+    errors = validate(element_type, data)
+    assert [error.as_dict() for error in errors] == expected
+    if isinstance(data, dict):
+        errors = validate_bytes(element_type, json.dumps(data).encode())
+        assert [error.as_dict() for error in errors] == expected
+
+
+def test_validate_bytes():
+    """ """
+    errors = validate_bytes("Patient", b"{invalid json")
+    assert len(errors) == 1
+    assert errors[0].loc == ("__root__",)
+    assert errors[0].type == "value_error.jsondecode"
+
+    with pytest.raises(LookupError):
+        validate("NoSuchResource", {})
+
+
+@pytest.mark.parametrize("element_type,data", make_payloads())
+def test_fail_fast(element_type, data):
+    """ """
+    expected = get_errors(element_type, data)
+    if not expected:
+        model = construct_fhir_element(element_type, copy.deepcopy(data))
+        model_ = construct_fhir_element(
+            element_type, copy.deepcopy(data), fail_fast=True
+        )
+        assert model_.__fields_set__ == model.__fields_set__
+        assert model_.json() == model.json()
+        return
+
+    with pytest.raises(FailFastError) as exc_info:
+        construct_fhir_element(element_type, copy.deepcopy(data), fail_fast=True)
+    assert exc_info.value.errors() == expected[:1]
+    assert exc_info.value.loc == expected[0]["loc"]
+
+
+def test_fail_fast_json_path():
+    """ """
+    data = json.loads((STATIC_PATH / "Patient-with-ext.json").read_text())
+    data["name"][1]["given"] = [1, {}]
+    bundle = {
+        "resourceType": "Bundle",
+        "type": "collection",
+        "entry": [{"resource": {"resourceType": "Patient"}}, {"resource": data}],
+    }
+    with pytest.raises(ValidationError) as exc_info:
+        Bundle.parse_raw(json.dumps(bundle), fail_fast=True)
+    assert isinstance(exc_info.value, FailFastError)
+    assert exc_info.value.json_path == "$.entry[1].resource.name[1].given[1]"
+
+    # lazy entries are validated later
+    bundle["timestamp"] = "yesterday"
+    with pytest.raises(FailFastError) as exc_info:
+        Bundle.parse_raw(json.dumps(bundle), lazy_entries=True, fail_fast=True)
+    assert exc_info.value.json_path == "$.timestamp"
+    del bundle["timestamp"]
+    bundle = Bundle.parse_raw(json.dumps(bundle), lazy_entries=True, fail_fast=True)
+    assert isinstance(bundle.entry[1].resource, Patient)
+
+    with pytest.raises(FailFastError) as exc_info:
+        Patient.parse_obj([1, 2], fail_fast=True)
+    assert exc_info.value.json_path == "$"
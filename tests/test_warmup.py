@@ -0,0 +1,44 @@
+# _*_ coding: utf-8 _*_
+import gc
+
+import pytest
+
+from fhir.resources import warmup
+from fhir.resources.core.utils.common import is_primitive_type
+from fhir.resources.R4B import fhirtypesvalidators
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def test_warmup():
+    """ """
+    report = warmup(["Patient", "Observation"], releases=("R4B",))
+    assert report.releases == ("R4B",)
+    assert report.model_classes == 2
+    assert report.fields > 0
+    assert report.elapsed > 0
+    assert report.frozen == 0
+    assert "2 model classes" in str(report)
+
+    klass = fhirtypesvalidators.MODEL_CLASSES["Patient"][0]
+    assert klass is not None
+    info = klass.get_serialization_plan.cache_info()
+    klass.get_serialization_plan()
+    assert klass.get_serialization_plan.cache_info().hits == info.hits + 1
+    info = is_primitive_type.cache_info()
+    is_primitive_type(klass.__fields__["birthDate"])
+    assert is_primitive_type.cache_info().hits == info.hits + 1
+
+
+def test_warmup_freeze():
+    """ """
+    try:
+        report = warmup(["Bundle"], releases=("R4B", "STU3"), freeze=True)
+        assert report.model_classes == 2
+        assert report.frozen > 0
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+    with pytest.raises(ValueError):
+        warmup(releases=("DSTU2",))